@@ -0,0 +1,141 @@
+-- ============================================
+-- 대화 히스토리 조회 벤치마크 (V2 스키마)
+-- ============================================
+-- 목적: 테이블이 수백만 행으로 커져도 유저 단위 조회
+--       (get_recent_conversations / recent_conversations 뷰 / get_recent_turns / get_turns_by_date)
+--       가 해당 유저의 최근 N턴만 인덱스로 읽는지 EXPLAIN으로 확인
+--
+-- 실행 (테스트 DB에서만!):
+--   psql "$DATABASE_URL" -v users=2000 -v turns=500 -f db_benchmark_v2.sql
+--   → users × turns 행씩 3개 테이블에 시드 (기본 2000 × 500 = 100만 턴)
+--
+-- 시드 데이터는 kakao_user_id가 'bench_'로 시작하며 마지막에 삭제됨
+-- ============================================
+
+\if :{?users}
+\else
+\set users 2000
+\endif
+\if :{?turns}
+\else
+\set turns 500
+\endif
+
+\timing on
+
+-- ============================================
+-- 1. 시드 데이터 생성
+-- ============================================
+INSERT INTO users (kakao_user_id, name, onboarding_completed)
+SELECT 'bench_' || u, 'bench', TRUE
+FROM generate_series(1, :users) u
+ON CONFLICT (kakao_user_id) DO NOTHING;
+
+-- 유저당 turns개 턴, 하루 5턴씩 과거 날짜로 분산
+CREATE TEMP TABLE bench_turns AS
+SELECT
+    'bench_' || u AS kakao_user_id,
+    gen_random_uuid() AS user_uuid,
+    gen_random_uuid() AS ai_uuid,
+    (CURRENT_DATE - ((:turns - t) / 5)) AS session_date,
+    ((t - 1) % 5) + 1 AS turn_index,
+    NOW() - make_interval(mins => (:turns - t) * 30) AS created_at,
+    t
+FROM generate_series(1, :users) u
+CROSS JOIN generate_series(1, :turns) t;
+
+INSERT INTO user_answer_messages (uuid, kakao_user_id, content, created_at)
+SELECT user_uuid, kakao_user_id, '오늘 작업 ' || t || ' 진행했어', created_at FROM bench_turns;
+
+INSERT INTO ai_answer_messages (uuid, kakao_user_id, content, created_at)
+SELECT ai_uuid, kakao_user_id, '좋아요! 작업 ' || t || '에 대해 더 이야기해주세요.', created_at FROM bench_turns;
+
+INSERT INTO message_history (kakao_user_id, user_answer_key, ai_answer_key, session_date, turn_index, created_at)
+SELECT kakao_user_id, user_uuid, ai_uuid, session_date, turn_index, created_at FROM bench_turns;
+
+DROP TABLE bench_turns;
+
+-- 통계 + visibility map 갱신 (Index Only Scan의 Heap Fetches 최소화)
+VACUUM ANALYZE users;
+VACUUM ANALYZE user_answer_messages;
+VACUUM ANALYZE ai_answer_messages;
+VACUUM ANALYZE message_history;
+
+SELECT COUNT(*) AS message_history_rows FROM message_history;
+
+-- ============================================
+-- 2. 조회 계획 확인 (모두 Index Scan + LIMIT, 전체 테이블 스캔/WindowAgg 없어야 함)
+-- ============================================
+
+-- 2-0. (비교용) 이전 recent_conversations 뷰 방식: 전체 대화에 ROW_NUMBER() 후 필터
+--      → 전체 message_history를 조인/정렬하므로 테이블 크기에 비례해 느려짐
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF)
+WITH ranked_messages AS (
+    SELECT
+        mh.kakao_user_id,
+        um.content AS user_message,
+        am.content AS ai_message,
+        mh.created_at,
+        ROW_NUMBER() OVER (PARTITION BY mh.kakao_user_id ORDER BY mh.created_at DESC) AS rn
+    FROM message_history mh
+    JOIN user_answer_messages um ON mh.user_answer_key = um.uuid
+    JOIN ai_answer_messages am ON mh.ai_answer_key = am.uuid
+)
+SELECT jsonb_agg(jsonb_build_object('user', user_message, 'ai', ai_message) ORDER BY created_at DESC)
+FROM ranked_messages
+WHERE rn <= 5 AND kakao_user_id = 'bench_1'
+GROUP BY kakao_user_id;
+
+-- 2-1. 숏텀 메모리 (Database.get_shortterm_memory_v2)
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF)
+SELECT get_recent_conversations('bench_1', 5);
+
+-- 함수 내부 쿼리 계획
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF)
+SELECT um.content AS user_message, am.content AS ai_message, mh.created_at
+FROM message_history mh
+JOIN user_answer_messages um ON mh.user_answer_key = um.uuid
+JOIN ai_answer_messages am ON mh.ai_answer_key = am.uuid
+WHERE mh.kakao_user_id = 'bench_1'
+ORDER BY mh.created_at DESC
+LIMIT 5;
+
+-- 2-2. recent_conversations 뷰 (유저 필터가 LATERAL 안으로 전달되는지)
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF)
+SELECT recent_turns FROM recent_conversations WHERE kakao_user_id = 'bench_1';
+
+-- 2-3. 최근 N턴 (get_recent_turns)
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF)
+SELECT mh.turn_index, um.content, am.content, mh.session_date, mh.created_at
+FROM message_history mh
+JOIN user_answer_messages um ON mh.user_answer_key = um.uuid
+JOIN ai_answer_messages am ON mh.ai_answer_key = am.uuid
+WHERE mh.kakao_user_id = 'bench_1'
+ORDER BY mh.created_at DESC
+LIMIT 10;
+
+-- 2-4. 날짜별 턴 (get_turns_by_date)
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF)
+SELECT mh.turn_index, um.content, am.content, mh.created_at
+FROM message_history mh
+JOIN user_answer_messages um ON mh.user_answer_key = um.uuid
+JOIN ai_answer_messages am ON mh.ai_answer_key = am.uuid
+WHERE mh.kakao_user_id = 'bench_1'
+  AND mh.session_date = CURRENT_DATE
+ORDER BY mh.created_at DESC
+LIMIT 3;
+
+-- 2-5. 요청 컨텍스트 일괄 조회 (load_request_context)
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF)
+SELECT load_request_context('bench_1', CURRENT_DATE, 3);
+
+-- 2-6. 이번 주 평일 요약 작성일 (get_summary_dates_between, 주간요약 조건 체크)
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF)
+SELECT * FROM get_summary_dates_between('bench_1', CURRENT_DATE - 6, CURRENT_DATE, 'daily');
+
+-- ============================================
+-- 3. 시드 데이터 정리 (ON DELETE CASCADE로 메시지 테이블까지 삭제)
+-- ============================================
+DELETE FROM users WHERE kakao_user_id LIKE 'bench\_%';
+
+\timing off
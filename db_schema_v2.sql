@@ -14,6 +14,9 @@
 -- 1. user_answer_messages     - 유저 메시지
 -- 2. ai_answer_messages        - AI 응답 (is_summary, summary_type 필드 포함)
 -- 3. message_history           - 대화 턴 히스토리
+-- 3-1. daily_summaries         - 날짜별 최신 데일리 요약 (주간 피드백 입력)
+-- 3-2. weekly_v1_precomputed   - 주말 배치로 미리 생성한 주간요약 v1.0 + 역질문
+-- 3-3. notification_deliveries - 알림톡 발송 큐 + 발송 상태
 --
 -- 뷰 (실시간 조회):
 -- 4. recent_conversations      - 최근 5개 턴 (뷰)
@@ -22,7 +25,16 @@
 -- 함수 (RPC):
 -- - get_recent_turns()                           - 최근 N개 턴 조회
 -- - get_turns_by_date()                          - 특정 날짜의 대화 턴 조회
+-- - get_recent_conversations()                   - 숏텀 메모리 (최근 N턴 JSON)
+-- - save_conversation_turn()                     - 대화 턴 저장 (단일 트랜잭션)
+-- - increment_daily_counts()                     - 일일기록/출석 카운트 원자적 증가
+-- - load_request_context()                       - 요청 컨텍스트 일괄 조회 (JSON 1건)
 -- - get_recent_daily_summaries_by_unique_dates() - 고유 날짜별 데일리 요약 조회
+-- - get_summary_dates_between()                  - 기간 내 요약 작성 날짜 목록
+-- - get_weekly_precompute_candidates()           - 주간요약 미리 생성 대상 (keyset 페이지)
+-- - claim_notification_deliveries()              - 발송 시각이 된 알림 선점 (SKIP LOCKED)
+-- - record_notification_results()                - 발송 결과 일괄 기록
+-- - get_notification_delivery_counts()           - 상태별 알림 건수
 --
 -- 삭제된 구조 (더 이상 사용 안 함):
 -- ❌ user_answer_count (테이블)
@@ -146,37 +158,183 @@ ON message_history(kakao_user_id, session_date DESC, turn_index DESC);
 CREATE INDEX idx_message_history_uuid
 ON message_history(uuid);
 
+-- 최근 N턴 조회용 커버링 인덱스 (get_recent_turns / get_recent_conversations)
+-- 유저별 created_at 역순으로 LIMIT만큼만 읽고, 조인 키까지 인덱스에서 바로 꺼냄
+CREATE INDEX IF NOT EXISTS idx_message_history_user_created
+ON message_history(kakao_user_id, created_at DESC)
+INCLUDE (user_answer_key, ai_answer_key, session_date, turn_index);
+
+-- FK 역참조 인덱스: user/ai 메시지 삭제 시 ON DELETE CASCADE가 message_history를
+-- 메시지 1건마다 전체 스캔하지 않도록 (온보딩 턴 삭제, 사용자 삭제)
+CREATE INDEX IF NOT EXISTS idx_message_history_user_answer_key
+ON message_history(user_answer_key);
+
+CREATE INDEX IF NOT EXISTS idx_message_history_ai_answer_key
+ON message_history(ai_answer_key);
+
+-- 날짜별 턴 조회용 커버링 인덱스 (get_turns_by_date)
+CREATE INDEX IF NOT EXISTS idx_message_history_user_date_created
+ON message_history(kakao_user_id, session_date, created_at DESC)
+INCLUDE (user_answer_key, ai_answer_key, turn_index);
+
 COMMENT ON TABLE message_history IS '대화 턴 히스토리 (user-ai 쌍 관리, UUID 키로 참조)';
 COMMENT ON COLUMN message_history.user_answer_key IS 'user_answer_messages 테이블의 UUID';
 COMMENT ON COLUMN message_history.ai_answer_key IS 'ai_answer_messages 테이블의 UUID';
 
+-- ============================================
+-- 3-1. daily_summaries 테이블 (날짜별 최신 데일리 요약)
+-- ============================================
+-- save_conversation_turn에서 summary_type='daily' 요약 저장 시 함께 upsert
+-- → 주간 피드백 입력 조회가 (kakao_user_id, session_date) PK 범위 스캔 1회로 끝남
+CREATE TABLE IF NOT EXISTS daily_summaries (
+    kakao_user_id TEXT NOT NULL,
+    session_date DATE NOT NULL,
+    ai_answer_key UUID NOT NULL,
+    summary_content TEXT NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+
+    -- 같은 날짜는 최신 요약 1건만 (upsert)
+    PRIMARY KEY (kakao_user_id, session_date),
+
+    CONSTRAINT fk_daily_summaries_user
+        FOREIGN KEY (kakao_user_id)
+        REFERENCES users(kakao_user_id)
+        ON DELETE CASCADE,
+
+    CONSTRAINT fk_daily_summaries_ai_answer
+        FOREIGN KEY (ai_answer_key)
+        REFERENCES ai_answer_messages(uuid)
+        ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_daily_summaries_ai_answer_key
+ON daily_summaries(ai_answer_key);
+
+COMMENT ON TABLE daily_summaries IS '날짜별 최신 데일리 요약 (save_conversation_turn에서 upsert, 주간 피드백 입력용)';
+COMMENT ON COLUMN daily_summaries.ai_answer_key IS '해당 날짜 최신 요약의 ai_answer_messages UUID';
+COMMENT ON COLUMN daily_summaries.updated_at IS '최신 요약 생성 시각 (같은 날 재요약 시 갱신)';
+
+-- 기존 요약 백필 (날짜별 최신 요약 1건, 이미 있으면 건너뜀)
+INSERT INTO daily_summaries (kakao_user_id, session_date, ai_answer_key, summary_content, created_at, updated_at)
+SELECT DISTINCT ON (mh.kakao_user_id, mh.session_date)
+    mh.kakao_user_id,
+    mh.session_date,
+    am.uuid,
+    am.content,
+    am.created_at,
+    am.created_at
+FROM message_history mh
+JOIN ai_answer_messages am ON mh.ai_answer_key = am.uuid
+WHERE am.is_summary = TRUE
+  AND am.summary_type = 'daily'
+ORDER BY mh.kakao_user_id, mh.session_date, am.created_at DESC
+ON CONFLICT (kakao_user_id, session_date) DO NOTHING;
+
+-- 주간요약 미리 생성 대상 조회용 (주간 범위 × 전체 사용자)
+CREATE INDEX IF NOT EXISTS idx_daily_summaries_date_user
+ON daily_summaries(session_date, kakao_user_id);
+
+-- ============================================
+-- 3-2. weekly_v1_precomputed 테이블 (주간요약 v1.0 미리 생성 결과)
+-- ============================================
+-- 주말 배치(src/service/weekly/precompute.py)가 저장, handle_weekly_v1_request가 조회
+-- input_fingerprint: 생성 당시 입력(WeeklyFeedbackInput) 해시 → 요청 시 입력이 바뀌었으면 사용하지 않음
+CREATE TABLE IF NOT EXISTS weekly_v1_precomputed (
+    kakao_user_id TEXT NOT NULL,
+    week_start DATE NOT NULL,
+    input_fingerprint TEXT NOT NULL,
+    v1_summary TEXT NOT NULL,
+    follow_up_questions JSONB NOT NULL DEFAULT '[]'::jsonb,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+
+    PRIMARY KEY (kakao_user_id, week_start),
+
+    CONSTRAINT fk_weekly_v1_precomputed_user
+        FOREIGN KEY (kakao_user_id)
+        REFERENCES users(kakao_user_id)
+        ON DELETE CASCADE
+);
+
+COMMENT ON TABLE weekly_v1_precomputed IS '주말 배치로 미리 생성한 주간요약 v1.0 + 역질문 (주 단위, 요청 시 캐시로 사용)';
+COMMENT ON COLUMN weekly_v1_precomputed.week_start IS '해당 주 월요일 (KST)';
+COMMENT ON COLUMN weekly_v1_precomputed.input_fingerprint IS '생성 입력(사용자 메타데이터 + 7일치 데일리 요약) SHA-256';
+
+-- ============================================
+-- 3-3. notification_deliveries 테이블 (알림톡 발송 큐)
+-- ============================================
+-- 예약(INSERT) → 발송 워커가 claim_notification_deliveries로 선점 → record_notification_results로 결과 기록
+-- status: pending(대기/재시도 대기) → sending(워커 선점) → sent / failed
+CREATE TABLE IF NOT EXISTS notification_deliveries (
+    id BIGSERIAL PRIMARY KEY,
+    kakao_user_id TEXT NOT NULL,
+    template_code VARCHAR(50) NOT NULL,
+    dedup_key TEXT NOT NULL,
+    payload JSONB NOT NULL DEFAULT '{}'::jsonb,
+    status VARCHAR(20) NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    send_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    next_attempt_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    locked_until TIMESTAMP WITH TIME ZONE,
+    provider_message_id TEXT,
+    last_error TEXT,
+    sent_at TIMESTAMP WITH TIME ZONE,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+
+    -- 같은 알림 중복 예약 방지 (예: weekly_summary:{user}:{week_start})
+    CONSTRAINT uq_notification_deliveries_dedup UNIQUE (dedup_key),
+
+    CONSTRAINT chk_notification_deliveries_status
+        CHECK (status IN ('pending', 'sending', 'sent', 'failed')),
+
+    CONSTRAINT fk_notification_deliveries_user
+        FOREIGN KEY (kakao_user_id)
+        REFERENCES users(kakao_user_id)
+        ON DELETE CASCADE
+);
+
+-- 발송 대상 선점용 (완료된 알림은 인덱스에서 제외)
+CREATE INDEX IF NOT EXISTS idx_notification_deliveries_due
+ON notification_deliveries(next_attempt_at)
+WHERE status IN ('pending', 'sending');
+
+CREATE INDEX IF NOT EXISTS idx_notification_deliveries_user
+ON notification_deliveries(kakao_user_id);
+
+COMMENT ON TABLE notification_deliveries IS '알림톡 발송 큐 + 발송 상태 (src/service/notification/dispatcher.py)';
+COMMENT ON COLUMN notification_deliveries.attempts IS '발송 시도 횟수 (선점 시 증가)';
+COMMENT ON COLUMN notification_deliveries.locked_until IS '워커 선점 만료 시각 (지나면 다른 워커가 회수)';
+
 -- ============================================
 -- 4. recent_conversations 뷰 (숏텀 메모리)
 -- ============================================
 -- 최근 5개 턴을 실시간 조회하는 뷰
+-- 유저별 LATERAL + LIMIT: kakao_user_id로 필터하면 해당 유저의 최근 5턴만 인덱스로 읽음
+-- (이전: 전체 대화에 ROW_NUMBER() 윈도우를 계산한 뒤 필터 → 테이블 크기에 비례해 느려짐)
 CREATE OR REPLACE VIEW recent_conversations AS
-WITH ranked_messages AS (
-    SELECT
-        mh.kakao_user_id,
-        um.content as user_message,
-        am.content as ai_message,
-        mh.created_at,
-        ROW_NUMBER() OVER (PARTITION BY mh.kakao_user_id ORDER BY mh.created_at DESC) as rn
-    FROM message_history mh
-    JOIN user_answer_messages um ON mh.user_answer_key = um.uuid
-    JOIN ai_answer_messages am ON mh.ai_answer_key = am.uuid
-)
 SELECT
-    kakao_user_id,
-    jsonb_agg(
-        jsonb_build_object('user', user_message, 'ai', ai_message)
-        ORDER BY created_at DESC
-    ) as recent_turns
-FROM ranked_messages
-WHERE rn <= 5
-GROUP BY kakao_user_id;
-
-COMMENT ON VIEW recent_conversations IS '최근 5개 턴을 실시간 조회하는 뷰 (물리적 저장 없음, 항상 최신 데이터)';
+    u.kakao_user_id::TEXT AS kakao_user_id,
+    r.recent_turns
+FROM users u
+CROSS JOIN LATERAL (
+    SELECT jsonb_agg(
+        jsonb_build_object('user', t.user_message, 'ai', t.ai_message)
+        ORDER BY t.created_at DESC
+    ) AS recent_turns
+    FROM (
+        SELECT um.content AS user_message, am.content AS ai_message, mh.created_at
+        FROM message_history mh
+        JOIN user_answer_messages um ON mh.user_answer_key = um.uuid
+        JOIN ai_answer_messages am ON mh.ai_answer_key = am.uuid
+        WHERE mh.kakao_user_id = u.kakao_user_id
+        ORDER BY mh.created_at DESC
+        LIMIT 5
+    ) t
+) r
+WHERE r.recent_turns IS NOT NULL;
+
+COMMENT ON VIEW recent_conversations IS '최근 5개 턴을 실시간 조회하는 뷰 (유저별 LATERAL + LIMIT, 물리적 저장 없음)';
 
 -- ============================================
 -- 5. 편의 함수들
@@ -246,6 +404,176 @@ $$ LANGUAGE plpgsql;
 COMMENT ON FUNCTION get_turns_by_date(TEXT, DATE, INTEGER)
 IS '특정 날짜의 대화 턴 조회 (최신순, limit 지원)';
 
+-- 5-2-1. 숏텀 메모리 조회 (recent_conversations 뷰의 유저 단위 버전)
+CREATE OR REPLACE FUNCTION get_recent_conversations(
+    p_kakao_user_id TEXT,
+    p_limit INTEGER DEFAULT 5
+)
+RETURNS JSONB AS $$
+    SELECT COALESCE(
+        jsonb_agg(
+            jsonb_build_object('user', t.user_message, 'ai', t.ai_message)
+            ORDER BY t.created_at DESC
+        ),
+        '[]'::jsonb
+    )
+    FROM (
+        SELECT um.content AS user_message, am.content AS ai_message, mh.created_at
+        FROM message_history mh
+        JOIN user_answer_messages um ON mh.user_answer_key = um.uuid
+        JOIN ai_answer_messages am ON mh.ai_answer_key = am.uuid
+        WHERE mh.kakao_user_id = p_kakao_user_id
+        ORDER BY mh.created_at DESC
+        LIMIT p_limit
+    ) t;
+$$ LANGUAGE sql STABLE;
+
+COMMENT ON FUNCTION get_recent_conversations(TEXT, INTEGER)
+IS '숏텀 메모리 조회 - 최근 N턴을 [{user, ai}, ...] JSON 배열로 반환 (idx_message_history_user_created 사용)';
+
+-- 5-3. 대화 턴 저장 (turn_index 계산 + 3개 테이블 INSERT를 한 트랜잭션으로 처리)
+-- 주간 소감 구분 컬럼 (save_conversation_turn에서 사용)
+ALTER TABLE user_answer_messages
+ADD COLUMN IF NOT EXISTS is_review BOOLEAN DEFAULT FALSE;
+
+CREATE OR REPLACE FUNCTION save_conversation_turn(
+    p_kakao_user_id TEXT,
+    p_user_message TEXT,
+    p_ai_message TEXT,
+    p_is_summary BOOLEAN DEFAULT FALSE,
+    p_summary_type VARCHAR(20) DEFAULT NULL,
+    p_is_review BOOLEAN DEFAULT FALSE,
+    p_session_date DATE DEFAULT CURRENT_DATE
+)
+RETURNS TABLE (
+    history_id BIGINT,
+    user_uuid UUID,
+    ai_uuid UUID,
+    turn_index INTEGER,
+    session_date DATE
+) AS $$
+#variable_conflict use_column
+DECLARE
+    v_user_uuid UUID;
+    v_ai_uuid UUID;
+    v_turn_index INTEGER;
+    v_history_id BIGINT;
+BEGIN
+    -- 같은 유저/날짜의 동시 저장(웹훅 재시도 등)을 직렬화 → turn_index 중복 방지
+    -- (트랜잭션 종료 시 자동 해제)
+    PERFORM pg_advisory_xact_lock(hashtext(p_kakao_user_id || ':' || p_session_date::TEXT));
+
+    SELECT COALESCE(MAX(mh.turn_index), 0) + 1
+    INTO v_turn_index
+    FROM message_history mh
+    WHERE mh.kakao_user_id = p_kakao_user_id
+      AND mh.session_date = p_session_date;
+
+    INSERT INTO user_answer_messages (kakao_user_id, content, is_review)
+    VALUES (p_kakao_user_id, p_user_message, p_is_review)
+    RETURNING uuid INTO v_user_uuid;
+
+    INSERT INTO ai_answer_messages (kakao_user_id, content, is_summary, summary_type)
+    VALUES (p_kakao_user_id, p_ai_message, p_is_summary, p_summary_type)
+    RETURNING uuid INTO v_ai_uuid;
+
+    INSERT INTO message_history (kakao_user_id, user_answer_key, ai_answer_key, session_date, turn_index)
+    VALUES (p_kakao_user_id, v_user_uuid, v_ai_uuid, p_session_date, v_turn_index)
+    RETURNING id INTO v_history_id;
+
+    -- 데일리 요약이면 날짜별 최신 요약 테이블 갱신 (같은 날 재요약 시 덮어씀)
+    IF p_is_summary AND p_summary_type = 'daily' THEN
+        INSERT INTO daily_summaries (kakao_user_id, session_date, ai_answer_key, summary_content)
+        VALUES (p_kakao_user_id, p_session_date, v_ai_uuid, p_ai_message)
+        ON CONFLICT (kakao_user_id, session_date) DO UPDATE
+        SET ai_answer_key = EXCLUDED.ai_answer_key,
+            summary_content = EXCLUDED.summary_content,
+            updated_at = NOW();
+    END IF;
+
+    RETURN QUERY SELECT v_history_id, v_user_uuid, v_ai_uuid, v_turn_index, p_session_date;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION save_conversation_turn(TEXT, TEXT, TEXT, BOOLEAN, VARCHAR, BOOLEAN, DATE)
+IS '대화 턴 저장 (turn_index 원자적 계산 + user/ai/history 3개 테이블 단일 트랜잭션 INSERT, 데일리 요약은 daily_summaries upsert)';
+
+-- 5-4. 일일기록/출석 카운트 원자적 증가 (날짜 리셋 + 임계값 + 평일 규칙을 UPDATE 1회로 처리)
+CREATE OR REPLACE FUNCTION increment_daily_counts(
+    p_kakao_user_id TEXT,
+    p_today DATE DEFAULT CURRENT_DATE,
+    p_threshold INTEGER DEFAULT 4
+)
+RETURNS TABLE (
+    daily_record_count INTEGER,
+    attendance_count INTEGER,
+    attendance_incremented BOOLEAN
+) AS $$
+#variable_conflict use_column
+BEGIN
+    -- 행 잠금 하에서 읽기-계산-쓰기가 한 번에 일어나므로 동시 요청에도 카운트 유실 없음
+    -- (SET 우변은 갱신 전 값, RETURNING은 갱신 후 값을 참조)
+    RETURN QUERY
+    UPDATE users u
+    SET daily_record_count = CASE
+            WHEN u.last_record_date = p_today THEN COALESCE(u.daily_record_count, 0) + 1
+            ELSE 1  -- 날짜 변경 → 리셋 후 1부터 시작
+        END,
+        attendance_count = CASE
+            WHEN (CASE WHEN u.last_record_date = p_today THEN COALESCE(u.daily_record_count, 0) + 1 ELSE 1 END) = p_threshold
+                 AND EXTRACT(ISODOW FROM p_today) <= 5  -- 평일(월~금)만 출석 인정
+            THEN COALESCE(u.attendance_count, 0) + 1
+            ELSE COALESCE(u.attendance_count, 0)
+        END,
+        last_record_date = p_today,
+        updated_at = NOW()
+    WHERE u.kakao_user_id = p_kakao_user_id
+    RETURNING
+        u.daily_record_count,
+        u.attendance_count,
+        (u.daily_record_count = p_threshold AND EXTRACT(ISODOW FROM p_today) <= 5);
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION increment_daily_counts(TEXT, DATE, INTEGER)
+IS 'daily_record_count 증가 + 임계값 달성(평일) 시 attendance_count 증가를 원자적으로 처리';
+
+-- 5-5. 요청 컨텍스트 일괄 조회 (GraphManager.load_request_cache 전용)
+-- 사용자 / 대화 상태 / 마지막 대화 날짜 / 오늘 최근 N턴을 JSON 1건으로 반환 → 요청당 DB 왕복 1회
+CREATE OR REPLACE FUNCTION load_request_context(
+    p_kakao_user_id TEXT,
+    p_today DATE DEFAULT CURRENT_DATE,
+    p_turn_limit INTEGER DEFAULT 3
+)
+RETURNS JSONB AS $$
+    SELECT jsonb_build_object(
+        'user', (
+            SELECT to_jsonb(u)
+            FROM users u
+            WHERE u.kakao_user_id = p_kakao_user_id
+        ),
+        'conv_state', (
+            SELECT to_jsonb(cs)
+            FROM conversation_states cs
+            WHERE cs.kakao_user_id = p_kakao_user_id
+        ),
+        'last_turn_date', (
+            SELECT mh.session_date
+            FROM message_history mh
+            WHERE mh.kakao_user_id = p_kakao_user_id
+            ORDER BY mh.created_at DESC
+            LIMIT 1
+        ),
+        'today_turns', COALESCE((
+            SELECT jsonb_agg(to_jsonb(t) ORDER BY t.created_at DESC, t.turn_index DESC)
+            FROM get_turns_by_date(p_kakao_user_id, p_today, p_turn_limit) t
+        ), '[]'::jsonb)
+    );
+$$ LANGUAGE sql STABLE;
+
+COMMENT ON FUNCTION load_request_context(TEXT, DATE, INTEGER)
+IS '요청 시작 시 필요한 user / conv_state / last_turn_date / 오늘 최근 N턴을 JSON 1건으로 조회';
+
 -- ============================================
 -- 6. 유용한 뷰 (View)
 -- ============================================
@@ -277,45 +605,170 @@ IS '데일리/위클리 요약 메시지만 조회 (is_summary = TRUE, summary_t
 -- ============================================
 
 -- 7-1. 고유 날짜별 데일리 요약 조회 (하루에 여러 요약 생성 시 최신 것만 선택)
-CREATE OR REPLACE FUNCTION get_recent_daily_summaries_by_unique_dates(
+-- daily_summaries PK (kakao_user_id, session_date) 역순 범위 스캔 + LIMIT
+-- (반환 컬럼이 바뀌었으므로 기존 함수 삭제 후 재생성)
+DROP FUNCTION IF EXISTS get_recent_daily_summaries_by_unique_dates(TEXT, INTEGER);
+
+CREATE FUNCTION get_recent_daily_summaries_by_unique_dates(
     p_kakao_user_id TEXT,
     p_limit INTEGER DEFAULT 7
 )
 RETURNS TABLE (
-    id BIGINT,
-    uuid UUID,
+    ai_answer_key UUID,
     kakao_user_id TEXT,
     summary_content TEXT,
-    is_summary BOOLEAN,
     summary_type VARCHAR(20),
     created_at TIMESTAMP WITH TIME ZONE,
-    session_date DATE,
-    turn_index INTEGER,
-    user_request TEXT
+    session_date DATE
 ) AS $$
-BEGIN
-    RETURN QUERY
-    SELECT DISTINCT ON (smv.session_date)
-        smv.id,
-        smv.uuid,
-        smv.kakao_user_id,
-        smv.summary_content,
-        smv.is_summary,
-        smv.summary_type,
-        smv.created_at,
-        smv.session_date,
-        smv.turn_index,
-        smv.user_request
-    FROM summary_messages_view smv
-    WHERE smv.kakao_user_id = p_kakao_user_id
-      AND smv.summary_type = 'daily'
-    ORDER BY smv.session_date DESC, smv.created_at DESC
+    SELECT
+        ds.ai_answer_key,
+        ds.kakao_user_id,
+        ds.summary_content,
+        'daily'::VARCHAR(20),
+        ds.updated_at,
+        ds.session_date
+    FROM daily_summaries ds
+    WHERE ds.kakao_user_id = p_kakao_user_id
+    ORDER BY ds.session_date DESC
     LIMIT p_limit;
-END;
-$$ LANGUAGE plpgsql;
+$$ LANGUAGE sql STABLE;
 
 COMMENT ON FUNCTION get_recent_daily_summaries_by_unique_dates(TEXT, INTEGER)
-IS '최근 N개의 고유 날짜별 데일리 요약 조회 (하루에 여러 요약 생성 시 최신 것만 반환)';
+IS '최근 N개의 고유 날짜별 데일리 요약 조회 (daily_summaries 기반, 날짜별 최신 요약만 반환)';
+
+-- 7-2. 기간 내 요약이 있는 날짜 목록 (주간요약 조건 체크용)
+-- 요약 본문 없이 날짜만 반환 → 대화량과 무관하게 최대 기간 일수만큼의 작은 응답
+CREATE OR REPLACE FUNCTION get_summary_dates_between(
+    p_kakao_user_id TEXT,
+    p_start_date DATE,
+    p_end_date DATE,
+    p_summary_type VARCHAR(20) DEFAULT 'daily'
+)
+RETURNS TABLE (
+    session_date DATE
+) AS $$
+    SELECT DISTINCT mh.session_date
+    FROM message_history mh
+    JOIN ai_answer_messages am ON mh.ai_answer_key = am.uuid
+    WHERE mh.kakao_user_id = p_kakao_user_id
+      AND mh.session_date BETWEEN p_start_date AND p_end_date
+      AND am.summary_type = p_summary_type
+    ORDER BY mh.session_date;
+$$ LANGUAGE sql STABLE;
+
+COMMENT ON FUNCTION get_summary_dates_between(TEXT, DATE, DATE, VARCHAR)
+IS '기간 내 summary_type 요약이 있는 고유 날짜 목록 (주간요약 평일 작성일 수 계산용)';
+
+-- 7-3. 주간요약 미리 생성 대상 (평일 데일리 요약 작성일 >= p_min_days, 이미 생성한 사용자 제외)
+-- kakao_user_id 순 keyset 페이지네이션 → 배치가 중단돼도 마지막 사용자 ID부터 이어서 조회
+CREATE OR REPLACE FUNCTION get_weekly_precompute_candidates(
+    p_week_start DATE,
+    p_week_end DATE,
+    p_min_days INTEGER,
+    p_after_user TEXT DEFAULT NULL,
+    p_limit INTEGER DEFAULT 200
+)
+RETURNS TABLE (
+    kakao_user_id TEXT,
+    weekday_count INTEGER
+) AS $$
+    SELECT ds.kakao_user_id, COUNT(*)::INTEGER
+    FROM daily_summaries ds
+    WHERE ds.session_date BETWEEN p_week_start AND p_week_end
+      AND EXTRACT(ISODOW FROM ds.session_date) <= 5
+      AND (p_after_user IS NULL OR ds.kakao_user_id > p_after_user)
+      AND NOT EXISTS (
+          SELECT 1
+          FROM weekly_v1_precomputed wp
+          WHERE wp.kakao_user_id = ds.kakao_user_id
+            AND wp.week_start = p_week_start
+      )
+    GROUP BY ds.kakao_user_id
+    HAVING COUNT(*) >= p_min_days
+    ORDER BY ds.kakao_user_id
+    LIMIT p_limit;
+$$ LANGUAGE sql STABLE;
+
+COMMENT ON FUNCTION get_weekly_precompute_candidates(DATE, DATE, INTEGER, TEXT, INTEGER)
+IS '주간요약 v1.0 미리 생성 대상 사용자 (평일 요약 작성일 수 조건, 미생성자만, kakao_user_id keyset 페이지)';
+
+-- ============================================
+-- 8. 알림톡 발송 큐 함수
+-- ============================================
+
+-- 8-1. 발송 시각이 된 알림 선점 (여러 워커/인스턴스가 동시에 호출해도 SKIP LOCKED로 중복 없음)
+-- 선점 만료(locked_until)가 지난 sending 건은 워커가 죽은 것으로 보고 다시 가져감
+CREATE OR REPLACE FUNCTION claim_notification_deliveries(
+    p_limit INTEGER DEFAULT 500,
+    p_lease_seconds INTEGER DEFAULT 120
+)
+RETURNS SETOF notification_deliveries AS $$
+    UPDATE notification_deliveries nd
+    SET status = 'sending',
+        attempts = nd.attempts + 1,
+        locked_until = NOW() + make_interval(secs => p_lease_seconds),
+        updated_at = NOW()
+    WHERE nd.id IN (
+        SELECT id
+        FROM notification_deliveries
+        WHERE status IN ('pending', 'sending')
+          AND next_attempt_at <= NOW()
+          AND (status = 'pending' OR locked_until < NOW())
+        ORDER BY next_attempt_at
+        LIMIT p_limit
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING nd.*;
+$$ LANGUAGE sql;
+
+COMMENT ON FUNCTION claim_notification_deliveries(INTEGER, INTEGER)
+IS '발송 시각이 된 알림 선점 (status=sending, attempts+1, 선점 만료 지난 건 회수)';
+
+-- 8-2. 발송 결과 일괄 기록 (배치 1건당 UPDATE 1회)
+-- p_results: [{"id", "status", "provider_message_id", "error", "next_attempt_at"}, ...]
+CREATE OR REPLACE FUNCTION record_notification_results(p_results JSONB)
+RETURNS INTEGER AS $$
+    WITH results AS (
+        SELECT *
+        FROM jsonb_to_recordset(p_results) AS r(
+            id BIGINT,
+            status VARCHAR(20),
+            provider_message_id TEXT,
+            error TEXT,
+            next_attempt_at TIMESTAMP WITH TIME ZONE
+        )
+    ),
+    updated AS (
+        UPDATE notification_deliveries nd
+        SET status = r.status,
+            provider_message_id = COALESCE(r.provider_message_id, nd.provider_message_id),
+            last_error = r.error,
+            next_attempt_at = COALESCE(r.next_attempt_at, nd.next_attempt_at),
+            locked_until = NULL,
+            sent_at = CASE WHEN r.status = 'sent' THEN NOW() ELSE nd.sent_at END,
+            updated_at = NOW()
+        FROM results r
+        WHERE nd.id = r.id
+          AND nd.status = 'sending'
+        RETURNING 1
+    )
+    SELECT COUNT(*)::INTEGER FROM updated;
+$$ LANGUAGE sql;
+
+COMMENT ON FUNCTION record_notification_results(JSONB)
+IS '알림 발송 결과 일괄 기록 (sent / failed / pending 재시도 + next_attempt_at)';
+
+-- 8-3. 상태별 알림 건수 (모니터링용)
+CREATE OR REPLACE FUNCTION get_notification_delivery_counts()
+RETURNS TABLE (
+    status VARCHAR(20),
+    count BIGINT
+) AS $$
+    SELECT nd.status, COUNT(*)
+    FROM notification_deliveries nd
+    GROUP BY nd.status;
+$$ LANGUAGE sql STABLE;
 
 -- ============================================
 -- 스키마 생성 완료!
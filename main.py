@@ -7,6 +7,21 @@ from dotenv import load_dotenv
 
 from src.chatbot.graph_manager import ChatBotManager
 from src.database import Database
+from src.service.callback import KakaoCallbackDispatcher
+from src.service.weekly import WeeklyPrecomputeScheduler
+from src.service.notification import NotificationDispatcher
+from src.service.daily import (
+    get_intent_cache_stats,
+    get_speculation_stats,
+    get_summary_prefetch_stats,
+    get_quick_reply_stats,
+    parse_quick_reply_intent,
+)
+from src.service.weekly import get_weekly_precompute_stats
+from src.utils.tracing import get_metrics, get_recent_traces
+from src.utils.llm_gateway import get_llm_gateway_stats
+from src.utils.llm_governor import get_llm_governor_stats
+from src.config.config import KAKAO_CALLBACK_ENABLED, ALIMTALK_ENABLED, ALIMTALK_DISPATCHER_IN_PROCESS
 
 # 환경 변수 로드
 load_dotenv()
@@ -28,11 +43,31 @@ async def get_js():
 # 데이터베이스 및 ChatBot 초기화
 db = Database()
 chatbot_manager = ChatBotManager(db)
+callback_dispatcher = KakaoCallbackDispatcher()
+weekly_precompute_scheduler = WeeklyPrecomputeScheduler(db)
+# 알림톡 발송은 별도 프로세스(python -m src.service.notification.dispatcher)가 기본
+# (웹 서버 워커마다 띄우면 토큰 버킷도 워커마다 생겨 발송 속도 상한이 워커 수만큼 곱해짐)
+notification_dispatcher = (
+    NotificationDispatcher(db) if ALIMTALK_ENABLED and ALIMTALK_DISPATCHER_IN_PROCESS else None
+)
 
 # 앱 시작 시 초기화
 @app.on_event("startup")
 async def startup_event():
     await chatbot_manager.initialize()
+    await callback_dispatcher.start()
+    await weekly_precompute_scheduler.start()
+    if notification_dispatcher:
+        await notification_dispatcher.start()
+
+# 앱 종료 시 정리
+@app.on_event("shutdown")
+async def shutdown_event():
+    await weekly_precompute_scheduler.stop()
+    if notification_dispatcher:
+        await notification_dispatcher.stop()
+    await callback_dispatcher.stop()
+    db.close()
 
 class ChatRequest(BaseModel):
     userId: str
@@ -59,6 +94,33 @@ async def get_status():
         "message": "3분 커리어 챗봇 서버가 정상 작동 중입니다."
     }
 
+@app.get("/metrics")
+async def metrics():
+    """지연 시간 히스토그램 (요청 / 의도 / 그래프 노드 / DB 왕복 / LLM) + 컴포넌트 통계"""
+    return {
+        **get_metrics(),
+        "components": {
+            "user_cache": db.get_user_cache_stats(),
+            "idempotency": chatbot_manager.idempotency.stats(),
+            "user_locks": chatbot_manager.user_locks.stats(),
+            "fast_path": chatbot_manager.fast_path.stats(),
+            "intent_cache": get_intent_cache_stats(),
+            "speculation": get_speculation_stats(),
+            "summary_prefetch": get_summary_prefetch_stats(),
+            "quick_replies": get_quick_reply_stats(),
+            "llm_gateway": get_llm_gateway_stats(),
+            "llm_governor": get_llm_governor_stats(),
+            "weekly_precompute": get_weekly_precompute_stats(),
+            "kakao_callback": callback_dispatcher.stats,
+            "alimtalk": notification_dispatcher.stats if notification_dispatcher else None,
+        }
+    }
+
+@app.get("/metrics/traces")
+async def recent_traces(limit: int = 20, min_ms: float = 0.0):
+    """최근 요청 트레이스 (min_ms 이상 걸린 요청만, 스팬별 시작 오프셋/소요 시간)"""
+    return get_recent_traces(limit, min_ms)
+
 @app.post("/api/chat")
 async def chat(request: ChatRequest):
     """로컬 테스트용 채팅 API"""
@@ -106,6 +168,15 @@ async def webhook(request: dict):
         user_request = request.get("userRequest")
         action = request.get("action")
 
+        # 콜백이 켜진 블록이면 5초 제한을 넘길 수 있는 처리를 백그라운드로 넘김
+        callback_url = user_request.get("callbackUrl")
+        if KAKAO_CALLBACK_ENABLED and callback_url:
+            return await callback_dispatcher.dispatch(
+                lambda: handle_webhook_request(user_request, action),
+                callback_url,
+                label=user_request["user"]["id"]
+            )
+
         response = await handle_webhook_request(user_request, action)
         return response
 
@@ -127,6 +198,10 @@ async def handle_webhook_request(user_request: dict, action: dict):
     user_id = user_request["user"]["id"]
     user_message = user_request["utterance"]
     action_name = action.get("name", "fallback")
+    # 카카오 요청 ID (전달되지 않으면 user_id + 발화로 진행 중인 같은 요청에만 합류)
+    request_id = user_request.get("requestId")
+    # 퀵리플라이 버튼의 세부 의도 (버튼 extra → action.clientExtra)
+    quick_reply_intent = parse_quick_reply_intent(action)
 
     print(f"🎯 Action: {action_name}")
     print(f"💬 User message: {user_message}")
@@ -136,7 +211,9 @@ async def handle_webhook_request(user_request: dict, action: dict):
     # ========================================
     if "test_user" in user_id:
         print("🧪 [Test User] LangGraph 워크플로우 처리")
-        response = await chatbot_manager.handle_conversation(user_id, user_message)
+        response = await chatbot_manager.handle_conversation(
+            user_id, user_message, request_id=request_id, quick_reply_intent=quick_reply_intent
+        )
         return response
 
     # ========================================
@@ -147,7 +224,8 @@ async def handle_webhook_request(user_request: dict, action: dict):
         response = await chatbot_manager.handle_conversation(
             user_id,
             user_message,
-            action_hint="onboarding"
+            action_hint="onboarding",
+            request_id=request_id
         )
         return response
 
@@ -156,7 +234,9 @@ async def handle_webhook_request(user_request: dict, action: dict):
         response = await chatbot_manager.handle_conversation(
             user_id,
             user_message,
-            action_hint="daily_record"
+            action_hint="daily_record",
+            request_id=request_id,
+            quick_reply_intent=quick_reply_intent
         )
         return response
 
@@ -165,7 +245,8 @@ async def handle_webhook_request(user_request: dict, action: dict):
         response = await chatbot_manager.handle_conversation(
             user_id,
             user_message,
-            action_hint="service_feedback"
+            action_hint="service_feedback",
+            request_id=request_id
         )
         return response
 
@@ -174,7 +255,9 @@ async def handle_webhook_request(user_request: dict, action: dict):
     # ========================================
     # router_node가 DB 기반으로 자동 판단
     print("🤖 [자연어] LangGraph 워크플로우로 자동 라우팅")
-    response = await chatbot_manager.handle_conversation(user_id, user_message)
+    response = await chatbot_manager.handle_conversation(
+        user_id, user_message, request_id=request_id, quick_reply_intent=quick_reply_intent
+    )
     return response
 
 async def handle_welcome(user_id: str):
@@ -0,0 +1,201 @@
+"""그래프 실행 전 빠른 응답 규칙 (Fast Path)
+
+일부 요청은 응답이 고정 문구로 정해져 있는데도 load_request_context(RPC) →
+OverallState 구성 → router → service_router → agent 노드를 모두 거친다.
+
+- 온보딩 완료 당일의 모든 메시지 → 차단 안내 (router_node)
+- 평일에 "주간요약" 요청 → 주말에만 가능 안내 (service_router → daily_agent)
+- 이번 주 주간요약 + 소감까지 끝난 뒤 반복 접근 → 완료 안내 (weekly_agent_node)
+
+각 규칙은 필요한 데이터(users row / conversation_state)를 선언하고, Database의 캐시
+(peek_user / peek_conversation_state)에 그 데이터가 있을 때만 평가된다. 캐시에 없거나
+조건이 하나라도 애매하면 None을 돌려 그래프로 넘긴다 → 규칙이 응답하는 경우 그래프도
+같은 문구를 돌려주고 DB에 아무것도 쓰지 않는 경우로만 한정한다.
+
+규칙은 user_id 락 안에서 평가하므로 같은 사용자의 앞선 요청이 남긴 상태를 본다.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..config import get_kst_now
+from ..prompt.onboarding_questions import format_onboarding_day_block_message
+from ..service.router.service_intent_router import WEEKLY_KEYWORDS
+from ..service.weekly.fallback_handler import format_weekday_only_message, format_weekly_completed_message
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FastPathContext:
+    """규칙 평가 입력 (캐시에서 꺼낸 데이터만, DB 접근 없음)"""
+    user_id: str
+    message: str
+    action_hint: Optional[str]
+    now: datetime  # KST
+    user: Optional[Dict[str, Any]] = None
+    conv_state: Optional[Dict[str, Any]] = None  # 행이 없으면 {}
+
+    @property
+    def temp_data(self) -> Dict[str, Any]:
+        return (self.conv_state or {}).get("temp_data") or {}
+
+
+@dataclass
+class FastPathRule:
+    """빠른 응답 규칙
+
+    Args:
+        name: 규칙 이름 (트레이스 intent / 통계 키)
+        respond: 컨텍스트 → 응답 문구 (해당 없으면 None)
+        needs: 평가에 필요한 캐시 데이터 ("user", "conv_state")
+        matches: 메시지만 보는 사전 필터 (캐시 조회 전에 걸러냄)
+    """
+    name: str
+    respond: Callable[[FastPathContext], Optional[str]]
+    needs: Tuple[str, ...] = ()
+    matches: Callable[[str], bool] = field(default=lambda message: True)
+
+
+def _onboarding_completed_today(user: Dict[str, Any]) -> Optional[bool]:
+    """온보딩 완료 당일 여부 (router_node와 같은 기준, 판단 불가면 None)"""
+    completed_at = user.get("onboarding_completed_at")
+    if not completed_at:
+        return False
+    try:
+        completed = completed_at if isinstance(completed_at, datetime) else datetime.fromisoformat(completed_at)
+    except (TypeError, ValueError):
+        return None
+    return completed.date() == datetime.now().date()
+
+
+def _serviceable(ctx: FastPathContext) -> bool:
+    """온보딩 완료 + 완료 당일 아님 + 주간 QnA 세션 진행 중 아님 → service_router로 가는 사용자"""
+    user = ctx.user or {}
+    if not user.get("onboarding_completed"):
+        return False
+    if _onboarding_completed_today(user) is not False:
+        return False
+    return not ctx.temp_data.get("weekly_qna_session", {}).get("active")
+
+
+def _is_weekly_request(message: str) -> bool:
+    message_lower = message.lower().strip()
+    return any(keyword in message_lower for keyword in WEEKLY_KEYWORDS)
+
+
+def onboarding_day_block(ctx: FastPathContext) -> Optional[str]:
+    """온보딩 완료 당일 → 업무기록 차단 안내"""
+    user = ctx.user or {}
+    if user.get("onboarding_completed") and _onboarding_completed_today(user):
+        return format_onboarding_day_block_message(user.get("name"))
+    return None
+
+
+def weekly_weekday_only(ctx: FastPathContext) -> Optional[str]:
+    """평일 주간요약 요청 → 주말에만 가능 안내"""
+    if ctx.now.weekday() >= 5 or not _serviceable(ctx):
+        return None
+
+    temp_data = ctx.temp_data
+    current_week = ctx.now.isocalendar()[1]
+    if temp_data.get("weekly_completed_week") == current_week:
+        return None  # 완료 후 반복 접근 → weekly_agent_node
+    if temp_data.get("weekly_summary_ready") or (ctx.conv_state or {}).get("current_step") == "weekly_summary_pending":
+        return None  # 주간요약 제안 응답 → 수락/거절 분류
+
+    # 날짜가 바뀌었으면 daily_agent_node가 카운트 리셋을 먼저 하므로 그래프로 보냄
+    last_record_date = (ctx.user or {}).get("last_record_date")
+    if last_record_date and last_record_date != datetime.now().date().isoformat():
+        return None
+
+    return format_weekday_only_message()
+
+
+def weekly_completed_repeat(ctx: FastPathContext) -> Optional[str]:
+    """이번 주 주간요약 완료 + 소감 저장 후 반복 접근 → 완료 안내"""
+    if not _serviceable(ctx):
+        return None
+    temp_data = ctx.temp_data
+    if temp_data.get("weekly_completed_week") != ctx.now.isocalendar()[1]:
+        return None
+    if not temp_data.get("user_shared_weekly_thoughts"):
+        return None  # 첫 응답은 소감으로 저장해야 함
+    return format_weekly_completed_message()
+
+
+DEFAULT_RULES: List[FastPathRule] = [
+    FastPathRule("onboarding_day_block", onboarding_day_block, needs=("user",)),
+    FastPathRule("weekly_weekday_only", weekly_weekday_only, needs=("user", "conv_state"), matches=_is_weekly_request),
+    FastPathRule("weekly_completed_repeat", weekly_completed_repeat, needs=("user", "conv_state")),
+]
+
+
+class FastPathEngine:
+    """규칙을 순서대로 평가해 첫 응답을 반환
+
+    앞 규칙에 필요한 데이터가 캐시에 없으면 뒤 규칙도 평가하지 않는다
+    (그래프에서는 앞 분기가 먼저 처리하므로 뒤 규칙만 보고 응답하면 결과가 달라질 수 있음).
+
+    Args:
+        db: Database 인스턴스 (peek_user / peek_conversation_state만 사용)
+        rules: 평가할 규칙 목록 (기본: DEFAULT_RULES)
+    """
+
+    def __init__(self, db, rules: Optional[List[FastPathRule]] = None):
+        self.db = db
+        self.rules = list(DEFAULT_RULES if rules is None else rules)
+        self.evaluated = 0
+        self.misses = 0
+        self.skipped_uncached = 0
+        self.hits: Dict[str, int] = {rule.name: 0 for rule in self.rules}
+
+    def _load(self, ctx: FastPathContext, needs: Tuple[str, ...]) -> bool:
+        """필요한 데이터를 캐시에서 채움 (하나라도 없으면 False)"""
+        if "user" in needs and ctx.user is None:
+            ctx.user = self.db.peek_user(ctx.user_id)
+            if ctx.user is None:
+                return False
+        if "conv_state" in needs and ctx.conv_state is None:
+            ctx.conv_state = self.db.peek_conversation_state(ctx.user_id)
+            if ctx.conv_state is None:
+                return False
+        return True
+
+    def evaluate(self, user_id: str, message: str, action_hint: Optional[str] = None) -> Optional[Tuple[str, str]]:
+        """빠른 응답 규칙 평가
+
+        Returns:
+            (규칙 이름, 응답 문구) 또는 None (그래프로 처리)
+        """
+        self.evaluated += 1
+        ctx = FastPathContext(user_id=user_id, message=message or "", action_hint=action_hint, now=get_kst_now())
+
+        for rule in self.rules:
+            if not rule.matches(ctx.message):
+                continue
+            if not self._load(ctx, rule.needs):
+                self.skipped_uncached += 1
+                break
+            try:
+                reply = rule.respond(ctx)
+            except Exception as e:
+                logger.warning(f"[FastPath] 규칙 평가 실패 ({rule.name}): {e}")
+                break
+            if reply is not None:
+                self.hits[rule.name] = self.hits.get(rule.name, 0) + 1
+                logger.info(f"[FastPath] ⚡ {rule.name} - user_id={user_id}")
+                return rule.name, reply
+
+        self.misses += 1
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "evaluated": self.evaluated,
+            "hits": dict(self.hits),
+            "misses": self.misses,
+            "skipped_uncached": self.skipped_uncached,
+        }
@@ -1,17 +1,24 @@
 """
-그래프 관리 모듈 - 유저별 워크플로우 관리
+그래프 관리 모듈 - 공유 워크플로우 및 요청 캐시 관리
 """
 
 from typing import Dict, Optional, Tuple, Any
+import asyncio
 import logging
-from datetime import datetime
 from langgraph.graph.state import CompiledStateGraph
 
 from .workflow import build_workflow_graph
 from ..utils.models import get_chat_llm, get_onboarding_llm
 from ..utils.utils import simple_text_response
 from .state import OnboardingResponse, OverallState, UserContext, UserMetadata, OnboardingStage
-from ..database.user_repository import get_user_with_context
+from ..database.user_repository import load_request_context
+from ..database.state_session import ConversationStateSession
+from .idempotency import IdempotencyGuard, make_idempotency_key
+from .user_lock import UserLockManager
+from .fast_path import FastPathEngine
+from ..service.daily.local_intent_classifier import get_local_intent_classifier
+from ..config.config import LOCAL_INTENT_CLASSIFIER_ENABLED, FAST_PATH_ENABLED
+from ..utils.tracing import start_trace, set_trace_attribute
 from langchain_google_vertexai import ChatVertexAI
 import os
 
@@ -19,57 +26,60 @@ logger = logging.getLogger(__name__)
 
 
 class GraphManager:
-    """유저별 그래프 인스턴스 및 요청 내 캐시 관리"""
+    """공유 그래프 인스턴스 및 요청 내 캐시 관리
+
+    그래프는 요청 간 상태를 갖지 않으므로(카카오톡은 stateless, checkpointer 없음)
+    그래프 타입별로 한 번만 컴파일하고 모든 유저가 공유한다.
+    유저별 상태는 매 요청 load_request_cache()로 OverallState에 주입된다.
+    """
 
     def __init__(self, database):
         self.db = database
-        self.user_graphs: Dict[str, CompiledStateGraph] = {}
         self.graph_types: Dict[str, CompiledStateGraph] = {}
+        self._compile_lock = asyncio.Lock()
 
-    async def init_all_graphs(self):
-        """모든 그래프 타입 초기화"""
-        try:
+    def _build_graph(self, graph_type: str) -> CompiledStateGraph:
+        """그래프 타입별 컴파일"""
+        if graph_type == "main":
             # 온보딩용 LLM (structured output, 캐시됨)
             onboarding_llm = get_onboarding_llm().with_structured_output(OnboardingResponse)
 
             # 서비스용 LLM (일반 채팅, 캐시됨)
             service_llm = get_chat_llm()
 
-            main_graph = build_workflow_graph(self.db, onboarding_llm, service_llm)
-            self.graph_types["main"] = main_graph
+            return build_workflow_graph(self.db, onboarding_llm, service_llm)
 
+        raise ValueError(f"지원하지 않는 그래프 타입: {graph_type}")
+
+    async def init_all_graphs(self):
+        """모든 그래프 타입 초기화 (앱 시작 시 1회 컴파일)"""
+        try:
+            self.graph_types["main"] = self._build_graph("main")
             logger.info("모든 그래프 타입 초기화 완료")
 
         except Exception as e:
             logger.error(f"그래프 초기화 실패: {e}")
             raise
 
-    def get_or_create_user_graph(self, user_id: str, graph_type: str = "main") -> CompiledStateGraph:
-        """유저별 그래프를 가져오거나 생성"""
-        user_graph_key = f"{user_id}_{graph_type}"
+    async def get_graph(self, graph_type: str = "main") -> CompiledStateGraph:
+        """공유 그래프 반환 (초기화 전이면 1회만 컴파일)"""
+        graph = self.graph_types.get(graph_type)
+        if graph is not None:
+            return graph
 
-        if user_graph_key not in self.user_graphs:
-            # 베이스 그래프를 복사하여 유저별 그래프 생성
-            base_graph = self.graph_types.get(graph_type)
-            if not base_graph:
-                raise ValueError(f"지원하지 않는 그래프 타입: {graph_type}")
+        async with self._compile_lock:
+            if graph_type not in self.graph_types:
+                self.graph_types[graph_type] = self._build_graph(graph_type)
+                logger.info(f"그래프 컴파일 완료: {graph_type}")
 
-            # 새로운 그래프 컴파일 (카카오톡은 stateless이므로 checkpointer 불필요)
-            if graph_type == "main":
-                # 온보딩용 LLM (캐시됨)
-                onboarding_llm = get_onboarding_llm().with_structured_output(OnboardingResponse)
+        return self.graph_types[graph_type]
 
-                # 서비스용 LLM (캐시됨)
-                service_llm = get_chat_llm()
-
-                user_graph = build_workflow_graph(self.db, onboarding_llm, service_llm)
-            else:
-                user_graph = base_graph
-
-            self.user_graphs[user_graph_key] = user_graph
-            logger.info(f"유저 그래프 생성: {user_id} ({graph_type})")
-
-        return self.user_graphs[user_graph_key]
+    def get_graph_stats(self) -> Dict[str, Any]:
+        """컴파일된 그래프 현황 (유저 수와 무관하게 그래프 타입 수만큼 유지)"""
+        return {
+            "compiled_graphs": len(self.graph_types),
+            "graph_types": list(self.graph_types.keys())
+        }
 
     async def load_request_cache(
         self,
@@ -88,15 +98,11 @@ class GraphManager:
         Returns:
             (user_context, conv_state, today_turns)
         """
-        # 사용자 정보 + UserContext 로드
-        user, user_context = await get_user_with_context(self.db, user_id)
-
-        # conversation_state 조회
-        conv_state = await self.db.get_conversation_state(user_id)
-
-        # 오늘 대화 히스토리 조회 (최근 3턴만, 요약 생성 시 전체 재조회)
-        today = datetime.now().date().isoformat()
-        today_turns = await self.db.get_conversation_history_by_date_v2(user_id, today, limit=3)
+        # 사용자 + conversation_state + 마지막 대화 날짜 + 오늘 최근 3턴 (RPC 1회)
+        # (요약 생성 시에는 오늘 대화 전체 재조회)
+        user, user_context, conv_state, today_turns = await load_request_context(
+            self.db, user_id, turn_limit=3
+        )
 
         logger.info(
             f"[GraphManager] 캐시 로드 완료 - "
@@ -113,10 +119,18 @@ class ChatBotManager:
     def __init__(self, database):
         self.db = database
         self.graph_manager = GraphManager(database)
+        self.idempotency = IdempotencyGuard()
+        self.user_locks = UserLockManager()
+        self.fast_path = FastPathEngine(database)
 
     async def initialize(self):
         """챗봇 매니저 초기화"""
         await self.graph_manager.init_all_graphs()
+
+        # 로컬 의도 분류기 사전 학습 (첫 요청 지연 방지)
+        if LOCAL_INTENT_CLASSIFIER_ENABLED:
+            get_local_intent_classifier()
+
         logger.info("ChatBotManager 초기화 완료")
 
     async def get_user_info(self, user_id: str) -> Dict:
@@ -124,15 +138,72 @@ class ChatBotManager:
         user = await self.db.get_user(user_id)
         return user if user else {}
 
-    async def handle_conversation(self, user_id: str, message: str, action_hint: str = None) -> Dict:
-        """대화 처리 - 워크플로우 진입점"""
-        try:
-            # ✅ 캐싱된 그래프 가져오기 (없으면 생성)
-            graph = self.graph_manager.get_or_create_user_graph(user_id, graph_type="main")
-
-            # ✅ 요청 캐시 데이터 로드 (DB 쿼리 1회로 모든 필요 데이터 확보)
-            user_context, conv_state, today_turns = await self.graph_manager.load_request_cache(user_id)
-
+    async def handle_conversation(
+        self,
+        user_id: str,
+        message: str,
+        action_hint: str = None,
+        request_id: Optional[str] = None,
+        quick_reply_intent: Optional[str] = None
+    ) -> Dict:
+        """대화 처리 - 워크플로우 진입점
+
+        카카오 재시도로 같은 요청이 다시 들어오면 그래프를 다시 실행하지 않고
+        진행 중인 실행에 합류하거나 캐시된 응답을 돌려준다.
+        서로 다른 메시지라도 같은 사용자의 요청은 user_id 락으로 순서대로 처리한다.
+        요청 단위 트레이스(노드/DB/LLM 스팬)는 /metrics로 집계된다.
+        퀵리플라이 버튼 요청은 quick_reply_intent로 세부 의도를 받아 의도 분류를 생략한다.
+        """
+        key = make_idempotency_key(user_id, message, action_hint, request_id, quick_reply_intent)
+        with start_trace(request_id, user_id=user_id, action_hint=action_hint):
+            try:
+                return await self.idempotency.run(
+                    key,
+                    lambda: self._run_conversation(user_id, message, action_hint, quick_reply_intent)
+                )
+
+            except Exception as e:
+                logger.error(f"대화 처리 실패: {e}")
+                import traceback
+                traceback.print_exc()
+                return simple_text_response("대화 처리 중 오류가 발생했습니다.")
+
+    async def _run_conversation(
+        self,
+        user_id: str,
+        message: str,
+        action_hint: str = None,
+        quick_reply_intent: Optional[str] = None
+    ) -> Dict:
+        """그래프 1회 실행 (예외는 호출자에게 전달 → 실패 응답은 캐시하지 않음)"""
+        # ✅ 같은 사용자 요청 직렬화 (캐시 로드부터 상태 flush까지 한 번에 한 요청만)
+        async with self.user_locks.acquire(user_id):
+            # ⚡ 캐시만으로 응답이 정해지는 요청은 컨텍스트 로드/그래프 실행 없이 응답
+            if FAST_PATH_ENABLED:
+                fast = self.fast_path.evaluate(user_id, message, action_hint)
+                if fast:
+                    rule_name, reply = fast
+                    set_trace_attribute("intent", f"fast_path:{rule_name}")
+                    return simple_text_response(reply)
+
+            return await self._invoke_graph(user_id, message, action_hint, quick_reply_intent)
+
+    async def _invoke_graph(
+        self,
+        user_id: str,
+        message: str,
+        action_hint: str = None,
+        quick_reply_intent: Optional[str] = None
+    ) -> Dict:
+        """요청 캐시 로드 → 그래프 실행 → 응답 생성"""
+        # ✅ 공유 그래프 가져오기 (유저별 컴파일 없음)
+        graph = await self.graph_manager.get_graph("main")
+
+        # ✅ 요청 캐시 데이터 로드 (DB 쿼리 1회로 모든 필요 데이터 확보)
+        user_context, conv_state, today_turns = await self.graph_manager.load_request_cache(user_id)
+
+        # ✅ 요청 단위 상태 세션: temp_data 변경을 모아 요청 종료 시 upsert 1회
+        async with ConversationStateSession(self.db, user_id, conv_state):
             # 초기 상태 구성 (캐시 데이터 포함)
             initial_state = OverallState(
                 user_id=user_id,
@@ -144,22 +215,24 @@ class ChatBotManager:
                 conversation_history=[],
                 conversation_summary="",
                 action_hint=action_hint,  # 카카오톡 버튼 힌트
+                quick_reply_intent=quick_reply_intent,  # 퀵리플라이 버튼 의도
+                quick_replies=None,  # daily_agent에서 설정
                 cached_conv_state=conv_state,  # ✅ 캐시된 대화 상태
-                cached_today_turns=today_turns  # ✅ 캐시된 오늘 대화 (최근 3턴)
+                cached_today_turns=today_turns,  # ✅ 캐시된 오늘 대화 (최근 3턴)
+                speculative_reply=None  # service_router에서 추측 실행 시 설정
             )
 
             # 워크플로우 실행
             final_state = await graph.ainvoke(initial_state)
 
-            # 최종 응답 반환
-            ai_response = final_state.get("ai_response", "응답 생성 중 오류가 발생했습니다.")
-            return simple_text_response(ai_response)
+        # 의도별 지연 시간 집계용 (온보딩은 user_intent 없음)
+        user_intent = final_state.get("user_intent") or "onboarding"
+        classified_intent = final_state.get("classified_intent")
+        set_trace_attribute("intent", f"{user_intent}:{classified_intent}" if classified_intent else user_intent)
 
-        except Exception as e:
-            logger.error(f"대화 처리 실패: {e}")
-            import traceback
-            traceback.print_exc()
-            return simple_text_response("대화 처리 중 오류가 발생했습니다.")
+        # 최종 응답 반환
+        ai_response = final_state.get("ai_response", "응답 생성 중 오류가 발생했습니다.")
+        return simple_text_response(ai_response, final_state.get("quick_replies"))
 
 
 # 싱글톤 인스턴스는 main.py에서 생성
\ No newline at end of file
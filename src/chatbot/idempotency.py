@@ -0,0 +1,84 @@
+"""웹훅 멱등성 처리 - 카카오 재시도 요청 중복 실행 방지
+
+응답이 늦으면 카카오는 같은 발화를 다시 보낸다. 재시도 요청이 그래프를 다시 돌리면
+LLM 호출, save_conversation_turn, 카운트 증가가 모두 중복되므로:
+
+- 실행 중인 요청과 같은 키 → 기존 실행에 합류해 같은 응답을 받음 (SingleFlight)
+- 이미 끝난 요청과 같은 요청 ID (IDEMPOTENCY_TTL 이내) → 캐시된 응답 반환 (TTLCache)
+
+키는 카카오 요청 ID가 있으면 그것을, 없으면 (user_id, action_hint, 퀵리플라이 의도, utterance)를 쓴다.
+발화 키는 진행 중 합류에만 쓰고 완료 응답은 캐시하지 않는다 - 새 질문에 대한 두 번째 "응"은
+같은 발화라도 새 요청이므로 다시 처리해야 한다.
+"""
+
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+from ..config.config import IDEMPOTENCY_TTL, IDEMPOTENCY_CACHE_SIZE
+from ..utils.cache import TTLCache, SingleFlight
+
+logger = logging.getLogger(__name__)
+
+
+def make_idempotency_key(
+    user_id: str,
+    message: str,
+    action_hint: Optional[str] = None,
+    request_id: Optional[str] = None,
+    quick_reply_intent: Optional[str] = None
+) -> Hashable:
+    """중복 요청 판별 키 생성"""
+    if request_id:
+        return ("request", request_id)
+    return ("utterance", user_id, action_hint or "", quick_reply_intent or "", (message or "").strip())
+
+
+def _is_cacheable(key: Hashable) -> bool:
+    """완료 응답을 캐시할 키인지 (요청 ID 키만)"""
+    return isinstance(key, tuple) and key[0] == "request"
+
+
+class IdempotencyGuard:
+    """진행 중 요청 합류 + 완료 응답 TTL 캐시 (요청 ID 키만)
+
+    Args:
+        ttl: 완료된 응답을 재사용하는 시간 (초)
+        maxsize: 응답 캐시 최대 항목 수
+    """
+
+    def __init__(self, ttl: float = IDEMPOTENCY_TTL, maxsize: int = IDEMPOTENCY_CACHE_SIZE):
+        self._responses = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._inflight = SingleFlight()
+
+    async def run(self, key: Hashable, fn: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """중복이면 기존 결과를, 아니면 fn()을 실행하고 결과를 캐시
+
+        fn()이 예외를 던지면 캐시하지 않는다 (재시도가 다시 실행될 수 있도록).
+        발화 키는 캐시하지 않고 진행 중인 실행에만 합류한다.
+        """
+        if not _is_cacheable(key):
+            if self._inflight.is_running(key):
+                logger.info(f"[Idempotency] 중복 요청 - 진행 중인 실행에 합류: {key}")
+            return await self._inflight.do(key, fn)
+
+        cached = self._responses.get(key)
+        if cached is not None:
+            logger.info(f"[Idempotency] 중복 요청 - 캐시 응답 반환: {key}")
+            return cached
+
+        if self._inflight.is_running(key):
+            logger.info(f"[Idempotency] 중복 요청 - 진행 중인 실행에 합류: {key}")
+            return await self._inflight.do(key, fn)
+
+        async def run_and_cache():
+            response = await fn()
+            self._responses.set(key, response)
+            return response
+
+        return await self._inflight.do(key, run_and_cache)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self._responses.stats(),
+            "joined_inflight": self._inflight.joined,
+        }
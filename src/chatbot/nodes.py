@@ -10,8 +10,8 @@ from ..service.onboarding import (
     extract_field_value,
     save_onboarding_conversation
 )
-from ..utils.models import get_chat_llm, get_summary_llm
 from ..service.router.message_enhancer import extract_last_bot_message
+from ..prompt.onboarding_questions import format_onboarding_day_block_message
 from ..utils.utils import (
     format_conversation_history,
     error_command,
@@ -61,7 +61,7 @@ async def router_node(state: OverallState, db) -> Command[Literal["onboarding_ag
                 if onboarding_completed_date == today:
                     logger.info(f"[RouterNode] 🚫 온보딩 완료 당일 (completed={onboarding_completed_date}, today={today}) - 일일기록 차단")
                     user_name = user_context.metadata.name if user_context.metadata else None
-                    blocking_message = f"{user_name}님, 내일부터 업무기록을 시작할 수 있어요. 잊지 않도록 <3분커리어>가 알림할게요!" if user_name else "내일부터 업무기록을 시작할 수 있어요. 잊지 않도록 <3분커리어>가 알림할게요!"
+                    blocking_message = format_onboarding_day_block_message(user_name)
                     return Command(update={"ai_response": blocking_message}, goto="__end__")
 
             logger.info(f"[RouterNode] ✅ 온보딩 완료 → service_router_node로 라우팅")
@@ -91,9 +91,11 @@ async def service_router_node(state: OverallState, llm, db) -> Command[Literal["
     logger.info(f"🔀 [ServiceRouter] 시작")
 
     from ..service import route_user_intent
+    from ..service.daily import start_speculative_reply
 
     message = state["message"]
     user_context = state["user_context"]
+    quick_reply_intent = state.get("quick_reply_intent")
 
     # 캐시된 데이터 사용
     cached_conv_state = state.get("cached_conv_state")
@@ -110,11 +112,22 @@ async def service_router_node(state: OverallState, llm, db) -> Command[Literal["
             else message
         )
 
-        # 비즈니스 로직: 의도 분류 + 라우팅 결정 (service 레이어)
-        route, user_intent, classified_intent = await route_user_intent(
-            enhanced_message, llm, user_context, db, cached_conv_state
+        # (opt-in) 의도 분류와 병렬로 일반 대화 응답 생성 시작 - continue가 아니면 폐기
+        # (퀵리플라이 버튼이면 분류를 생략하므로 병렬화할 것이 없음)
+        speculation = None if quick_reply_intent else start_speculative_reply(
+            message, enhanced_message, user_context, cached_today_turns, llm, cached_conv_state
         )
 
+        # 비즈니스 로직: 의도 분류 + 라우팅 결정 (service 레이어)
+        try:
+            route, user_intent, classified_intent = await route_user_intent(
+                enhanced_message, llm, user_context, db, cached_conv_state, quick_reply_intent
+            )
+        except Exception:
+            if speculation:
+                speculation.discard("router_error")
+            raise
+
         # Command 생성
         logger.info(f"[ServiceRouter] 🔍 route={route}, user_intent={user_intent}, classified_intent={classified_intent}")
 
@@ -125,6 +138,12 @@ async def service_router_node(state: OverallState, llm, db) -> Command[Literal["
         else:
             logger.warning(f"[ServiceRouter] ⚠️ classified_intent가 None! route={route}")
 
+        if speculation:
+            if route == "daily_agent_node" and classified_intent == "continue":
+                update["speculative_reply"] = speculation
+            else:
+                speculation.discard(f"route={route}, intent={classified_intent}")
+
         logger.info(f"[ServiceRouter] ✅ Command 반환 - goto={route}")
         return Command(update=update, goto=route)
 
@@ -246,7 +265,7 @@ async def onboarding_agent_node(state: OverallState, db, llm) -> Command[Literal
 # =============================================================================
 
 @traceable(name="daily_agent_node")
-async def daily_agent_node(state: OverallState, db) -> Command[Literal["__end__", "weekly_agent_node"]]:
+async def daily_agent_node(state: OverallState, db, llm) -> Command[Literal["__end__", "weekly_agent_node"]]:
     """일일 기록 대화 처리 (비즈니스 로직은 service 레이어로 분리)
 
     Orchestration:
@@ -265,6 +284,7 @@ async def daily_agent_node(state: OverallState, db) -> Command[Literal["__end__"
 
     # 캐시된 데이터 사용
     cached_today_turns = state.get("cached_today_turns")
+    speculative_reply = state.get("speculative_reply")
 
     logger.info(f"[DailyAgent] user_id={user_id}, message={message[:50]}")
     logger.info(f"[DailyAgent] 🔍 state.user_intent={state.get('user_intent')}")
@@ -290,8 +310,6 @@ async def daily_agent_node(state: OverallState, db) -> Command[Literal["__end__"
             user_context.daily_record_count = 0
             user_context.attendance_count = current_attendance
 
-        llm = get_chat_llm()
-
         # ========================================
         # 2. 의도 가져오기 (service_router에서 전달받음)
         # ========================================
@@ -311,23 +329,24 @@ async def daily_agent_node(state: OverallState, db) -> Command[Literal["__end__"
             user_intent=user_intent,
             user_context=user_context,
             cached_today_turns=today_turns,
-            llm=llm
+            llm=llm,
+            speculative_reply=speculative_reply
         )
 
         # 조기 종료 필요 시 (7일차 제안 등)
         if result.early_return:
-            return Command(update={"ai_response": result.ai_response, "user_context": user_context}, goto="__end__")
+            return Command(update={"ai_response": result.ai_response, "user_context": user_context, "quick_replies": result.quick_replies}, goto="__end__")
 
         # ========================================
         # 4. 대화 저장 + 카운트 증가 + 세션 업데이트 (service 레이어)
         # ========================================
         updated_daily_count, new_attendance = await save_daily_conversation(
-            db, user_id, message, result, user_context
+            db, user_id, message, result, user_context, llm
         )
 
         logger.info(f"[DailyAgent] 완료: daily_record_count={updated_daily_count}")
 
-        return Command(update={"ai_response": result.ai_response, "user_context": user_context}, goto="__end__")
+        return Command(update={"ai_response": result.ai_response, "user_context": user_context, "quick_replies": result.quick_replies}, goto="__end__")
 
     except Exception as e:
         logger.error(f"[DailyAgent] Error: {e}")
@@ -339,12 +358,17 @@ async def daily_agent_node(state: OverallState, db) -> Command[Literal["__end__"
 
         return Command(update={"ai_response": fallback_response}, goto="__end__")
 
+    finally:
+        # 일반 대화로 처리되지 않았으면 추측 응답 폐기 (채택된 경우 무시됨)
+        if speculative_reply:
+            speculative_reply.discard("daily_agent_unused")
+
 
 # 5. Weekly Agent Node - 주간 피드백 생성 (7일차 자동 or 사용자 수동 요청)
 # =============================================================================
 
 @traceable(name="weekly_agent_node")
-async def weekly_agent_node(state: OverallState, db) -> Command[Literal["__end__"]]:
+async def weekly_agent_node(state: OverallState, db, llm) -> Command[Literal["__end__"]]:
     """주간 피드백 생성 및 DB 저장 (세션 기반 분기)
 
     호출 경로:
@@ -357,6 +381,7 @@ async def weekly_agent_node(state: OverallState, db) -> Command[Literal["__end__
         handle_weekly_v1_request,
         handle_weekly_qna_response
     )
+    from ..service.weekly.fallback_handler import format_weekly_completed_message
 
     user_id = state["user_id"]
     message = state["message"]
@@ -365,9 +390,6 @@ async def weekly_agent_node(state: OverallState, db) -> Command[Literal["__end__
 
     logger.info(f"[WeeklyAgent] user_id={user_id}, message={message[:50]}")
 
-    # LLM 인스턴스 가져오기 (캐시됨)
-    llm = get_chat_llm()
-
     try:
         # 세션 상태 확인
         conv_state = await db.get_conversation_state(user_id)
@@ -413,7 +435,7 @@ async def weekly_agent_node(state: OverallState, db) -> Command[Literal["__end__
                 else:
                     # 이미 소감 남김 → 완료 메시지 반복
                     logger.info(f"[WeeklyAgent] v2.0 완료 후 반복 접근 → 완료 메시지")
-                    ai_response = "이번 주 주간요약이 완료되었어요! 다음 주에도 열심히 기록해봐요! 😊"
+                    ai_response = format_weekly_completed_message()
 
                 return Command(update={"ai_response": ai_response}, goto="__end__")
 
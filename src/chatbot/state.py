@@ -112,11 +112,16 @@ class OverallState(TypedDict):
     conversation_history: List[BaseMessage]
     conversation_summary: str
     action_hint: Optional[str]  # 카카오톡 버튼 힌트 ("onboarding", "daily_record", "service_feedback")
+    quick_reply_intent: Optional[str]  # 퀵리플라이 버튼의 세부 의도 (있으면 의도 분류 생략)
+    quick_replies: Optional[List[Dict[str, Any]]]  # 응답에 붙일 퀵리플라이 버튼
 
     # DB 쿼리 캐시 (한 요청 내에서 재사용)
     cached_conv_state: Optional[Dict[str, Any]]  # ConversationStateSchema
     cached_today_turns: Optional[List[Dict[str, Any]]]  # 오늘 대화 목록 (요약 시 전체, 일반 대화 시 최근 3턴)
 
+    # 의도 분류와 병렬로 시작한 일반 대화 응답 (SpeculativeReply, service_router → daily_agent 전달)
+    speculative_reply: Optional[Any]
+
 
 @dataclass
 class ConversationState:
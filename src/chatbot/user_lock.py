@@ -0,0 +1,66 @@
+"""사용자별 요청 직렬화 - user_id 키 비동기 락
+
+같은 사용자의 메시지가 연달아 들어오면 두 요청이 같은 conv_state / daily_session_data를
+읽고 마지막 쓰기만 남는다. user_id별 asyncio.Lock으로 같은 사용자 요청은 도착 순서대로
+하나씩 처리하고, 다른 사용자 요청은 그대로 병렬 실행한다.
+
+락은 WeakValueDictionary에 보관하므로 대기/실행 중인 요청이 없으면 자동으로 사라진다
+(활성 사용자 수만큼만 메모리 사용).
+"""
+
+import asyncio
+import logging
+import time
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict
+
+logger = logging.getLogger(__name__)
+
+# 이 시간 이상 대기하면 경고 로그
+SLOW_WAIT_WARNING_SECONDS = 1.0
+
+
+class UserLockManager:
+    """user_id별 비동기 락 관리 + 대기 시간 지표"""
+
+    def __init__(self):
+        self._locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+        self.acquisitions = 0
+        self.contended = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _get_lock(self, user_id: str) -> asyncio.Lock:
+        lock = self._locks.get(user_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[user_id] = lock
+        return lock
+
+    @asynccontextmanager
+    async def acquire(self, user_id: str) -> AsyncIterator[None]:
+        """같은 user_id의 요청을 도착 순서대로 하나씩 실행 (asyncio.Lock은 FIFO)"""
+        lock = self._get_lock(user_id)
+        was_locked = lock.locked()
+        start = time.monotonic()
+
+        async with lock:
+            waited = time.monotonic() - start
+            self.acquisitions += 1
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+            if was_locked:
+                self.contended += 1
+                log = logger.warning if waited >= SLOW_WAIT_WARNING_SECONDS else logger.info
+                log(f"[UserLock] 같은 사용자 요청 대기 후 실행 - user_id={user_id}, 대기 {waited:.2f}초")
+            yield
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "active_users": len(self._locks),
+            "acquisitions": self.acquisitions,
+            "contended": self.contended,
+            "avg_wait": round(self.total_wait / self.acquisitions, 4) if self.acquisitions else 0.0,
+            "max_wait": round(self.max_wait, 4),
+        }
@@ -6,6 +6,7 @@ from functools import partial
 from langgraph.graph import StateGraph
 from .state import OverallState
 from . import nodes
+from ..utils.tracing import trace_node
 
 
 def build_workflow_graph(db, onboarding_llm, service_llm) -> StateGraph:
@@ -24,21 +25,21 @@ def build_workflow_graph(db, onboarding_llm, service_llm) -> StateGraph:
     # StateGraph 생성
     workflow = StateGraph(OverallState)
 
-    # 노드 추가 (memory_manager 제거, database 직접 사용)
+    # 노드 추가 (memory_manager 제거, database 직접 사용, 노드별 지연 시간 계측)
     workflow.add_node("router_node",
-                     partial(nodes.router_node, db=db))
+                     trace_node("router_node", partial(nodes.router_node, db=db)))
 
     workflow.add_node("service_router_node",
-                     partial(nodes.service_router_node, llm=service_llm, db=db))
+                     trace_node("service_router_node", partial(nodes.service_router_node, llm=service_llm, db=db)))
 
     workflow.add_node("onboarding_agent_node",
-                     partial(nodes.onboarding_agent_node, db=db, llm=onboarding_llm))
+                     trace_node("onboarding_agent_node", partial(nodes.onboarding_agent_node, db=db, llm=onboarding_llm)))
 
     workflow.add_node("daily_agent_node",
-                     partial(nodes.daily_agent_node, db=db))
+                     trace_node("daily_agent_node", partial(nodes.daily_agent_node, db=db, llm=service_llm)))
 
     workflow.add_node("weekly_agent_node",
-                     partial(nodes.weekly_agent_node, db=db))
+                     trace_node("weekly_agent_node", partial(nodes.weekly_agent_node, db=db, llm=service_llm)))
 
     # 시작점 설정
     workflow.set_entry_point("router_node")
@@ -18,3 +18,101 @@ SUMMARY_MODEL_NAME = "gemini-2.5-flash-lite"
 SUMMARY_TEMPERATURE = 0.0
 SUMMARY_MAX_TOKENS = 400  # 한글 900자 이내 목표 (여유 확보, 강제 종료 방지)
 SUMMARY_TIMEOUT = 10.0
+
+# LLM 게이트웨이 설정 (get_*_llm 뒤에서 공급자 선택 + 역할별 마감 시간 + 헤징 + 장애 전환)
+LLM_GATEWAY_ENABLED = True
+LLM_PROVIDERS = ["vertex", "openai"]  # 기본 우선순위 (openai는 OPENAI_API_KEY가 있을 때만 사용, "fake"는 오프라인 테스트용)
+OPENAI_MODEL_NAME = "gpt-4.1-mini"  # 장애 전환용 OpenAI 모델 (역할별 temperature / max tokens는 위 설정 사용)
+LLM_PROVIDER_MAX_RETRIES = 0  # 공급자 클라이언트 자체 재시도 (재시도 백오프가 마감 시간을 다 쓰지 않도록 게이트웨이가 장애 전환)
+LLM_EWMA_ALPHA = 0.2  # 지연 시간 / 오류율 EWMA 가중치 (클수록 최근 호출 반영이 빠름)
+LLM_ERROR_RATE_THRESHOLD = 0.5  # 오류율 EWMA가 이 값 이상이면 공급자를 잠시 후순위로
+LLM_COOLDOWN_SECONDS = 30.0  # 후순위 유지 시간 (이후 다시 지연 시간 순으로 선택)
+LLM_HEDGE_ENABLED = False  # 응답이 p95보다 늦으면 다음 공급자로 같은 요청을 한 번 더 보냄 (호출 비용 증가)
+LLM_HEDGE_MIN_SAMPLES = 20  # p95를 신뢰할 최소 성공 샘플 수 (부족하면 LLM_HEDGE_DEFAULT_DELAY)
+LLM_HEDGE_DEFAULT_DELAY = 3.0  # 초
+LLM_HEDGE_MIN_DELAY = 0.5  # 헤징 지연 하한 (초, p95가 작아도 이 시간은 기다림)
+FAKE_LLM_LATENCY = 0.5  # "fake" 공급자 기본 지연 (초)
+FAKE_LLM_TAIL_RATE = 0.05  # "fake" 공급자 꼬리 지연 비율
+FAKE_LLM_TAIL_LATENCY = 5.0  # "fake" 공급자 꼬리 지연 (초)
+
+# LLM 동시 실행 제어 설정 (모든 get_*_llm 호출을 우선순위별로 입장 제어)
+# 초당 호출 상한은 환경 변수 LLM_QUOTA_PER_SEC (공급자 할당량 / 60 / 인스턴스 수, 없으면 동시 호출 수만 제한)
+# 버스트는 LLM_QUOTA_BURST (없으면 초당 상한 x 2), 입장 대기는 역할별 *_TIMEOUT 안에서만 (초과 시 LLMDeadlineExceeded)
+LLM_GOVERNOR_ENABLED = False  # 실제 할당량 / 트래픽으로 상한을 정한 뒤 켤 것
+LLM_CONCURRENCY_LIMITS = {  # 우선순위별 동시 LLM 호출 수 상한
+    "interactive": 32,  # 대화 응답 / 의도 분류 / 온보딩 추출 (사용자가 기다리는 호출)
+    "summary": 8,  # 일일 요약 / 주간요약 v1.0·v2.0 생성 (요청이 기다리는 요약 미리 생성 포함)
+    "batch": 4,  # 주간요약 미리 생성 배치 (백그라운드)
+}
+LLM_QUOTA_INTERACTIVE_RESERVE = 5  # 대화용으로 남겨 두는 토큰 수 (summary / batch는 이보다 많이 남았을 때만 사용)
+
+# 데이터베이스 설정
+DB_MAX_WORKERS = 16  # 동기 Supabase 호출을 처리할 스레드 풀 크기 (동시 DB 요청 상한)
+
+# 사용자 프로필 캐시 설정 (Database.get_user, 쓰기 시 즉시 갱신)
+USER_CACHE_ENABLED = True
+USER_CACHE_TTL = 60.0  # 초 (다른 인스턴스에서 바뀐 값이 보이기까지 최대 지연, 요청 시작 시 load_request_context로 갱신됨)
+USER_CACHE_SIZE = 10000  # 최대 사용자 수 (초과 시 LRU 제거)
+
+# 카카오 콜백(비동기 응답) 설정
+KAKAO_CALLBACK_ENABLED = True  # 오픈빌더 블록에서 콜백을 켠 경우에만 userRequest.callbackUrl이 전달됨
+KAKAO_CALLBACK_SYNC_TIMEOUT = 3.5  # 이 시간 안에 끝나면 즉시 응답, 넘으면 useCallback 응답 후 콜백 전송 (카카오 제한 5초)
+KAKAO_CALLBACK_POST_TIMEOUT = 5.0  # 콜백 URL POST 타임아웃 (초)
+KAKAO_CALLBACK_MAX_RETRIES = 2  # 콜백 POST 실패 시 재시도 횟수 (콜백 URL 유효시간 1분)
+
+# 웹훅 중복 요청(카카오 재시도) 처리 설정
+IDEMPOTENCY_TTL = 15.0  # 같은 요청 ID의 완료 응답 재사용 시간 (초, 카카오 재시도 간격보다 길게, 요청 ID 없으면 진행 중 합류만)
+IDEMPOTENCY_CACHE_SIZE = 5000  # 응답 캐시 최대 항목 수
+
+# 의도 분류 캐시 설정 ((직전 봇 메시지 상태, 정규화된 사용자 메시지) → LLM 원본 라벨)
+INTENT_CACHE_TTL = 600.0  # 초
+INTENT_CACHE_SIZE = 2000
+
+# 로컬 의도 분류기 설정 (확신도 높은 메시지는 LLM 호출 생략)
+# 골든 케이스(~110건) 학습 모델이라 일반 업무 문장("종료 처리 로직 만들었어")도 확신하고 틀림 →
+# 실제 트래픽 / 학습에 쓰지 않은 데이터로 임계값을 보정하기 전까지 끔
+LOCAL_INTENT_CLASSIFIER_ENABLED = False
+LOCAL_INTENT_CONFIDENCE_THRESHOLD = 0.9  # 학습 데이터 LOO 교차검증 기준 (실제 정확도는 더 낮음)
+LOCAL_INTENT_BOT_STATES = ("ask", "edit", "shown")  # 로컬 분류 대상: 요약 제안 / 수정 질문 / 요약 표시 직후의 답만
+LOCAL_INTENT_MAX_LENGTH = 8  # 로컬 분류 대상 최대 길이 (정규화 후 글자 수, "응" / "정리해줘" 같은 짧은 답)
+
+# 추측 실행 설정 (의도 분류 LLM 호출과 일반 대화 응답 생성을 병렬 실행, continue가 아니면 취소)
+SPECULATIVE_REPLY_ENABLED = False  # opt-in: 다른 의도로 분류되면 응답 생성 LLM 호출 1회가 낭비됨
+
+# 일일 요약 미리 생성 설정 (요약 제안 직후 백그라운드 생성 → "응" 요청에서 즉시 응답)
+SUMMARY_PREFETCH_ENABLED = True
+SUMMARY_PREFETCH_TTL = 1800.0  # 초 (제안 후 이 시간 안에 요약 요청이 오지 않으면 폐기)
+SUMMARY_PREFETCH_CACHE_SIZE = 1000
+
+# 주간요약 v1.0 주말 배치 미리 생성 설정 (토요일 18시 알림 전에 생성 → 요청 시 캐시 조회)
+WEEKLY_PRECOMPUTE_ENABLED = False  # 앱 내 스케줄러 (워커/인스턴스마다 따로 실행됨 → 단일 프로세스 배포에서만 켜고, 그 외에는 cron으로 CLI 실행)
+WEEKLY_PRECOMPUTE_WEEKDAY = 5  # 실행 요일 (0=월, 5=토, KST)
+WEEKLY_PRECOMPUTE_HOUR = 15  # 실행 시각 (알림 발송 18시 전에 끝나도록)
+WEEKLY_PRECOMPUTE_MINUTE = 0
+WEEKLY_PRECOMPUTE_CONCURRENCY = 8  # 동시에 생성하는 사용자 수 (사용자당 LLM 호출 2회)
+WEEKLY_PRECOMPUTE_BATCH_SIZE = 200  # 대상 조회 페이지 크기 (페이지마다 체크포인트 저장)
+WEEKLY_PRECOMPUTE_CHECKPOINT_PATH = "weekly_precompute_checkpoint.json"  # 재시작 시 이어서 실행할 위치
+
+# 알림톡 발송 설정 (notification_deliveries 큐 → 발송 워커)
+ALIMTALK_ENABLED = False  # 주간요약 알림 예약 (발송 대행사 연동 후 켤 것, 발송은 python -m src.service.notification.dispatcher 1개 프로세스로 실행)
+ALIMTALK_DISPATCHER_IN_PROCESS = False  # 웹 서버 안에서 발송 워커 실행 (uvicorn 워커/인스턴스마다 따로 떠서 실제 발송 속도가 N x ALIMTALK_RATE_PER_SEC → 단일 프로세스 배포에서만 켤 것)
+ALIMTALK_TRANSPORT = "fake"  # "http" (발송 대행사 API) | "fake" (로그만 남김, 로컬/테스트용)
+ALIMTALK_RATE_PER_SEC = 50.0  # 초당 발송 건수 상한 (디스패처 프로세스 1개 기준, 대행사 API 제한에 맞출 것)
+ALIMTALK_BURST = 100  # 순간 허용 발송 건수 (토큰 버킷 크기, ALIMTALK_BATCH_SIZE 이상)
+ALIMTALK_BATCH_SIZE = 100  # API 1회 요청당 메시지 수 (대행사 대량 발송 API 제한)
+ALIMTALK_WORKERS = 4  # 동시에 API를 호출하는 워커 수
+ALIMTALK_CLAIM_SIZE = 500  # DB에서 한 번에 선점하는 알림 수
+ALIMTALK_POLL_INTERVAL = 5.0  # 발송할 알림이 없을 때 DB 재조회 간격 (초)
+ALIMTALK_LEASE_SECONDS = 120  # 선점 유효 시간 (초과 시 워커가 죽은 것으로 보고 재발송)
+ALIMTALK_MAX_ATTEMPTS = 5  # 최대 발송 시도 횟수 (초과 시 failed)
+ALIMTALK_RETRY_BASE_DELAY = 30.0  # 재시도 대기 시간 기준 (초, 시도마다 2배 + 지터)
+ALIMTALK_SEND_TIMEOUT = 10.0  # 대행사 API 요청 타임아웃 (초)
+
+# 요청 트레이싱 설정 (노드 / DB 왕복 / LLM 호출 지연 시간 → /metrics)
+TRACING_ENABLED = True
+TRACE_BUFFER_SIZE = 200  # 메모리에 보관할 최근 요청 트레이스 수 (/metrics/traces)
+TRACE_HISTOGRAM_SAMPLES = 1024  # 백분위(p50/p95/p99) 계산에 쓰는 최근 샘플 수 (히스토그램별)
+TRACE_SLOW_REQUEST_MS = 4000.0  # 이 시간 이상 걸린 요청은 구간별 합계와 함께 경고 로그
+
+# 그래프 실행 전 빠른 응답 규칙 (캐시된 users / conversation_states만 보고 판단, DB·LLM 호출 없음)
+FAST_PATH_ENABLED = True  # 규칙에 필요한 데이터가 캐시에 없으면 그래프로 처리 (결과는 그래프와 동일)
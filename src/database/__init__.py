@@ -7,6 +7,8 @@ from .database import Database
 # User Repository
 from .user_repository import (
     get_user_with_context,
+    load_request_context,
+    build_user_context,
     check_and_reset_daily_count,
     increment_counts_with_check,
     save_onboarding_metadata,
@@ -41,6 +43,8 @@ __all__ = [
 
     # User Repository
     "get_user_with_context",
+    "load_request_context",
+    "build_user_context",
     "check_and_reset_daily_count",
     "increment_counts_with_check",
     "save_onboarding_metadata",
@@ -1,8 +1,18 @@
 import os
+import asyncio
+import copy
+from concurrent.futures import ThreadPoolExecutor
 from supabase import create_client, Client
-from typing import Optional, Dict, Any
-from datetime import datetime
+from typing import Optional, Dict, Any, List, Tuple
+from datetime import datetime, timedelta, timezone
 
+from ..config.config import DB_MAX_WORKERS, USER_CACHE_ENABLED, USER_CACHE_TTL, USER_CACHE_SIZE
+from .state_session import get_active_state_session
+from ..utils.cache import SingleFlight, TTLCache
+from ..utils.tracing import label_operations, get_operation_name, trace_span
+
+
+@label_operations(exclude=("execute",))
 class Database:
     def __init__(self):
         # Supabase 클라이언트 설정
@@ -19,18 +29,137 @@ class Database:
         # 모킹 데이터 저장소 (실제 DB 없을 때 사용)
         self._mock_users = {}
         self._mock_states = {}
+        self._mock_notifications: Dict[int, Dict[str, Any]] = {}
+        # V2 대화 히스토리 (message_history + user/ai_answer_messages를 한 행으로, 유저별 저장 순서)
+        self._mock_turns: Dict[str, List[Dict[str, Any]]] = {}
+        self._mock_turn_seq = 0
+        self._mock_daily_summaries: Dict[Tuple[str, str], Dict[str, Any]] = {}  # (user_id, session_date)
+        self._mock_weekly_precomputed: Dict[Tuple[str, str], Dict[str, Any]] = {}  # (user_id, week_start)
+
+        # 사용자 row 캐시 (users 쓰기는 모두 이 클래스를 거치므로 쓰기 시 즉시 갱신)
+        # 동시 미스는 SingleFlight로 합쳐 같은 사용자 조회 쿼리가 1회만 나감
+        self._user_cache = TTLCache(maxsize=USER_CACHE_SIZE, ttl=USER_CACHE_TTL)
+        self._user_flight = SingleFlight()
+        self._user_written_during_fetch: set = set()
+        # 마지막으로 읽거나 쓴 conversation_states 스냅샷 (fast path 규칙 평가용, DB 조회 대체 아님)
+        self._state_snapshots = TTLCache(maxsize=USER_CACHE_SIZE, ttl=USER_CACHE_TTL)
+
+        # 동기 Supabase 클라이언트 호출을 오프로드할 스레드 풀 (이벤트 루프 블로킹 방지)
+        self._executor = ThreadPoolExecutor(
+            max_workers=DB_MAX_WORKERS,
+            thread_name_prefix="supabase"
+        )
+
+    async def execute(self, query) -> Any:
+        """Supabase 쿼리 빌더를 스레드 풀에서 실행
+
+        supabase.Client는 동기 HTTP 호출이므로 이벤트 루프에서 직접 execute()하면
+        다른 사용자의 요청까지 모두 멈춘다. 최대 DB_MAX_WORKERS개의 쿼리를
+        병렬로 실행하고, 초과분은 스레드 풀 큐에서 대기한다.
+        왕복 1회마다 호출한 메서드 이름으로 "db" 스팬을 남긴다 (캐시 응답은 기록되지 않음).
+
+        Args:
+            query: .execute() 호출 전의 쿼리 빌더 (table/rpc 체인)
+
+        Returns:
+            APIResponse: execute() 결과
+        """
+        loop = asyncio.get_running_loop()
+        with trace_span(get_operation_name("execute"), "db"):
+            return await loop.run_in_executor(self._executor, query.execute)
+
+    def close(self) -> None:
+        """스레드 풀 종료 (앱 종료 시 호출)"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # ============================================
+    # 사용자 row 캐시
+    # ============================================
+
+    def _mark_user_written(self, user_id: str) -> None:
+        """진행 중인 조회가 있으면 그 결과(쓰기 이전 값일 수 있음)는 캐시하지 않도록 표시"""
+        if self._user_flight.is_running(user_id):
+            self._user_written_during_fetch.add(user_id)
+
+    def _cache_user(self, user_id: str, row: Optional[Dict[str, Any]]) -> None:
+        """DB에서 읽거나 쓴 최신 사용자 row로 캐시 갱신 (없는 사용자는 캐시하지 않음)"""
+        self._mark_user_written(user_id)
+        if USER_CACHE_ENABLED and row:
+            self._user_cache.set(user_id, dict(row))
+
+    def _update_cached_user(self, user_id: str, fields: Dict[str, Any]) -> None:
+        """캐시된 사용자 row의 일부 컬럼만 갱신 (RPC 결과 반영용)"""
+        self._mark_user_written(user_id)
+        cached = self._user_cache.get(user_id)
+        if cached is not None:
+            cached.update(fields)
+
+    def _invalidate_user(self, user_id: str) -> None:
+        """쓰기 결과를 알 수 없을 때 캐시 제거 (다음 조회는 DB에서)"""
+        self._mark_user_written(user_id)
+        self._user_cache.pop(user_id)
+
+    def _snapshot_state(self, user_id: str, state: Optional[Dict[str, Any]]) -> None:
+        """대화 상태 스냅샷 갱신 (행이 없으면 빈 dict로 기록 → '없음'을 아는 상태)"""
+        if USER_CACHE_ENABLED:
+            self._state_snapshots.set(user_id, copy.deepcopy(state) if state else {})
+
+    def peek_user(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """캐시된 사용자 row 사본 (DB 조회 없음, 캐시에 없거나 없는 사용자면 None)"""
+        if not self.supabase:
+            user = self._mock_users.get(user_id)
+            return dict(user) if user else None
+        cached = self._user_cache.get(user_id)
+        return dict(cached) if cached is not None else None
+
+    def peek_conversation_state(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """마지막으로 알려진 대화 상태 사본 (DB 조회 없음)
+
+        Returns:
+            상태 dict / 행이 없는 것으로 알려졌으면 {} / 모르면 None
+        """
+        if not self.supabase:
+            return copy.deepcopy(self._mock_states.get(user_id)) or {}
+        state = self._state_snapshots.get(user_id)
+        return copy.deepcopy(state) if state is not None else None
+
+    def get_user_cache_stats(self) -> Dict[str, Any]:
+        """사용자 캐시 hit/miss + 동시 미스 합류 수"""
+        return {**self._user_cache.stats(), "coalesced": self._user_flight.joined}
 
     async def get_user(self, user_id: str) -> Optional[Dict[str, Any]]:
-        """사용자 정보 조회
+        """사용자 정보 조회 (프로세스 캐시 → 미스 시 DB, 동시 미스는 1회 조회로 합침)
 
         Returns:
-            Optional[Dict[str, Any]]: 사용자 정보 dict (없으면 None)
+            Optional[Dict[str, Any]]: 사용자 정보 dict (없으면 None, 호출자가 수정해도 되는 사본)
         """
         if not self.supabase:
             return self._mock_users.get(user_id)
 
+        if not USER_CACHE_ENABLED:
+            return await self._fetch_user(user_id)
+
+        cached = self._user_cache.get(user_id)
+        if cached is not None:
+            return dict(cached)
+
+        user = await self._user_flight.do(user_id, lambda: self._load_user(user_id))
+        return dict(user) if user else None
+
+    async def _load_user(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """캐시 미스 시 DB 조회 후 캐시 저장 (조회 도중 같은 사용자에 쓰기가 있었으면 저장 안 함)"""
+        self._user_written_during_fetch.discard(user_id)
+        user = await self._fetch_user(user_id)
+        if user_id in self._user_written_during_fetch:
+            self._user_written_during_fetch.discard(user_id)
+        elif user:
+            self._user_cache.set(user_id, dict(user))
+        return user
+
+    async def _fetch_user(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """users 테이블 조회 (캐시 미사용)"""
         try:
-            response = self.supabase.table("users").select("*").eq("kakao_user_id", user_id).single().execute()
+            response = await self.execute(self.supabase.table("users").select("*").eq("kakao_user_id", user_id).single())
             if not response.data:
                 return None
 
@@ -44,7 +173,22 @@ class Database:
     async def create_or_update_user(self, user_id: str, user_data: Dict[str, Any]) -> Dict[str, Any]:
         """사용자 생성 또는 업데이트"""
         if not self.supabase:
-            self._mock_users[user_id] = {**user_data, "kakao_user_id": user_id}
+            existing_user = self._mock_users.get(user_id)
+            if existing_user:
+                existing_user.update(user_data)
+                existing_user["updated_at"] = datetime.now().isoformat()
+                return existing_user
+            # users 테이블 DEFAULT 값과 동일하게 생성
+            self._mock_users[user_id] = {
+                "onboarding_completed": False,
+                "attendance_count": 0,
+                "daily_record_count": 0,
+                "last_record_date": None,
+                "onboarding_completed_at": None,
+                "created_at": datetime.now().isoformat(),
+                **user_data,
+                "kakao_user_id": user_id,
+            }
             return self._mock_users[user_id]
 
         try:
@@ -54,42 +198,58 @@ class Database:
             if existing_user:
                 # ✅ 기존 사용자 업데이트 (update 사용)
                 print(f"🔄 [DB] 기존 사용자 업데이트: {user_id}, 필드: {list(user_data.keys())}")
-                response = self.supabase.table("users").update(
+                response = await self.execute(self.supabase.table("users").update(
                     user_data
-                ).eq("kakao_user_id", user_id).execute()
-                return response.data[0] if response.data else None
+                ).eq("kakao_user_id", user_id))
+                row = response.data[0] if response.data else None
+                self._cache_user(user_id, row)
+                return row
             else:
                 # ✅ 신규 사용자 생성 (insert 사용)
                 print(f"✨ [DB] 신규 사용자 생성: {user_id}")
                 user_data["kakao_user_id"] = user_id
-                response = self.supabase.table("users").insert(user_data).execute()
-                return response.data[0] if response.data else None
+                response = await self.execute(self.supabase.table("users").insert(user_data))
+                row = response.data[0] if response.data else None
+                self._cache_user(user_id, row)
+                return row
 
         except Exception as e:
+            self._invalidate_user(user_id)
             print(f"❌ [DB] 사용자 생성/업데이트 오류: {e}")
             import traceback
             traceback.print_exc()
             raise e
 
     async def get_conversation_state(self, user_id: str) -> Optional[Dict[str, Any]]:
-        """대화 상태 조회"""
+        """대화 상태 조회 (요청 세션이 열려 있으면 세션 상태 반환)"""
+        session = get_active_state_session(user_id)
+        if session:
+            return session.get()
+
         if not self.supabase:
             return self._mock_states.get(user_id)
 
         try:
             print(f"🔍 [DB] get 시도 - user_id: {user_id}")
-            response = self.supabase.table("conversation_states").select("*").eq("kakao_user_id", user_id).single().execute()
+            response = await self.execute(self.supabase.table("conversation_states").select("*").eq("kakao_user_id", user_id).single())
             print(f"✅ [DB] get 성공 - data: {response.data}")
+            self._snapshot_state(user_id, response.data)
             return response.data if response.data else None
         except Exception as e:
             if "PGRST116" in str(e):  # 데이터 없음
                 print(f"⚠️ [DB] 데이터 없음 (PGRST116)")
+                self._snapshot_state(user_id, None)
                 return None
+            self._state_snapshots.pop(user_id)
             print(f"❌ [DB] 대화 상태 조회 오류: {e}")
             return None
 
     async def upsert_conversation_state(self, user_id: str, current_step: str, temp_data: Dict[str, Any]) -> Dict[str, Any]:
-        """대화 상태 생성 또는 업데이트"""
+        """대화 상태 생성 또는 업데이트 (요청 세션이 열려 있으면 종료 시 일괄 저장)"""
+        session = get_active_state_session(user_id)
+        if session:
+            return session.stage(current_step, temp_data)
+
         if not self.supabase:
             self._mock_states[user_id] = {
                 "kakao_user_id": user_id,
@@ -107,20 +267,28 @@ class Database:
                 "updated_at": datetime.now().isoformat()
             }
             print(f"💾 [DB] upsert 시도 - user_id: {user_id}, current_step: {current_step}, temp_data keys: {list(temp_data.keys())}")
-            response = self.supabase.table("conversation_states").upsert(
+            response = await self.execute(self.supabase.table("conversation_states").upsert(
                 state_data,
                 on_conflict="kakao_user_id"
-            ).execute()
+            ))
             print(f"✅ [DB] upsert 성공 - response: {response.data}")
+            self._snapshot_state(user_id, state_data)
             return response.data[0] if response.data else None
         except Exception as e:
+            self._state_snapshots.pop(user_id)
             print(f"❌ [DB] 대화 상태 생성/업데이트 오류: {e}")
             import traceback
             traceback.print_exc()
             raise e
 
     async def update_conversation_state(self, user_id: str, current_step: str, temp_data: Dict[str, Any]) -> Dict[str, Any]:
-        """대화 상태 업데이트"""
+        """대화 상태 업데이트 (요청 세션이 열려 있으면 종료 시 일괄 저장)"""
+        session = get_active_state_session(user_id)
+        if session:
+            if session.get() is None:
+                return None
+            return session.stage(current_step, temp_data)
+
         if not self.supabase:
             if user_id in self._mock_states:
                 self._mock_states[user_id].update({
@@ -136,14 +304,20 @@ class Database:
                 "temp_data": temp_data,
                 "updated_at": datetime.now().isoformat()
             }
-            response = self.supabase.table("conversation_states").update(state_data).eq("kakao_user_id", user_id).execute()
+            response = await self.execute(self.supabase.table("conversation_states").update(state_data).eq("kakao_user_id", user_id))
+            self._snapshot_state(user_id, response.data[0] if response.data else None)
             return response.data[0] if response.data else None
         except Exception as e:
+            self._state_snapshots.pop(user_id)
             print(f"대화 상태 업데이트 오류: {e}")
             raise e
 
     async def delete_conversation_state(self, user_id: str) -> bool:
-        """대화 상태 삭제"""
+        """대화 상태 삭제 (요청 세션이 열려 있으면 종료 시 일괄 반영)"""
+        session = get_active_state_session(user_id)
+        if session:
+            return session.delete()
+
         if not self.supabase:
             if user_id in self._mock_states:
                 del self._mock_states[user_id]
@@ -151,9 +325,11 @@ class Database:
             return False
 
         try:
-            self.supabase.table("conversation_states").delete().eq("kakao_user_id", user_id).execute()
+            await self.execute(self.supabase.table("conversation_states").delete().eq("kakao_user_id", user_id))
+            self._snapshot_state(user_id, None)
             return True
         except Exception as e:
+            self._state_snapshots.pop(user_id)
             print(f"대화 상태 삭제 오류: {e}")
             return False
 
@@ -165,7 +341,7 @@ class Database:
 
         try:
             # users 테이블에 간단한 쿼리 수행
-            response = self.supabase.table("users").select("count").limit(1).execute()
+            response = await self.execute(self.supabase.table("users").select("count").limit(1))
             print("✅ Supabase 연결 성공!")
             return True
         except Exception as e:
@@ -186,10 +362,11 @@ class Database:
             return self._mock_summaries.get(user_id)
 
         try:
-            response = self.supabase.table("conversation_states") \
-                .select("temp_data") \
-                .eq("kakao_user_id", user_id) \
-                .execute()
+            response = await self.execute(
+                self.supabase.table("conversation_states")
+                .select("temp_data")
+                .eq("kakao_user_id", user_id)
+            )
 
             if not response.data or len(response.data) == 0:
                 return None
@@ -223,12 +400,14 @@ class Database:
             }
             return True
 
+        self._state_snapshots.pop(user_id)  # 세션 밖에서 temp_data를 직접 고침 → 스냅샷 무효화
         try:
             # 기존 temp_data 가져오기
-            response = self.supabase.table("conversation_states") \
-                .select("temp_data") \
-                .eq("kakao_user_id", user_id) \
-                .execute()
+            response = await self.execute(
+                self.supabase.table("conversation_states")
+                .select("temp_data")
+                .eq("kakao_user_id", user_id)
+            )
 
             temp_data = {}
             if response.data and len(response.data) > 0:
@@ -242,14 +421,15 @@ class Database:
             }
 
             # 저장 (upsert)
-            self.supabase.table("conversation_states") \
+            await self.execute(
+                self.supabase.table("conversation_states")
                 .upsert({
                     "kakao_user_id": user_id,
                     "current_step": "ai_conversation",  # 기본값
                     "temp_data": temp_data,
                     "updated_at": datetime.now().isoformat()
-                }) \
-                .execute()
+                })
+            )
 
             return True
         except Exception as e:
@@ -264,22 +444,25 @@ class Database:
                 del self._mock_summaries[user_id]
             return True
 
+        self._state_snapshots.pop(user_id)
         try:
             # temp_data에서 conversation_summary만 제거
-            response = self.supabase.table("conversation_states") \
-                .select("temp_data") \
-                .eq("kakao_user_id", user_id) \
-                .execute()
+            response = await self.execute(
+                self.supabase.table("conversation_states")
+                .select("temp_data")
+                .eq("kakao_user_id", user_id)
+            )
 
             if response.data and len(response.data) > 0:
                 temp_data = response.data[0].get("temp_data", {})
                 if "conversation_summary" in temp_data:
                     del temp_data["conversation_summary"]
 
-                    self.supabase.table("conversation_states") \
-                        .update({"temp_data": temp_data}) \
-                        .eq("kakao_user_id", user_id) \
-                        .execute()
+                    await self.execute(
+                        self.supabase.table("conversation_states")
+                        .update({"temp_data": temp_data})
+                        .eq("kakao_user_id", user_id)
+                    )
 
             return True
         except Exception as e:
@@ -369,6 +552,68 @@ class Database:
             print(f"❌ [DB] attendance_count 증가 실패: {e}")
             return 0
 
+    async def increment_daily_counts(self, user_id: str) -> Tuple[int, Optional[int]]:
+        """daily_record_count 증가 + 평일 임계값 달성 시 attendance_count 증가 (RPC 1회)
+
+        날짜 리셋, DAILY_TURNS_THRESHOLD 체크, 평일 규칙을 increment_daily_counts RPC가
+        단일 UPDATE로 처리하므로 동시 요청에도 카운트가 유실되거나 중복되지 않는다.
+
+        Args:
+            user_id: 사용자 ID
+
+        Returns:
+            (new_daily_count, new_attendance):
+                - new_daily_count: 증가된 daily_record_count (사용자 없으면 0)
+                - new_attendance: 이번 호출로 증가한 attendance_count, 아니면 None
+        """
+        from ..config.business_config import DAILY_TURNS_THRESHOLD
+
+        today = datetime.now().date()
+
+        if not self.supabase:
+            user = self._mock_users.get(user_id)
+            if not user:
+                return 0, None
+
+            if user.get("last_record_date") == today.isoformat():
+                new_daily_count = user.get("daily_record_count", 0) + 1
+            else:
+                new_daily_count = 1
+            user["daily_record_count"] = new_daily_count
+            user["last_record_date"] = today.isoformat()
+
+            if new_daily_count == DAILY_TURNS_THRESHOLD and today.weekday() <= 4:
+                user["attendance_count"] = user.get("attendance_count", 0) + 1
+                return new_daily_count, user["attendance_count"]
+            return new_daily_count, None
+
+        try:
+            response = await self.execute(self.supabase.rpc("increment_daily_counts", {
+                "p_kakao_user_id": user_id,
+                "p_today": today.isoformat(),
+                "p_threshold": DAILY_TURNS_THRESHOLD
+            }))
+
+            if not response.data:
+                print(f"❌ [DB] 사용자 정보 없음: {user_id}")
+                return 0, None
+
+            row = response.data[0]
+            new_daily_count = row["daily_record_count"]
+            new_attendance = row["attendance_count"] if row["attendance_incremented"] else None
+            self._update_cached_user(user_id, {
+                "daily_record_count": new_daily_count,
+                "attendance_count": row["attendance_count"],
+                "last_record_date": today.isoformat()
+            })
+            print(f"✅ [DB] daily_record_count 업데이트: {user_id} → {new_daily_count}회 (attendance 증가: {new_attendance})")
+            return new_daily_count, new_attendance
+
+        except Exception as e:
+            self._invalidate_user(user_id)
+            print(f"❌ [DB] 카운트 증가 실패: {e}")
+            return 0, None
+
     # =============================================================================
     # 주간 요약 관리 (weekly_summaries 테이블) - DEPRECATED
     # =============================================================================
@@ -406,10 +651,10 @@ class Database:
                 "created_at": datetime.now().isoformat()
             }
 
-            self.supabase.table("weekly_summaries").upsert(
+            await self.execute(self.supabase.table("weekly_summaries").upsert(
                 data,
                 on_conflict="kakao_user_id,sequence_number"
-            ).execute()
+            ))
 
             print(f"✅ [DB] 주간요약 저장 완료: {user_id} - {sequence_number}번째 ({start_daily_count}-{end_daily_count}일차)")
             return True
@@ -427,12 +672,13 @@ class Database:
             return []
 
         try:
-            response = self.supabase.table("weekly_summaries")\
-                .select("*")\
-                .eq("kakao_user_id", user_id)\
-                .order("sequence_number", desc=True)\
-                .limit(limit)\
-                .execute()
+            response = await self.execute(
+                self.supabase.table("weekly_summaries")
+                .select("*")
+                .eq("kakao_user_id", user_id)
+                .order("sequence_number", desc=True)
+                .limit(limit)
+            )
 
             return response.data if response.data else []
 
@@ -449,12 +695,13 @@ class Database:
             return None
 
         try:
-            response = self.supabase.table("weekly_summaries")\
-                .select("*")\
-                .eq("kakao_user_id", user_id)\
-                .eq("sequence_number", sequence_number)\
-                .single()\
-                .execute()
+            response = await self.execute(
+                self.supabase.table("weekly_summaries")
+                .select("*")
+                .eq("kakao_user_id", user_id)
+                .eq("sequence_number", sequence_number)
+                .single()
+            )
 
             return response.data if response.data else None
 
@@ -471,12 +718,13 @@ class Database:
             return None
 
         try:
-            response = self.supabase.table("weekly_summaries")\
-                .select("*")\
-                .eq("kakao_user_id", user_id)\
-                .order("sequence_number", desc=True)\
-                .limit(1)\
-                .execute()
+            response = await self.execute(
+                self.supabase.table("weekly_summaries")
+                .select("*")
+                .eq("kakao_user_id", user_id)
+                .order("sequence_number", desc=True)
+                .limit(1)
+            )
 
             return response.data[0] if response.data else None
 
@@ -498,8 +746,9 @@ class Database:
         summary_type: str = None,
         is_review: bool = False
     ) -> Optional[Dict[str, Any]]:
-        """대화 턴 저장 (V2 스키마)
+        """대화 턴 저장 (V2 스키마 - RPC 함수 사용)
 
+        save_conversation_turn RPC가 한 트랜잭션에서 turn_index를 계산하고
         user_answer_messages, ai_answer_messages, message_history 테이블에 저장
 
         Args:
@@ -512,80 +761,49 @@ class Database:
 
         Returns:
             dict: {
-                "history_uuid": "...",
+                "history_id": 123,
                 "user_uuid": "...",
                 "ai_uuid": "...",
                 "turn_index": 1,
                 "session_date": "2025-10-19"
             }
         """
+        from datetime import date
+        session_date = date.today().isoformat()
+
         if not self.supabase:
-            print("⚠️ [DB] Supabase 미연결 - 대화 턴 저장 스킵")
-            return None
+            return self._mock_save_turn(
+                user_id, user_message, ai_message, is_summary, summary_type, is_review, session_date
+            )
 
         try:
-            from datetime import date
-            session_date = date.today().isoformat()
-
-            # 1. 오늘 날짜의 turn_index 계산
-            turn_count_response = self.supabase.table("message_history") \
-                .select("turn_index", count="exact") \
-                .eq("kakao_user_id", user_id) \
-                .eq("session_date", session_date) \
-                .execute()
-
-            turn_index = (turn_count_response.count or 0) + 1
-
-            # 2. user_answer_messages 저장
-            user_response = self.supabase.table("user_answer_messages").insert({
-                "kakao_user_id": user_id,
-                "content": user_message,
-                "is_review": is_review
-            }).execute()
-
-            if not user_response.data:
-                print(f"❌ [DB V2] user_answer_messages 저장 실패")
-                return None
-
-            user_uuid = user_response.data[0]["uuid"]
-
-            # 3. ai_answer_messages 저장
-            ai_response = self.supabase.table("ai_answer_messages").insert({
-                "kakao_user_id": user_id,
-                "content": ai_message,
-                "is_summary": is_summary,
-                "summary_type": summary_type  # 🆕 추가
-            }).execute()
-
-            if not ai_response.data:
-                print(f"❌ [DB V2] ai_answer_messages 저장 실패")
-                return None
 
-            ai_uuid = ai_response.data[0]["uuid"]
-
-            # 4. message_history에 턴 저장
-            history_response = self.supabase.table("message_history").insert({
-                "kakao_user_id": user_id,
-                "user_answer_key": user_uuid,
-                "ai_answer_key": ai_uuid,
-                "session_date": session_date,
-                "turn_index": turn_index
-            }).execute()
+            response = await self.execute(self.supabase.rpc(
+                "save_conversation_turn",
+                {
+                    "p_kakao_user_id": user_id,
+                    "p_user_message": user_message,
+                    "p_ai_message": ai_message,
+                    "p_is_summary": is_summary,
+                    "p_summary_type": summary_type,
+                    "p_is_review": is_review,
+                    "p_session_date": session_date
+                }
+            ))
 
-            if not history_response.data:
-                print(f"❌ [DB V2] message_history 저장 실패")
+            if not response.data:
+                print(f"❌ [DB V2] 대화 턴 저장 실패 (RPC 응답 없음)")
                 return None
 
-            history_id = history_response.data[0]["id"]
-
-            print(f"✅ [DB V2] 대화 턴 저장 완료: {user_id} - 턴 #{turn_index}")
+            row = response.data[0]
+            print(f"✅ [DB V2] 대화 턴 저장 완료: {user_id} - 턴 #{row['turn_index']}")
 
             return {
-                "history_id": history_id,
-                "user_uuid": user_uuid,
-                "ai_uuid": ai_uuid,
-                "turn_index": turn_index,
-                "session_date": session_date
+                "history_id": row["history_id"],
+                "user_uuid": row["user_uuid"],
+                "ai_uuid": row["ai_uuid"],
+                "turn_index": row["turn_index"],
+                "session_date": row["session_date"]
             }
 
         except Exception as e:
@@ -594,6 +812,65 @@ class Database:
             traceback.print_exc()
             return None
 
+    def _mock_save_turn(
+        self,
+        user_id: str,
+        user_message: str,
+        ai_message: str,
+        is_summary: bool,
+        summary_type: Optional[str],
+        is_review: bool,
+        session_date: str
+    ) -> Dict[str, Any]:
+        """모킹 모드 대화 턴 저장 (save_conversation_turn RPC와 같은 규칙)
+
+        같은 날짜 안에서 turn_index 증가, 데일리 요약이면 날짜별 최신 요약 갱신.
+        await 없이 실행되므로 동시 요청에도 turn_index가 중복되지 않는다.
+        """
+        import uuid
+
+        turns = self._mock_turns.setdefault(user_id, [])
+        turn_index = 1 + max(
+            (t["turn_index"] for t in turns if t["session_date"] == session_date), default=0
+        )
+        self._mock_turn_seq += 1
+        now = datetime.now(timezone.utc).isoformat()
+        row = {
+            "history_id": self._mock_turn_seq,
+            "user_uuid": str(uuid.uuid4()),
+            "ai_uuid": str(uuid.uuid4()),
+            "turn_index": turn_index,
+            "session_date": session_date,
+            "user_message": user_message,
+            "ai_message": ai_message,
+            "is_summary": is_summary,
+            "summary_type": summary_type,
+            "is_review": is_review,
+            "created_at": now,
+        }
+        turns.append(row)
+
+        if is_summary and summary_type == "daily":
+            key = (user_id, session_date)
+            created_at = self._mock_daily_summaries.get(key, {}).get("created_at", now)
+            self._mock_daily_summaries[key] = {
+                "kakao_user_id": user_id,
+                "session_date": session_date,
+                "ai_answer_key": row["ai_uuid"],
+                "summary_content": ai_message,
+                "created_at": created_at,
+                "updated_at": now,
+            }
+
+        return {k: row[k] for k in ("history_id", "user_uuid", "ai_uuid", "turn_index", "session_date")}
+
+    def _mock_recent_turns(self, user_id: str, session_date: Optional[str] = None) -> List[Dict[str, Any]]:
+        """모킹 모드 턴 목록 (최신순, session_date 지정 시 해당 날짜만)"""
+        turns = self._mock_turns.get(user_id, [])
+        if session_date is not None:
+            turns = [t for t in turns if t["session_date"] == session_date]
+        return list(reversed(turns))
+
     async def get_recent_turns_v2(
         self,
         user_id: str,
@@ -618,16 +895,19 @@ class Database:
             ]
         """
         if not self.supabase:
-            return []
+            return [
+                {k: t[k] for k in ("turn_index", "user_message", "ai_message", "session_date", "created_at")}
+                for t in self._mock_recent_turns(user_id)[:limit]
+            ]
 
         try:
-            response = self.supabase.rpc(
+            response = await self.execute(self.supabase.rpc(
                 "get_recent_turns",
                 {
                     "p_kakao_user_id": user_id,
                     "p_limit": limit
                 }
-            ).execute()
+            ))
 
             return response.data if response.data else []
 
@@ -635,8 +915,63 @@ class Database:
             print(f"❌ [DB V2] 최근 턴 조회 실패: {e}")
             return []
 
+    async def get_request_context(
+        self,
+        user_id: str,
+        date: str,
+        turn_limit: int = 3
+    ) -> Optional[Dict[str, Any]]:
+        """요청 컨텍스트 일괄 조회 (load_request_context RPC 1회)
+
+        Args:
+            user_id: 카카오 사용자 ID
+            date: 오늘 날짜 (YYYY-MM-DD)
+            turn_limit: 오늘 대화 최근 N턴
+
+        Returns:
+            Optional[Dict]: {
+                "user": dict | None,
+                "conv_state": dict | None,
+                "last_turn_date": "2025-10-15" | None,
+                "today_turns": [{"turn_index", "user_message", "ai_message", "created_at"}, ...]
+            }
+            조회 실패 시 None (호출자가 개별 조회로 대체)
+        """
+        if not self.supabase:
+            import copy
+
+            turns = self._mock_recent_turns(user_id)
+            user = self._mock_users.get(user_id)
+            # RPC는 JSON으로 직렬화된 사본을 반환하므로 모킹 모드도 사본을 넘김
+            return {
+                "user": dict(user) if user else None,
+                "conv_state": copy.deepcopy(self._mock_states.get(user_id)),
+                "last_turn_date": turns[0]["session_date"] if turns else None,
+                "today_turns": await self.get_conversation_history_by_date_v2(user_id, date, turn_limit)
+            }
+
+        try:
+            response = await self.execute(self.supabase.rpc(
+                "load_request_context",
+                {
+                    "p_kakao_user_id": user_id,
+                    "p_today": date,
+                    "p_turn_limit": turn_limit
+                }
+            ))
+            if not response.data:
+                return None
+            # 요청마다 DB의 최신 사용자 row로 캐시를 갱신 → 이후 get_user는 메모리 조회
+            self._cache_user(user_id, response.data.get("user"))
+            self._snapshot_state(user_id, response.data.get("conv_state"))
+            return response.data
+
+        except Exception as e:
+            print(f"❌ [DB V2] 요청 컨텍스트 조회 실패: {e}")
+            return None
+
     async def get_shortterm_memory_v2(self, user_id: str) -> list:
-        """숏텀 메모리 조회 (V2 스키마 - recent_conversations 뷰 사용)
+        """숏텀 메모리 조회 (V2 스키마 - get_recent_conversations RPC, 유저별 최근 5턴만 인덱스 조회)
 
         Args:
             user_id: 카카오 사용자 ID
@@ -649,17 +984,21 @@ class Database:
             ]
         """
         if not self.supabase:
-            return []
+            return [
+                {"user": t["user_message"], "ai": t["ai_message"]}
+                for t in self._mock_recent_turns(user_id)[:5]
+            ]
 
         try:
-            response = self.supabase.table("recent_conversations") \
-                .select("recent_turns") \
-                .eq("kakao_user_id", user_id) \
-                .execute()
+            response = await self.execute(self.supabase.rpc(
+                "get_recent_conversations",
+                {
+                    "p_kakao_user_id": user_id,
+                    "p_limit": 5
+                }
+            ))
 
-            if response.data and len(response.data) > 0:
-                return response.data[0].get("recent_turns", [])
-            return []
+            return response.data if response.data else []
 
         except Exception as e:
             print(f"❌ [DB V2] 숏텀 메모리 조회 실패: {e}")
@@ -670,6 +1009,7 @@ class Database:
 
         하루에 여러 데일리 요약을 생성한 경우, 각 날짜별 최신 요약만 반환합니다.
         이를 통해 주간 요약 생성 시 정확히 7일치 데이터를 가져올 수 있습니다.
+        (save_conversation_turn이 갱신하는 daily_summaries 테이블을 날짜 역순으로 조회)
 
         Args:
             user_id: 카카오 사용자 ID
@@ -687,17 +1027,32 @@ class Database:
             ]
         """
         if not self.supabase:
-            return []
+            rows = sorted(
+                (row for (uid, _), row in self._mock_daily_summaries.items() if uid == user_id),
+                key=lambda row: row["session_date"],
+                reverse=True
+            )[:limit]
+            return [
+                {
+                    "ai_answer_key": row["ai_answer_key"],
+                    "kakao_user_id": user_id,
+                    "summary_content": row["summary_content"],
+                    "summary_type": "daily",
+                    "created_at": row["updated_at"],
+                    "session_date": row["session_date"]
+                }
+                for row in rows
+            ]
 
         try:
-            # RPC 함수 호출 (DISTINCT ON session_date로 각 날짜별 최신 요약만 선택)
-            response = self.supabase.rpc(
+            # RPC 함수 호출 (daily_summaries PK 범위 스캔 - 날짜별 최신 요약 1건씩)
+            response = await self.execute(self.supabase.rpc(
                 'get_recent_daily_summaries_by_unique_dates',
                 {
                     'p_kakao_user_id': user_id,
                     'p_limit': limit
                 }
-            ).execute()
+            ))
 
             return response.data if response.data else []
 
@@ -730,17 +1085,20 @@ class Database:
             ]
         """
         if not self.supabase:
-            return []
+            return [
+                {k: t[k] for k in ("turn_index", "user_message", "ai_message", "created_at")}
+                for t in self._mock_recent_turns(user_id, date)[:limit]
+            ]
 
         try:
-            response = self.supabase.rpc(
+            response = await self.execute(self.supabase.rpc(
                 "get_turns_by_date",
                 {
                     "p_kakao_user_id": user_id,
                     "p_session_date": date,
                     "p_limit": limit  # ✅ limit 파라미터 전달
                 }
-            ).execute()
+            ))
 
             return response.data if response.data else []
 
@@ -804,36 +1162,44 @@ class Database:
     ) -> list:
         """특정 기간 동안의 요약 메시지 조회 (V2 스키마)"""
         if not self.supabase:
-            return []
+            return [
+                {
+                    "uuid": t["ai_uuid"],
+                    "content": t["ai_message"],
+                    "session_date": t["session_date"],
+                    "created_at": t["created_at"],
+                    "summary_type": t["summary_type"]
+                }
+                for t in self._mock_turns.get(user_id, [])
+                if t["summary_type"] == summary_type and start_date <= t["session_date"] <= end_date
+            ]
 
         try:
-            # message_history와 ai_answer_messages 조인하여 조회
-            response = self.supabase.table("message_history") \
-                .select("session_date, ai_answer_messages(uuid, content, summary_type, created_at)") \
-                .eq("kakao_user_id", user_id) \
-                .gte("session_date", start_date) \
-                .lte("session_date", end_date) \
-                .execute()
+            # message_history와 ai_answer_messages 내부 조인(!inner) + summary_type 필터를 DB에서 처리
+            # → 일반 대화 턴은 전송되지 않고 요약 턴만 내려옴
+            response = await self.execute(
+                self.supabase.table("message_history")
+                .select("session_date, ai_answer_messages!inner(uuid, content, summary_type, created_at)")
+                .eq("kakao_user_id", user_id)
+                .gte("session_date", start_date)
+                .lte("session_date", end_date)
+                .eq("ai_answer_messages.summary_type", summary_type)
+            )
 
             if not response.data:
                 return []
 
-            # ai_answer_messages에서 is_summary=TRUE인 레코드만 필터링
             summaries = []
             for row in response.data:
                 ai_message = row.get("ai_answer_messages")
-                session_date = row.get("session_date")
-
                 if ai_message and isinstance(ai_message, dict):
-                    # summary_type 필터링
-                    if ai_message.get("summary_type") == summary_type:
-                        summaries.append({
-                            "uuid": ai_message.get("uuid"),
-                            "content": ai_message.get("content"),
-                            "session_date": session_date,
-                            "created_at": ai_message.get("created_at"),
-                            "summary_type": ai_message.get("summary_type")
-                        })
+                    summaries.append({
+                        "uuid": ai_message.get("uuid"),
+                        "content": ai_message.get("content"),
+                        "session_date": row.get("session_date"),
+                        "created_at": ai_message.get("created_at"),
+                        "summary_type": ai_message.get("summary_type")
+                    })
 
             print(f"✅ [DB V2] 기간별 요약 조회 완료: {user_id} ({start_date} ~ {end_date}) - {len(summaries)}개")
             return summaries
@@ -842,4 +1208,307 @@ class Database:
             print(f"❌ [DB V2] 기간별 요약 조회 실패: {e}")
             import traceback
             traceback.print_exc()
-            return []
\ No newline at end of file
+            return []
+
+    async def get_summary_dates_between(
+        self,
+        user_id: str,
+        start_date: str,
+        end_date: str,
+        summary_type: str = 'daily'
+    ) -> List[str]:
+        """특정 기간 중 요약이 있는 날짜 목록 (V2 스키마 - get_summary_dates_between RPC)
+
+        요약 본문 없이 고유 날짜만 조회하므로 응답 크기가 기간 일수로 제한된다.
+
+        Returns:
+            List[str]: 'YYYY-MM-DD' 날짜 목록 (오름차순, 중복 없음)
+        """
+        if not self.supabase:
+            return sorted({
+                t["session_date"]
+                for t in self._mock_turns.get(user_id, [])
+                if t["summary_type"] == summary_type and start_date <= t["session_date"] <= end_date
+            })
+
+        try:
+            response = await self.execute(self.supabase.rpc(
+                "get_summary_dates_between",
+                {
+                    "p_kakao_user_id": user_id,
+                    "p_start_date": start_date,
+                    "p_end_date": end_date,
+                    "p_summary_type": summary_type
+                }
+            ))
+            dates = [row["session_date"] for row in (response.data or [])]
+            print(f"✅ [DB V2] 기간별 요약 날짜 조회 완료: {user_id} ({start_date} ~ {end_date}) - {len(dates)}일")
+            return dates
+
+        except Exception as e:
+            print(f"❌ [DB V2] 기간별 요약 날짜 조회 실패: {e}")
+            return []
+
+    # ============================================
+    # 주간요약 v1.0 미리 생성 (weekly_v1_precomputed)
+    # ============================================
+
+    async def get_weekly_precompute_candidates(
+        self,
+        week_start: str,
+        week_end: str,
+        min_days: int,
+        after_user: Optional[str] = None,
+        limit: int = 200
+    ) -> List[Dict[str, Any]]:
+        """주간요약 미리 생성 대상 사용자 (get_weekly_precompute_candidates RPC)
+
+        kakao_user_id 오름차순 keyset 페이지 - 다음 페이지는 마지막 ID를 after_user로 전달한다.
+        이번 주 결과가 이미 저장된 사용자는 제외된다.
+
+        Returns:
+            List[Dict]: [{"kakao_user_id", "weekday_count"}, ...]
+        """
+        if not self.supabase:
+            counts: Dict[str, int] = {}
+            for (uid, session_date) in self._mock_daily_summaries:
+                if not (week_start <= session_date <= week_end):
+                    continue
+                if datetime.fromisoformat(session_date).weekday() > 4:
+                    continue
+                if after_user is not None and uid <= after_user:
+                    continue
+                if (uid, week_start) in self._mock_weekly_precomputed:
+                    continue
+                counts[uid] = counts.get(uid, 0) + 1
+            return [
+                {"kakao_user_id": uid, "weekday_count": count}
+                for uid, count in sorted(counts.items())
+                if count >= min_days
+            ][:limit]
+
+        try:
+            response = await self.execute(self.supabase.rpc(
+                "get_weekly_precompute_candidates",
+                {
+                    "p_week_start": week_start,
+                    "p_week_end": week_end,
+                    "p_min_days": min_days,
+                    "p_after_user": after_user,
+                    "p_limit": limit
+                }
+            ))
+            return response.data or []
+
+        except Exception as e:
+            print(f"❌ [DB V2] 주간요약 미리 생성 대상 조회 실패: {e}")
+            raise
+
+    async def get_weekly_v1_precomputed(self, user_id: str, week_start: str) -> Optional[Dict[str, Any]]:
+        """미리 생성된 주간요약 v1.0 조회 (PK 조회 1회)"""
+        if not self.supabase:
+            return self._mock_weekly_precomputed.get((user_id, week_start))
+
+        try:
+            response = await self.execute(
+                self.supabase.table("weekly_v1_precomputed")
+                .select("input_fingerprint, v1_summary, follow_up_questions, created_at")
+                .eq("kakao_user_id", user_id)
+                .eq("week_start", week_start)
+                .limit(1)
+            )
+            return response.data[0] if response.data else None
+
+        except Exception as e:
+            print(f"❌ [DB V2] 미리 생성된 주간요약 조회 실패: {e}")
+            return None
+
+    async def save_weekly_v1_precomputed(
+        self,
+        user_id: str,
+        week_start: str,
+        input_fingerprint: str,
+        v1_summary: str,
+        follow_up_questions: List[str]
+    ) -> bool:
+        """미리 생성한 주간요약 v1.0 + 역질문 저장 (같은 주는 덮어씀)"""
+        if not self.supabase:
+            self._mock_weekly_precomputed[(user_id, week_start)] = {
+                "input_fingerprint": input_fingerprint,
+                "v1_summary": v1_summary,
+                "follow_up_questions": follow_up_questions,
+                "created_at": datetime.now().isoformat()
+            }
+            return True
+
+        try:
+            await self.execute(self.supabase.table("weekly_v1_precomputed").upsert(
+                {
+                    "kakao_user_id": user_id,
+                    "week_start": week_start,
+                    "input_fingerprint": input_fingerprint,
+                    "v1_summary": v1_summary,
+                    "follow_up_questions": follow_up_questions,
+                    "created_at": datetime.now().isoformat()
+                },
+                on_conflict="kakao_user_id,week_start"
+            ))
+            return True
+
+        except Exception as e:
+            print(f"❌ [DB V2] 주간요약 미리 생성 결과 저장 실패: {e}")
+            raise
+
+    async def delete_weekly_v1_precomputed_before(self, week_start: str) -> None:
+        """지난 주차의 미리 생성 결과 정리"""
+        if not self.supabase:
+            for key in [key for key in self._mock_weekly_precomputed if key[1] < week_start]:
+                del self._mock_weekly_precomputed[key]
+            return
+
+        try:
+            await self.execute(
+                self.supabase.table("weekly_v1_precomputed")
+                .delete()
+                .lt("week_start", week_start)
+            )
+        except Exception as e:
+            print(f"⚠️ [DB V2] 지난 주간요약 미리 생성 결과 정리 실패: {e}")
+
+    # ============================================
+    # 알림톡 발송 큐 (notification_deliveries)
+    # ============================================
+
+    async def enqueue_notifications(self, rows: List[Dict[str, Any]], chunk_size: int = 1000) -> int:
+        """알림 예약 (dedup_key가 이미 있으면 건너뜀)
+
+        Args:
+            rows: [{"kakao_user_id", "template_code", "dedup_key", "payload", "send_at"(ISO, timezone 포함)}, ...]
+            chunk_size: INSERT 1회당 행 수 (대량 예약 시)
+
+        Returns:
+            int: 새로 예약된 건수
+        """
+        if not self.supabase:
+            inserted = 0
+            existing = {row["dedup_key"] for row in self._mock_notifications.values()}
+            for row in rows:
+                if row["dedup_key"] in existing:
+                    continue
+                existing.add(row["dedup_key"])
+                delivery_id = len(self._mock_notifications) + 1
+                send_at = datetime.fromisoformat(row["send_at"])
+                self._mock_notifications[delivery_id] = {
+                    **row,
+                    "id": delivery_id,
+                    "payload": row.get("payload") or {},
+                    "status": "pending",
+                    "attempts": 0,
+                    "next_attempt_at": send_at,
+                    "locked_until": None,
+                    "provider_message_id": None,
+                    "last_error": None,
+                }
+                inserted += 1
+            return inserted
+
+        inserted = 0
+        try:
+            for start in range(0, len(rows), chunk_size):
+                chunk = [
+                    {**row, "next_attempt_at": row["send_at"]}
+                    for row in rows[start:start + chunk_size]
+                ]
+                response = await self.execute(self.supabase.table("notification_deliveries").upsert(
+                    chunk,
+                    on_conflict="dedup_key",
+                    ignore_duplicates=True
+                ))
+                inserted += len(response.data or [])
+            return inserted
+
+        except Exception as e:
+            print(f"❌ [DB V2] 알림 예약 실패: {e}")
+            raise
+
+    async def claim_notification_deliveries(self, limit: int, lease_seconds: int) -> List[Dict[str, Any]]:
+        """발송 시각이 된 알림 선점 (claim_notification_deliveries RPC, attempts는 선점 시 증가)"""
+        if not self.supabase:
+            now = datetime.now(timezone.utc)
+            due = sorted(
+                (
+                    row for row in self._mock_notifications.values()
+                    if row["next_attempt_at"] <= now and (
+                        row["status"] == "pending"
+                        or (row["status"] == "sending" and row["locked_until"] < now)
+                    )
+                ),
+                key=lambda row: row["next_attempt_at"]
+            )[:limit]
+            for row in due:
+                row["status"] = "sending"
+                row["attempts"] += 1
+                row["locked_until"] = now + timedelta(seconds=lease_seconds)
+            return [dict(row) for row in due]
+
+        try:
+            response = await self.execute(self.supabase.rpc(
+                "claim_notification_deliveries",
+                {"p_limit": limit, "p_lease_seconds": lease_seconds}
+            ))
+            return response.data or []
+
+        except Exception as e:
+            print(f"❌ [DB V2] 알림 선점 실패: {e}")
+            raise
+
+    async def record_notification_results(self, results: List[Dict[str, Any]]) -> int:
+        """발송 결과 일괄 기록 (record_notification_results RPC)
+
+        Args:
+            results: [{"id", "status", "provider_message_id", "error", "next_attempt_at"(ISO)}, ...]
+
+        Returns:
+            int: 갱신된 건수
+        """
+        if not self.supabase:
+            updated = 0
+            for result in results:
+                row = self._mock_notifications.get(result["id"])
+                if not row or row["status"] != "sending":
+                    continue
+                row["status"] = result["status"]
+                row["provider_message_id"] = result.get("provider_message_id") or row["provider_message_id"]
+                row["last_error"] = result.get("error")
+                if result.get("next_attempt_at"):
+                    row["next_attempt_at"] = datetime.fromisoformat(result["next_attempt_at"])
+                row["locked_until"] = None
+                updated += 1
+            return updated
+
+        try:
+            response = await self.execute(self.supabase.rpc(
+                "record_notification_results",
+                {"p_results": results}
+            ))
+            return response.data or 0
+
+        except Exception as e:
+            print(f"❌ [DB V2] 알림 발송 결과 기록 실패: {e}")
+            raise
+
+    async def get_notification_delivery_counts(self) -> Dict[str, int]:
+        """상태별 알림 건수 (pending / sending / sent / failed)"""
+        if not self.supabase:
+            counts: Dict[str, int] = {}
+            for row in self._mock_notifications.values():
+                counts[row["status"]] = counts.get(row["status"], 0) + 1
+            return counts
+
+        try:
+            response = await self.execute(self.supabase.rpc("get_notification_delivery_counts"))
+            return {row["status"]: row["count"] for row in (response.data or [])}
+
+        except Exception as e:
+            print(f"❌ [DB V2] 알림 상태 집계 실패: {e}")
+            return {}
@@ -0,0 +1,109 @@
+"""요청 단위 conversation_states 세션 (Unit of Work)
+
+한 요청 안에서 여러 헬퍼(increment_weekday_record_count, update_daily_session_data,
+handle_rejection_flag 등)가 각자 get → upsert를 반복하던 것을 메모리상의 상태 하나로 모은다.
+
+- 세션이 열려 있는 동안 Database.get/upsert/update/delete_conversation_state는
+  DB 대신 세션 상태를 읽고 쓴다 (같은 user_id일 때만).
+- 요청 종료 시 flush()가 병합된 최종 상태를 upsert 1회로 저장한다.
+"""
+
+import copy
+import logging
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_active_session: ContextVar[Optional["ConversationStateSession"]] = ContextVar(
+    "conversation_state_session", default=None
+)
+
+
+def get_active_state_session(user_id: str) -> Optional["ConversationStateSession"]:
+    """현재 요청에서 열려 있는 user_id의 세션 반환 (없으면 None)"""
+    session = _active_session.get()
+    if session is not None and session.active and session.user_id == user_id:
+        return session
+    return None
+
+
+class ConversationStateSession:
+    """요청 동안 conversation_states 변경을 모아두었다가 한 번에 저장
+
+    Args:
+        db: Database 인스턴스
+        user_id: 카카오 사용자 ID
+        initial_state: load_request_cache에서 이미 조회한 conversation_state (없으면 None)
+    """
+
+    def __init__(self, db, user_id: str, initial_state: Optional[Dict[str, Any]]):
+        self.db = db
+        self.user_id = user_id
+        self.active = False
+        self._state = copy.deepcopy(initial_state) if initial_state else None
+        self._dirty = False
+        self._deleted = False
+        self._write_count = 0
+        self._token = None
+
+    def get(self) -> Optional[Dict[str, Any]]:
+        """현재 상태 조회 (호출자가 수정해도 세션에 영향 없도록 복사본 반환)"""
+        return copy.deepcopy(self._state)
+
+    def stage(self, current_step: str, temp_data: Dict[str, Any]) -> Dict[str, Any]:
+        """upsert 대신 세션 상태만 갱신"""
+        self._state = {
+            **(self._state or {}),
+            "kakao_user_id": self.user_id,
+            "current_step": current_step,
+            "temp_data": copy.deepcopy(temp_data),
+            "updated_at": datetime.now().isoformat()
+        }
+        self._dirty = True
+        self._deleted = False
+        self._write_count += 1
+        return self.get()
+
+    def delete(self) -> bool:
+        """삭제도 flush 시점까지 미룬다"""
+        existed = self._state is not None
+        self._state = None
+        self._dirty = True
+        self._deleted = True
+        self._write_count += 1
+        return existed
+
+    async def flush(self) -> None:
+        """병합된 최종 상태를 DB에 1회 반영"""
+        self.active = False
+        if not self._dirty:
+            return
+
+        if self._deleted:
+            await self.db.delete_conversation_state(self.user_id)
+        else:
+            await self.db.upsert_conversation_state(
+                self.user_id,
+                current_step=self._state.get("current_step"),
+                temp_data=self._state.get("temp_data") or {}
+            )
+
+        logger.info(
+            f"[StateSession] flush 완료 - user_id={self.user_id}, "
+            f"병합된 쓰기 {self._write_count}회 → DB 1회"
+        )
+        self._dirty = False
+        self._write_count = 0
+
+    async def __aenter__(self) -> "ConversationStateSession":
+        self.active = True
+        self._token = _active_session.set(self)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        try:
+            await self.flush()
+        finally:
+            _active_session.reset(self._token)
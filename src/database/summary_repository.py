@@ -158,7 +158,18 @@ async def get_all_summaries_v2(
     """
     try:
         if not db.supabase:
-            return []
+            summaries = [
+                {
+                    "uuid": t["ai_uuid"],
+                    "kakao_user_id": user_id,
+                    "content": t["ai_message"],
+                    "summary_type": t["summary_type"],
+                    "created_at": t["created_at"]
+                }
+                for t in db._mock_recent_turns(user_id)
+                if t["is_summary"] and (not summary_type or t["summary_type"] == summary_type)
+            ]
+            return summaries[:limit]
 
         query = db.supabase.table("ai_answer_messages") \
             .select("uuid, kakao_user_id, content, summary_type, created_at") \
@@ -168,9 +179,10 @@ async def get_all_summaries_v2(
         if summary_type:
             query = query.eq("summary_type", summary_type)
 
-        response = query.order("created_at", desc=True) \
-            .limit(limit) \
-            .execute()
+        response = await db.execute(
+            query.order("created_at", desc=True)
+            .limit(limit)
+        )
 
         summaries = response.data if response.data else []
         logger.info(
@@ -388,14 +400,16 @@ async def prepare_weekly_feedback_data(
 # =============================================================================
 
 async def count_this_week_weekday_records(db, user_id: str) -> int:
-    """이번 주 평일(월~금) 일일 요약 개수를 DB에서 동적으로 계산
+    """이번 주 평일(월~금) 중 일일 요약을 작성한 날 수를 DB에서 동적으로 계산
+
+    같은 날 요약을 여러 번 생성해도 하루로 센다.
 
     Args:
         db: Database 인스턴스
         user_id: 카카오 사용자 ID
 
     Returns:
-        int: 이번 주 평일 일일 요약 개수 (0 이상)
+        int: 이번 주 평일 일일 요약 작성일 수 (0~5)
     """
     from datetime import datetime, timedelta
 
@@ -410,17 +424,16 @@ async def count_this_week_weekday_records(db, user_id: str) -> int:
         # 이번 주 금요일 계산
         friday = monday + timedelta(days=4)
 
-        # DB에서 이번 주 월~금 사이의 일일 요약 개수 조회
-        # ai_answer_messages 테이블에서 is_summary=TRUE, summary_type='daily'인 레코드 카운트
-        records = await db.get_summaries_between_dates(
+        # DB에서 이번 주 월~금 중 일일 요약이 있는 날짜만 조회 (요약 본문은 전송하지 않음)
+        summary_dates = await db.get_summary_dates_between(
             user_id=user_id,
             start_date=monday.isoformat(),
             end_date=friday.isoformat(),
             summary_type='daily'
         )
 
-        count = len(records) if records else 0
-        logger.info(f"[SummaryRepo] 이번 주 평일 일일 요약 개수: {count} (기간: {monday} ~ {friday})")
+        count = len(summary_dates)
+        logger.info(f"[SummaryRepo] 이번 주 평일 일일 요약 작성일: {count}일 (기간: {monday} ~ {friday})")
 
         return count
 
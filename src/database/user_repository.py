@@ -16,8 +16,6 @@ async def get_user_with_context(db, user_id: str) -> Tuple[Optional[Dict[str, An
     Returns:
         (user_data, user_context): 사용자 정보 dict와 UserContext 튜플
     """
-    from ..chatbot.state import UserContext, UserMetadata, OnboardingStage
-
     # 병렬 DB 쿼리 (V2 스키마)
     import asyncio
     user, conv_state, recent_turns = await asyncio.gather(
@@ -26,6 +24,76 @@ async def get_user_with_context(db, user_id: str) -> Tuple[Optional[Dict[str, An
         db.get_recent_turns_v2(user_id, limit=1)
     )
 
+    user_context = build_user_context(user_id, user, conv_state, _last_turn_date(recent_turns))
+    return user, user_context
+
+
+async def load_request_context(
+    db,
+    user_id: str,
+    turn_limit: int = 3
+) -> Tuple[Optional[Dict[str, Any]], "UserContext", Optional[Dict[str, Any]], list]:
+    """요청 시작 시 필요한 데이터 일괄 로드 (load_request_context RPC 1회)
+
+    RPC 실패 시(함수 미배포 등) 개별 조회를 병렬로 실행해 같은 결과를 만든다.
+
+    Args:
+        db: Database 인스턴스
+        user_id: 카카오 사용자 ID
+        turn_limit: 오늘 대화 최근 N턴
+
+    Returns:
+        (user, user_context, conv_state, today_turns)
+    """
+    today = datetime.now().date().isoformat()
+    context = await db.get_request_context(user_id, today, turn_limit)
+
+    if context is not None:
+        user = context.get("user")
+        conv_state = context.get("conv_state")
+        last_turn_date = context.get("last_turn_date")
+        today_turns = context.get("today_turns") or []
+    else:
+        logger.warning(f"[UserRepo] load_request_context RPC 실패 → 개별 조회로 대체")
+        import asyncio
+        user, conv_state, recent_turns, today_turns = await asyncio.gather(
+            db.get_user(user_id),
+            db.get_conversation_state(user_id),
+            db.get_recent_turns_v2(user_id, limit=1),
+            db.get_conversation_history_by_date_v2(user_id, today, limit=turn_limit)
+        )
+        last_turn_date = _last_turn_date(recent_turns)
+
+    user_context = build_user_context(user_id, user, conv_state, last_turn_date)
+    return user, user_context, conv_state, today_turns
+
+
+def _last_turn_date(recent_turns: list) -> Optional[str]:
+    """최근 턴 목록에서 마지막 대화 날짜 추출 (V2: session_date 또는 created_at)"""
+    if not recent_turns:
+        return None
+    return recent_turns[0].get("session_date") or recent_turns[0].get("created_at", "")[:10]
+
+
+def build_user_context(
+    user_id: str,
+    user: Optional[Dict[str, Any]],
+    conv_state: Optional[Dict[str, Any]],
+    last_turn_date: Optional[str]
+) -> "UserContext":
+    """조회된 데이터로 UserContext 구성 (DB 접근 없음)
+
+    Args:
+        user_id: 카카오 사용자 ID
+        user: users 테이블 row (신규 사용자면 None)
+        conv_state: conversation_states row (없으면 None)
+        last_turn_date: 마지막 대화 날짜 (YYYY-MM-DD, 대화 없으면 None)
+
+    Returns:
+        UserContext
+    """
+    from ..chatbot.state import UserContext, UserMetadata, OnboardingStage
+
     # 신규 사용자 (users 테이블에 레코드 없음)
     if not user:
         # conversation_states에서 온보딩 진행 상태 로드
@@ -53,7 +121,7 @@ async def get_user_with_context(db, user_id: str) -> Tuple[Optional[Dict[str, An
             onboarding_stage=onboarding_stage,
             metadata=metadata
         )
-        return None, user_context
+        return user_context
 
     # user는 dict 객체
 
@@ -76,17 +144,13 @@ async def get_user_with_context(db, user_id: str) -> Tuple[Optional[Dict[str, An
         # daily_session_data는 날짜 기반으로 리셋 (V2 스키마)
         today = datetime.now().date().isoformat()
 
-        if recent_turns and len(recent_turns) > 0:
-            # V2: session_date 또는 created_at 사용
-            last_turn_date = recent_turns[0].get("session_date") or recent_turns[0].get("created_at", "")[:10]
-
-            if last_turn_date == today:
-                # 오늘 대화가 있으면 세션 유지
-                daily_session_data = temp_data.get("daily_session_data", {})
-                logger.info(f"[UserRepo] 세션 유지: conversation_count={daily_session_data.get('conversation_count', 0)}")
-            else:
-                # 다른 날 대화면 세션 리셋
-                logger.info(f"[UserRepo] 세션 리셋: last={last_turn_date}, today={today}")
+        if last_turn_date == today:
+            # 오늘 대화가 있으면 세션 유지
+            daily_session_data = temp_data.get("daily_session_data", {})
+            logger.info(f"[UserRepo] 세션 유지: conversation_count={daily_session_data.get('conversation_count', 0)}")
+        elif last_turn_date:
+            # 다른 날 대화면 세션 리셋
+            logger.info(f"[UserRepo] 세션 리셋: last={last_turn_date}, today={today}")
         else:
             logger.info(f"[UserRepo] 세션 리셋 (대화 히스토리 없음)")
 
@@ -109,7 +173,7 @@ async def get_user_with_context(db, user_id: str) -> Tuple[Optional[Dict[str, An
 
     logger.info(f"[UserRepo] onboarding_completed={onboarding_completed}, stage={user_context.onboarding_stage}")
 
-    return user, user_context
+    return user_context
 
 
 async def check_and_reset_daily_count(db, user_id: str) -> Tuple[int, bool]:
@@ -151,6 +215,9 @@ async def check_and_reset_daily_count(db, user_id: str) -> Tuple[int, bool]:
 async def increment_counts_with_check(db, user_id: str) -> Tuple[int, Optional[int]]:
     """daily_record_count 증가 및 평일 4회 달성 시 attendance_count 증가
 
+    날짜 리셋 / DAILY_TURNS_THRESHOLD 체크 / 평일 규칙은 increment_daily_counts RPC에서
+    원자적으로 처리한다 (get_user → update 반복 없이 DB 왕복 1회).
+
     Args:
         db: Database 인스턴스
         user_id: 카카오 사용자 ID
@@ -161,28 +228,15 @@ async def increment_counts_with_check(db, user_id: str) -> Tuple[int, Optional[i
             - new_attendance_count: 평일 4회 달성 시 증가된 attendance_count, 아니면 None
     """
     from ..config.business_config import DAILY_TURNS_THRESHOLD
-    from datetime import datetime
 
-    # daily_record_count 증가
-    new_daily_count = await db.increment_daily_record_count(user_id)
-
-    # DAILY_TURNS_THRESHOLD 달성 시 평일 여부 체크 후 attendance_count 증가
-    if new_daily_count == DAILY_TURNS_THRESHOLD:
-        now = datetime.now()
-        weekday = now.weekday()  # 0=월, 1=화, ..., 4=금, 5=토, 6=일
-
-        # 평일(월~금)만 attendance_count 증가
-        if weekday <= 4:
-            user = await db.get_user(user_id)
-            current_attendance = user.get("attendance_count", 0) if user else 0
-            new_attendance = await db.increment_attendance_count(user_id, new_daily_count)
-            logger.info(f"[UserRepo] 🎉 {DAILY_TURNS_THRESHOLD}회 달성 (평일)! attendance: {current_attendance} → {new_attendance}일차")
-            return new_daily_count, new_attendance
-        else:
-            logger.info(f"[UserRepo] {DAILY_TURNS_THRESHOLD}회 달성했지만 주말이므로 attendance_count 증가 안 함")
-            return new_daily_count, None
+    new_daily_count, new_attendance = await db.increment_daily_counts(user_id)
+
+    if new_attendance is not None:
+        logger.info(f"[UserRepo] 🎉 {DAILY_TURNS_THRESHOLD}회 달성 (평일)! attendance: {new_attendance}일차")
+    elif new_daily_count == DAILY_TURNS_THRESHOLD:
+        logger.info(f"[UserRepo] {DAILY_TURNS_THRESHOLD}회 달성했지만 주말이므로 attendance_count 증가 안 함")
 
-    return new_daily_count, None
+    return new_daily_count, new_attendance
 
 
 async def save_onboarding_metadata(db, user_id: str, metadata: "UserMetadata") -> None:
@@ -262,14 +316,16 @@ async def complete_onboarding(db, user_id: str) -> None:
     # 3. DB 온보딩 대화 턴 삭제 (혹시 저장된 경우 대비, V2 스키마)
     try:
         if not db.supabase:
-            logger.warning(f"[UserRepo] Supabase 미연결 - 온보딩 턴 삭제 스킵")
+            turn_count = len(db._mock_turns.pop(user_id, []))
+            logger.info(f"[UserRepo] 🗑️ 온보딩 턴 삭제 완료: {turn_count}개")
             return
 
         # 2-1. 삭제할 턴 조회
-        turns_response = db.supabase.table("message_history") \
-            .select("uuid, user_answer_key, ai_answer_key") \
-            .eq("kakao_user_id", user_id) \
-            .execute()
+        turns_response = await db.execute(
+            db.supabase.table("message_history")
+            .select("uuid, user_answer_key, ai_answer_key")
+            .eq("kakao_user_id", user_id)
+        )
 
         if not turns_response.data:
             logger.info(f"[UserRepo] 삭제할 온보딩 턴 없음")
@@ -280,24 +336,27 @@ async def complete_onboarding(db, user_id: str) -> None:
         ai_answer_keys = [turn["ai_answer_key"] for turn in turns_response.data]
 
         # 2-2. message_history 삭제
-        db.supabase.table("message_history") \
-            .delete() \
-            .eq("kakao_user_id", user_id) \
-            .execute()
+        await db.execute(
+            db.supabase.table("message_history")
+            .delete()
+            .eq("kakao_user_id", user_id)
+        )
 
         # 2-3. user_answer_messages 삭제
         if user_answer_keys:
-            db.supabase.table("user_answer_messages") \
-                .delete() \
-                .in_("uuid", user_answer_keys) \
-                .execute()
+            await db.execute(
+                db.supabase.table("user_answer_messages")
+                .delete()
+                .in_("uuid", user_answer_keys)
+            )
 
         # 2-4. ai_answer_messages 삭제
         if ai_answer_keys:
-            db.supabase.table("ai_answer_messages") \
-                .delete() \
-                .in_("uuid", ai_answer_keys) \
-                .execute()
+            await db.execute(
+                db.supabase.table("ai_answer_messages")
+                .delete()
+                .in_("uuid", ai_answer_keys)
+            )
 
         logger.info(f"[UserRepo] 🗑️ 온보딩 턴 삭제 완료: {turn_count}개")
 
@@ -223,6 +223,14 @@ def format_welcome_message(name: Optional[str] = None) -> str:
         return "안녕하세요! 반가워요. 커리어를 기록하고 돌아보는 시간을 함께 만들어가는 <3분커리어>입니다. 시작하기 전에 몇 가지만 여쭤볼게요."
 
 
+def format_onboarding_day_block_message(name: Optional[str] = None) -> str:
+    """온보딩 완료 당일 업무기록 차단 메시지"""
+    if name:
+        return f"{name}님, 내일부터 업무기록을 시작할 수 있어요. 잊지 않도록 <3분커리어>가 알림할게요!"
+    else:
+        return "내일부터 업무기록을 시작할 수 있어요. 잊지 않도록 <3분커리어>가 알림할게요!"
+
+
 def format_completion_message(name: Optional[str] = None) -> str:
     """온보딩 완료 메시지"""
     if name:
@@ -0,0 +1,10 @@
+"""카카오 콜백(비동기 응답) 서비스"""
+from .kakao_callback import (
+    KakaoCallbackDispatcher,
+    callback_waiting_response,
+)
+
+__all__ = [
+    "KakaoCallbackDispatcher",
+    "callback_waiting_response",
+]
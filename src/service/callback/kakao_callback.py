@@ -0,0 +1,183 @@
+"""카카오 콜백(useCallback) 응답 서비스
+
+오픈빌더는 스킬 응답을 5초 안에 받아야 한다. 주간요약/일일요약처럼 LLM 호출이 이어지는
+흐름은 이 제한을 넘길 수 있으므로:
+
+1. 웹훅 요청마다 백그라운드 태스크를 만들어 그래프를 바로 실행한다.
+   (고정 워커 풀을 두지 않음 - 워커가 사용자 락 / 진행 중 요청 합류 / 콜백 재시도 동안 묶여
+   뒤 요청이 큐에서 sync_timeout을 소모하기 때문. 동시 실행은 DB 스레드 풀(DB_MAX_WORKERS)과
+   LLM 입장 제어(LLM_CONCURRENCY_LIMITS)가 실제 용량에 맞춰 제한한다)
+2. KAKAO_CALLBACK_SYNC_TIMEOUT 안에 끝나면 결과를 그대로 동기 응답한다.
+3. 넘으면 {"useCallback": true} 대기 응답을 먼저 돌려주고,
+   작업이 끝나면 최종 simple_text_response를 userRequest.callbackUrl로 POST한다.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+import httpx
+
+from ...config.config import (
+    KAKAO_CALLBACK_SYNC_TIMEOUT,
+    KAKAO_CALLBACK_POST_TIMEOUT,
+    KAKAO_CALLBACK_MAX_RETRIES,
+)
+from ...utils.utils import simple_text_response
+
+logger = logging.getLogger(__name__)
+
+CALLBACK_WAITING_TEXT = "답변을 준비하고 있어요. 잠시만 기다려주세요! ⏳"
+CALLBACK_ERROR_TEXT = "처리 중 오류가 발생했습니다. 다시 시도해주세요."
+
+
+def callback_waiting_response(text: str = CALLBACK_WAITING_TEXT) -> Dict[str, Any]:
+    """useCallback 대기 응답 (카카오 콜백 API 포맷)"""
+    return {
+        "version": "2.0",
+        "useCallback": True,
+        "data": {
+            "text": text
+        }
+    }
+
+
+@dataclass
+class CallbackJob:
+    """백그라운드 태스크로 실행되는 웹훅 처리 작업"""
+    handler: Callable[[], Awaitable[Dict[str, Any]]]
+    callback_url: str
+    result: asyncio.Future
+    use_callback: bool = False  # 동기 응답 시간 초과 → 콜백으로 전달해야 함
+    label: str = ""
+
+
+class KakaoCallbackDispatcher:
+    """웹훅 작업 태스크 실행 + 콜백 전송
+
+    Args:
+        sync_timeout: 동기 응답을 기다리는 최대 시간 (초)
+        client: 콜백 POST에 사용할 httpx.AsyncClient (테스트 시 주입)
+    """
+
+    def __init__(
+        self,
+        sync_timeout: float = KAKAO_CALLBACK_SYNC_TIMEOUT,
+        client: Optional[httpx.AsyncClient] = None
+    ):
+        self.sync_timeout = sync_timeout
+        self._client = client
+        self._owns_client = client is None
+        self._tasks: Set[asyncio.Task] = set()
+        self.stats = {
+            "sync_responses": 0,
+            "callback_responses": 0,
+            "callback_failures": 0,
+            "in_flight": 0,
+            "max_in_flight": 0,
+        }
+
+    async def start(self) -> None:
+        """콜백 전송용 HTTP 클라이언트 생성 (앱 시작 시 1회)"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=KAKAO_CALLBACK_POST_TIMEOUT)
+            logger.info("[KakaoCallback] 시작")
+
+    async def stop(self, drain_timeout: float = 10.0) -> None:
+        """종료 (앱 종료 시, 처리 중인 작업과 콜백 전송은 drain_timeout까지 기다림)"""
+        if self._tasks:
+            _, pending = await asyncio.wait(set(self._tasks), timeout=drain_timeout)
+            if pending:
+                logger.warning(f"[KakaoCallback] 미처리 작업 {len(pending)}건 남기고 종료")
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        logger.info("[KakaoCallback] 종료")
+
+    async def dispatch(
+        self,
+        handler: Callable[[], Awaitable[Dict[str, Any]]],
+        callback_url: str,
+        label: str = ""
+    ) -> Dict[str, Any]:
+        """웹훅 작업을 백그라운드 태스크로 실행하고 동기 응답 또는 useCallback 대기 응답 반환
+
+        Args:
+            handler: 최종 카카오 응답을 만드는 코루틴 함수 (인자 없음)
+            callback_url: userRequest.callbackUrl
+            label: 로그용 식별자 (user_id 등)
+
+        Returns:
+            sync_timeout 안에 끝나면 최종 응답, 아니면 callback_waiting_response()
+        """
+        if self._client is None:
+            await self.start()
+
+        job = CallbackJob(
+            handler=handler,
+            callback_url=callback_url,
+            result=asyncio.get_running_loop().create_future(),
+            label=label
+        )
+
+        # 대기열 없이 바로 실행 → sync_timeout은 작업이 실제로 시작된 시점부터 흐름
+        task = asyncio.create_task(self._run_job(job), name=f"kakao-callback-{label}")
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+        await asyncio.wait({job.result}, timeout=self.sync_timeout)
+
+        # 완료 여부 확인과 use_callback 설정 사이에 await가 없으므로 작업 태스크와 경합하지 않음
+        if job.result.done():
+            self.stats["sync_responses"] += 1
+            return job.result.result()
+
+        job.use_callback = True
+        logger.info(f"[KakaoCallback] {self.sync_timeout}초 초과 → 콜백 응답 전환: {label}")
+        return callback_waiting_response()
+
+    async def _run_job(self, job: CallbackJob) -> None:
+        self.stats["in_flight"] += 1
+        self.stats["max_in_flight"] = max(self.stats["max_in_flight"], self.stats["in_flight"])
+        try:
+            try:
+                response = await job.handler()
+            except Exception as e:
+                logger.error(f"[KakaoCallback] 작업 처리 오류 ({job.label}): {e}")
+                response = simple_text_response(CALLBACK_ERROR_TEXT)
+
+            if not job.result.done():
+                job.result.set_result(response)
+
+            if job.use_callback:
+                await self._post_callback(job, response)
+        finally:
+            self.stats["in_flight"] -= 1
+
+    async def _post_callback(self, job: CallbackJob, response: Dict[str, Any]) -> bool:
+        """최종 응답을 콜백 URL로 전송 (네트워크 오류/5xx 시 재시도)"""
+        for attempt in range(KAKAO_CALLBACK_MAX_RETRIES + 1):
+            try:
+                res = await self._client.post(job.callback_url, json=response)
+                if res.status_code < 500:
+                    if res.status_code >= 400:
+                        logger.error(f"[KakaoCallback] 콜백 거부 ({res.status_code}): {res.text}")
+                        self.stats["callback_failures"] += 1
+                        return False
+                    self.stats["callback_responses"] += 1
+                    logger.info(f"[KakaoCallback] 콜백 전송 완료: {job.label}")
+                    return True
+                logger.warning(f"[KakaoCallback] 콜백 서버 오류 ({res.status_code}), 재시도 {attempt + 1}")
+            except httpx.HTTPError as e:
+                logger.warning(f"[KakaoCallback] 콜백 전송 실패: {e}, 재시도 {attempt + 1}")
+
+            if attempt < KAKAO_CALLBACK_MAX_RETRIES:
+                await asyncio.sleep(0.5 * (attempt + 1))
+
+        self.stats["callback_failures"] += 1
+        logger.error(f"[KakaoCallback] 콜백 전송 최종 실패: {job.label}")
+        return False
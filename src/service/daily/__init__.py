@@ -1,5 +1,5 @@
 """Daily Agent - 일일 기록 비즈니스 로직"""
-from .intent_classifier import classify_user_intent
+from .intent_classifier import classify_user_intent, get_intent_cache_stats
 from .record_handler import (
     process_daily_record,
     save_daily_conversation,
@@ -8,13 +8,30 @@ from .record_handler import (
     check_and_suggest_weekly_summary
 )
 from .summary_generator import generate_daily_summary
+from .speculation import SpeculativeReply, start_speculative_reply, get_speculation_stats
+from .summary_prefetch import get_summary_prefetch_stats
+from .quick_replies import (
+    QUICK_REPLY_INTENTS,
+    build_quick_replies,
+    parse_quick_reply_intent,
+    get_quick_reply_stats,
+)
 
 __all__ = [
     "classify_user_intent",
+    "get_intent_cache_stats",
     "process_daily_record",
     "save_daily_conversation",
     "DailyRecordResponse",
     "generate_daily_summary",
     "save_and_increment",
     "check_and_suggest_weekly_summary",
+    "SpeculativeReply",
+    "start_speculative_reply",
+    "get_speculation_stats",
+    "get_summary_prefetch_stats",
+    "QUICK_REPLY_INTENTS",
+    "build_quick_replies",
+    "parse_quick_reply_intent",
+    "get_quick_reply_stats",
 ]
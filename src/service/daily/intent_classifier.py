@@ -1,34 +1,117 @@
 """사용자 의도 분류 서비스 (일일 기록 세부 의도)"""
 from langchain_core.messages import SystemMessage, HumanMessage
 from ...prompt.intent_prompts import INTENT_CLASSIFICATION_SYSTEM_PROMPT, INTENT_CLASSIFICATION_USER_PROMPT
+from ...config.config import (
+    INTENT_CACHE_TTL,
+    INTENT_CACHE_SIZE,
+    LOCAL_INTENT_CLASSIFIER_ENABLED,
+    LOCAL_INTENT_CONFIDENCE_THRESHOLD,
+)
+from ...utils.cache import TTLCache
 from langsmith import traceable
 from datetime import datetime
+from typing import Tuple
 import logging
+import re
+import unicodedata
 
 logger = logging.getLogger(__name__)
 
 
-@traceable(name="classify_user_intent")
-async def classify_user_intent(message: str, llm, user_context=None, db=None) -> str:
-    """사용자 의도 분류 (summary/edit_summary/continue/restart/no_record_today)
+# 일일기록 세부 의도 라벨 (INTENT_CLASSIFICATION_USER_PROMPT 응답 형식)
+INTENT_LABELS = (
+    "summary", "edit_summary", "no_edit_needed", "end_conversation",
+    "rejection", "continue", "restart",
+)
 
-    Args:
-        message: 사용자 메시지
-        llm: LLM 인스턴스
-        user_context: 사용자 컨텍스트 (선택)
-        db: Database 인스턴스 (선택)
+# (직전 봇 메시지 상태, 정규화된 사용자 메시지) → LLM 원본 라벨
+_intent_cache = TTLCache(maxsize=INTENT_CACHE_SIZE, ttl=INTENT_CACHE_TTL)
 
-    Returns:
-        str: "summary", "edit_summary", "continue", "restart", "no_record_today" 중 하나
+_TRAILING_PUNCT = re.compile(r"[\s.!?~^]+$")
+_WHITESPACE = re.compile(r"\s+")
+
+# 직전 봇 메시지 상태 판별 (INTENT_CLASSIFICATION_USER_PROMPT의 맥락 규칙과 동일한 단서)
+_SUMMARY_ASK = re.compile(r"정리해\s*드릴까요|요약해\s*드릴까요")
+_EDIT_ASK = re.compile(r"수정하고 싶은|디테일은 없나요")
+_SUMMARY_SHOWN = re.compile(r"요약|📝|커리어 메모")
+
+_ENHANCED_MESSAGE = re.compile(r"^\[Previous bot\]: (?P<bot>.*)\n\[User\]: (?P<user>.*)$", re.DOTALL)
+
+
+def normalize_intent_message(message: str) -> str:
+    """캐시 키용 메시지 정규화 ("요약해줘!!" / " 요약해줘 " → "요약해줘")"""
+    text = unicodedata.normalize("NFKC", message or "").strip().lower()
+    text = _WHITESPACE.sub(" ", text)
+    return _TRAILING_PUNCT.sub("", text)
+
+
+def split_enhanced_message(message: str) -> Tuple[str, str]:
+    """service_router_node의 강화 메시지를 (사용자 메시지, 직전 봇 메시지)로 분리"""
+    match = _ENHANCED_MESSAGE.match(message or "")
+    if match:
+        return match.group("user"), match.group("bot")
+    return message or "", ""
+
+
+def bot_message_state(bot_message: str) -> str:
+    """직전 봇 메시지 → 상태 (none / ask: 요약 제안 / edit: 수정 질문 / shown: 요약 표시 / other)"""
+    if not bot_message:
+        return "none"
+    if _SUMMARY_ASK.search(bot_message):
+        return "ask"
+    if _EDIT_ASK.search(bot_message):
+        return "edit"
+    if _SUMMARY_SHOWN.search(bot_message):
+        return "shown"
+    return "other"
+
+
+def intent_cache_key(message: str) -> Tuple[str, str]:
+    """강화 메시지 → 캐시 키 (직전 봇 메시지 원문 대신 상태만 사용)
+
+    직전 봇 메시지는 LLM 응답이거나 이름이 들어간 문구라 원문을 키에 넣으면 거의 적중하지 않는다.
     """
+    user_message, bot_message = split_enhanced_message(message)
+    return bot_message_state(bot_message), normalize_intent_message(user_message)
+
+
+def get_intent_cache_stats() -> dict:
+    """의도 분류 캐시 hit/miss 통계"""
+    return _intent_cache.stats()
+
+
+async def _classify_raw_intent(message: str, llm) -> str:
+    """LLM 원본 라벨 분류 (사용자 컨텍스트 보정 전, 캐시 적용)"""
+    cache_key = intent_cache_key(message)
+    cached = _intent_cache.get(cache_key)
+    if cached is not None:
+        logger.info(f"⚡ [IntentClassifier] 캐시 히트: '{message}' → '{cached}'")
+        return cached
+
     intent_response = await llm.ainvoke([
         SystemMessage(content=INTENT_CLASSIFICATION_SYSTEM_PROMPT),
         HumanMessage(content=INTENT_CLASSIFICATION_USER_PROMPT.format(message=message))
     ])
 
     intent = intent_response.content.strip().lower()
-    logger.info(f"🎯 [IntentClassifier] 사용자 메시지: '{message}' → 분류 결과: '{intent}'")
 
+    # 형식에 맞는 라벨만 캐시 (설명문 등 비정상 응답은 매번 재분류)
+    if intent in INTENT_LABELS:
+        _intent_cache.set(cache_key, intent)
+
+    return intent
+
+
+def apply_intent_context(intent: str, user_context=None) -> str:
+    """LLM 라벨을 사용자 상태에 맞게 보정
+
+    Args:
+        intent: LLM 원본 라벨
+        user_context: 사용자 컨텍스트 (없으면 보정 없이 반환)
+
+    Returns:
+        str: 보정된 최종 인텐트
+    """
     # edit_summary 의도는 요약이 존재할 때만 유효
     if "edit_summary" in intent and user_context:
         last_summary_at = user_context.daily_session_data.get("last_summary_at")
@@ -52,5 +135,35 @@ async def classify_user_intent(message: str, llm, user_context=None, db=None) ->
             logger.info(f"🔄 [IntentClassifier] summary이지만 오늘 대화 없음 → no_record_today로 변경")
             return "no_record_today"
 
+    return intent
+
+
+@traceable(name="classify_user_intent")
+async def classify_user_intent(message: str, llm, user_context=None, db=None) -> str:
+    """사용자 의도 분류 (summary/edit_summary/continue/restart/no_record_today)
+
+    Args:
+        message: 사용자 메시지
+        llm: LLM 인스턴스
+        user_context: 사용자 컨텍스트 (선택)
+        db: Database 인스턴스 (선택)
+
+    Returns:
+        str: "summary", "edit_summary", "continue", "restart", "no_record_today" 중 하나
+    """
+    intent = None
+    if LOCAL_INTENT_CLASSIFIER_ENABLED:
+        # 1차: 로컬 분류기 (확신도 높은 경우만, LLM 호출 없음)
+        from .local_intent_classifier import get_local_intent_classifier
+        intent = get_local_intent_classifier().classify(message, LOCAL_INTENT_CONFIDENCE_THRESHOLD)
+
+    if intent is None:
+        # 2차: LLM 분류 (캐시 적용)
+        intent = await _classify_raw_intent(message, llm)
+
+    logger.info(f"🎯 [IntentClassifier] 사용자 메시지: '{message}' → 분류 결과: '{intent}'")
+
+    intent = apply_intent_context(intent, user_context)
+
     logger.info(f"✅ [IntentClassifier] 최종 인텐트: '{intent}'")
     return intent
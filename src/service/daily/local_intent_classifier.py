@@ -0,0 +1,141 @@
+"""로컬 경량 의도 분류기 (일일기록 세부 의도)
+
+LLM 호출 전에 봇 질문에 바로 답하는 짧은 메시지(요약 제안 뒤의 "응", 요약 뒤의 "좋아요" 등)를
+마이크로초 단위로 분류한다. 직전 봇 메시지 상태가 LOCAL_INTENT_BOT_STATES가 아니거나
+LOCAL_INTENT_MAX_LENGTH보다 긴 메시지, 확신도가 LOCAL_INTENT_CONFIDENCE_THRESHOLD 미만인 메시지는
+None을 돌려주고 기존 LLM 분류(classify_user_intent)로 넘어간다.
+(일반 업무 문장은 학습 데이터가 적어 "종료 처리 로직 만들었어" → end_conversation처럼 확신하고 틀림)
+
+모델: 문자 n-gram(1~3) + 직전 봇 메시지 상태 특징을 쓰는 다중 클래스 로지스틱 회귀.
+- 직전 봇 메시지는 상태(none/ask/edit/shown/other)로 요약하고,
+  사용자 n-gram과 상태를 결합한 특징("ask|응")으로 맥락 의존 응답을 구분한다.
+- 학습 데이터: intent_golden_cases.INTENT_GOLDEN_CASES (앱 시작 시 1회 학습)
+- 정확도/커버리지/지연 벤치마크: tests/benchmark_local_intent_classifier.py
+"""
+
+import logging
+import math
+import random
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from ...config.config import LOCAL_INTENT_BOT_STATES, LOCAL_INTENT_MAX_LENGTH
+from .intent_classifier import bot_message_state, normalize_intent_message, split_enhanced_message
+
+logger = logging.getLogger(__name__)
+
+
+def extract_features(user_message: str, bot_message: str = "") -> Set[str]:
+    """문자 n-gram + 봇 상태 결합 특징"""
+    text = normalize_intent_message(user_message)
+    padded = f"^{text}$"
+    state = bot_message_state(bot_message)
+
+    features = {f"state:{state}", f"len:{min(len(text) // 4, 5)}"}
+    for n in (1, 2, 3):
+        for i in range(len(padded) - n + 1):
+            gram = padded[i:i + n]
+            if not gram.strip():
+                continue
+            features.add(f"u:{gram}")
+            features.add(f"{state}|{gram}")
+    return features
+
+
+class LocalIntentClassifier:
+    """다중 클래스 로지스틱 회귀 (순수 파이썬, 희소 이진 특징)
+
+    Args:
+        epochs: SGD 학습 반복 횟수
+        learning_rate: 학습률
+        seed: 셔플 시드 (학습 결과 재현용)
+    """
+
+    def __init__(self, epochs: int = 40, learning_rate: float = 0.3, seed: int = 0):
+        self.epochs = epochs
+        self.learning_rate = learning_rate
+        self.seed = seed
+        self.labels: List[str] = []
+        self.weights: Dict[str, Dict[str, float]] = {}
+
+    def fit(self, cases: Sequence[Tuple[str, str, str]]) -> "LocalIntentClassifier":
+        """(사용자 메시지, 직전 봇 메시지, 정답) 목록으로 학습"""
+        samples = [(extract_features(user, bot), label) for user, bot, label in cases]
+        self.labels = sorted({label for _, label in samples})
+        self.weights = {label: defaultdict(float) for label in self.labels}
+
+        rnd = random.Random(self.seed)
+        order = list(range(len(samples)))
+        for _ in range(self.epochs):
+            rnd.shuffle(order)
+            for i in order:
+                features, target = samples[i]
+                probs = self._softmax(features)
+                for label in self.labels:
+                    gradient = (1.0 if label == target else 0.0) - probs[label]
+                    if gradient == 0.0:
+                        continue
+                    w = self.weights[label]
+                    for f in features:
+                        w[f] += self.learning_rate * gradient
+
+        # 학습 후에는 조회 전용 dict로 고정 (미등록 특징이 가중치 테이블에 추가되지 않도록)
+        self.weights = {label: dict(w) for label, w in self.weights.items()}
+        return self
+
+    def _softmax(self, features: Iterable[str]) -> Dict[str, float]:
+        scores = {
+            label: sum(self.weights[label].get(f, 0.0) for f in features)
+            for label in self.labels
+        }
+        top = max(scores.values())
+        exp = {label: math.exp(s - top) for label, s in scores.items()}
+        total = sum(exp.values())
+        return {label: v / total for label, v in exp.items()}
+
+    def predict_proba(self, user_message: str, bot_message: str = "") -> Dict[str, float]:
+        return self._softmax(extract_features(user_message, bot_message))
+
+    def predict(self, user_message: str, bot_message: str = "") -> Tuple[str, float]:
+        """(라벨, 확신도) 반환"""
+        probs = self.predict_proba(user_message, bot_message)
+        label = max(probs, key=probs.get)
+        return label, probs[label]
+
+    def is_applicable(self, user_message: str, bot_message: str = "") -> bool:
+        """로컬 분류 대상인지 (봇 질문에 바로 답하는 짧은 메시지만, 그 외는 항상 LLM)"""
+        return (
+            bot_message_state(bot_message) in LOCAL_INTENT_BOT_STATES
+            and len(normalize_intent_message(user_message)) <= LOCAL_INTENT_MAX_LENGTH
+        )
+
+    def classify(self, message: str, threshold: float) -> Optional[str]:
+        """강화 메시지 분류 - 대상 메시지이고 확신도가 threshold 이상일 때만 라벨 반환, 아니면 None"""
+        user_message, bot_message = split_enhanced_message(message)
+        if not self.is_applicable(user_message, bot_message):
+            return None
+        label, confidence = self.predict(user_message, bot_message)
+        if confidence >= threshold:
+            logger.info(f"⚡ [LocalIntent] '{user_message}' → '{label}' (확신도 {confidence:.3f})")
+            return label
+        logger.info(f"[LocalIntent] 확신도 부족 ({label} {confidence:.3f}) → LLM 분류")
+        return None
+
+
+_classifier: Optional[LocalIntentClassifier] = None
+
+
+def get_local_intent_classifier() -> LocalIntentClassifier:
+    """골든 데이터셋으로 학습된 분류기 (최초 호출 시 1회 학습, 이후 재사용)"""
+    global _classifier
+    if _classifier is None:
+        from .intent_golden_cases import INTENT_GOLDEN_CASES
+
+        start = time.perf_counter()
+        _classifier = LocalIntentClassifier().fit(INTENT_GOLDEN_CASES)
+        logger.info(
+            f"[LocalIntent] 학습 완료 - {len(INTENT_GOLDEN_CASES)}건, "
+            f"{(time.perf_counter() - start) * 1000:.0f}ms"
+        )
+    return _classifier
@@ -0,0 +1,135 @@
+"""일일기록 퀵리플라이 버튼 (버튼 의도 → 세부 의도 분류 생략)
+
+요약 제안 / 요약 결과처럼 다음 답이 몇 가지로 정해진 봇 메시지에는 카카오 quickReplies를
+붙이고, service_router는 classify_user_intent(로컬 분류기 / LLM) 없이 버튼 의도를 그대로 쓴다.
+
+- 요약 제안 후: 정리해줘(summary) / 계속할래(continue) / 오늘은 끝(end_conversation)
+- 요약 결과 후: 수정할게(edit_request) / 좋아요(no_edit_needed)
+
+버튼 의도는 두 경로로 받는다.
+1. 블록 버튼 (환경 변수 KAKAO_QUICK_REPLY_BLOCK_ID가 있을 때): 오픈빌더는 extra를
+   "action": "block" 버튼에만 action.clientExtra로 전달한다 ("message" 버튼의 extra는 버려짐).
+   이 스킬을 연결한 블록 ID를 지정해야 한다.
+2. 버튼 문구 일치: 직전 봇 메시지가 요약 제안(ask) / 요약 표시(shown)이고 사용자 메시지가
+   그 버튼 문구와 정확히 같으면 해당 의도로 본다 (message 버튼 / 직접 입력 모두 해당).
+"""
+
+import logging
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# clientExtra에 담는 키
+QUICK_REPLY_INTENT_KEY = "quick_reply_intent"
+
+# 버튼으로 받을 수 있는 세부 의도 (그 외 값은 무시하고 분류)
+QUICK_REPLY_INTENTS = (
+    "summary", "continue", "end_conversation", "edit_request", "no_edit_needed",
+)
+
+# (버튼 문구, 세부 의도)
+SUMMARY_OFFER_BUTTONS: List[Tuple[str, str]] = [
+    ("정리해줘", "summary"),
+    ("계속할래", "continue"),
+    ("오늘은 끝", "end_conversation"),
+]
+SUMMARY_RESULT_BUTTONS: List[Tuple[str, str]] = [
+    ("수정할게", "edit_request"),
+    ("좋아요", "no_edit_needed"),
+]
+
+# 직전 봇 메시지 상태 (intent_classifier.bot_message_state) → 그 메시지에 붙는 버튼
+_BUTTONS_BY_BOT_STATE: Dict[str, List[Tuple[str, str]]] = {
+    "ask": SUMMARY_OFFER_BUTTONS,
+    "shown": SUMMARY_RESULT_BUTTONS,
+}
+
+_stats: Dict[str, int] = {}
+
+
+def build_quick_replies(
+    buttons: List[Tuple[str, str]],
+    block_id: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """(문구, 의도) 목록 → 카카오 quickReplies 형식
+
+    Args:
+        buttons: (버튼 문구, 세부 의도) 목록
+        block_id: 버튼이 호출할 블록 ID (기본: 환경 변수 KAKAO_QUICK_REPLY_BLOCK_ID,
+            없으면 message 버튼 → 문구 일치로 의도 판별)
+
+    Returns:
+        list: quickReplies 항목 (messageText는 버튼 문구 그대로 채팅창에 표시됨)
+    """
+    block_id = block_id if block_id is not None else os.getenv("KAKAO_QUICK_REPLY_BLOCK_ID", "")
+    if not block_id:
+        return [
+            {"label": label, "action": "message", "messageText": label}
+            for label, _ in buttons
+        ]
+    return [
+        {
+            "label": label,
+            "action": "block",
+            "blockId": block_id,
+            "messageText": label,
+            "extra": {QUICK_REPLY_INTENT_KEY: intent},
+        }
+        for label, intent in buttons
+    ]
+
+
+def parse_quick_reply_intent(action: Optional[Dict[str, Any]]) -> Optional[str]:
+    """웹훅 action.clientExtra에서 버튼 의도 추출 (없거나 알 수 없는 값이면 None)"""
+    extra = (action or {}).get("clientExtra") or {}
+    intent = extra.get(QUICK_REPLY_INTENT_KEY) if isinstance(extra, dict) else None
+    return intent if intent in QUICK_REPLY_INTENTS else None
+
+
+def match_quick_reply_label(message: str) -> Optional[str]:
+    """강화 메시지의 사용자 메시지가 직전 봇 메시지의 버튼 문구와 같으면 그 의도 (아니면 None)
+
+    Args:
+        message: service_router_node의 강화 메시지 (직전 봇 메시지 포함)
+    """
+    from .intent_classifier import bot_message_state, split_enhanced_message
+
+    user_message, bot_message = split_enhanced_message(message)
+    buttons = _BUTTONS_BY_BOT_STATE.get(bot_message_state(bot_message), [])
+    text = user_message.strip()
+    for label, intent in buttons:
+        if text == label:
+            return intent
+    return None
+
+
+def resolve_quick_reply_intent(intent: str, user_context) -> str:
+    """버튼 의도를 사용자 상태에 맞게 보정 (분류 결과와 같은 규칙 적용)
+
+    Args:
+        intent: 버튼 의도 (QUICK_REPLY_INTENTS)
+        user_context: UserContext 객체
+
+    Returns:
+        str: daily_agent_node에 전달할 세부 의도
+    """
+    from .intent_classifier import apply_intent_context
+
+    _stats[intent] = _stats.get(intent, 0) + 1
+    has_summary = bool(user_context.daily_session_data.get("last_summary_at"))
+
+    # 수정 버튼은 요약이 있을 때만 의미 있음
+    if intent == "edit_request" and not has_summary:
+        return "continue"
+
+    if intent == "continue":
+        # 요약 제안을 미룸 → 다음 제안은 다시 SUMMARY_SUGGESTION_THRESHOLD회 대화 후
+        user_context.daily_session_data["conversation_count"] = 0
+
+    return apply_intent_context(intent, user_context)
+
+
+def get_quick_reply_stats() -> Dict[str, int]:
+    """버튼 의도별 사용 횟수 (의도 분류를 생략한 횟수)"""
+    return dict(_stats)
@@ -1,9 +1,11 @@
 """일일 기록 처리 비즈니스 로직 (Daily Agent용)"""
 import logging
-from typing import Tuple, Optional, Dict, Any
+from typing import Tuple, Optional, Dict, Any, List
 from datetime import datetime
 from dataclasses import dataclass
 
+from .quick_replies import build_quick_replies, SUMMARY_OFFER_BUTTONS, SUMMARY_RESULT_BUTTONS
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,6 +18,8 @@ class DailyRecordResponse:
     is_edit_summary: bool = False
     should_update_session: bool = True
     early_return: bool = False  # 7일차 제안 등으로 조기 종료 필요 시 True
+    summary_offered: bool = False  # 요약 제안 응답 (저장 후 백그라운드로 요약 미리 생성)
+    quick_replies: Optional[List[Dict[str, Any]]] = None  # 응답에 붙일 카카오 퀵리플라이 버튼
 
 
 async def handle_no_record_today(
@@ -128,6 +132,30 @@ async def handle_no_edit_needed(
     )
 
 
+async def handle_edit_request(
+    user_context,
+    metadata
+) -> DailyRecordResponse:
+    """요약 수정 버튼 처리 (수정할 내용 안내)
+
+    안내 턴은 저장하지 않는다 → 다음 메시지의 직전 봇 메시지가 요약으로 남아
+    수정 내용이 edit_summary로 분류된다.
+
+    Args:
+        user_context: UserContext 객체
+        metadata: UserMetadata 객체
+
+    Returns:
+        DailyRecordResponse: 처리 결과
+    """
+    logger.info(f"[DailyRecordHandler] 요약 수정 버튼 → 수정 내용 요청")
+
+    return DailyRecordResponse(
+        ai_response=f"{metadata.name}님, 어떤 부분을 고치거나 추가할까요? 알려주시면 요약에 반영할게요!",
+        early_return=True
+    )
+
+
 async def handle_edit_summary(
     db,
     user_id: str,
@@ -190,20 +218,54 @@ async def handle_edit_summary(
         is_summary_response=True,
         summary_type='daily',
         is_edit_summary=True,
-        early_return=weekly_suggested
+        early_return=weekly_suggested,
+        quick_replies=None if weekly_suggested else build_quick_replies(SUMMARY_RESULT_BUTTONS)
     )
 
 
+async def generate_today_summary(
+    db,
+    user_id: str,
+    today: str,
+    user_data: Dict[str, Any],
+    llm
+) -> Tuple[list, Any, Any]:
+    """오늘 전체 대화 조회 + 일일 요약 생성 (요약 요청 / 백그라운드 미리 생성 공용)
+
+    Args:
+        db: Database 인스턴스
+        user_id: 사용자 ID
+        today: 요약 대상 날짜 (YYYY-MM-DD)
+        user_data: _build_user_data() 결과 (중복 DB 쿼리 방지)
+        llm: LLM 인스턴스
+
+    Returns:
+        (all_today_turns, input_data, output): 조회한 대화(최신순), DailySummaryInput, DailySummaryOutput
+    """
+    from ...database import prepare_daily_summary_data
+    from .summary_generator import generate_daily_summary
+
+    all_today_turns = await db.get_conversation_history_by_date_v2(user_id, today, limit=50)
+    logger.info(f"[DailyRecordHandler] 요약용 전체 대화 조회: {len(all_today_turns)}턴")
+
+    input_data = await prepare_daily_summary_data(db, user_id, all_today_turns, user_data=user_data)
+    output = await generate_daily_summary(input_data, llm)
+    return all_today_turns, input_data, output
+
+
 async def handle_summary_request(
     db,
     user_id: str,
     message: str,
     user_context,
     metadata,
-    llm
+    llm,
+    cached_today_turns: Optional[list] = None
 ) -> DailyRecordResponse:
     """요약 생성 요청 처리
 
+    요약 제안 직후 백그라운드로 미리 생성된 요약이 있고, 그 뒤로 새 턴이 없으면 그대로 사용한다.
+
     Args:
         db: Database 인스턴스
         user_id: 사용자 ID
@@ -211,26 +273,26 @@ async def handle_summary_request(
         user_context: UserContext 객체
         metadata: UserMetadata 객체
         llm: LLM 인스턴스
+        cached_today_turns: 캐시된 오늘 최근 대화 (최신순, 미리 생성된 요약 유효성 확인용)
 
     Returns:
         DailyRecordResponse: 처리 결과
     """
-    from ...database import prepare_daily_summary_data
-    from .summary_generator import generate_daily_summary
+    from .summary_prefetch import take_prefetched_summary
 
     logger.info(f"[DailyRecordHandler] 요약 생성 요청")
 
-    # 요약 생성 시 오늘 전체 대화 조회
     today = datetime.now().date().isoformat()
-    all_today_turns = await db.get_conversation_history_by_date_v2(user_id, today, limit=50)
-    logger.info(f"[DailyRecordHandler] 요약용 전체 대화 조회: {len(all_today_turns)}턴")
+    last_turn_index = cached_today_turns[0].get("turn_index") if cached_today_turns else None
 
-    # user_data 캐시 전달 (중복 DB 쿼리 방지)
-    user_data = _build_user_data(metadata, user_context)
+    prefetched = await take_prefetched_summary(user_id, today, last_turn_index)
+    if prefetched:
+        input_data, output = prefetched
+    else:
+        # 요약 생성 시 오늘 전체 대화 조회 (user_data 캐시 전달 - 중복 DB 쿼리 방지)
+        user_data = _build_user_data(metadata, user_context)
+        _, input_data, output = await generate_today_summary(db, user_id, today, user_data, llm)
 
-    # 요약 생성
-    input_data = await prepare_daily_summary_data(db, user_id, all_today_turns, user_data=user_data)
-    output = await generate_daily_summary(input_data, llm)
     ai_response = output.summary_text
     current_attendance_count = input_data.attendance_count
 
@@ -250,7 +312,8 @@ async def handle_summary_request(
         is_summary_response=True,
         summary_type='daily',
         is_edit_summary=False,
-        early_return=weekly_suggested
+        early_return=weekly_suggested,
+        quick_replies=None if weekly_suggested else build_quick_replies(SUMMARY_RESULT_BUTTONS)
     )
 
 
@@ -282,12 +345,56 @@ async def handle_restart_request(
     )
 
 
+async def generate_general_reply(
+    message: str,
+    metadata,
+    recent_turns: list,
+    llm
+) -> str:
+    """일반 대화 질문 생성 (LLM 호출만 수행, 사용자 상태 변경 없음)
+
+    handle_general_conversation과 추측 실행(speculation)에서 함께 사용한다.
+
+    Args:
+        message: 사용자 메시지
+        metadata: UserMetadata 객체
+        recent_turns: 오늘 최근 대화 턴 목록
+        llm: LLM 인스턴스
+
+    Returns:
+        str: 생성된 AI 응답
+    """
+    from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
+    from ...prompt.daily_record_prompt import DAILY_CONVERSATION_SYSTEM_PROMPT
+
+    system_prompt = DAILY_CONVERSATION_SYSTEM_PROMPT.format(
+        name=metadata.name or "없음",
+        job_title=metadata.job_title or "없음",
+        total_years=metadata.total_years or "없음",
+        job_years=metadata.job_years or "없음",
+        career_goal=metadata.career_goal or "없음",
+        project_name=metadata.project_name or "없음",
+        recent_work=metadata.recent_work or "없음"
+    )
+
+    messages = [SystemMessage(content=system_prompt)]
+    # 최근 3턴 사용 (메모리 최적화)
+    for turn in recent_turns:
+        messages.append(HumanMessage(content=turn["user_message"]))
+        messages.append(AIMessage(content=turn["ai_message"]))
+    messages.append(HumanMessage(content=message))
+
+    response = await llm.ainvoke(messages)
+    return response.content
+
+
 async def handle_general_conversation(
     message: str,
     user_context,
     metadata,
     cached_today_turns: list,
-    llm
+    llm,
+    speculative_reply=None
 ) -> DailyRecordResponse:
     """일반 대화 처리 (질문 생성)
 
@@ -297,13 +404,11 @@ async def handle_general_conversation(
         metadata: UserMetadata 객체
         cached_today_turns: 캐시된 오늘 대화 히스토리
         llm: LLM 인스턴스
+        speculative_reply: 의도 분류와 병렬로 시작한 응답 생성 (SpeculativeReply, 없으면 None)
 
     Returns:
         DailyRecordResponse: 처리 결과
     """
-    from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
-    from ...prompt.daily_record_prompt import DAILY_CONVERSATION_SYSTEM_PROMPT
-
     from ...config.business_config import SUMMARY_SUGGESTION_THRESHOLD
 
     current_session_count = user_context.daily_session_data.get("conversation_count", 0)
@@ -319,33 +424,21 @@ async def handle_general_conversation(
     if new_count >= SUMMARY_SUGGESTION_THRESHOLD:
         logger.info(f"[DailyRecordHandler] {SUMMARY_SUGGESTION_THRESHOLD}회 대화 완료 → 요약 제안")
         return DailyRecordResponse(
-            ai_response=f"{metadata.name}님, 오늘도 많은 이야기 나눠주셨네요! 지금까지 내용을 정리해드릴까요?"
+            ai_response=f"{metadata.name}님, 오늘도 많은 이야기 나눠주셨네요! 지금까지 내용을 정리해드릴까요?",
+            summary_offered=True,
+            quick_replies=build_quick_replies(SUMMARY_OFFER_BUTTONS)
         )
 
     # 캐시된 대화 히스토리 재사용
     recent_turns = cached_today_turns
     logger.info(f"[DailyRecordHandler] 캐시된 대화 재사용: {len(recent_turns)}턴")
 
-    # 자연스러운 질문 생성
-    system_prompt = DAILY_CONVERSATION_SYSTEM_PROMPT.format(
-        name=metadata.name or "없음",
-        job_title=metadata.job_title or "없음",
-        total_years=metadata.total_years or "없음",
-        job_years=metadata.job_years or "없음",
-        career_goal=metadata.career_goal or "없음",
-        project_name=metadata.project_name or "없음",
-        recent_work=metadata.recent_work or "없음"
-    )
-
-    messages = [SystemMessage(content=system_prompt)]
-    # 최근 3턴 사용 (메모리 최적화)
-    for turn in recent_turns:
-        messages.append(HumanMessage(content=turn["user_message"]))
-        messages.append(AIMessage(content=turn["ai_message"]))
-    messages.append(HumanMessage(content=message))
+    # 의도 분류와 병렬로 생성해 둔 응답이 있으면 사용 (실패 시 새로 생성)
+    ai_response_final = await speculative_reply.take() if speculative_reply else None
 
-    response = await llm.ainvoke(messages)
-    ai_response_final = response.content
+    # 자연스러운 질문 생성
+    if ai_response_final is None:
+        ai_response_final = await generate_general_reply(message, metadata, recent_turns, llm)
 
     logger.info(f"[DailyRecordHandler] ✅ 질문 생성 완료, 대화 횟수: {new_count}")
 
@@ -382,7 +475,8 @@ async def save_daily_conversation(
     user_id: str,
     message: str,
     result: DailyRecordResponse,
-    user_context
+    user_context,
+    llm=None
 ) -> Tuple[int, Optional[int]]:
     """일일 대화 저장 + 카운트 증가 + 평일 카운트 통합 처리
 
@@ -392,6 +486,7 @@ async def save_daily_conversation(
         message: 사용자 메시지
         result: DailyRecordResponse (처리 결과)
         user_context: UserContext 객체
+        llm: LLM 인스턴스 (요약 제안 시 요약 미리 생성용, 없으면 미리 생성 안 함)
 
     Returns:
         (updated_daily_count, new_attendance)
@@ -404,6 +499,7 @@ async def save_daily_conversation(
     should_increment = not (result.is_summary_response and not result.is_edit_summary)
 
     # 대화 저장 + 카운트 증가
+    # (summary_type='daily' 요약은 save_conversation_turn RPC가 daily_summaries에도 함께 upsert)
     updated_daily_count, new_attendance = await save_and_increment(
         db, user_id, message, result.ai_response, user_context,
         is_summary=result.is_summary_response,
@@ -416,11 +512,19 @@ async def save_daily_conversation(
         weekday_count = await increment_weekday_record_count(db, user_id)
         logger.info(f"[DailyRecordHandler] 평일 작성 카운트: {weekday_count}일")
 
-        # TODO: 평일 2일 이상 작성 시 알림톡 예약 (카카오 비즈니스 플랫폼 연동 필요)
-        # if weekday_count >= 2:
-        #     from ...service.notification.kakao_alimtalk import schedule_weekly_summary_notification
-        #     send_time = calculate_next_saturday_6pm()
-        #     await schedule_weekly_summary_notification(user_id, send_time)
+        # 주간요약 조건 충족 시 토요일 18시 알림톡 예약 (INSERT 1회, 발송은 NotificationDispatcher)
+        from ...config import WEEKLY_SUMMARY_MIN_WEEKDAY_COUNT, get_kst_now
+        from ...config.config import ALIMTALK_ENABLED
+        if ALIMTALK_ENABLED and weekday_count >= WEEKLY_SUMMARY_MIN_WEEKDAY_COUNT:
+            from ..notification.kakao_alimtalk import (
+                schedule_weekly_summary_notification,
+                calculate_next_weekly_time,
+            )
+            try:
+                send_time = calculate_next_weekly_time(weekday=5, hour=18, now=get_kst_now()).isoformat()
+                await schedule_weekly_summary_notification(db, user_id, send_time)
+            except Exception as e:
+                logger.warning(f"[DailyRecordHandler] 주간요약 알림톡 예약 실패 (대화 저장은 유지): {e}")
 
     # 세션 데이터 업데이트
     await update_daily_session_data(
@@ -430,6 +534,15 @@ async def save_daily_conversation(
         current_step="daily_recording" if user_context.daily_session_data else "daily_summary_completed"
     )
 
+    # 요약 제안 턴이 저장되면 요약을 미리 생성, 그 외의 새 턴은 미리 생성된 요약을 무효화
+    from .summary_prefetch import start_summary_prefetch, invalidate_summary_prefetch
+    if result.summary_offered and llm is not None:
+        user_data = _build_user_data(user_context.metadata, user_context)
+        user_data["daily_record_count"] = updated_daily_count  # 다음 요청에서 로드될 값과 동일하게
+        start_summary_prefetch(db, user_id, user_data, llm)
+    else:
+        invalidate_summary_prefetch(user_id, "new_turn")
+
     current_session_count = user_context.daily_session_data.get("conversation_count", 0)
     logger.info(f"[DailyRecordHandler] 저장 완료: conversation_count={current_session_count}, daily_record_count={updated_daily_count}")
 
@@ -443,7 +556,8 @@ async def process_daily_record(
     user_intent: str,
     user_context,
     cached_today_turns: list,
-    llm
+    llm,
+    speculative_reply=None
 ) -> DailyRecordResponse:
     """일일 기록 요청 전체 처리
 
@@ -455,6 +569,7 @@ async def process_daily_record(
         user_context: UserContext 객체
         cached_today_turns: 캐시된 오늘 대화 히스토리
         llm: LLM 인스턴스
+        speculative_reply: 추측 실행 중인 일반 대화 응답 (일반 대화로 처리될 때만 사용)
 
     Returns:
         DailyRecordResponse: 처리 결과
@@ -464,7 +579,7 @@ async def process_daily_record(
     # user_intent가 None인 경우 처리
     if user_intent is None:
         logger.error(f"[DailyRecordHandler] ❌ user_intent가 None입니다! 일반 대화로 fallback")
-        return await handle_general_conversation(message, user_context, metadata, cached_today_turns, llm)
+        return await handle_general_conversation(message, user_context, metadata, cached_today_turns, llm, speculative_reply)
 
     # 오늘 기록 없이 요약 요청한 경우
     if "no_record_today" in user_intent:
@@ -496,8 +611,9 @@ async def process_daily_record(
 
     elif "weekly_weekday_only" in user_intent:
         # 평일에 주간요약 요청한 경우
+        from ..weekly.fallback_handler import format_weekday_only_message
         return DailyRecordResponse(
-            ai_response="주간요약은 주말(토요일 오후 6시 이후)에만 가능해요! 평일에는 일일기록을 꾸준히 작성해주세요 😊",
+            ai_response=format_weekday_only_message(),
             early_return=True
         )
 
@@ -513,13 +629,17 @@ async def process_daily_record(
     elif "no_edit_needed" in user_intent and user_context.daily_session_data.get("last_summary_at"):
         return await handle_no_edit_needed(user_context, metadata)
 
+    # 요약 수정 버튼 (수정 내용 안내)
+    elif "edit_request" in user_intent:
+        return await handle_edit_request(user_context, metadata)
+
     # 요약 수정 요청
     elif "edit_summary" in user_intent:
         return await handle_edit_summary(db, user_id, message, user_context, metadata, llm)
 
     # 요약 요청
     elif "summary" in user_intent:
-        return await handle_summary_request(db, user_id, message, user_context, metadata, llm)
+        return await handle_summary_request(db, user_id, message, user_context, metadata, llm, cached_today_turns)
 
     # 재시작 요청
     elif "restart" in user_intent:
@@ -527,7 +647,7 @@ async def process_daily_record(
 
     # 일반 대화 (질문 생성)
     else:
-        return await handle_general_conversation(message, user_context, metadata, cached_today_turns, llm)
+        return await handle_general_conversation(message, user_context, metadata, cached_today_turns, llm, speculative_reply)
 
 
 # =============================================================================
@@ -0,0 +1,168 @@
+"""일반 대화 응답 추측 실행 (의도 분류와 병렬)
+
+service_router_node는 세부 의도 분류(LLM 1회)를 기다린 뒤 daily_agent_node에서
+일반 대화 응답(LLM 1회)을 만든다. 대부분의 메시지는 "continue"로 분류되므로
+SPECULATIVE_REPLY_ENABLED이면 분류와 동시에 일반 대화 응답 생성을 시작하고:
+
+- 분류 결과가 continue → 진행 중인 응답을 그대로 사용 (LLM 왕복 ~1회)
+- 다른 의도 → 진행 중이면 취소, 이미 끝났으면 폐기
+
+추측 실행은 LLM 호출만 하고 사용자 상태(conversation_count, 저장, 카운트)는 건드리지 않는다.
+채택 이후의 처리는 기존 handle_general_conversation 흐름 그대로다.
+낭비 비용은 get_speculation_stats()의 cancelled / discarded로 확인한다.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+from ...config.config import (
+    SPECULATIVE_REPLY_ENABLED,
+    LOCAL_INTENT_CLASSIFIER_ENABLED,
+    LOCAL_INTENT_CONFIDENCE_THRESHOLD,
+)
+from ...config.business_config import SUMMARY_SUGGESTION_THRESHOLD
+
+logger = logging.getLogger(__name__)
+
+# 추측 실행 통계 (프로세스 단위)
+_stats: Dict[str, int] = {
+    "started": 0,    # 추측 실행 시작
+    "used": 0,       # 분류 결과 continue → 응답 채택
+    "cancelled": 0,  # 다른 의도 → 생성 중 취소
+    "discarded": 0,  # 다른 의도 → 이미 생성 완료된 응답 폐기
+    "failed": 0,     # 추측 실행 오류 → 기존 방식으로 재생성
+}
+
+
+def get_speculation_stats() -> Dict[str, Any]:
+    """추측 실행 통계 (wasted = 취소 + 폐기, 낭비된 LLM 호출 수)"""
+    wasted = _stats["cancelled"] + _stats["discarded"]
+    started = _stats["started"]
+    return {
+        **_stats,
+        "wasted": wasted,
+        "hit_rate": round(_stats["used"] / started, 3) if started else 0.0,
+    }
+
+
+class SpeculativeReply:
+    """의도 분류와 병렬로 실행 중인 일반 대화 응답 생성
+
+    take() 또는 discard() 중 하나만 효력이 있다 (이후 호출은 무시).
+    """
+
+    def __init__(self, task: "asyncio.Task[str]"):
+        self._task = task
+        self._settled = False
+
+    async def take(self) -> Optional[str]:
+        """추측 응답 채택 - 생성이 끝날 때까지 대기, 실패 시 None (호출자가 새로 생성)"""
+        if self._settled:
+            return None
+        self._settled = True
+
+        try:
+            reply = await self._task
+        except asyncio.CancelledError:
+            raise  # 호출자(요청) 취소 - 추측 작업도 함께 취소됨
+        except Exception as e:
+            _stats["failed"] += 1
+            logger.warning(f"[Speculation] 추측 응답 생성 실패 → 재생성: {e}")
+            return None
+
+        _stats["used"] += 1
+        logger.info(f"⚡ [Speculation] 추측 응답 채택 ({get_speculation_stats()})")
+        return reply
+
+    def discard(self, reason: str = "") -> None:
+        """추측 응답 폐기 - 생성 중이면 취소"""
+        if self._settled:
+            return
+        self._settled = True
+
+        if not self._task.done():
+            self._task.cancel()
+            _stats["cancelled"] += 1
+        else:
+            if not self._task.cancelled():
+                self._task.exception()  # 미조회 예외 경고 방지
+            _stats["discarded"] += 1
+
+        logger.info(f"[Speculation] 추측 응답 폐기 ({reason}) ({get_speculation_stats()})")
+
+
+def should_speculate(enhanced_message: str, user_context, cached_conv_state: Optional[dict] = None) -> bool:
+    """추측 실행 여부 판단 - 일반 대화 응답이 필요할 가능성이 높고, 분류에 LLM 호출이 필요한 경우만
+
+    Args:
+        enhanced_message: 직전 봇 메시지가 포함된 사용자 메시지 (의도 분류 입력)
+        user_context: UserContext 객체
+        cached_conv_state: 캐시된 conversation_state
+
+    Returns:
+        bool: 추측 실행 여부
+    """
+    if not SPECULATIVE_REPLY_ENABLED:
+        return False
+
+    # 이번 턴이 요약 제안 턴이면 LLM 응답 생성 자체가 없음
+    conversation_count = user_context.daily_session_data.get("conversation_count", 0)
+    if conversation_count + 1 >= SUMMARY_SUGGESTION_THRESHOLD:
+        return False
+
+    # 주간 흐름(QnA 진행 중, 주간요약 제안 대기)은 일반 대화로 가지 않음
+    if cached_conv_state:
+        temp_data = cached_conv_state.get("temp_data", {}) or {}
+        if temp_data.get("weekly_qna_session", {}).get("active"):
+            return False
+        if temp_data.get("weekly_summary_ready") or cached_conv_state.get("current_step") == "weekly_summary_pending":
+            return False
+
+    # 로컬 분류기가 확신하면 분류가 즉시 끝나므로 병렬화 이득이 없음
+    if LOCAL_INTENT_CLASSIFIER_ENABLED:
+        from .local_intent_classifier import get_local_intent_classifier, split_enhanced_message
+
+        classifier = get_local_intent_classifier()
+        user_message, bot_message = split_enhanced_message(enhanced_message)
+        if classifier.is_applicable(user_message, bot_message):
+            _, confidence = classifier.predict(user_message, bot_message)
+            if confidence >= LOCAL_INTENT_CONFIDENCE_THRESHOLD:
+                return False
+
+    return True
+
+
+def start_speculative_reply(
+    message: str,
+    enhanced_message: str,
+    user_context,
+    cached_today_turns: list,
+    llm,
+    cached_conv_state: Optional[dict] = None
+) -> Optional[SpeculativeReply]:
+    """조건이 맞으면 일반 대화 응답 생성을 백그라운드로 시작
+
+    Args:
+        message: 사용자 메시지 (응답 생성 입력)
+        enhanced_message: 직전 봇 메시지가 포함된 사용자 메시지 (추측 여부 판단용)
+        user_context: UserContext 객체
+        cached_today_turns: 캐시된 오늘 대화 히스토리
+        llm: 일반 대화용 LLM 인스턴스 (daily_agent_node와 동일해야 함)
+        cached_conv_state: 캐시된 conversation_state
+
+    Returns:
+        Optional[SpeculativeReply]: 시작한 경우 핸들, 아니면 None
+    """
+    if not should_speculate(enhanced_message, user_context, cached_conv_state):
+        return None
+
+    from .record_handler import generate_general_reply
+
+    metadata = user_context.metadata
+    task = asyncio.create_task(
+        generate_general_reply(message, metadata, cached_today_turns or [], llm)
+    )
+    _stats["started"] += 1
+    logger.info(f"[Speculation] 의도 분류와 병렬로 일반 대화 응답 생성 시작")
+    return SpeculativeReply(task)
@@ -9,6 +9,7 @@ from ...prompt.daily_summary_prompt import (
     DAILY_SUMMARY_CORRECTION_INSTRUCTION
 )
 from ...utils.schemas import DailySummaryInput, DailySummaryOutput
+from ...utils.llm_governor import llm_priority, SUMMARY
 from langsmith import traceable
 import logging
 
@@ -57,11 +58,12 @@ async def generate_daily_summary(
             system_prompt = DAILY_SUMMARY_SYSTEM_PROMPT
             logger.info(f"[DailySummary] ℹ️ 일반 요약 생성 모드")
 
-        # LLM 호출
-        summary_response = await llm.ainvoke([
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=summary_prompt)
-        ])
+        # LLM 호출 (무거운 호출 → 대화 응답보다 낮은 우선순위)
+        with llm_priority(SUMMARY):
+            summary_response = await llm.ainvoke([
+                SystemMessage(content=system_prompt),
+                HumanMessage(content=summary_prompt)
+            ])
 
         summary_text = summary_response.content
 
@@ -0,0 +1,146 @@
+"""일일 요약 미리 생성 (요약 제안 직후 백그라운드)
+
+conversation_count가 SUMMARY_SUGGESTION_THRESHOLD에 도달하면 봇이 "정리해드릴까요?"라고
+묻고, 사용자는 거의 항상 "응"이라고 답한다. 제안 턴이 저장되는 즉시 요약 생성을
+백그라운드로 시작해 두고, "응" 요청은 결과를 바로 사용한다.
+
+- 키: (user_id, 날짜, 마지막 turn_index) - 미리 생성 시점의 오늘 대화 기준
+- 무효화: 그 사용자의 새 턴 저장 시 (save_daily_conversation) 즉시 폐기,
+  요청 시점의 마지막 turn_index가 다르면 폐기 후 새로 생성
+- 생성 중에 "응"이 도착하면 진행 중인 작업을 기다린다 (중복 생성 없음)
+"""
+
+import asyncio
+import contextvars
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+from ...config.config import (
+    SUMMARY_PREFETCH_ENABLED,
+    SUMMARY_PREFETCH_TTL,
+    SUMMARY_PREFETCH_CACHE_SIZE,
+)
+from ...utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# user_id → (날짜, 생성 작업) / 작업 결과: (마지막 turn_index, DailySummaryInput, DailySummaryOutput)
+_prefetched = TTLCache(maxsize=SUMMARY_PREFETCH_CACHE_SIZE, ttl=SUMMARY_PREFETCH_TTL)
+
+_stats: Dict[str, int] = {
+    "started": 0,      # 미리 생성 시작
+    "hits": 0,         # 요약 요청에서 사용
+    "stale": 0,        # 날짜/turn_index 불일치로 폐기
+    "invalidated": 0,  # 새 턴 저장으로 폐기
+    "failed": 0,       # 생성 실패 (요청 시 새로 생성)
+}
+
+
+def get_summary_prefetch_stats() -> Dict[str, Any]:
+    """요약 미리 생성 통계"""
+    return {**_stats, "pending": len(_prefetched)}
+
+
+async def _generate(db, user_id: str, today: str, user_data: Dict[str, Any], llm):
+    from .record_handler import generate_today_summary
+
+    all_today_turns, input_data, output = await generate_today_summary(db, user_id, today, user_data, llm)
+    last_turn_index = all_today_turns[0].get("turn_index") if all_today_turns else None
+    logger.info(f"[SummaryPrefetch] 요약 미리 생성 완료 - user_id={user_id}, turn_index={last_turn_index}")
+    return last_turn_index, input_data, output
+
+
+def _discard(task: "asyncio.Task") -> None:
+    if not task.done():
+        task.cancel()
+    elif not task.cancelled():
+        task.exception()  # 미조회 예외 경고 방지
+
+
+def start_summary_prefetch(db, user_id: str, user_data: Dict[str, Any], llm) -> bool:
+    """요약 제안 턴 저장 직후 호출 - 백그라운드로 요약 생성 시작
+
+    Args:
+        db: Database 인스턴스
+        user_id: 사용자 ID
+        user_data: 요약 입력용 사용자 정보 (_build_user_data 결과)
+        llm: 요약 생성 LLM 인스턴스 (handle_summary_request와 동일해야 함)
+
+    Returns:
+        bool: 시작 여부
+    """
+    if not SUMMARY_PREFETCH_ENABLED:
+        return False
+
+    from datetime import datetime
+
+    invalidate_summary_prefetch(user_id, "restart")
+    today = datetime.now().date().isoformat()
+
+    # 요청 단위 ContextVar(상태 세션 등)를 물려받지 않도록 빈 컨텍스트에서 실행
+    task = asyncio.create_task(
+        _generate(db, user_id, today, user_data, llm),
+        context=contextvars.Context()
+    )
+    # 만료/LRU로 캐시에서 빠져 아무도 꺼내지 않은 작업의 예외 경고 방지
+    task.add_done_callback(_discard)
+    _prefetched.set(user_id, (today, task))
+    _stats["started"] += 1
+    logger.info(f"[SummaryPrefetch] 요약 제안 → 백그라운드 요약 생성 시작 - user_id={user_id}")
+    return True
+
+
+def invalidate_summary_prefetch(user_id: str, reason: str = "") -> None:
+    """미리 생성된(또는 생성 중인) 요약 폐기"""
+    entry = _prefetched.pop(user_id)
+    if entry is None:
+        return
+    _discard(entry[1])
+    _stats["invalidated"] += 1
+    logger.info(f"[SummaryPrefetch] 미리 생성된 요약 폐기 ({reason}) - user_id={user_id}")
+
+
+async def take_prefetched_summary(
+    user_id: str,
+    today: str,
+    last_turn_index: Optional[int]
+) -> Optional[Tuple[Any, Any]]:
+    """요약 요청 시 미리 생성된 요약 꺼내기 (1회용)
+
+    Args:
+        user_id: 사용자 ID
+        today: 요청 날짜 (YYYY-MM-DD)
+        last_turn_index: 요청 시점 오늘 마지막 turn_index (캐시된 today_turns 기준)
+
+    Returns:
+        Optional[(DailySummaryInput, DailySummaryOutput)]: 유효하면 결과, 아니면 None
+    """
+    entry = _prefetched.pop(user_id)
+    if entry is None:
+        return None
+
+    prefetched_date, task = entry
+    if prefetched_date != today:
+        _discard(task)
+        _stats["stale"] += 1
+        return None
+
+    try:
+        prefetched_turn_index, input_data, output = await task
+    except asyncio.CancelledError:
+        raise  # 요청 자체가 취소됨 (캐시에서 꺼낸 작업이므로 다른 곳에서 취소되지 않음)
+    except Exception as e:
+        _stats["failed"] += 1
+        logger.warning(f"[SummaryPrefetch] 미리 생성 실패 → 새로 생성: {e}")
+        return None
+
+    if prefetched_turn_index != last_turn_index:
+        _stats["stale"] += 1
+        logger.info(
+            f"[SummaryPrefetch] 미리 생성 이후 대화 변경 (turn_index {prefetched_turn_index} → {last_turn_index}) → 새로 생성"
+        )
+        return None
+
+    _stats["hits"] += 1
+    logger.info(f"⚡ [SummaryPrefetch] 미리 생성된 요약 사용 - user_id={user_id} ({get_summary_prefetch_stats()})")
+    return input_data, output
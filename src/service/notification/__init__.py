@@ -1 +1,22 @@
 """알림톡 발송 서비스"""
+from .kakao_alimtalk import (
+    schedule_weekly_summary_notification,
+    calculate_next_weekly_time,
+    calculate_next_saturday_6pm,
+)
+from .dispatcher import NotificationDispatcher
+from .transport import (
+    NotificationTransport,
+    HttpAlimtalkTransport,
+    FakeTransport,
+)
+
+__all__ = [
+    "schedule_weekly_summary_notification",
+    "calculate_next_weekly_time",
+    "calculate_next_saturday_6pm",
+    "NotificationDispatcher",
+    "NotificationTransport",
+    "HttpAlimtalkTransport",
+    "FakeTransport",
+]
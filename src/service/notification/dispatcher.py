@@ -0,0 +1,260 @@
+"""알림톡 발송 디스패처 (notification_deliveries 큐 → transport)
+
+예약은 notification_deliveries에 INSERT만 하고(웹훅 경로에서는 행 1건), 발송은 이 디스패처가 맡는다.
+
+1. 폴러: 발송 시각이 된 알림을 ALIMTALK_CLAIM_SIZE건씩 선점 (SKIP LOCKED, 여러 인스턴스 안전)
+2. 선점한 알림을 transport.max_batch_size 단위 배치로 나눠 작업 큐에 넣음
+3. 워커 ALIMTALK_WORKERS개: 토큰 버킷(배치 크기만큼 토큰)으로 초당 발송 건수 제한 → send_batch
+4. 결과를 배치 단위로 기록 - 성공 sent / 재시도 가능 실패는 지수 백오프 후 pending /
+   재시도 불가 또는 ALIMTALK_MAX_ATTEMPTS 초과는 failed
+
+발송 중 프로세스가 죽으면 선점(locked_until)이 만료된 뒤 다른 워커가 다시 가져간다.
+
+별도 프로세스 1개로 실행 (웹훅 서버와 분리):
+    python -m src.service.notification.dispatcher
+    python -m src.service.notification.dispatcher --drain   # 지금 발송할 알림만 처리하고 종료
+
+토큰 버킷은 프로세스마다 따로라 디스패처를 N개 띄우면 발송 속도가 N x ALIMTALK_RATE_PER_SEC가 된다
+(선점은 안전하지만 속도 상한은 나눠지지 않음). 웹 서버 안에서 돌리는 것(ALIMTALK_DISPATCHER_IN_PROCESS)은
+uvicorn 워커 / 인스턴스가 1개일 때만 켤 것.
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from ...config.config import (
+    ALIMTALK_TRANSPORT,
+    ALIMTALK_RATE_PER_SEC,
+    ALIMTALK_BURST,
+    ALIMTALK_BATCH_SIZE,
+    ALIMTALK_WORKERS,
+    ALIMTALK_CLAIM_SIZE,
+    ALIMTALK_POLL_INTERVAL,
+    ALIMTALK_LEASE_SECONDS,
+    ALIMTALK_MAX_ATTEMPTS,
+    ALIMTALK_RETRY_BASE_DELAY,
+)
+from ...utils.rate_limiter import TokenBucket
+from .transport import DeliveryResult, NotificationMessage, NotificationTransport, create_transport
+
+logger = logging.getLogger(__name__)
+
+
+def retry_delay(attempts: int, base_delay: float = ALIMTALK_RETRY_BASE_DELAY) -> float:
+    """재시도 대기 시간 (초) - base * 2^(시도-1) + 최대 10% 지터 (동시 실패 건이 한꺼번에 재시도되지 않도록)"""
+    delay = base_delay * (2 ** max(attempts - 1, 0))
+    return delay + random.uniform(0, delay * 0.1)
+
+
+class NotificationDispatcher:
+    """알림톡 발송 큐 워커
+
+    Args:
+        db: Database 인스턴스
+        transport: 발송 transport (기본: ALIMTALK_TRANSPORT 설정)
+        num_workers: 동시에 API를 호출하는 워커 수
+        rate: 초당 발송 건수 상한
+        burst: 순간 허용 발송 건수 (배치 크기 이상)
+        claim_size: DB에서 한 번에 선점하는 알림 수
+        poll_interval: 발송할 알림이 없을 때 재조회 간격 (초)
+        max_attempts: 최대 발송 시도 횟수
+        retry_base_delay: 재시도 대기 시간 기준 (초)
+    """
+
+    def __init__(
+        self,
+        db,
+        transport: Optional[NotificationTransport] = None,
+        num_workers: int = ALIMTALK_WORKERS,
+        rate: float = ALIMTALK_RATE_PER_SEC,
+        burst: float = ALIMTALK_BURST,
+        claim_size: int = ALIMTALK_CLAIM_SIZE,
+        poll_interval: float = ALIMTALK_POLL_INTERVAL,
+        max_attempts: int = ALIMTALK_MAX_ATTEMPTS,
+        retry_base_delay: float = ALIMTALK_RETRY_BASE_DELAY
+    ):
+        self.db = db
+        self.transport = transport or create_transport(ALIMTALK_TRANSPORT)
+        self.num_workers = num_workers
+        self.batch_size = min(self.transport.max_batch_size, ALIMTALK_BATCH_SIZE, int(burst))
+        self.claim_size = claim_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.retry_base_delay = retry_base_delay
+        self._bucket = TokenBucket(rate=rate, capacity=burst)
+        self._queue: Optional[asyncio.Queue] = None
+        self._poller: Optional[asyncio.Task] = None
+        self._workers: List[asyncio.Task] = []
+        self.stats = {
+            "claimed": 0,
+            "batches": 0,
+            "sent": 0,
+            "retried": 0,
+            "failed": 0,
+            "rate_limited_seconds": 0.0,
+        }
+
+    async def start(self) -> None:
+        """폴러 + 워커 시작 (앱 시작 시 1회)"""
+        if self._poller:
+            return
+        # 큐를 작게 유지 → 선점 후 오래 대기하다 선점이 만료되는 일을 막음
+        self._queue = asyncio.Queue(maxsize=self.num_workers * 2)
+        self._workers = [
+            asyncio.create_task(self._worker(i), name=f"alimtalk-{i}")
+            for i in range(self.num_workers)
+        ]
+        self._poller = asyncio.create_task(self._poll_loop(), name="alimtalk-poller")
+        logger.info(f"[AlimTalk] 발송 워커 {self.num_workers}개 시작 (transport={self.transport.name})")
+
+    async def stop(self, drain_timeout: float = 10.0) -> None:
+        """종료 (큐에 남은 배치는 drain_timeout까지 발송, 나머지는 선점 만료 후 재발송됨)"""
+        if self._poller:
+            self._poller.cancel()
+            await asyncio.gather(self._poller, return_exceptions=True)
+            self._poller = None
+
+        if self._queue is not None and self._workers:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout=drain_timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"[AlimTalk] 미발송 배치 {self._queue.qsize()}개 남기고 종료")
+
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        await self.transport.aclose()
+        logger.info(f"[AlimTalk] 발송 워커 종료 ({self.stats})")
+
+    async def _claim(self) -> List[List[Dict[str, Any]]]:
+        """발송할 알림 선점 → 배치 목록"""
+        rows = await self.db.claim_notification_deliveries(self.claim_size, ALIMTALK_LEASE_SECONDS)
+        self.stats["claimed"] += len(rows)
+        return [rows[i:i + self.batch_size] for i in range(0, len(rows), self.batch_size)]
+
+    async def _poll_loop(self) -> None:
+        while True:
+            try:
+                batches = await self._claim()
+            except Exception as e:
+                logger.error(f"[AlimTalk] 알림 선점 실패: {e}")
+                batches = []
+
+            for batch in batches:
+                await self._queue.put(batch)
+
+            # 선점량이 꽉 찼으면 밀린 알림이 더 있으므로 바로 다시 선점
+            if sum(len(batch) for batch in batches) < self.claim_size:
+                await asyncio.sleep(self.poll_interval)
+
+    async def _worker(self, worker_id: int) -> None:
+        while True:
+            batch = await self._queue.get()
+            try:
+                await self._send_batch(batch)
+            except Exception as e:
+                logger.error(f"[AlimTalk] 워커 {worker_id} 배치 처리 실패 (선점 만료 후 재발송): {e}")
+            finally:
+                self._queue.task_done()
+
+    async def run_once(self) -> int:
+        """지금 발송할 알림을 모두 처리 (폴러/워커 없이, CLI --drain·테스트용)
+
+        Returns:
+            int: 선점한 알림 수
+        """
+        total = 0
+        while True:
+            batches = await self._claim()
+            if not batches:
+                return total
+            semaphore = asyncio.Semaphore(self.num_workers)
+
+            async def send(batch):
+                async with semaphore:
+                    await self._send_batch(batch)
+
+            await asyncio.gather(*(send(batch) for batch in batches))
+            total += sum(len(batch) for batch in batches)
+
+    async def _send_batch(self, rows: List[Dict[str, Any]]) -> None:
+        self.stats["rate_limited_seconds"] += await self._bucket.acquire(len(rows))
+
+        messages = [
+            NotificationMessage(
+                delivery_id=row["id"],
+                user_id=row["kakao_user_id"],
+                template_code=row["template_code"],
+                payload=row.get("payload") or {}
+            )
+            for row in rows
+        ]
+        try:
+            results = await self.transport.send_batch(messages)
+        except Exception as e:
+            logger.warning(f"[AlimTalk] 배치 발송 오류 ({len(rows)}건): {e}")
+            results = [DeliveryResult(m.delivery_id, ok=False, retryable=True, error=str(e)) for m in messages]
+        self.stats["batches"] += 1
+
+        by_id = {result.delivery_id: result for result in results}
+        updates = [self._to_update(row, by_id.get(row["id"])) for row in rows]
+        await self.db.record_notification_results(updates)
+
+    def _to_update(self, row: Dict[str, Any], result: Optional[DeliveryResult]) -> Dict[str, Any]:
+        """발송 결과 → notification_deliveries 갱신 값"""
+        if result is None:
+            result = DeliveryResult(row["id"], ok=False, retryable=True, error="발송 결과 없음")
+
+        if result.ok:
+            self.stats["sent"] += 1
+            return {"id": row["id"], "status": "sent", "provider_message_id": result.provider_message_id}
+
+        attempts = row.get("attempts") or 1
+        if result.retryable and attempts < self.max_attempts:
+            self.stats["retried"] += 1
+            next_attempt_at = datetime.now(timezone.utc) + timedelta(seconds=retry_delay(attempts, self.retry_base_delay))
+            return {
+                "id": row["id"],
+                "status": "pending",
+                "error": result.error,
+                "next_attempt_at": next_attempt_at.isoformat()
+            }
+
+        self.stats["failed"] += 1
+        logger.warning(f"[AlimTalk] 발송 실패 확정 (시도 {attempts}회): {row['kakao_user_id']} - {result.error}")
+        return {"id": row["id"], "status": "failed", "error": result.error}
+
+
+async def _main(args: argparse.Namespace) -> None:
+    from dotenv import load_dotenv
+    from ...database import Database
+
+    load_dotenv()
+    logging.basicConfig(level=logging.INFO)
+
+    db = Database()
+    dispatcher = NotificationDispatcher(db, transport=create_transport(args.transport))
+    try:
+        if args.drain:
+            await dispatcher.run_once()
+            await dispatcher.transport.aclose()
+        else:
+            await dispatcher.start()
+            await asyncio.Event().wait()
+    finally:
+        if dispatcher._poller:
+            await dispatcher.stop()
+        print(f"{dispatcher.stats} / {await db.get_notification_delivery_counts()}")
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="알림톡 발송 워커")
+    parser.add_argument("--drain", action="store_true", help="지금 발송할 알림만 처리하고 종료")
+    parser.add_argument("--transport", default=ALIMTALK_TRANSPORT, help="http | fake")
+    asyncio.run(_main(parser.parse_args()))
@@ -6,64 +6,67 @@ from typing import Optional
 logger = logging.getLogger(__name__)
 
 
-async def schedule_weekly_summary_notification(user_id: str, send_time: str):
-    """주간요약 알림톡 예약 발송
+WEEKLY_SUMMARY_TEMPLATE_CODE = "WEEKLY_SUMMARY_READY"
+
+
+async def schedule_weekly_summary_notification(db, user_id: str, send_time: str) -> bool:
+    """주간요약 알림톡 예약 (notification_deliveries에 INSERT, 발송은 NotificationDispatcher)
+
+    같은 주에 여러 번 호출돼도 1건만 예약된다 (dedup_key = 사용자 + 발송 날짜).
 
     Args:
+        db: Database 인스턴스
         user_id: 카카오 사용자 ID
-        send_time: 발송 시간 (ISO format: "2025-01-11T18:00:00")
+        send_time: 발송 시간 (ISO format, timezone 포함: "2025-01-11T18:00:00+09:00")
+
+    Returns:
+        bool: 새로 예약했으면 True (이미 예약돼 있으면 False)
     """
-    try:
-        # TODO: 실제 카카오 알림톡 API 연동
-        # 참고: https://ssodaa.com/service/api/kakaoapi
-
-        # 예시 코드:
-        # import requests
-        # response = requests.post(
-        #     "https://api.kakao.com/v2/api/talk/alimtalk/send",
-        #     headers={"Authorization": f"Bearer {API_KEY}"},
-        #     json={
-        #         "receiver_id": user_id,
-        #         "template_code": "WEEKLY_SUMMARY_READY",
-        #         "message": "주간요약이 생성되었어요! 확인하시겠어요?",
-        #         "send_time": send_time,  # 예약 발송 시간
-        #         "buttons": [
-        #             {
-        #                 "label": "주간요약 보기",
-        #                 "type": "WL",
-        #                 "url_mobile": "kakao://..."
-        #             }
-        #         ]
-        #     }
-        # )
-        # logger.info(f"[AlimTalk] API 응답: {response.json()}")
+    send_date = send_time[:10]
+    inserted = await db.enqueue_notifications([{
+        "kakao_user_id": user_id,
+        "template_code": WEEKLY_SUMMARY_TEMPLATE_CODE,
+        "dedup_key": f"weekly_summary:{user_id}:{send_date}",
+        "payload": {"message": "주간요약이 생성되었어요! 확인하시겠어요?", "button_label": "주간요약 보기"},
+        "send_at": send_time,
+    }])
 
+    if inserted:
         logger.info(f"[AlimTalk] 주간요약 알림톡 예약 완료: user_id={user_id}, send_time={send_time}")
+    return bool(inserted)
 
-    except Exception as e:
-        logger.error(f"[AlimTalk] 알림톡 발송 실패: {e}")
-        raise
 
+def calculate_next_weekly_time(
+    weekday: int,
+    hour: int,
+    minute: int = 0,
+    now: Optional[datetime] = None
+) -> datetime:
+    """다음 주간 실행 시각 계산 (매주 weekday요일 hour:minute)
 
-def calculate_next_saturday_6pm() -> str:
-    """다음 토요일 오후 6시 계산
+    Args:
+        weekday: 요일 (0=월, 5=토, 6=일)
+        hour: 시
+        minute: 분
+        now: 기준 시각 (기본: 현재 로컬 시각, timezone-aware면 같은 시간대로 계산)
 
     Returns:
-        ISO format 날짜 문자열 (예: "2025-01-11T18:00:00")
+        datetime: now 이후 가장 가까운 실행 시각 (오늘 시각이 지났으면 다음 주)
     """
-    now = datetime.now()
-    current_weekday = now.weekday()  # 0=월, 5=토, 6=일
+    now = now or datetime.now()
+    days_until = (weekday - now.weekday()) % 7
+    target = (now + timedelta(days=days_until)).replace(hour=hour, minute=minute, second=0, microsecond=0)
 
-    # 토요일까지 남은 일수 계산
-    days_until_saturday = (5 - current_weekday) % 7
+    if target <= now:
+        target += timedelta(days=7)
 
-    # 이미 토요일이면 다음 주 토요일
-    if days_until_saturday == 0:
-        days_until_saturday = 7
+    return target
 
-    next_saturday = now + timedelta(days=days_until_saturday)
 
-    # 오후 6시로 설정
-    saturday_6pm = next_saturday.replace(hour=18, minute=0, second=0, microsecond=0)
+def calculate_next_saturday_6pm() -> str:
+    """다음 토요일 오후 6시 계산
 
-    return saturday_6pm.isoformat()
+    Returns:
+        ISO format 날짜 문자열 (예: "2025-01-11T18:00:00")
+    """
+    return calculate_next_weekly_time(weekday=5, hour=18).isoformat()
@@ -0,0 +1,176 @@
+"""알림톡 발송 transport (발송 대행사 API 추상화)
+
+NotificationDispatcher는 send_batch()만 호출한다. 대행사를 바꾸거나 테스트할 때는
+transport만 교체한다.
+
+- HttpAlimtalkTransport: 대량 발송 API에 배치 단위 POST (ALIMTALK_API_URL / ALIMTALK_API_KEY / ALIMTALK_SENDER_KEY)
+- FakeTransport: 실제 발송 없이 기록만 남김 (로컬/테스트, 지연/실패 주입 가능)
+"""
+
+import asyncio
+import logging
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+
+import httpx
+
+from ...config.config import ALIMTALK_BATCH_SIZE, ALIMTALK_SEND_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class NotificationMessage:
+    """발송할 알림 1건 (notification_deliveries 행)"""
+    delivery_id: int
+    user_id: str
+    template_code: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class DeliveryResult:
+    """알림 1건 발송 결과
+
+    retryable=True면 재시도 대상 (네트워크 오류, 5xx, 대행사 일시 오류),
+    False인 실패는 바로 failed 처리 (수신 거부, 템플릿 오류 등)
+    """
+    delivery_id: int
+    ok: bool
+    retryable: bool = False
+    provider_message_id: Optional[str] = None
+    error: Optional[str] = None
+
+
+class NotificationTransport:
+    """발송 transport 인터페이스"""
+
+    name = "base"
+    max_batch_size = ALIMTALK_BATCH_SIZE
+
+    async def send_batch(self, messages: List[NotificationMessage]) -> List[DeliveryResult]:
+        """메시지 배치 발송 (max_batch_size 이하) - 메시지마다 결과 반환"""
+        raise NotImplementedError
+
+    async def aclose(self) -> None:
+        """연결 정리"""
+
+
+class HttpAlimtalkTransport(NotificationTransport):
+    """발송 대행사 대량 발송 API transport
+
+    요청: POST {api_url} {"sender_key", "messages": [{"id", "receiver", "template_code", "variables"}]}
+    응답: {"results": [{"id", "success", "message_id", "error", "retryable"}]}
+    (대행사 스펙이 다르면 _build_request / _parse_response만 맞춘다)
+    """
+
+    name = "http"
+
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        self.api_url = os.getenv("ALIMTALK_API_URL", "")
+        self.sender_key = os.getenv("ALIMTALK_SENDER_KEY", "")
+        self._client = client or httpx.AsyncClient(
+            timeout=ALIMTALK_SEND_TIMEOUT,
+            headers={"Authorization": f"Bearer {os.getenv('ALIMTALK_API_KEY', '')}"}
+        )
+
+    def _build_request(self, messages: List[NotificationMessage]) -> Dict[str, Any]:
+        return {
+            "sender_key": self.sender_key,
+            "messages": [
+                {
+                    "id": str(m.delivery_id),
+                    "receiver": m.user_id,
+                    "template_code": m.template_code,
+                    "variables": m.payload,
+                }
+                for m in messages
+            ],
+        }
+
+    def _parse_response(self, messages: List[NotificationMessage], body: Dict[str, Any]) -> List[DeliveryResult]:
+        by_id = {str(r.get("id")): r for r in body.get("results", [])}
+        results = []
+        for m in messages:
+            r = by_id.get(str(m.delivery_id))
+            if r is None:
+                results.append(DeliveryResult(m.delivery_id, ok=False, retryable=True, error="응답에 결과 없음"))
+            elif r.get("success"):
+                results.append(DeliveryResult(m.delivery_id, ok=True, provider_message_id=r.get("message_id")))
+            else:
+                results.append(DeliveryResult(
+                    m.delivery_id, ok=False, retryable=bool(r.get("retryable")), error=r.get("error")
+                ))
+        return results
+
+    async def send_batch(self, messages: List[NotificationMessage]) -> List[DeliveryResult]:
+        try:
+            res = await self._client.post(self.api_url, json=self._build_request(messages))
+        except httpx.HTTPError as e:
+            return [DeliveryResult(m.delivery_id, ok=False, retryable=True, error=str(e)) for m in messages]
+
+        if res.status_code >= 500 or res.status_code == 429:
+            error = f"HTTP {res.status_code}"
+            return [DeliveryResult(m.delivery_id, ok=False, retryable=True, error=error) for m in messages]
+        if res.status_code >= 400:
+            error = f"HTTP {res.status_code}: {res.text[:200]}"
+            return [DeliveryResult(m.delivery_id, ok=False, error=error) for m in messages]
+
+        return self._parse_response(messages, res.json())
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+class FakeTransport(NotificationTransport):
+    """실제 발송 없이 기록만 남기는 transport
+
+    Args:
+        latency: 배치 1회 발송에 걸리는 시간 (초)
+        fail_user_ids: 항상 실패(재시도 불가)할 사용자
+        flaky_user_ids: 첫 시도만 실패(재시도 가능)할 사용자
+    """
+
+    name = "fake"
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        fail_user_ids: Optional[Set[str]] = None,
+        flaky_user_ids: Optional[Set[str]] = None,
+        max_batch_size: int = ALIMTALK_BATCH_SIZE
+    ):
+        self.latency = latency
+        self.fail_user_ids = set(fail_user_ids or ())
+        self.flaky_user_ids = set(flaky_user_ids or ())
+        self.max_batch_size = max_batch_size
+        self.sent: List[NotificationMessage] = []
+        self.batch_sizes: List[int] = []
+
+    async def send_batch(self, messages: List[NotificationMessage]) -> List[DeliveryResult]:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        self.batch_sizes.append(len(messages))
+
+        results = []
+        for m in messages:
+            if m.user_id in self.fail_user_ids:
+                results.append(DeliveryResult(m.delivery_id, ok=False, error="수신 거부"))
+            elif m.user_id in self.flaky_user_ids:
+                self.flaky_user_ids.discard(m.user_id)
+                results.append(DeliveryResult(m.delivery_id, ok=False, retryable=True, error="일시 오류"))
+            else:
+                self.sent.append(m)
+                results.append(DeliveryResult(m.delivery_id, ok=True, provider_message_id=f"fake-{m.delivery_id}"))
+        logger.info(f"[AlimTalk] (fake) 배치 발송 {len(messages)}건")
+        return results
+
+
+def create_transport(name: str) -> NotificationTransport:
+    """설정 이름으로 transport 생성 ("http" | "fake")"""
+    if name == "http":
+        return HttpAlimtalkTransport()
+    if name == "fake":
+        return FakeTransport()
+    raise ValueError(f"알 수 없는 알림톡 transport: {name}")
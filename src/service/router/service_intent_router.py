@@ -14,6 +14,21 @@ from typing import Tuple, Optional
 
 logger = logging.getLogger(__name__)
 
+# 주간요약 요청 키워드 (소문자 비교)
+WEEKLY_KEYWORDS = ["주간요약", "주간 요약", "주간피드백", "주간 피드백", "위클리", "weekly"]
+
+
+def has_weekly_summary_flag(cached_conv_state: Optional[dict]) -> bool:
+    """주간 요약 제안 대기 중 여부 (weekly_summary_ready 플래그 또는 weekly_summary_pending 단계)"""
+    if not cached_conv_state:
+        return False
+    temp_data = cached_conv_state.get("temp_data", {})
+    current_step = cached_conv_state.get("current_step", "")
+    return bool(
+        temp_data.get("weekly_summary_ready", False) or
+        current_step == "weekly_summary_pending"
+    )
+
 
 def classify_service_intent_rule_based(
     message: str,
@@ -32,14 +47,7 @@ def classify_service_intent_rule_based(
         - has_weekly_flag: 주간 요약 플래그 존재 여부
     """
     # ===== 플래그/상태 기반 우선 라우팅 =====
-    has_weekly_flag = False
-    if cached_conv_state:
-        temp_data = cached_conv_state.get("temp_data", {})
-        current_step = cached_conv_state.get("current_step", "")
-        has_weekly_flag = (
-            temp_data.get("weekly_summary_ready", False) or
-            current_step == "weekly_summary_pending"
-        )
+    has_weekly_flag = has_weekly_summary_flag(cached_conv_state)
 
     message_lower = message.lower().strip()
 
@@ -64,8 +72,7 @@ def classify_service_intent_rule_based(
         return "daily_record", has_weekly_flag
 
     # 2. 플래그 없을 때: 주간요약 요청 키워드 체크
-    weekly_keywords = ["주간요약", "주간 요약", "주간피드백", "주간 피드백", "위클리", "weekly"]
-    if any(keyword in message_lower for keyword in weekly_keywords):
+    if any(keyword in message_lower for keyword in WEEKLY_KEYWORDS):
         logger.info(f"[IntentRouter] 규칙 기반: 주간요약 키워드 감지 → weekly_feedback")
         return "weekly_feedback", has_weekly_flag
 
@@ -79,7 +86,8 @@ async def route_user_intent(
     llm,
     user_context,
     db,
-    cached_conv_state: Optional[dict] = None
+    cached_conv_state: Optional[dict] = None,
+    quick_reply_intent: Optional[str] = None
 ) -> Tuple[str, str, Optional[str]]:
     """
     사용자 의도 분류 + 라우팅 결정
@@ -90,6 +98,7 @@ async def route_user_intent(
         user_context: UserContext 객체
         db: Database 인스턴스
         cached_conv_state: 캐시된 conversation_state
+        quick_reply_intent: 퀵리플라이 버튼의 세부 의도 (있으면 의도 분류 생략)
 
     Returns:
         (route, user_intent, classified_intent)
@@ -121,6 +130,16 @@ async def route_user_intent(
             logger.info(f"[IntentRouter] 🔥 주간 완료 후 반복 접근 감지 → weekly_agent_node (마무리 멘트)")
             return "weekly_agent_node", UserIntent.WEEKLY_FEEDBACK.value, None
 
+    # 0-1. 퀵리플라이 버튼 → 버튼 의도 그대로 사용 (주간 요약 제안 대기 중이면 기존 분류)
+    if not has_weekly_summary_flag(cached_conv_state):
+        from ..daily.quick_replies import match_quick_reply_label, resolve_quick_reply_intent
+        # 블록 버튼이 아니면 clientExtra가 없음 → 직전 봇 메시지의 버튼 문구와 일치하는지 확인
+        quick_reply_intent = quick_reply_intent or match_quick_reply_label(message)
+        if quick_reply_intent:
+            detailed_intent = resolve_quick_reply_intent(quick_reply_intent, user_context)
+            logger.info(f"[IntentRouter] 퀵리플라이 버튼 → daily_agent_node (의도 분류 생략): {quick_reply_intent} → {detailed_intent}")
+            return "daily_agent_node", UserIntent.DAILY_RECORD.value, detailed_intent
+
     # 1. 최상위 의도 분류 (규칙 기반 - LLM 제거)
     intent, has_weekly_flag = classify_service_intent_rule_based(message, cached_conv_state)
 
@@ -3,10 +3,22 @@ from .feedback_generator import generate_weekly_feedback
 from .fallback_handler import (
     format_no_record_message,
     format_insufficient_weekday_message,
+    format_weekday_only_message,
+    format_weekly_completed_message,
+)
+from .precompute import (
+    WeeklyPrecomputeScheduler,
+    run_weekly_precompute,
+    get_weekly_precompute_stats,
 )
 
 __all__ = [
     "generate_weekly_feedback",
     "format_no_record_message",
     "format_insufficient_weekday_message",
+    "format_weekday_only_message",
+    "format_weekly_completed_message",
+    "WeeklyPrecomputeScheduler",
+    "run_weekly_precompute",
+    "get_weekly_precompute_stats",
 ]
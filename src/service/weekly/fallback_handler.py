@@ -6,6 +6,16 @@ def format_no_record_message() -> str:
     return "아직 일일기록을 시작하지 않으셨어요. 평일에 일일기록을 작성하고 주말에 주간요약을 확인해보세요!"
 
 
+def format_weekday_only_message() -> str:
+    """평일에 주간요약 요청 시 응답 메시지"""
+    return "주간요약은 주말(토요일 오후 6시 이후)에만 가능해요! 평일에는 일일기록을 꾸준히 작성해주세요 😊"
+
+
+def format_weekly_completed_message() -> str:
+    """이번 주 주간요약 완료 후(소감까지 남긴 뒤) 반복 접근 시 응답 메시지"""
+    return "이번 주 주간요약이 완료되었어요! 다음 주에도 열심히 기록해봐요! 😊"
+
+
 def format_insufficient_weekday_message(weekday_count: int) -> str:
     """평일 작성 일수 부족 시 응답 메시지
 
@@ -5,6 +5,7 @@ DB 접근 로직 없음 - Repository에서 준비한 데이터를 받아서 LLM
 from langchain_core.messages import SystemMessage, HumanMessage
 from ...prompt.weekly_summary_prompt import WEEKLY_AGENT_SYSTEM_PROMPT, WEEKLY_AGENT_USER_PROMPT
 from ...utils.schemas import WeeklyFeedbackInput, WeeklyFeedbackOutput
+from ...utils.llm_governor import llm_priority, SUMMARY
 from langsmith import traceable
 import logging
 
@@ -39,11 +40,12 @@ async def generate_weekly_feedback(
             summary=input_data.formatted_context
         )
 
-        # LLM 호출
-        response = await llm.ainvoke([
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=user_prompt)
-        ])
+        # LLM 호출 (무거운 호출 → 대화 응답보다 낮은 우선순위)
+        with llm_priority(SUMMARY):
+            response = await llm.ainvoke([
+                SystemMessage(content=system_prompt),
+                HumanMessage(content=user_prompt)
+            ])
 
         weekly_feedback = response.content.strip()
         logger.info(f"[WeeklyFeedback] 주간 피드백 생성 완료 (길이: {len(weekly_feedback)}자)")
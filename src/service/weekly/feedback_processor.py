@@ -39,6 +39,7 @@ async def handle_weekly_v1_request(
     from ...database import prepare_weekly_feedback_data
     from .feedback_generator import generate_weekly_feedback
     from .follow_up_generator import generate_follow_up_questions
+    from .precompute import load_precomputed_weekly_v1
 
     logger.info(f"[WeeklyV1] 주간요약 v1.0 생성 시작")
 
@@ -50,10 +51,18 @@ async def handle_weekly_v1_request(
     }
 
     input_data = await prepare_weekly_feedback_data(db, user_id, user_data=user_data)
-    v1_output = await generate_weekly_feedback(input_data, llm)
 
-    # 역질문 생성
-    follow_up_output = await generate_follow_up_questions(v1_output.feedback_text, llm)
+    # 주말 배치로 미리 생성된 결과가 있고 입력이 그대로면 LLM 호출 없이 사용
+    precomputed = await load_precomputed_weekly_v1(db, user_id, input_data)
+    if precomputed:
+        v1_summary, follow_up_questions = precomputed
+    else:
+        v1_output = await generate_weekly_feedback(input_data, llm)
+        v1_summary = v1_output.feedback_text
+
+        # 역질문 생성
+        follow_up_output = await generate_follow_up_questions(v1_summary, llm)
+        follow_up_questions = follow_up_output.questions
 
     # temp_data에 저장 (v2.0 생성 시 필요)
     conv_state = await db.get_conversation_state(user_id)
@@ -61,8 +70,8 @@ async def handle_weekly_v1_request(
 
     temp_data["weekly_qna_session"] = {
         "active": True,
-        "v1_summary": v1_output.feedback_text,
-        "follow_up_questions": follow_up_output.questions,
+        "v1_summary": v1_summary,
+        "follow_up_questions": follow_up_questions,
         "turn_count": 0,
         "max_turns": 5,
         "conversation_history": []
@@ -74,8 +83,8 @@ async def handle_weekly_v1_request(
 
     # 응답 포맷팅
     intro_message = "이번 주에 기록한 것들을 정리해봤어요! 요약 하단의 질문들에 답해주시면 내용을 더 구체화해서 최종 요약을 만들어드릴게요 😊\n\n"
-    response = f"{intro_message}{v1_output.feedback_text}\n\n💬 궁금한 점이 있어요:\n"
-    for i, q in enumerate(follow_up_output.questions, 1):
+    response = f"{intro_message}{v1_summary}\n\n💬 궁금한 점이 있어요:\n"
+    for i, q in enumerate(follow_up_questions, 1):
         response += f"{i}. {q}\n"
 
     logger.info(f"[WeeklyV1] v1.0 + 역질문 제공 완료")
@@ -175,6 +184,7 @@ async def generate_weekly_v2(
     """
     from langchain_core.messages import SystemMessage, HumanMessage
     from ...prompt.weekly_summary_prompt import WEEKLY_V2_GENERATION_PROMPT
+    from ...utils.llm_governor import llm_priority, SUMMARY
 
     logger.info(f"[WeeklyV2] 주간요약 v2.0 생성 시작")
 
@@ -193,7 +203,8 @@ async def generate_weekly_v2(
         HumanMessage(content=f"# v1.0 요약\n{v1_summary}\n\n# 추가 대화\n{qna_text}")
     ]
 
-    response = await llm.ainvoke(messages)
+    with llm_priority(SUMMARY):
+        response = await llm.ainvoke(messages)
     v2_summary = response.content
 
     # v2.0 저장
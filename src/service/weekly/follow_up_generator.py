@@ -28,6 +28,7 @@ async def generate_follow_up_questions(
     """
     from langchain_core.messages import SystemMessage, HumanMessage
     from ...prompt.weekly_summary_prompt import WEEKLY_FOLLOW_UP_QUESTIONS_PROMPT
+    from ...utils.llm_governor import llm_priority, SUMMARY
 
     # Structured Output 사용
     try:
@@ -38,7 +39,8 @@ async def generate_follow_up_questions(
             HumanMessage(content=f"Weekly Summary:\n{weekly_summary}")
         ]
 
-        result = await structured_llm.ainvoke(messages)
+        with llm_priority(SUMMARY):
+            result = await structured_llm.ainvoke(messages)
 
         if not result.questions or len(result.questions) != 3:
             logger.warning(f"[FollowUp] Invalid question count: {len(result.questions) if result.questions else 0}")
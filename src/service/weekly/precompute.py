@@ -0,0 +1,428 @@
+"""주간요약 v1.0 주말 배치 미리 생성
+
+토요일 18시 주간요약 알림이 나가면 요청이 한꺼번에 몰리고, 요청마다
+generate_weekly_feedback → generate_follow_up_questions (LLM 2회 연쇄)가 실행된다.
+알림 전에 이번 주 평일 요약 작성일이 WEEKLY_SUMMARY_MIN_WEEKDAY_COUNT 이상인 사용자의
+v1.0 + 역질문을 미리 만들어 weekly_v1_precomputed에 저장해 두고,
+handle_weekly_v1_request는 입력이 그대로면 저장된 결과를 사용한다 (DB 조회 1회).
+
+- 대상: get_weekly_precompute_candidates RPC (kakao_user_id keyset 페이지, 이미 생성한 사용자 제외)
+- 동시 생성 수: WEEKLY_PRECOMPUTE_CONCURRENCY
+- 체크포인트: 페이지마다 마지막 사용자 ID를 파일에 저장 → 중단 후 재실행 시 이어서 진행
+- 실패: 마지막 페이지 후 실패한 사용자만 한 번 더 생성, 그래도 실패가 남으면 완료로 기록하지 않음
+  (커서를 비워 두므로 재실행 시 처음부터 조회 → 이미 생성한 사용자는 RPC에서 제외되어 실패분만 다시 생성)
+- 앱 내 스케줄러(WEEKLY_PRECOMPUTE_ENABLED)는 워커/인스턴스마다 따로 돌고 체크포인트도 로컬 파일이므로
+  인스턴스가 여러 개면 끄고 cron 등으로 아래 CLI를 한 곳에서만 실행할 것
+- 유효성: 생성 당시 입력(WeeklyFeedbackInput) 해시가 요청 시점과 다르면 사용하지 않고 새로 생성
+
+실행:
+    python -m src.service.weekly.precompute                          # 이번 주 미리 생성
+    python -m src.service.weekly.precompute --dry-run                # 대상만 조회 (LLM 호출/저장 없음)
+    python -m src.service.weekly.precompute --benchmark --limit 20   # 생성만 하고 저장 안 함, 지연 통계 출력
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from ...config import KST, WEEKLY_SUMMARY_MIN_WEEKDAY_COUNT, get_kst_now
+from ...config.config import (
+    WEEKLY_PRECOMPUTE_ENABLED,
+    WEEKLY_PRECOMPUTE_WEEKDAY,
+    WEEKLY_PRECOMPUTE_HOUR,
+    WEEKLY_PRECOMPUTE_MINUTE,
+    WEEKLY_PRECOMPUTE_CONCURRENCY,
+    WEEKLY_PRECOMPUTE_BATCH_SIZE,
+    WEEKLY_PRECOMPUTE_CHECKPOINT_PATH,
+)
+
+logger = logging.getLogger(__name__)
+
+# 요청 경로 사용 통계 (프로세스 단위)
+_stats: Dict[str, int] = {
+    "hits": 0,    # 미리 생성된 결과 사용
+    "misses": 0,  # 이번 주 결과 없음 → 새로 생성
+    "stale": 0,   # 생성 이후 입력 변경 → 새로 생성
+}
+_last_report: Optional[Dict[str, Any]] = None
+
+
+def get_weekly_precompute_stats() -> Dict[str, Any]:
+    """주간요약 미리 생성 사용 통계 + 마지막 배치 결과"""
+    return {**_stats, "last_run": _last_report}
+
+
+def get_week_range(today: Optional[date] = None) -> Tuple[date, date]:
+    """해당 날짜가 속한 주의 월요일, 금요일 (기본: 오늘, KST)"""
+    today = today or get_kst_now().date()
+    monday = today - timedelta(days=today.weekday())
+    return monday, monday + timedelta(days=4)
+
+
+def weekly_input_fingerprint(input_data) -> str:
+    """주간요약 입력(WeeklyFeedbackInput) 해시 - 미리 생성 결과 유효성 확인용"""
+    payload = json.dumps(input_data.model_dump(), ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+async def load_precomputed_weekly_v1(db, user_id: str, input_data) -> Optional[Tuple[str, List[str]]]:
+    """요청 시 미리 생성된 이번 주 v1.0 + 역질문 조회
+
+    Args:
+        db: Database 인스턴스
+        user_id: 사용자 ID
+        input_data: 요청 시점에 준비한 WeeklyFeedbackInput
+
+    Returns:
+        Optional[(v1_summary, follow_up_questions)]: 입력이 같으면 결과, 아니면 None
+    """
+    week_start, _ = get_week_range()
+    row = await db.get_weekly_v1_precomputed(user_id, week_start.isoformat())
+    if not row:
+        _stats["misses"] += 1
+        return None
+
+    if row.get("input_fingerprint") != weekly_input_fingerprint(input_data):
+        _stats["stale"] += 1
+        logger.info(f"[WeeklyPrecompute] 미리 생성 이후 입력 변경 → 새로 생성 - user_id={user_id}")
+        return None
+
+    _stats["hits"] += 1
+    logger.info(f"⚡ [WeeklyPrecompute] 미리 생성된 주간요약 v1.0 사용 - user_id={user_id}")
+    return row["v1_summary"], list(row.get("follow_up_questions") or [])
+
+
+async def _generate(db, user_id: str, llm) -> Tuple[Any, str, List[str]]:
+    """사용자 1명의 v1.0 + 역질문 생성 (handle_weekly_v1_request와 같은 입력/생성 경로, 배치 우선순위)"""
+    from ...database import prepare_weekly_feedback_data
+    from ...utils.llm_governor import llm_priority, BATCH
+    from .feedback_generator import generate_weekly_feedback
+    from .follow_up_generator import generate_follow_up_questions
+
+    user = await db.get_user(user_id)
+    if not user:
+        raise ValueError("사용자 정보 없음")
+
+    user_data = {
+        "name": user.get("name"),
+        "job_title": user.get("job_title"),
+        "career_goal": user.get("career_goal")
+    }
+    input_data = await prepare_weekly_feedback_data(db, user_id, user_data=user_data)
+    with llm_priority(BATCH):
+        v1_output = await generate_weekly_feedback(input_data, llm)
+        follow_up_output = await generate_follow_up_questions(v1_output.feedback_text, llm)
+    return input_data, v1_output.feedback_text, follow_up_output.questions
+
+
+@dataclass
+class PrecomputeReport:
+    """배치 실행 결과"""
+    week_start: str
+    mode: str = "run"  # run / dry_run / benchmark
+    candidates: int = 0
+    generated: int = 0
+    failed: int = 0  # 재시도 후에도 실패한 사용자 수
+    retried: int = 0  # 첫 시도에 실패해 다시 생성한 사용자 수
+    completed: bool = False  # 대상 끝까지 처리하고 실패 없음 (limit으로 멈추거나 실패가 남으면 False)
+    resumed_from: Optional[str] = None
+    elapsed: float = 0.0
+    latencies: List[float] = field(default_factory=list)
+
+    def summary(self) -> Dict[str, Any]:
+        latencies = sorted(self.latencies)
+
+        def percentile(p: float) -> Optional[float]:
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(len(latencies) * p))], 3)
+
+        return {
+            "week_start": self.week_start,
+            "mode": self.mode,
+            "candidates": self.candidates,
+            "generated": self.generated,
+            "failed": self.failed,
+            "retried": self.retried,
+            "completed": self.completed,
+            "resumed_from": self.resumed_from,
+            "elapsed": round(self.elapsed, 3),
+            "estimated_llm_calls": self.candidates * 2,
+            "latency_p50": percentile(0.5),
+            "latency_p95": percentile(0.95),
+            "users_per_sec": round(self.generated / self.elapsed, 2) if self.elapsed else 0.0,
+        }
+
+
+def _load_checkpoint(path: str, week_start: str) -> Dict[str, Any]:
+    """같은 주차 체크포인트만 사용 (지난 주 파일은 무시)"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            checkpoint = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+    return checkpoint if checkpoint.get("week_start") == week_start else {}
+
+
+def _save_checkpoint(path: str, report: PrecomputeReport, cursor: Optional[str]) -> None:
+    """임시 파일에 쓴 뒤 교체 (중간에 죽어도 이전 체크포인트 유지)"""
+    checkpoint = {
+        "week_start": report.week_start,
+        "cursor": cursor,
+        "completed": report.completed,
+        "updated_at": datetime.now(KST).isoformat(),
+    }
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+async def run_weekly_precompute(
+    db,
+    llm=None,
+    week_of: Optional[date] = None,
+    concurrency: int = WEEKLY_PRECOMPUTE_CONCURRENCY,
+    batch_size: int = WEEKLY_PRECOMPUTE_BATCH_SIZE,
+    checkpoint_path: Optional[str] = WEEKLY_PRECOMPUTE_CHECKPOINT_PATH,
+    dry_run: bool = False,
+    benchmark: bool = False,
+    limit: Optional[int] = None
+) -> PrecomputeReport:
+    """이번 주 주간요약 v1.0 + 역질문 미리 생성
+
+    Args:
+        db: Database 인스턴스
+        llm: LLM 인스턴스 (기본: weekly_agent_node와 같은 get_chat_llm())
+        week_of: 대상 주에 속한 날짜 (기본: 오늘, KST)
+        concurrency: 동시에 생성하는 사용자 수
+        batch_size: 대상 조회 페이지 크기
+        checkpoint_path: 체크포인트 파일 경로 (None이면 사용 안 함)
+        dry_run: 대상만 조회 (LLM 호출/저장/체크포인트 없음)
+        benchmark: 생성만 하고 저장하지 않음 (체크포인트 없음)
+        limit: 최대 대상 사용자 수
+
+    Returns:
+        PrecomputeReport: 실행 결과
+    """
+    global _last_report
+
+    monday, friday = get_week_range(week_of)
+    mode = "dry_run" if dry_run else "benchmark" if benchmark else "run"
+    report = PrecomputeReport(week_start=monday.isoformat(), mode=mode)
+    use_checkpoint = bool(checkpoint_path) and mode == "run"
+
+    checkpoint = _load_checkpoint(checkpoint_path, report.week_start) if use_checkpoint else {}
+    if checkpoint.get("completed"):
+        logger.info(f"[WeeklyPrecompute] {report.week_start} 주차는 이미 완료됨 - 건너뜀")
+        report.completed = True
+        return report
+
+    cursor = checkpoint.get("cursor")
+    report.resumed_from = cursor
+    if cursor:
+        logger.info(f"[WeeklyPrecompute] 체크포인트에서 이어서 실행 - after={cursor}")
+
+    if llm is None and not dry_run:
+        from ...utils.models import get_chat_llm
+        llm = get_chat_llm()
+
+    if mode == "run":
+        await db.delete_weekly_v1_precomputed_before(report.week_start)
+
+    semaphore = asyncio.Semaphore(concurrency)
+    failed_users: List[str] = []
+
+    async def process(user_id: str) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                input_data, v1_summary, questions = await _generate(db, user_id, llm)
+                if mode == "run":
+                    await db.save_weekly_v1_precomputed(
+                        user_id,
+                        report.week_start,
+                        weekly_input_fingerprint(input_data),
+                        v1_summary,
+                        questions
+                    )
+            except Exception as e:
+                failed_users.append(user_id)
+                logger.warning(f"[WeeklyPrecompute] 생성 실패 - user_id={user_id}: {e}")
+                return
+            report.latencies.append(time.perf_counter() - start)
+            report.generated += 1
+
+    logger.info(f"[WeeklyPrecompute] 시작 ({mode}) - 주차 {monday} ~ {friday}, 동시 {concurrency}")
+    started = time.perf_counter()
+    pages_done = False
+
+    while True:
+        page_size = batch_size if limit is None else min(batch_size, limit - report.candidates)
+        if page_size <= 0:
+            break
+
+        page = await db.get_weekly_precompute_candidates(
+            report.week_start,
+            friday.isoformat(),
+            WEEKLY_SUMMARY_MIN_WEEKDAY_COUNT,
+            after_user=cursor,
+            limit=page_size
+        )
+        user_ids = [row["kakao_user_id"] for row in page]
+        report.candidates += len(user_ids)
+
+        if user_ids and not dry_run:
+            await asyncio.gather(*(process(user_id) for user_id in user_ids))
+
+        if len(user_ids) < page_size:
+            pages_done = True
+        if user_ids:
+            cursor = user_ids[-1]
+        if use_checkpoint and not pages_done:
+            _save_checkpoint(checkpoint_path, report, cursor)
+
+        logger.info(
+            f"[WeeklyPrecompute] 진행 - 대상 {report.candidates}명, 생성 {report.generated}, 실패 {len(failed_users)}"
+        )
+        if pages_done:
+            break
+
+    if pages_done and failed_users:
+        # 일시적인 LLM 오류 대비 - 실패한 사용자만 한 번 더
+        retry_users = list(failed_users)
+        failed_users.clear()
+        report.retried = len(retry_users)
+        logger.info(f"[WeeklyPrecompute] 실패 {len(retry_users)}명 재시도")
+        await asyncio.gather(*(process(user_id) for user_id in retry_users))
+
+    report.failed = len(failed_users)
+    report.completed = pages_done and not failed_users
+    if use_checkpoint and pages_done:
+        # 실패가 남으면 커서 없이 미완료로 기록 → 재실행 시 남은 사용자만 다시 조회
+        _save_checkpoint(checkpoint_path, report, None if failed_users else cursor)
+    if failed_users:
+        logger.warning(f"[WeeklyPrecompute] 재시도 후에도 실패 {len(failed_users)}명 (요청 시 새로 생성): {failed_users[:10]}")
+
+    report.elapsed = time.perf_counter() - started
+    if mode == "run":
+        _last_report = report.summary()
+    logger.info(f"[WeeklyPrecompute] 종료 - {report.summary()}")
+    return report
+
+
+class WeeklyPrecomputeScheduler:
+    """매주 WEEKLY_PRECOMPUTE_WEEKDAY요일 HOUR:MINUTE(KST)에 run_weekly_precompute 실행
+
+    실행 시각 이후(같은 주) 재시작되어 체크포인트가 완료되지 않았으면 바로 이어서 실행한다.
+
+    Args:
+        db: Database 인스턴스
+        llm: LLM 인스턴스 (기본: 실행 시 get_chat_llm())
+    """
+
+    def __init__(self, db, llm=None):
+        self.db = db
+        self._llm = llm
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """스케줄러 시작 (앱 시작 시 1회)"""
+        if not WEEKLY_PRECOMPUTE_ENABLED or self._task:
+            return
+        self._task = asyncio.create_task(self._loop(), name="weekly-precompute")
+
+    async def stop(self) -> None:
+        """스케줄러 종료 (진행 중인 배치는 취소, 다음 실행 시 체크포인트부터 이어서)"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        logger.info("[WeeklyPrecompute] 스케줄러 종료")
+
+    def _missed_this_week(self, now: datetime) -> bool:
+        monday, _ = get_week_range(now.date())
+        run_at = datetime(
+            monday.year, monday.month, monday.day,
+            WEEKLY_PRECOMPUTE_HOUR, WEEKLY_PRECOMPUTE_MINUTE, tzinfo=KST
+        ) + timedelta(days=WEEKLY_PRECOMPUTE_WEEKDAY)
+        if now < run_at:
+            return False
+        return not _load_checkpoint(WEEKLY_PRECOMPUTE_CHECKPOINT_PATH, monday.isoformat()).get("completed")
+
+    async def _run_once(self) -> None:
+        try:
+            await run_weekly_precompute(self.db, self._llm)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"[WeeklyPrecompute] 배치 실행 실패: {e}")
+
+    async def _loop(self) -> None:
+        from ..notification.kakao_alimtalk import calculate_next_weekly_time
+
+        if self._missed_this_week(get_kst_now()):
+            logger.info("[WeeklyPrecompute] 이번 주 실행이 완료되지 않음 → 바로 실행")
+            await self._run_once()
+
+        while True:
+            now = get_kst_now()
+            next_run = calculate_next_weekly_time(
+                WEEKLY_PRECOMPUTE_WEEKDAY, WEEKLY_PRECOMPUTE_HOUR, WEEKLY_PRECOMPUTE_MINUTE, now=now
+            )
+            logger.info(f"[WeeklyPrecompute] 다음 실행: {next_run.isoformat()}")
+            await asyncio.sleep((next_run - now).total_seconds())
+            await self._run_once()
+
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="주간요약 v1.0 미리 생성 배치")
+    parser.add_argument("--dry-run", action="store_true", help="대상만 조회 (LLM 호출/저장 없음)")
+    parser.add_argument("--benchmark", action="store_true", help="생성만 하고 저장하지 않음, 지연 통계 출력")
+    parser.add_argument("--week-of", type=date.fromisoformat, help="대상 주에 속한 날짜 (YYYY-MM-DD, 기본: 오늘)")
+    parser.add_argument("--concurrency", type=int, default=WEEKLY_PRECOMPUTE_CONCURRENCY)
+    parser.add_argument("--batch-size", type=int, default=WEEKLY_PRECOMPUTE_BATCH_SIZE)
+    parser.add_argument("--limit", type=int, help="최대 대상 사용자 수")
+    parser.add_argument("--checkpoint", default=WEEKLY_PRECOMPUTE_CHECKPOINT_PATH, help="체크포인트 파일 경로")
+    parser.add_argument("--reset", action="store_true", help="체크포인트를 지우고 처음부터 실행")
+    return parser.parse_args(argv)
+
+
+async def _main(args: argparse.Namespace) -> None:
+    from dotenv import load_dotenv
+    from ...database import Database
+
+    load_dotenv()
+    logging.basicConfig(level=logging.INFO)
+
+    if args.reset and os.path.exists(args.checkpoint):
+        os.remove(args.checkpoint)
+
+    db = Database()
+    try:
+        report = await run_weekly_precompute(
+            db,
+            week_of=args.week_of,
+            concurrency=args.concurrency,
+            batch_size=args.batch_size,
+            checkpoint_path=args.checkpoint,
+            dry_run=args.dry_run,
+            benchmark=args.benchmark,
+            limit=args.limit
+        )
+    finally:
+        db.close()
+
+    print(json.dumps(report.summary(), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(_main(_parse_args()))
@@ -0,0 +1,194 @@
+"""오프라인 가짜 채팅 모델 (부하 테스트 / 로컬 실행용)
+
+Vertex AI 호출 없이 프롬프트만 보고 결정적인 응답을 만든다. 같은 입력이면 항상 같은 응답과
+같은 지연 시간이 나오므로 부하 테스트 결과를 비교할 수 있다.
+
+- 의도 분류 프롬프트 → 키워드 기반 라벨 (summary / edit_summary / end_conversation / rejection / continue)
+- with_structured_output(ExtractionResponse 등) → 스키마에 맞는 JSON 응답을 파싱해 반환
+- 그 외 → 프롬프트 해시가 들어간 고정 문구
+
+사용 예:
+    from src.utils.fake_llm import FakeChatModel
+    from src.utils.models import set_llm_override
+
+    set_llm_override(FakeChatModel(latency=0.8, jitter=0.3))  # get_*_llm()이 모두 가짜 모델 반환
+"""
+
+import asyncio
+import dataclasses
+import hashlib
+import json
+import random
+import re
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables import RunnableLambda
+from pydantic import BaseModel
+
+
+# INTENT_CLASSIFICATION_USER_PROMPT에서 사용자 메시지 추출
+_INTENT_PROMPT = re.compile(r'^User message: "(.*)"\s*\n\s*Classify', re.DOTALL)
+# EXTRACTION_USER_PROMPT_TEMPLATE에서 사용자 메시지 추출
+_EXTRACTION_MESSAGE = re.compile(r"\*\*사용자 메시지:\*\* (.*)")
+
+# 의도 분류 키워드 (앞에 있을수록 우선)
+_INTENT_KEYWORDS = (
+    ("edit_summary", ("수정", "추가해", "빼줘", "다시 정리")),
+    ("summary", ("정리", "요약")),
+    ("end_conversation", ("끝", "종료", "그만", "bye")),
+    ("rejection", ("싫어", "나중에", "괜찮아")),
+)
+
+_FOLLOW_UP_QUESTIONS = [
+    "이번 주 가장 의미 있었던 성과는 무엇인가요?",
+    "어떤 어려움이 있었고 어떻게 해결하셨나요?",
+    "다음 주에 집중하고 싶은 목표는 무엇인가요?",
+]
+
+
+def _message_text(message: BaseMessage) -> str:
+    content = message.content
+    if isinstance(content, str):
+        return content
+    return " ".join(part.get("text", "") if isinstance(part, dict) else str(part) for part in content)
+
+
+def _fake_intent(message: str) -> str:
+    """의도 분류 프롬프트용 키워드 라벨 ([Previous bot] 맥락은 무시하고 사용자 발화만 본다)"""
+    user_part = message.rsplit("[User]:", 1)[-1]
+    for label, keywords in _INTENT_KEYWORDS:
+        if any(keyword in user_part for keyword in keywords):
+            return label
+    return "continue"
+
+
+def default_fake_response(messages: List[BaseMessage], schema_name: Optional[str] = None) -> str:
+    """프롬프트 → 가짜 응답 문자열 (structured output이면 JSON)
+
+    Args:
+        messages: LLM 입력 메시지
+        schema_name: with_structured_output 스키마 이름 (일반 호출이면 None)
+
+    Returns:
+        str: 응답 본문
+    """
+    prompt = _message_text(messages[-1]) if messages else ""
+
+    if schema_name == "ExtractionResponse":
+        match = _EXTRACTION_MESSAGE.search(prompt)
+        value = match.group(1).strip() if match else prompt[-50:].strip()
+        return json.dumps({"intent": "answer", "extracted_value": value, "confidence": 0.95}, ensure_ascii=False)
+    if schema_name == "FollowUpQuestionsOutput":
+        return json.dumps({"questions": _FOLLOW_UP_QUESTIONS}, ensure_ascii=False)
+    if schema_name == "OnboardingResponse":
+        return json.dumps({"response": "알려주셔서 감사해요! 다음 질문으로 넘어갈게요."}, ensure_ascii=False)
+    if schema_name:
+        return "{}"
+
+    intent_match = _INTENT_PROMPT.match(prompt)
+    if intent_match:
+        return _fake_intent(intent_match.group(1))
+
+    digest = hashlib.sha1(prompt.encode("utf-8")).hexdigest()[:8]
+    return f"좋아요! 오늘 하신 일에서 가장 기억에 남는 부분은 무엇이었나요? (fake:{digest})"
+
+
+class FakeChatModel(BaseChatModel):
+    """결정적인 가짜 채팅 모델
+
+    Args:
+        latency: 호출 1회 기본 지연 (초)
+        jitter: 지연 편차 (초, latency ± jitter 범위에서 프롬프트별로 고정)
+        seed: 지연 편차 시드 (같은 시드 + 같은 프롬프트 → 같은 지연)
+        responder: (messages, schema_name) → 응답 문자열 (기본: default_fake_response)
+        tail_rate: 꼬리 지연이 붙는 호출 비율 (0~1, 호출마다 무작위 → 같은 프롬프트 재시도/헤징은 빨라질 수 있음)
+        tail_latency: 꼬리 지연 호출에 더해지는 지연 (초)
+        error_rate: 예외를 던지는 호출 비율 (0~1, 장애 전환 테스트용)
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    seed: int = 0
+    tail_rate: float = 0.0
+    tail_latency: float = 0.0
+    error_rate: float = 0.0
+    responder: Callable[[List[BaseMessage], Optional[str]], str] = default_fake_response
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-chat"
+
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        return {"latency": self.latency, "jitter": self.jitter, "seed": self.seed}
+
+    def _delay(self, prompt: str) -> float:
+        if not self.jitter:
+            return self.latency
+        rng = random.Random(f"{self.seed}:{prompt}")
+        return max(0.0, self.latency + rng.uniform(-self.jitter, self.jitter))
+
+    def _call_delay(self, prompt: str) -> float:
+        """이번 호출의 지연 (프롬프트별 기본 지연 + 확률적 꼬리 지연, 확률적 오류)"""
+        if self.error_rate and random.random() < self.error_rate:
+            raise RuntimeError(f"fake provider error ({self._llm_type})")
+        delay = self._delay(prompt)
+        if self.tail_rate and random.random() < self.tail_rate:
+            delay += self.tail_latency
+        return delay
+
+    def _result(self, messages: List[BaseMessage], schema_name: Optional[str]) -> ChatResult:
+        content = self.responder(messages, schema_name)
+        input_tokens = sum(len(_message_text(m)) for m in messages) // 4
+        output_tokens = len(content) // 4
+        message = AIMessage(
+            content=content,
+            usage_metadata={
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens,
+            },
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        schema_name: Optional[str] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        time.sleep(self._call_delay("".join(_message_text(m) for m in messages)))
+        return self._result(messages, schema_name)
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        schema_name: Optional[str] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        await asyncio.sleep(self._call_delay("".join(_message_text(m) for m in messages)))
+        return self._result(messages, schema_name)
+
+    def with_structured_output(self, schema, **kwargs: Any):
+        """스키마 이름으로 JSON 응답을 만들고 스키마 객체로 파싱 (pydantic / dataclass / dict)"""
+        name = schema.__name__ if isinstance(schema, type) else schema.get("title", "output")
+
+        async def _structured(messages):
+            message = await self.ainvoke(messages, schema_name=name)
+            data = json.loads(message.content)
+            if isinstance(schema, type) and issubclass(schema, BaseModel):
+                return schema.model_validate(data)
+            if dataclasses.is_dataclass(schema):
+                return schema(**data)
+            return data
+
+        return RunnableLambda(_structured, name=name)
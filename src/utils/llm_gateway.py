@@ -0,0 +1,351 @@
+"""LLM 게이트웨이 - 지연 시간 기반 공급자 선택 + 마감 시간 + 헤징 + 장애 전환
+
+get_chat_llm / get_onboarding_llm / get_summary_llm이 역할별로 하나씩 반환한다.
+호출부는 기존처럼 ainvoke / with_structured_output만 사용하면 된다.
+
+- 선택: 공급자별 성공 지연 시간 EWMA와 오류율 EWMA로 점수를 매겨 가장 빠른 공급자부터 호출
+  (샘플이 없는 공급자는 LLM_PROVIDERS 순서로 뒤에, 오류율이 높은 공급자는 LLM_COOLDOWN_SECONDS 동안 후순위)
+- 마감 시간: 역할별 *_TIMEOUT 안에 응답이 없으면 진행 중인 호출을 취소하고 LLMDeadlineExceeded
+- 헤징 (LLM_HEDGE_ENABLED): 첫 호출이 p95(샘플 부족 시 기본값)보다 늦으면 다음 공급자로
+  같은 요청을 한 번 더 보내고 먼저 온 응답 사용 (공급자가 하나면 같은 공급자로)
+- 장애 전환: 호출이 예외로 끝나면 남은 시간 안에서 다음 공급자로 재시도
+
+사용 예 (오프라인 꼬리 지연 실험):
+    from src.utils.fake_llm import FakeChatModel
+    from src.utils.llm_gateway import LLMGateway
+
+    gateway = LLMGateway("chat", [
+        ("fake_a", FakeChatModel(latency=0.3, tail_rate=0.05, tail_latency=4.0)),
+        ("fake_b", FakeChatModel(latency=0.4)),
+    ], timeout=10.0, hedge=True)
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..config.config import (
+    LLM_PROVIDERS,
+    OPENAI_MODEL_NAME,
+    LLM_PROVIDER_MAX_RETRIES,
+    LLM_EWMA_ALPHA,
+    LLM_ERROR_RATE_THRESHOLD,
+    LLM_COOLDOWN_SECONDS,
+    LLM_HEDGE_ENABLED,
+    LLM_HEDGE_MIN_SAMPLES,
+    LLM_HEDGE_DEFAULT_DELAY,
+    LLM_HEDGE_MIN_DELAY,
+    FAKE_LLM_LATENCY,
+    FAKE_LLM_TAIL_RATE,
+    FAKE_LLM_TAIL_LATENCY,
+)
+from .tracing import LatencyHistogram, get_llm_tracing_callback
+
+logger = logging.getLogger(__name__)
+
+# 오류율 판단에 필요한 최소 호출 수 (첫 1~2회 실패로 바로 후순위가 되지 않도록)
+_MIN_CALLS_FOR_COOLDOWN = 5
+
+
+class LLMDeadlineExceeded(asyncio.TimeoutError):
+    """역할별 마감 시간 안에 어떤 공급자도 응답하지 못함"""
+
+
+class ProviderStats:
+    """공급자별 지연 시간 / 오류율 EWMA + 성공 지연 히스토그램 (헤징 지연 계산용)
+
+    Args:
+        name: 공급자 이름
+        alpha: EWMA 가중치
+    """
+
+    def __init__(self, name: str, alpha: float = LLM_EWMA_ALPHA):
+        self.name = name
+        self.alpha = alpha
+        self.ewma_ms: Optional[float] = None
+        self.error_rate = 0.0
+        self.calls = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.hedged = 0  # 헤징 요청으로 호출된 횟수
+        self.wins = 0  # 응답이 채택된 횟수
+        self.cooldown_until = 0.0
+        self.histogram = LatencyHistogram()
+
+    def record_success(self, duration_ms: float) -> None:
+        self.calls += 1
+        self.ewma_ms = duration_ms if self.ewma_ms is None else (
+            self.alpha * duration_ms + (1 - self.alpha) * self.ewma_ms
+        )
+        self.error_rate *= (1 - self.alpha)
+        self.histogram.observe(duration_ms)
+
+    def record_failure(self, timeout: bool = False) -> None:
+        self.calls += 1
+        self.failures += 1
+        self.timeouts += int(timeout)
+        self.error_rate = self.alpha + (1 - self.alpha) * self.error_rate
+        if self.calls >= _MIN_CALLS_FOR_COOLDOWN and self.error_rate >= LLM_ERROR_RATE_THRESHOLD:
+            if not self.in_cooldown():
+                logger.warning(f"[LLMGateway] {self.name} 오류율 {self.error_rate:.2f} → {LLM_COOLDOWN_SECONDS}초 후순위")
+            self.cooldown_until = time.monotonic() + LLM_COOLDOWN_SECONDS
+
+    def record_abandoned(self, duration_ms: float) -> None:
+        """헤징 경쟁에서 져서 취소된 호출 (최소 이만큼 걸린다는 하한값으로 지연 EWMA에만 반영)"""
+        if self.ewma_ms is not None and duration_ms > self.ewma_ms:
+            self.ewma_ms = self.alpha * duration_ms + (1 - self.alpha) * self.ewma_ms
+
+    def in_cooldown(self) -> bool:
+        return time.monotonic() < self.cooldown_until
+
+    def score(self) -> float:
+        """낮을수록 우선 (오류율만큼 지연 시간에 가중)
+
+        성공 샘플이 없는 공급자는 무한대 → 측정된 공급자 뒤, 설정 순서대로
+        (장애 전환 / 헤징으로 호출되며 샘플이 쌓이면 지연 시간으로 경쟁)
+        """
+        if self.ewma_ms is None:
+            return float("inf")
+        return self.ewma_ms * (1 + 4 * self.error_rate)
+
+    def hedge_delay(self) -> float:
+        """헤징 요청을 보내기까지 기다릴 시간 (초)"""
+        if self.histogram.count < LLM_HEDGE_MIN_SAMPLES:
+            return LLM_HEDGE_DEFAULT_DELAY
+        return max(LLM_HEDGE_MIN_DELAY, self.histogram.percentile(0.95) / 1000)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "ewma_ms": round(self.ewma_ms, 2) if self.ewma_ms is not None else None,
+            "p95_ms": round(self.histogram.percentile(0.95), 2),
+            "error_rate": round(self.error_rate, 3),
+            "calls": self.calls,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "hedged": self.hedged,
+            "wins": self.wins,
+            "cooldown": self.in_cooldown(),
+        }
+
+
+class LLMGateway:
+    """여러 공급자를 하나의 LLM처럼 호출 (ainvoke / with_structured_output)
+
+    Args:
+        role: 역할 이름 ("chat" / "onboarding" / "summary", 통계 키)
+        providers: (공급자 이름, LangChain Runnable) 목록 - 기본 우선순위 순
+        timeout: 호출 1회 마감 시간 (초, 헤징/장애 전환 포함)
+        hedge: 헤징 사용 여부
+        stats: 공급자 이름 → ProviderStats (with_structured_output 파생 게이트웨이와 공유)
+        counters: 헤징 승리 / 마감 초과 횟수 (파생 게이트웨이와 공유)
+    """
+
+    def __init__(
+        self,
+        role: str,
+        providers: List[Tuple[str, Any]],
+        timeout: float,
+        hedge: bool = LLM_HEDGE_ENABLED,
+        stats: Optional[Dict[str, ProviderStats]] = None,
+        counters: Optional[Dict[str, int]] = None
+    ):
+        if not providers:
+            raise ValueError(f"LLM 공급자가 없습니다: {role}")
+        self.role = role
+        self.providers = list(providers)
+        self.timeout = timeout
+        self.hedge = hedge
+        self.stats = stats if stats is not None else {name: ProviderStats(name) for name, _ in providers}
+        self.counters = counters if counters is not None else {"hedge_wins": 0, "deadline_exceeded": 0}
+
+    def with_structured_output(self, schema, **kwargs: Any) -> "LLMGateway":
+        """공급자별 structured output 래핑 (선택 통계는 원본 게이트웨이와 공유)"""
+        return LLMGateway(
+            self.role,
+            [(name, llm.with_structured_output(schema, **kwargs)) for name, llm in self.providers],
+            timeout=self.timeout,
+            hedge=self.hedge,
+            stats=self.stats,
+            counters=self.counters
+        )
+
+    def _ranked(self) -> List[Tuple[str, Any]]:
+        """후순위(cooldown) 여부 → 점수 순 (같으면 설정 순서)"""
+        return sorted(
+            self.providers,
+            key=lambda p: (self.stats[p[0]].in_cooldown(), self.stats[p[0]].score())
+        )
+
+    def invoke(self, input: Any, config: Optional[Dict[str, Any]] = None, **kwargs: Any) -> Any:
+        """동기 호출 (헤징 없이 순서대로 장애 전환)"""
+        last_error: Optional[BaseException] = None
+        for name, llm in self._ranked():
+            stats = self.stats[name]
+            start = time.perf_counter()
+            try:
+                result = llm.invoke(input, config, **kwargs)
+            except Exception as e:
+                stats.record_failure()
+                last_error = e
+                logger.warning(f"[LLMGateway] {self.role}/{name} 실패 → 다음 공급자: {e}")
+                continue
+            stats.record_success((time.perf_counter() - start) * 1000)
+            stats.wins += 1
+            return result
+        raise last_error
+
+    async def ainvoke(self, input: Any, config: Optional[Dict[str, Any]] = None, **kwargs: Any) -> Any:
+        """마감 시간 안에서 공급자 선택 → (헤징) → 장애 전환"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        queue = self._ranked()
+        running: Dict[asyncio.Task, Tuple[str, float, bool]] = {}
+        hedged = not self.hedge
+        last_error: Optional[BaseException] = None
+
+        def launch(is_hedge: bool = False) -> None:
+            name, llm = queue.pop(0)
+            if is_hedge:
+                self.stats[name].hedged += 1
+            task = asyncio.ensure_future(llm.ainvoke(input, config, **kwargs))
+            running[task] = (name, time.perf_counter(), is_hedge)
+
+        primary_name = queue[0][0]
+        launch()
+        try:
+            while running:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+
+                wait_for = remaining
+                if not hedged:
+                    wait_for = min(remaining, self.stats[primary_name].hedge_delay())
+
+                done, _ = await asyncio.wait(running, timeout=wait_for, return_when=asyncio.FIRST_COMPLETED)
+
+                if not done:
+                    if not hedged:
+                        # 첫 호출이 p95보다 늦음 → 다음 공급자로 한 번 더 (하나뿐이면 같은 공급자)
+                        hedged = True
+                        if not queue:
+                            queue = [p for p in self.providers if p[0] == primary_name]
+                        logger.info(f"[LLMGateway] {self.role}/{primary_name} 지연 → {queue[0][0]}로 헤징")
+                        launch(is_hedge=True)
+                    continue
+
+                for task in done:
+                    name, started, is_hedge = running.pop(task)
+                    stats = self.stats[name]
+                    error = task.exception()
+                    if error is None:
+                        stats.record_success((time.perf_counter() - started) * 1000)
+                        stats.wins += 1
+                        self.counters["hedge_wins"] += int(is_hedge)
+                        for loser_name, loser_started, _ in running.values():
+                            self.stats[loser_name].record_abandoned((time.perf_counter() - loser_started) * 1000)
+                        return task.result()
+
+                    stats.record_failure()
+                    last_error = error
+                    logger.warning(f"[LLMGateway] {self.role}/{name} 실패: {error}")
+
+                # 실패한 호출 대신 다음 공급자 (진행 중인 헤징 호출이 있으면 그쪽을 기다림)
+                if not running and queue:
+                    logger.info(f"[LLMGateway] {self.role} 장애 전환 → {queue[0][0]}")
+                    hedged = True  # 장애 전환 호출에는 다시 헤징하지 않음
+                    launch()
+        finally:
+            for task in running:
+                task.cancel()
+
+        if running:
+            # 마감 시간 초과 → 진행 중이던 공급자는 타임아웃으로 기록
+            for name, _, _ in running.values():
+                self.stats[name].record_failure(timeout=True)
+            self.counters["deadline_exceeded"] += 1
+            raise LLMDeadlineExceeded(f"{self.role} LLM 응답 시간 초과 ({self.timeout}초)")
+        raise last_error
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "timeout": self.timeout,
+            "hedge": self.hedge,
+            **self.counters,
+            "providers": {name: self.stats[name].summary() for name, _ in self.providers},
+        }
+
+
+def build_provider(name: str, model_config: Dict[str, Any]) -> Optional[Any]:
+    """공급자 이름 + 역할별 모델 설정 → LangChain 채팅 모델 (사용할 수 없으면 None)
+
+    Args:
+        name: "vertex" | "openai" | "fake"
+        model_config: models.py의 *_MODEL_CONFIG (model_name / temperature / max_output_tokens / callbacks)
+
+    클라이언트 재시도는 LLM_PROVIDER_MAX_RETRIES로 제한한다 (기본 재시도 백오프가 역할별 마감 시간을
+    다 써 버리면 장애 전환 / 헤징이 동작할 시간이 남지 않음).
+    """
+    if name == "vertex":
+        from langchain_google_vertexai import ChatVertexAI
+        return ChatVertexAI(**model_config, max_retries=LLM_PROVIDER_MAX_RETRIES)
+
+    if name == "openai":
+        if not os.getenv("OPENAI_API_KEY"):
+            logger.info("[LLMGateway] OPENAI_API_KEY 없음 → openai 공급자 제외")
+            return None
+        from langchain_openai import ChatOpenAI
+        return ChatOpenAI(
+            model=OPENAI_MODEL_NAME,
+            temperature=model_config["temperature"],
+            max_tokens=model_config["max_output_tokens"],
+            max_retries=LLM_PROVIDER_MAX_RETRIES,
+            callbacks=model_config.get("callbacks"),
+        )
+
+    if name == "fake":
+        from .fake_llm import FakeChatModel
+        return FakeChatModel(
+            latency=FAKE_LLM_LATENCY,
+            tail_rate=FAKE_LLM_TAIL_RATE,
+            tail_latency=FAKE_LLM_TAIL_LATENCY,
+            callbacks=[get_llm_tracing_callback()],
+        )
+
+    raise ValueError(f"지원하지 않는 LLM 공급자: {name}")
+
+
+_gateways: Dict[str, LLMGateway] = {}
+
+
+def create_gateway(role: str, model_config: Dict[str, Any], timeout: float) -> LLMGateway:
+    """LLM_PROVIDERS 순서로 공급자를 만들어 역할별 게이트웨이 생성 (통계 조회용으로 등록)
+
+    생성에 실패한 공급자(인증 정보 없음 등)는 제외하고, 하나도 없으면 마지막 오류를 그대로 던진다.
+    """
+    providers = []
+    last_error: Optional[Exception] = None
+    for name in LLM_PROVIDERS:
+        try:
+            llm = build_provider(name, model_config)
+        except Exception as e:
+            logger.warning(f"[LLMGateway] {role}/{name} 공급자 생성 실패 → 제외: {e}")
+            last_error = e
+            continue
+        if llm is not None:
+            providers.append((name, llm))
+
+    if not providers and last_error is not None:
+        raise last_error
+
+    gateway = LLMGateway(role, providers, timeout=timeout)
+    _gateways[role] = gateway
+    logger.info(f"[LLMGateway] {role} 게이트웨이 생성: {[name for name, _ in providers]} (마감 {timeout}초)")
+    return gateway
+
+
+def get_llm_gateway_stats() -> Dict[str, Any]:
+    """역할별 공급자 지연 / 오류율 / 헤징 통계 (/metrics)"""
+    return {role: gateway.get_stats() for role, gateway in _gateways.items()}
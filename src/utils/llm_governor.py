@@ -0,0 +1,251 @@
+"""LLM 동시 실행 제어 - 우선순위별 동시 호출 상한 + 할당량 토큰 버킷
+
+get_chat_llm / get_onboarding_llm / get_summary_llm은 모두 같은 공급자 할당량을 쓴다.
+주간요약 생성이 몰리면 할당량이 소진되어 대화 응답까지 밀리므로, LLM_GOVERNOR_ENABLED이면
+모든 ainvoke를 GovernedLLM으로 감싸 호출 전에 입장 허가를 받는다.
+
+- 우선순위: interactive(기본) > summary > batch
+  호출부는 llm_priority()로 현재 컨텍스트의 우선순위를 낮춘다 (이미 더 낮으면 유지 →
+  배치에서 부른 generate_weekly_feedback은 summary가 아니라 batch)
+- 동시 호출 상한: 우선순위별 세마포어 (LLM_CONCURRENCY_LIMITS)
+- 할당량 (환경 변수 LLM_QUOTA_PER_SEC가 있을 때만): 공용 TokenBucket
+  summary / batch는 LLM_QUOTA_INTERACTIVE_RESERVE개보다 많이 남았을 때만 토큰을 가져감 →
+  몰리는 동안에도 대화 호출은 예약분으로 바로 나가고, 대기는 무거운 호출이 흡수
+- 마감 시간: 입장 대기 + 호출 전체가 역할별 *_TIMEOUT 안에 끝나야 함 (초과 시 LLMDeadlineExceeded)
+- 지표: 우선순위별 대기 중 / 실행 중 / 최대 대기 수 / 대기 시간 p50·p95 / 대기 초과 (/metrics)
+
+단일 이벤트 루프(단일 프로세스) 기준이다. 인스턴스가 여러 개면 LLM_QUOTA_PER_SEC를 나눌 것.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
+
+from ..config.config import LLM_CONCURRENCY_LIMITS, LLM_QUOTA_INTERACTIVE_RESERVE
+from .llm_gateway import LLMDeadlineExceeded
+from .rate_limiter import TokenBucket
+from .tracing import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+INTERACTIVE = "interactive"
+SUMMARY = "summary"
+BATCH = "batch"
+PRIORITIES = (INTERACTIVE, SUMMARY, BATCH)  # 높은 순
+
+_llm_priority: ContextVar[str] = ContextVar("llm_priority", default=INTERACTIVE)
+
+
+def get_llm_priority() -> str:
+    """현재 컨텍스트의 LLM 호출 우선순위"""
+    return _llm_priority.get()
+
+
+@contextmanager
+def llm_priority(priority: str) -> Iterator[None]:
+    """블록 안의 LLM 호출 우선순위를 priority 이하로 낮춤
+
+    Args:
+        priority: INTERACTIVE / SUMMARY / BATCH
+    """
+    if priority not in PRIORITIES:
+        raise ValueError(f"알 수 없는 LLM 우선순위: {priority}")
+    lowest = max(_llm_priority.get(), priority, key=PRIORITIES.index)
+    token = _llm_priority.set(lowest)
+    try:
+        yield
+    finally:
+        _llm_priority.reset(token)
+
+
+class _PriorityStats:
+    """우선순위별 대기열 지표"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.queued = 0  # 세마포어 / 토큰 대기 중
+        self.max_queued = 0
+        self.in_flight = 0
+        self.admitted = 0
+        self.timed_out = 0  # 마감 시간 안에 입장하지 못함
+        self.wait = LatencyHistogram()  # 입장까지 걸린 시간 (ms)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+            "in_flight": self.in_flight,
+            "admitted": self.admitted,
+            "timed_out": self.timed_out,
+            "wait_p50_ms": round(self.wait.percentile(0.5), 2),
+            "wait_p95_ms": round(self.wait.percentile(0.95), 2),
+        }
+
+
+class LLMGovernor:
+    """우선순위별 입장 제어 (세마포어 → 토큰 버킷 순서로 대기)
+
+    Args:
+        limits: 우선순위 → 동시 호출 상한
+        rate: 초당 호출 상한 (None이면 토큰 버킷 없이 동시 호출 수만 제한)
+        burst: 순간 허용 호출 수 (기본: max(rate x 2, reserve + 1))
+        reserve: interactive 전용으로 남겨 두는 토큰 수
+        clock: 시간 함수 (테스트 시 주입)
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, int]] = None,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        reserve: float = LLM_QUOTA_INTERACTIVE_RESERVE,
+        clock=time.monotonic
+    ):
+        limits = limits if limits is not None else LLM_CONCURRENCY_LIMITS
+        self.reserve = reserve
+        self.bucket: Optional[TokenBucket] = None
+        if rate is not None:
+            burst = burst if burst is not None else max(rate * 2, reserve + 1)
+            if reserve + 1 > burst:
+                raise ValueError(f"예약 토큰({reserve})이 버킷 크기({burst})보다 작아야 합니다")
+            self.bucket = TokenBucket(rate=rate, capacity=burst, clock=clock)
+        self._semaphores = {p: asyncio.Semaphore(limits[p]) for p in PRIORITIES}
+        self._stats = {p: _PriorityStats(limits[p]) for p in PRIORITIES}
+
+    async def _acquire_token(self, priority: str) -> None:
+        if self.bucket is None:
+            return
+        if priority == INTERACTIVE:
+            await self.bucket.acquire()
+            return
+        # 예약분을 넘는 토큰만 사용 (interactive가 버킷을 기다리는 중이면 try_acquire가 양보)
+        while True:
+            available = self.bucket.available
+            if available >= 1 + self.reserve and self.bucket.try_acquire():
+                return
+            await asyncio.sleep(max(1 + self.reserve - available, 1) / self.bucket.rate)
+
+    async def _enter(self, priority: str) -> None:
+        """세마포어 + 토큰 획득 (토큰 대기 중 취소되면 세마포어 반환)"""
+        semaphore = self._semaphores[priority]
+        await semaphore.acquire()
+        try:
+            await self._acquire_token(priority)
+        except BaseException:
+            semaphore.release()
+            raise
+
+    @asynccontextmanager
+    async def admit(self, priority: Optional[str] = None, timeout: Optional[float] = None) -> AsyncIterator[None]:
+        """입장 허가를 받을 때까지 대기 후 블록 실행
+
+        Args:
+            priority: 우선순위 (기본: 현재 컨텍스트의 llm_priority)
+            timeout: 최대 대기 시간 (초, None이면 제한 없음)
+
+        Raises:
+            LLMDeadlineExceeded: timeout 안에 입장하지 못함
+        """
+        priority = priority or _llm_priority.get()
+        stats = self._stats[priority]
+        stats.queued += 1
+        stats.max_queued = max(stats.max_queued, stats.queued)
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._enter(priority), timeout)
+        except asyncio.TimeoutError:
+            stats.timed_out += 1
+            logger.warning(f"[LLMGovernor] {priority} 입장 대기 {timeout}초 초과 (대기 {stats.queued - 1}건)")
+            raise LLMDeadlineExceeded(f"{priority} LLM 입장 대기 시간 초과 ({timeout}초)")
+        finally:
+            stats.queued -= 1
+
+        stats.admitted += 1
+        stats.in_flight += 1
+        stats.wait.observe((time.perf_counter() - start) * 1000)
+        try:
+            yield
+        finally:
+            stats.in_flight -= 1
+            self._semaphores[priority].release()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "rate": self.bucket.rate if self.bucket else None,
+            "tokens_available": round(self.bucket.available, 2) if self.bucket else None,
+            "token_wait_seconds": round(self.bucket.waited, 3) if self.bucket else 0.0,
+            "reserve": self.reserve,
+            "priorities": {p: self._stats[p].summary() for p in PRIORITIES},
+        }
+
+
+class GovernedLLM:
+    """LLM의 ainvoke를 입장 제어 뒤에서 실행 (with_structured_output 결과도 같은 governor 사용)
+
+    Args:
+        llm: LangChain 채팅 모델 또는 LLMGateway
+        governor: LLMGovernor (기본: 프로세스 공용)
+        timeout: 입장 대기 + 호출 전체 마감 시간 (초, 역할별 *_TIMEOUT, None이면 제한 없음)
+    """
+
+    def __init__(self, llm: Any, governor: Optional[LLMGovernor] = None, timeout: Optional[float] = None):
+        self.llm = llm
+        self.governor = governor or get_llm_governor()
+        self.timeout = timeout
+
+    def with_structured_output(self, schema, **kwargs: Any) -> "GovernedLLM":
+        return GovernedLLM(self.llm.with_structured_output(schema, **kwargs), self.governor, self.timeout)
+
+    def invoke(self, input: Any, config: Optional[Dict[str, Any]] = None, **kwargs: Any) -> Any:
+        """동기 호출은 제어하지 않음 (스크립트 / 테스트용)"""
+        return self.llm.invoke(input, config, **kwargs)
+
+    async def ainvoke(self, input: Any, config: Optional[Dict[str, Any]] = None, **kwargs: Any) -> Any:
+        if self.timeout is None:
+            async with self.governor.admit():
+                return await self.llm.ainvoke(input, config, **kwargs)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        async with self.governor.admit(timeout=self.timeout):
+            # 입장 대기에 쓴 시간만큼 호출 시간이 줄어듦 (사용자가 기다리는 전체 시간 기준)
+            try:
+                return await asyncio.wait_for(self.llm.ainvoke(input, config, **kwargs), deadline - loop.time())
+            except LLMDeadlineExceeded:
+                raise
+            except asyncio.TimeoutError:
+                raise LLMDeadlineExceeded(f"LLM 응답 시간 초과 (입장 대기 포함 {self.timeout}초)")
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.llm, name)
+
+
+_governor: Optional[LLMGovernor] = None
+
+
+def get_llm_governor() -> LLMGovernor:
+    """프로세스 공용 LLMGovernor (첫 호출 시 생성, 할당량은 환경 변수 LLM_QUOTA_PER_SEC / LLM_QUOTA_BURST)"""
+    global _governor
+    if _governor is None:
+        rate = os.getenv("LLM_QUOTA_PER_SEC")
+        burst = os.getenv("LLM_QUOTA_BURST")
+        _governor = LLMGovernor(
+            rate=float(rate) if rate else None,
+            burst=float(burst) if burst else None
+        )
+        logger.info(
+            f"[LLMGovernor] 생성: 동시 {LLM_CONCURRENCY_LIMITS}, "
+            f"초당 {rate or '제한 없음'} (버스트 {_governor.bucket.capacity if _governor.bucket else '-'}, "
+            f"대화 예약 {LLM_QUOTA_INTERACTIVE_RESERVE})"
+        )
+    return _governor
+
+
+def get_llm_governor_stats() -> Optional[Dict[str, Any]]:
+    """우선순위별 대기열 / 토큰 버킷 지표 (/metrics, 아직 LLM을 만들지 않았으면 None)"""
+    return _governor.stats() if _governor is not None else None
@@ -12,7 +12,10 @@ from ..config.config import (
     SUMMARY_TEMPERATURE,
     SUMMARY_MAX_TOKENS,
     SUMMARY_TIMEOUT,
+    LLM_GATEWAY_ENABLED,
+    LLM_GOVERNOR_ENABLED,
 )
+from .tracing import get_llm_tracing_callback
 
 
 # Vertex AI 모델 설정 (credentials는 환경변수에서 자동 로드)
@@ -20,21 +23,24 @@ CHAT_MODEL_CONFIG = {
     "model_name": CHAT_MODEL_NAME,
     "temperature": CHAT_TEMPERATURE,
     "max_output_tokens": CHAT_MAX_TOKENS,
-    # Vertex AI는 timeout 대신 request_timeout 사용 (선택적)
+    # 호출 마감 시간(*_TIMEOUT)은 LLM 게이트웨이에서 적용
+    "callbacks": [get_llm_tracing_callback()],  # 호출 시간 + 토큰 사용량 계측 (/metrics)
 }
 
 ONBOARDING_MODEL_CONFIG = {
     "model_name": ONBOARDING_MODEL_NAME,
     "temperature": ONBOARDING_TEMPERATURE,
     "max_output_tokens": ONBOARDING_MAX_TOKENS,
-    # Vertex AI는 timeout 대신 request_timeout 사용 (선택적)
+    # 호출 마감 시간(*_TIMEOUT)은 LLM 게이트웨이에서 적용
+    "callbacks": [get_llm_tracing_callback()],  # 호출 시간 + 토큰 사용량 계측 (/metrics)
 }
 
 SUMMARY_MODEL_CONFIG = {
     "model_name": SUMMARY_MODEL_NAME,
     "temperature": SUMMARY_TEMPERATURE,
     "max_output_tokens": SUMMARY_MAX_TOKENS,
-    # Vertex AI는 timeout 대신 request_timeout 사용 (선택적)
+    # 호출 마감 시간(*_TIMEOUT)은 LLM 게이트웨이에서 적용
+    "callbacks": [get_llm_tracing_callback()],  # 호출 시간 + 토큰 사용량 계측 (/metrics)
 }
 
 
@@ -46,26 +52,62 @@ _cached_chat_llm = None
 _cached_onboarding_llm = None
 _cached_summary_llm = None
 
+# 설정 시 모든 get_*_llm()이 이 인스턴스를 반환 (부하 테스트용 FakeChatModel 등)
+_llm_override = None
+
+
+def set_llm_override(llm) -> None:
+    """모든 LLM 팩토리가 반환할 인스턴스 지정 (None이면 해제)
+
+    그래프 컴파일(ChatBotManager.initialize) 전에 호출해야 그래프 노드에도 적용된다.
+    """
+    global _llm_override
+    _llm_override = llm
+
+
+def _create_llm(role: str, model_config: dict, timeout: float):
+    """역할별 LLM 생성 (게이트웨이 사용 시 공급자 선택 + 마감 시간 적용, 아니면 Vertex AI 단일 모델)
+
+    LLM_GOVERNOR_ENABLED이면 모든 역할이 같은 동시 실행 제어(우선순위 + 할당량)를 거치고,
+    입장 대기까지 포함해 역할별 마감 시간(timeout) 안에 끝나야 한다.
+    """
+    if LLM_GATEWAY_ENABLED:
+        from .llm_gateway import create_gateway
+        llm = create_gateway(role, model_config, timeout)
+    else:
+        llm = ChatVertexAI(**model_config)
+
+    if LLM_GOVERNOR_ENABLED:
+        from .llm_governor import GovernedLLM
+        return GovernedLLM(llm, timeout=timeout)
+    return llm
+
 
 def get_chat_llm() -> ChatVertexAI:
     """일반 채팅용 LLM 인스턴스 반환 (캐시됨)"""
+    if _llm_override is not None:
+        return _llm_override
     global _cached_chat_llm
     if _cached_chat_llm is None:
-        _cached_chat_llm = ChatVertexAI(**CHAT_MODEL_CONFIG)
+        _cached_chat_llm = _create_llm("chat", CHAT_MODEL_CONFIG, CHAT_TIMEOUT)
     return _cached_chat_llm
 
 
 def get_onboarding_llm() -> ChatVertexAI:
     """온보딩용 LLM 인스턴스 반환 (캐시됨)"""
+    if _llm_override is not None:
+        return _llm_override
     global _cached_onboarding_llm
     if _cached_onboarding_llm is None:
-        _cached_onboarding_llm = ChatVertexAI(**ONBOARDING_MODEL_CONFIG)
+        _cached_onboarding_llm = _create_llm("onboarding", ONBOARDING_MODEL_CONFIG, ONBOARDING_TIMEOUT)
     return _cached_onboarding_llm
 
 
 def get_summary_llm() -> ChatVertexAI:
     """요약용 LLM 인스턴스 반환 (캐시됨)"""
+    if _llm_override is not None:
+        return _llm_override
     global _cached_summary_llm
     if _cached_summary_llm is None:
-        _cached_summary_llm = ChatVertexAI(**SUMMARY_MODEL_CONFIG)
-    return _cached_summary_llm
\ No newline at end of file
+        _cached_summary_llm = _create_llm("summary", SUMMARY_MODEL_CONFIG, SUMMARY_TIMEOUT)
+    return _cached_summary_llm
@@ -0,0 +1,76 @@
+"""속도 제한 유틸리티
+
+- TokenBucket: 초당 rate개씩 채워지고 최대 capacity개까지 쌓이는 토큰 버킷
+  (외부 API 호출 수 제한 - 순간 capacity건까지 허용, 장기적으로 초당 rate건)
+
+단일 이벤트 루프(단일 프로세스) 기준이다.
+"""
+
+import asyncio
+import time
+from typing import Callable, Optional
+
+
+class TokenBucket:
+    """토큰 버킷 속도 제한기
+
+    대기자는 도착 순서대로 토큰을 받는다 (큰 요청이 작은 요청에 밀려 굶지 않음).
+
+    Args:
+        rate: 초당 채워지는 토큰 수
+        capacity: 최대 누적 토큰 수 (기본: rate, 버스트 허용량)
+        clock: 시간 함수 (테스트 시 주입)
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated_at = clock()
+        self._lock = asyncio.Lock()
+        self.waited = 0.0  # 누적 대기 시간 (초)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    @property
+    def available(self) -> float:
+        """현재 사용 가능한 토큰 수"""
+        self._refill()
+        return self._tokens
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """대기 없이 토큰 획득 시도 (대기자가 있으면 실패)"""
+        if self._lock.locked():
+            return False
+        self._refill()
+        if self._tokens < tokens:
+            return False
+        self._tokens -= tokens
+        return True
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """토큰을 얻을 때까지 대기
+
+        Returns:
+            float: 대기한 시간 (초)
+        """
+        if tokens > self.capacity:
+            raise ValueError(f"한 번에 capacity({self.capacity})보다 많은 토큰을 요청할 수 없습니다: {tokens}")
+
+        waited = 0.0
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    self.waited += waited
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+                await asyncio.sleep(delay)
+                waited += delay
@@ -0,0 +1,427 @@
+"""요청 트레이싱 + 지연 시간 계측 (외부 SaaS 없이 /metrics로 확인)
+
+- 요청 ID: ContextVar (start_trace에서 설정, get_request_id()로 조회)
+- 스팬: 그래프 노드(trace_node) / DB 왕복(Database.execute, 호출한 메서드 이름 - label_operations) /
+  LLM 호출(LLMTracingCallback)
+  - 캐시/상태 세션에서 바로 응답한 Database 메서드는 스팬을 남기지 않는다 (db 히스토그램 = 실제 네트워크 호출)
+  - 요청 안에서 생긴 스팬은 Trace에 모여 요청 종료 시 exporter로 전달된다
+  - 요청 밖(백그라운드 배치 등) 스팬은 히스토그램에만 집계된다
+- 히스토그램: (kind, name)별 - request / intent / node / db / llm
+- exporter: 기본은 최근 요청 N개를 메모리에 보관 (InMemoryTraceExporter)
+
+단일 프로세스 기준이며, 비활성화(TRACING_ENABLED=False) 시 스팬은 아무 일도 하지 않는다.
+"""
+
+import contextvars
+import functools
+import inspect
+import logging
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import AsyncCallbackHandler
+
+from ..config.config import (
+    TRACING_ENABLED,
+    TRACE_BUFFER_SIZE,
+    TRACE_HISTOGRAM_SAMPLES,
+    TRACE_SLOW_REQUEST_MS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# 히스토그램
+# =============================================================================
+
+class LatencyHistogram:
+    """지연 시간 히스토그램 (누적 버킷 + 최근 샘플 기반 백분위)
+
+    Args:
+        sample_size: 백분위 계산에 쓰는 최근 샘플 수
+    """
+
+    BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+    def __init__(self, sample_size: int = TRACE_HISTOGRAM_SAMPLES):
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.bucket_counts = [0] * (len(self.BUCKETS_MS) + 1)
+        self._samples: Deque[float] = deque(maxlen=sample_size)
+
+    def observe(self, duration_ms: float, error: bool = False) -> None:
+        self.count += 1
+        self.errors += int(error)
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        for i, bound in enumerate(self.BUCKETS_MS):
+            if duration_ms <= bound:
+                self.bucket_counts[i] += 1
+                break
+        else:
+            self.bucket_counts[-1] += 1
+        self._samples.append(duration_ms)
+
+    def percentile(self, p: float) -> float:
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+    def summary(self) -> Dict[str, Any]:
+        buckets = {f"le_{bound}": n for bound, n in zip(self.BUCKETS_MS, self.bucket_counts)}
+        buckets["inf"] = self.bucket_counts[-1]
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "avg_ms": round(self.total_ms / self.count, 2) if self.count else 0.0,
+            "p50_ms": round(self.percentile(0.5), 2),
+            "p95_ms": round(self.percentile(0.95), 2),
+            "p99_ms": round(self.percentile(0.99), 2),
+            "max_ms": round(self.max_ms, 2),
+            "total_ms": round(self.total_ms, 2),
+            "buckets": buckets,
+        }
+
+
+_histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+_token_usage: Dict[str, Dict[str, int]] = {}
+
+
+def _observe(kind: str, name: str, duration_ms: float, error: bool = False) -> None:
+    histogram = _histograms.get((kind, name))
+    if histogram is None:
+        histogram = _histograms[(kind, name)] = LatencyHistogram()
+    histogram.observe(duration_ms, error)
+
+
+# =============================================================================
+# 스팬 / 트레이스
+# =============================================================================
+
+@dataclass
+class Span:
+    """계측 구간 1개"""
+    name: str
+    kind: str  # node / db / llm
+    parent: Optional[str] = None
+    started_at: float = field(default_factory=time.perf_counter)
+    duration_ms: Optional[float] = None
+    error: Optional[str] = None
+    attrs: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self, trace_started_at: float) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "parent": self.parent,
+            "offset_ms": round((self.started_at - trace_started_at) * 1000, 2),
+            "duration_ms": round(self.duration_ms, 2) if self.duration_ms is not None else None,
+            "error": self.error,
+            **({"attrs": self.attrs} if self.attrs else {}),
+        }
+
+
+@dataclass
+class Trace:
+    """요청 1건의 스팬 모음"""
+    request_id: str
+    attrs: Dict[str, Any] = field(default_factory=dict)
+    spans: List[Span] = field(default_factory=list)
+    started_at: float = field(default_factory=time.perf_counter)
+    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    duration_ms: Optional[float] = None
+
+    def breakdown(self) -> Dict[str, float]:
+        """kind별 합계 (ms) - 중첩 스팬은 각각 더해지므로 합이 전체보다 클 수 있음"""
+        totals: Dict[str, float] = {}
+        for span in self.spans:
+            if span.duration_ms is not None:
+                totals[span.kind] = round(totals.get(span.kind, 0.0) + span.duration_ms, 2)
+        return totals
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "request_id": self.request_id,
+            "timestamp": self.timestamp,
+            "duration_ms": round(self.duration_ms, 2) if self.duration_ms is not None else None,
+            "attrs": self.attrs,
+            "breakdown": self.breakdown(),
+            "spans": [span.to_dict(self.started_at) for span in self.spans],
+        }
+
+
+class InMemoryTraceExporter:
+    """최근 요청 트레이스를 메모리에 보관하는 exporter
+
+    Args:
+        maxsize: 보관할 최근 트레이스 수
+    """
+
+    def __init__(self, maxsize: int = TRACE_BUFFER_SIZE):
+        self._traces: Deque[Trace] = deque(maxlen=maxsize)
+
+    def export(self, trace: Trace) -> None:
+        self._traces.append(trace)
+
+    def recent(self, limit: int = 20, min_duration_ms: float = 0.0) -> List[Dict[str, Any]]:
+        """최근 트레이스 (최신순, min_duration_ms 이상만)"""
+        traces = [t for t in reversed(self._traces) if (t.duration_ms or 0.0) >= min_duration_ms]
+        return [t.to_dict() for t in traces[:limit]]
+
+    def clear(self) -> None:
+        self._traces.clear()
+
+
+_exporter = InMemoryTraceExporter()
+
+_request_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("request_id", default=None)
+_current_trace: contextvars.ContextVar[Optional[Trace]] = contextvars.ContextVar("current_trace", default=None)
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar("current_span", default=None)
+_current_operation: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("current_operation", default=None)
+
+
+def get_request_id() -> Optional[str]:
+    """현재 요청 ID (요청 밖이면 None)"""
+    return _request_id.get()
+
+
+def set_trace_exporter(exporter) -> None:
+    """exporter 교체 (export(trace) 메서드만 있으면 됨)"""
+    global _exporter
+    _exporter = exporter
+
+
+def set_trace_attribute(key: str, value: Any) -> None:
+    """현재 요청 트레이스에 속성 추가 (intent 등)"""
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.attrs[key] = value
+
+
+@contextmanager
+def start_trace(request_id: Optional[str] = None, **attrs) -> Iterator[Optional[Trace]]:
+    """요청 트레이스 시작 - 종료 시 request / intent 히스토그램 기록 + exporter 전달
+
+    Args:
+        request_id: 요청 ID (없으면 생성)
+        **attrs: 트레이스 속성 (user_id 등)
+    """
+    if not TRACING_ENABLED:
+        yield None
+        return
+
+    trace = Trace(request_id=request_id or uuid.uuid4().hex[:16], attrs=dict(attrs))
+    tokens = (_request_id.set(trace.request_id), _current_trace.set(trace), _current_span.set(None))
+    error = False
+    try:
+        yield trace
+    except BaseException:
+        error = True
+        raise
+    finally:
+        _current_span.reset(tokens[2])
+        _current_trace.reset(tokens[1])
+        _request_id.reset(tokens[0])
+
+        trace.duration_ms = (time.perf_counter() - trace.started_at) * 1000
+        _observe("request", "all", trace.duration_ms, error)
+        if "intent" in trace.attrs:
+            _observe("intent", str(trace.attrs["intent"]), trace.duration_ms, error)
+        _exporter.export(trace)
+
+        if trace.duration_ms >= TRACE_SLOW_REQUEST_MS:
+            logger.warning(
+                f"[Tracing] 느린 요청 {trace.duration_ms:.0f}ms - request_id={trace.request_id}, "
+                f"{trace.attrs}, breakdown={trace.breakdown()}"
+            )
+
+
+@contextmanager
+def trace_span(name: str, kind: str, **attrs) -> Iterator[Optional[Span]]:
+    """계측 구간 - (kind, name) 히스토그램 기록 + 요청 트레이스에 스팬 추가
+
+    Args:
+        name: 스팬 이름 (노드명, 메서드명, 모델명)
+        kind: node / db / llm
+        **attrs: 스팬 속성
+    """
+    if not TRACING_ENABLED:
+        yield None
+        return
+
+    parent = _current_span.get()
+    span = Span(name=name, kind=kind, parent=parent.name if parent else None, attrs=dict(attrs))
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.spans.append(span)
+
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as e:
+        span.error = type(e).__name__
+        raise
+    finally:
+        _current_span.reset(token)
+        span.duration_ms = (time.perf_counter() - span.started_at) * 1000
+        _observe(kind, name, span.duration_ms, span.error is not None)
+
+
+def trace_node(name: str, node: Callable) -> Callable:
+    """LangGraph 노드 계측 (state 1개를 받는 async 노드 → 같은 시그니처의 노드)"""
+
+    async def traced_node(state):
+        with trace_span(name, "node"):
+            return await node(state)
+
+    traced_node.__name__ = name
+    return traced_node
+
+
+def get_operation_name(default: str) -> str:
+    """label_operations로 감싼 메서드 안이면 그 메서드 이름, 아니면 default"""
+    return _current_operation.get() or default
+
+
+def label_operations(exclude: Tuple[str, ...] = ()) -> Callable[[type], type]:
+    """클래스의 공개 async 메서드 실행 중 메서드 이름을 작업 이름으로 기록하는 클래스 데코레이터
+
+    스팬은 만들지 않는다 - 실제 왕복 구간에서 trace_span(get_operation_name(...), kind)로 기록해
+    캐시에서 바로 응답한 호출이 히스토그램에 섞이지 않도록 한다 (중첩 호출은 안쪽 메서드 이름).
+
+    Args:
+        exclude: 제외할 메서드 이름
+    """
+
+    def wrap(method: Callable) -> Callable:
+        @functools.wraps(method)
+        async def labeled_method(*args, **kwargs):
+            token = _current_operation.set(method.__name__)
+            try:
+                return await method(*args, **kwargs)
+            finally:
+                _current_operation.reset(token)
+        return labeled_method
+
+    def decorate(cls: type) -> type:
+        for attr_name, attr in list(vars(cls).items()):
+            if attr_name.startswith("_") or attr_name in exclude:
+                continue
+            if inspect.iscoroutinefunction(attr):
+                setattr(cls, attr_name, wrap(attr))
+        return cls
+
+    return decorate
+
+
+# =============================================================================
+# LLM 호출 계측 (LangChain 콜백)
+# =============================================================================
+
+class LLMTracingCallback(AsyncCallbackHandler):
+    """채팅 모델 호출 시간 + 토큰 사용량 계측
+
+    모델 생성 시 callbacks=[get_llm_tracing_callback()]로 붙이면 ainvoke / with_structured_output 호출이
+    모두 "llm" 스팬으로 기록된다.
+    """
+
+    run_inline = True  # 호출한 요청의 컨텍스트(트레이스)에서 바로 실행
+
+    def __init__(self):
+        self._running: Dict[UUID, Tuple[Span, Optional[Trace]]] = {}
+
+    async def on_chat_model_start(self, serialized, messages, *, run_id: UUID, metadata=None, **kwargs) -> None:
+        if not TRACING_ENABLED:
+            return
+        model = (metadata or {}).get("ls_model_name") or (serialized or {}).get("name") or "llm"
+        parent = _current_span.get()
+        span = Span(name=model, kind="llm", parent=parent.name if parent else None)
+        trace = _current_trace.get()
+        if trace is not None:
+            trace.spans.append(span)
+        self._running[run_id] = (span, trace)
+
+    async def on_llm_end(self, response, *, run_id: UUID, **kwargs) -> None:
+        entry = self._running.pop(run_id, None)
+        if entry is None:
+            return
+        span, _ = entry
+        span.duration_ms = (time.perf_counter() - span.started_at) * 1000
+        _observe("llm", span.name, span.duration_ms)
+
+        usage = _extract_token_usage(response)
+        if usage:
+            span.attrs.update(usage)
+            totals = _token_usage.setdefault(span.name, {"calls": 0, "input_tokens": 0, "output_tokens": 0})
+            totals["calls"] += 1
+            totals["input_tokens"] += usage.get("input_tokens", 0)
+            totals["output_tokens"] += usage.get("output_tokens", 0)
+
+    async def on_llm_error(self, error, *, run_id: UUID, **kwargs) -> None:
+        entry = self._running.pop(run_id, None)
+        if entry is None:
+            return
+        span, _ = entry
+        span.duration_ms = (time.perf_counter() - span.started_at) * 1000
+        span.error = type(error).__name__
+        _observe("llm", span.name, span.duration_ms, error=True)
+
+
+def _extract_token_usage(response) -> Dict[str, int]:
+    """LLMResult에서 토큰 사용량 추출 (usage_metadata 우선)"""
+    try:
+        message = response.generations[0][0].message
+        usage = getattr(message, "usage_metadata", None) or {}
+    except (AttributeError, IndexError):
+        usage = {}
+    return {
+        key: int(usage[key])
+        for key in ("input_tokens", "output_tokens", "total_tokens")
+        if usage.get(key) is not None
+    }
+
+
+_llm_callback = LLMTracingCallback()
+
+
+def get_llm_tracing_callback() -> LLMTracingCallback:
+    """LLM 계측 콜백 (프로세스 공용)"""
+    return _llm_callback
+
+
+# =============================================================================
+# 조회
+# =============================================================================
+
+def get_metrics() -> Dict[str, Any]:
+    """kind별 히스토그램 요약 + LLM 토큰 사용량"""
+    metrics: Dict[str, Any] = {"request": {}, "intent": {}, "node": {}, "db": {}, "llm": {}}
+    for (kind, name), histogram in sorted(_histograms.items()):
+        metrics.setdefault(kind, {})[name] = histogram.summary()
+    metrics["llm_tokens"] = {name: dict(usage) for name, usage in _token_usage.items()}
+    return metrics
+
+
+def get_recent_traces(limit: int = 20, min_duration_ms: float = 0.0) -> List[Dict[str, Any]]:
+    """최근 요청 트레이스 (기본 exporter 사용 시)"""
+    if isinstance(_exporter, InMemoryTraceExporter):
+        return _exporter.recent(limit, min_duration_ms)
+    return []
+
+
+def reset_metrics() -> None:
+    """히스토그램 / 토큰 사용량 / 보관 트레이스 초기화"""
+    _histograms.clear()
+    _token_usage.clear()
+    if isinstance(_exporter, InMemoryTraceExporter):
+        _exporter.clear()
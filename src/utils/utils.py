@@ -10,9 +10,9 @@ logger = logging.getLogger(__name__)
 # 주의: get_system_prompt, format_user_prompt 함수는 더 이상 사용되지 않음
 # 새로운 온보딩 방식은 nodes.py에서 직접 EXTRACTION_SYSTEM_PROMPT를 사용함
 
-def simple_text_response(text: str) -> Dict[str, Any]:
-    """간단한 텍스트 응답 (카카오톡 API 포맷)"""
-    return {
+def simple_text_response(text: str, quick_replies: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """간단한 텍스트 응답 (카카오톡 API 포맷, quick_replies가 있으면 버튼 추가)"""
+    response = {
         "version": "2.0",
         "template": {
             "outputs": [{
@@ -22,6 +22,9 @@ def simple_text_response(text: str) -> Dict[str, Any]:
             }]
         }
     }
+    if quick_replies:
+        response["template"]["quickReplies"] = quick_replies
+    return response
 
 
 
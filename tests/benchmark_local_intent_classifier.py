@@ -0,0 +1,115 @@
+"""
+로컬 의도 분류기 오프라인 벤치마크
+골든 데이터셋(INTENT_GOLDEN_CASES) 기준 정확도/커버리지/지연 측정
+
+- 정확도: leave-one-out 교차검증 (평가 케이스를 학습에서 제외 → 처음 보는 문장 기준)
+- 커버리지: 로컬 분류 대상(봇 질문에 답하는 짧은 메시지)이면서 확신도 임계값 이상인 비율 (나머지는 LLM)
+- 주의: 학습 데이터 안에서의 교차검증이라 실제 트래픽 정확도보다 높게 나온다
+  (LOCAL_INTENT_CLASSIFIER_ENABLED를 켜기 전에 실제 대화 로그로 다시 확인할 것)
+- --llm: 같은 케이스를 현재 LLM 프롬프트로 분류해 정확도/지연 비교 (GCP 인증 필요)
+
+실행: python tests/benchmark_local_intent_classifier.py [--llm]
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config.config import LOCAL_INTENT_CONFIDENCE_THRESHOLD
+from src.service.daily.intent_golden_cases import INTENT_GOLDEN_CASES
+from src.service.daily.local_intent_classifier import LocalIntentClassifier
+
+THRESHOLDS = [0.0, 0.6, 0.7, 0.8, 0.9, 0.95, 0.99]
+
+
+def run_cross_validation():
+    """leave-one-out 교차검증 → (확신도, 정답 여부, 케이스) 목록"""
+    results = []
+    for i, (user_msg, bot_context, expected) in enumerate(INTENT_GOLDEN_CASES):
+        train = INTENT_GOLDEN_CASES[:i] + INTENT_GOLDEN_CASES[i + 1:]
+        model = LocalIntentClassifier().fit(train)
+        label, confidence = model.predict(user_msg, bot_context)
+        if not model.is_applicable(user_msg, bot_context):
+            confidence = -1.0  # 대상 아님 → 항상 LLM (어떤 임계값에서도 제외)
+        results.append((confidence, label == expected, (user_msg, bot_context, expected, label)))
+    return results
+
+
+def measure_latency(repeat: int = 20):
+    """전체 데이터로 학습한 모델의 학습 시간 / 1건 분류 지연 (마이크로초)"""
+    start = time.perf_counter()
+    model = LocalIntentClassifier().fit(INTENT_GOLDEN_CASES)
+    train_ms = (time.perf_counter() - start) * 1000
+
+    latencies = []
+    for _ in range(repeat):
+        for user_msg, bot_context, _ in INTENT_GOLDEN_CASES:
+            start = time.perf_counter()
+            model.predict(user_msg, bot_context)
+            latencies.append((time.perf_counter() - start) * 1_000_000)
+
+    latencies.sort()
+    return train_ms, statistics.median(latencies), latencies[int(len(latencies) * 0.99)]
+
+
+async def run_llm_baseline():
+    """현재 LLM 프롬프트로 같은 케이스 분류 (정확도, 지연 목록)"""
+    from langchain_core.messages import SystemMessage, HumanMessage
+    from src.prompt.intent_prompts import INTENT_CLASSIFICATION_SYSTEM_PROMPT, INTENT_CLASSIFICATION_USER_PROMPT
+    from src.utils.models import get_chat_llm
+
+    llm = get_chat_llm()
+    correct, latencies = 0, []
+    for user_msg, bot_context, expected in INTENT_GOLDEN_CASES:
+        message = f"[Previous bot]: {bot_context}\n[User]: {user_msg}" if bot_context else user_msg
+        start = time.perf_counter()
+        response = await llm.ainvoke([
+            SystemMessage(content=INTENT_CLASSIFICATION_SYSTEM_PROMPT),
+            HumanMessage(content=INTENT_CLASSIFICATION_USER_PROMPT.format(message=message))
+        ])
+        latencies.append((time.perf_counter() - start) * 1000)
+        correct += response.content.strip().lower() == expected
+    return correct / len(INTENT_GOLDEN_CASES), latencies
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--llm", action="store_true", help="LLM 프롬프트 기준선도 측정 (GCP 인증 필요)")
+    args = parser.parse_args()
+
+    total = len(INTENT_GOLDEN_CASES)
+    print(f"{'='*60}")
+    print(f"로컬 의도 분류기 벤치마크 (골든 케이스 {total}건, leave-one-out)")
+    print(f"{'='*60}")
+
+    results = run_cross_validation()
+    print(f"{'임계값':>8} | {'커버리지':>8} | {'정확도':>8}")
+    for threshold in THRESHOLDS:
+        selected = [ok for confidence, ok, _ in results if confidence >= threshold]
+        coverage = len(selected) / total * 100
+        accuracy = sum(selected) / len(selected) * 100 if selected else 0.0
+        marker = "  ← 현재 설정" if threshold == LOCAL_INTENT_CONFIDENCE_THRESHOLD else ""
+        print(f"{threshold:>8.2f} | {coverage:>7.1f}% | {accuracy:>7.1f}%{marker}")
+
+    print(f"\n임계값 {LOCAL_INTENT_CONFIDENCE_THRESHOLD} 이상인데 틀린 케이스:")
+    for confidence, ok, (user_msg, bot_context, expected, label) in results:
+        if confidence >= LOCAL_INTENT_CONFIDENCE_THRESHOLD and not ok:
+            print(f"  ❌ '{user_msg}' (봇: '{bot_context[:20]}') → {label} (정답: {expected}, {confidence:.3f})")
+
+    train_ms, p50, p99 = measure_latency()
+    print(f"\n학습 시간: {train_ms:.0f}ms")
+    print(f"분류 지연: p50 {p50:.0f}µs, p99 {p99:.0f}µs")
+
+    if args.llm:
+        accuracy, latencies = asyncio.run(run_llm_baseline())
+        latencies.sort()
+        print(f"\nLLM 프롬프트 정확도: {accuracy * 100:.1f}%")
+        print(f"LLM 분류 지연: p50 {statistics.median(latencies):.0f}ms, p99 {latencies[int(len(latencies) * 0.99)]:.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+카카오 콜백 URL 스텁 서버
+useCallback 응답 이후 챗봇이 POST하는 최종 응답을 받아 기록한다.
+
+단독 실행 (로컬 수동 테스트):
+    python tests/kakao_callback_stub.py --port 9000
+    → /webhook 요청의 userRequest.callbackUrl에 http://127.0.0.1:9000/callback 지정
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class KakaoCallbackStub:
+    """콜백 POST를 받아 received 리스트에 쌓는 로컬 HTTP 서버
+
+    Args:
+        port: 0이면 빈 포트 자동 할당
+        status_codes: 순서대로 돌려줄 응답 코드 (재시도 테스트용, 소진 후 200)
+    """
+
+    def __init__(self, port: int = 0, status_codes=None):
+        self.received = []
+        self.status_codes = list(status_codes or [])
+        self._event = threading.Event()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+                status = stub.status_codes.pop(0) if stub.status_codes else 200
+                if status == 200:
+                    stub.received.append({"path": self.path, "body": body})
+                    stub._event.set()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.end_headers()
+                self.wfile.write(json.dumps({"taskId": "stub", "status": "SUCCESS"}).encode())
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address
+        return f"http://{host}:{port}/callback"
+
+    def wait(self, timeout: float = 5.0) -> bool:
+        """콜백 1건 이상 수신될 때까지 대기"""
+        return self._event.wait(timeout)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=9000)
+    args = parser.parse_args()
+
+    with KakaoCallbackStub(port=args.port) as stub:
+        print(f"콜백 스텁 서버 실행 중: {stub.url}")
+        seen = 0
+        while True:
+            time.sleep(0.5)
+            for item in stub.received[seen:]:
+                print(json.dumps(item["body"], ensure_ascii=False, indent=2))
+            seen = len(stub.received)
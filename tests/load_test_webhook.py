@@ -0,0 +1,268 @@
+"""
+웹훅 오프라인 부하 테스트 (가짜 LLM + 모킹 모드 Database)
+Vertex AI / Supabase 없이 /webhook을 합성 카카오 사용자 수천 명으로 호출해 처리량과 플로우별 지연을 측정
+
+- LLM: FakeChatModel (--llm-latency ± --llm-jitter 초, 프롬프트별로 고정된 결정적 응답)
+- DB: SUPABASE_URL 없이 생성한 Database (모킹 모드 인메모리 테이블)
+- 시나리오 (사용자별로 순차, 사용자 간에는 동시):
+    onboarding (첫 메시지 + 10개 필드 답변)
+    → 다음 날로 간주 (onboarding_completed_at을 하루 전으로)
+    → daily (업무 대화 --daily-turns회) → summary (요약 요청)
+    → weekly (이번 주 평일 요약을 미리 채운 뒤 주간요약 요청)
+- 결과: 전체 처리량(req/s) + 플로우별 p50/p95/p99 + 노드/LLM 지연 상위 항목 (DB 스팬은 실제 왕복만 기록 → 모킹 모드에서는 없음)
+- 게이트웨이 모드 (--gateway): 가짜 공급자 --providers개를 LLMGateway로 묶어 꼬리 지연
+  (--tail-rate / --tail-latency)에 대한 헤징(--hedge) / 마감 시간(--llm-timeout) 효과 측정
+- 동시 실행 제어 모드 (--governor): LLMGovernor로 초당 --quota-per-sec회로 제한했을 때
+  우선순위(대화 / 요약 / 배치)별 대기열 길이와 대기 시간 측정
+
+실행: python tests/load_test_webhook.py [--users 2000] [--concurrency 200] [--llm-latency 0.8] [--llm-jitter 0.3]
+      python tests/load_test_webhook.py --gateway --providers 2 --tail-rate 0.05 --tail-latency 4 --hedge
+      python tests/load_test_webhook.py --governor --quota-per-sec 50
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import logging
+import os
+import sys
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.fake_llm import FakeChatModel
+from src.utils.llm_gateway import LLMGateway
+from src.utils.llm_governor import GovernedLLM, LLMGovernor
+from src.utils.models import set_llm_override
+from src.utils.tracing import LatencyHistogram, get_llm_tracing_callback, get_metrics, reset_metrics
+
+FLOWS = ("onboarding", "daily", "summary", "weekly")
+
+ONBOARDING_ANSWERS = [
+    "안녕하세요",  # 첫 메시지 → 온보딩 안내 + 첫 질문
+    "테스터",
+    "백엔드 개발자",
+    "5년",
+    "3년",
+    "테크 리드로 성장하기",
+    "결제 시스템 개편",
+    "정산 배치 성능 개선",
+    "사용자 문제를 해결하는 것",
+    "동료와의 신뢰",
+    "동의",
+]
+
+DAILY_MESSAGES = [
+    "오늘 결제 API 타임아웃 이슈를 분석했어",
+    "DB 인덱스를 추가해서 응답 시간을 절반으로 줄였어",
+    "오후에는 신입 개발자 코드 리뷰를 했어",
+    "내일은 배포 준비를 할 예정이야",
+]
+
+
+def webhook_body(user_id: str, utterance: str) -> dict:
+    """카카오 오픈빌더 스킬 요청 형식 (콜백 없음 → 동기 응답)"""
+    return {
+        "userRequest": {
+            "user": {"id": user_id},
+            "utterance": utterance,
+            "requestId": str(uuid.uuid4()),
+        },
+        "action": {"name": "fallback"},
+    }
+
+
+def seed_weekly_summaries(db, user_id: str, days: int = 3) -> None:
+    """이번 주 평일(오늘 이전) 데일리 요약 + 주간 작성일 수를 인메모리 DB에 채움"""
+    today = date.today()
+    monday = today - timedelta(days=today.weekday())
+    weekdays = [monday + timedelta(days=i) for i in range(5) if monday + timedelta(days=i) < today][-days:]
+    for day in weekdays:
+        db._mock_save_turn(user_id, "요약해줘", f"{day} 업무 요약", True, "daily", False, day.isoformat())
+
+    state = db._mock_states.get(user_id)
+    if state:
+        state["temp_data"]["weekday_record_count"] = max(
+            state["temp_data"].get("weekday_record_count", 0), len(weekdays)
+        )
+
+
+def build_fake_llm(args):
+    """가짜 LLM 1개, 또는 --gateway면 가짜 공급자 여러 개를 묶은 LLMGateway"""
+    def fake(seed: int) -> FakeChatModel:
+        return FakeChatModel(
+            latency=args.llm_latency,
+            jitter=args.llm_jitter,
+            seed=seed,
+            tail_rate=args.tail_rate,
+            tail_latency=args.tail_latency,
+            callbacks=[get_llm_tracing_callback()]
+        )
+
+    if not args.gateway:
+        llm = fake(args.seed)
+    else:
+        providers = [(f"fake_{i}", fake(args.seed + i)) for i in range(args.providers)]
+        llm = LLMGateway("load_test", providers, timeout=args.llm_timeout, hedge=args.hedge)
+
+    if args.governor:
+        llm = GovernedLLM(llm, LLMGovernor(rate=args.quota_per_sec), timeout=args.llm_timeout)
+    return llm
+
+
+class LoadTest:
+    """사용자 시나리오 실행 + 플로우별 지연 집계"""
+
+    def __init__(self, client, db, daily_turns: int):
+        self.client = client
+        self.db = db
+        self.daily_turns = daily_turns
+        self.histograms = {flow: LatencyHistogram(sample_size=1_000_000) for flow in FLOWS}
+        self.completed_onboarding = 0
+
+    async def send(self, flow: str, user_id: str, utterance: str) -> str:
+        start = time.perf_counter()
+        error = False
+        text = ""
+        try:
+            res = await self.client.post("/webhook", json=webhook_body(user_id, utterance))
+            error = res.status_code != 200
+            outputs = res.json().get("template", {}).get("outputs", [])
+            text = outputs[0].get("simpleText", {}).get("text", "") if outputs else ""
+            error = error or "오류가 발생했습니다" in text
+        except Exception:
+            error = True
+        self.histograms[flow].observe((time.perf_counter() - start) * 1000, error=error)
+        return text
+
+    async def run_user(self, user_id: str) -> None:
+        for answer in ONBOARDING_ANSWERS:
+            await self.send("onboarding", user_id, answer)
+            user = self.db._mock_users.get(user_id)
+            if user and user.get("onboarding_completed"):
+                self.completed_onboarding += 1
+                break
+
+        user = self.db._mock_users.get(user_id)
+        if user:
+            # 온보딩 완료 당일에는 일일기록이 차단되므로 다음 날로 간주
+            user["onboarding_completed_at"] = (datetime.now() - timedelta(days=1)).isoformat()
+
+        for i in range(self.daily_turns):
+            await self.send("daily", user_id, DAILY_MESSAGES[i % len(DAILY_MESSAGES)])
+        await self.send("summary", user_id, "오늘 내용 정리해줘")
+
+        seed_weekly_summaries(self.db, user_id)
+        await self.send("weekly", user_id, "주간요약 보여줘")
+
+
+async def run(args) -> None:
+    # 모킹 모드 Database + 가짜 LLM (그래프 컴파일 전에 주입)
+    # 빈 값으로 덮어둬야 main의 load_dotenv()가 .env의 Supabase 설정을 다시 넣지 않음
+    os.environ["SUPABASE_URL"] = ""
+    os.environ["SUPABASE_ANON_KEY"] = ""
+    llm = build_fake_llm(args)
+    set_llm_override(llm)
+    logging.disable(logging.WARNING)
+
+    import httpx
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        import main
+        await main.chatbot_manager.initialize()
+
+    reset_metrics()
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=60.0) as client:
+        load_test = LoadTest(client, main.db, args.daily_turns)
+        semaphore = asyncio.Semaphore(args.concurrency)
+
+        async def run_user(i: int):
+            async with semaphore:
+                await load_test.run_user(f"load_user_{i:05d}")
+
+        start = time.perf_counter()
+        # 서비스 코드의 print 출력은 버림 (사용자 수천 명 × 요청 수십 회)
+        with contextlib.redirect_stdout(io.StringIO()):
+            await asyncio.gather(*(run_user(i) for i in range(args.users)))
+        elapsed = time.perf_counter() - start
+
+    main.db.close()
+    report(load_test, elapsed, args)
+    if isinstance(llm, GovernedLLM):
+        report_governor(llm.governor)
+        llm = llm.llm
+    if isinstance(llm, LLMGateway):
+        report_gateway(llm)
+
+
+def report(load_test: LoadTest, elapsed: float, args) -> None:
+    total = sum(h.count for h in load_test.histograms.values())
+    errors = sum(h.errors for h in load_test.histograms.values())
+
+    print(f"\n사용자 {args.users}명 / 동시 {args.concurrency}명 / LLM {args.llm_latency}±{args.llm_jitter}초")
+    print(f"요청 {total}건 ({errors}건 오류) / {elapsed:.1f}초 → {total / elapsed:.1f} req/s")
+    print(f"온보딩 완료 {load_test.completed_onboarding}/{args.users}명\n")
+
+    print(f"{'flow':<12}{'count':>8}{'errors':>8}{'p50(ms)':>10}{'p95(ms)':>10}{'p99(ms)':>10}{'max(ms)':>10}")
+    for flow in FLOWS:
+        s = load_test.histograms[flow].summary()
+        print(
+            f"{flow:<12}{s['count']:>8}{s['errors']:>8}"
+            f"{s['p50_ms']:>10.1f}{s['p95_ms']:>10.1f}{s['p99_ms']:>10.1f}{s['max_ms']:>10.1f}"
+        )
+
+    # 서버 내부 계측 (/metrics와 같은 값) - 누적 시간이 큰 항목 순
+    metrics = get_metrics()
+    for kind in ("node", "llm", "db"):
+        top = sorted(metrics.get(kind, {}).items(), key=lambda kv: kv[1]["total_ms"], reverse=True)[:args.top]
+        if not top:
+            continue
+        print(f"\n[{kind}] 누적 시간 상위 {len(top)}")
+        for name, s in top:
+            print(f"  {name:<40}{s['count']:>8}회  p50 {s['p50_ms']:>8.1f}  p99 {s['p99_ms']:>8.1f} ms")
+
+
+def report_gateway(gateway: LLMGateway) -> None:
+    stats = gateway.get_stats()
+    print(f"\n[gateway] 헤징 {'on' if stats['hedge'] else 'off'} / 마감 {stats['timeout']}초 / "
+          f"헤징 승리 {stats['hedge_wins']}회 / 마감 초과 {stats['deadline_exceeded']}회")
+    for name, s in stats["providers"].items():
+        print(f"  {name:<12}{s['calls']:>8}회  ewma {s['ewma_ms'] or 0:>8.1f}  p95 {s['p95_ms']:>8.1f} ms  "
+              f"승리 {s['wins']}  헤징 호출 {s['hedged']}  실패 {s['failures']}")
+
+
+def report_governor(governor: LLMGovernor) -> None:
+    stats = governor.stats()
+    print(f"\n[governor] 초당 {stats['rate']}회 / 대화 예약 {stats['reserve']} / "
+          f"토큰 대기 누적 {stats['token_wait_seconds']}초")
+    for priority, s in stats["priorities"].items():
+        print(f"  {priority:<12}{s['admitted']:>8}회  최대 대기 {s['max_queued']:>5}  "
+              f"대기 p50 {s['wait_p50_ms']:>8.1f}  p95 {s['wait_p95_ms']:>8.1f} ms  대기 초과 {s['timed_out']}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=1000, help="합성 카카오 사용자 수")
+    parser.add_argument("--concurrency", type=int, default=100, help="동시에 진행하는 사용자 수")
+    parser.add_argument("--daily-turns", type=int, default=4, help="사용자당 일일기록 대화 횟수")
+    parser.add_argument("--llm-latency", type=float, default=0.5, help="가짜 LLM 기본 지연 (초)")
+    parser.add_argument("--llm-jitter", type=float, default=0.2, help="가짜 LLM 지연 편차 (초)")
+    parser.add_argument("--seed", type=int, default=0, help="가짜 LLM 지연 시드")
+    parser.add_argument("--top", type=int, default=5, help="노드/LLM/DB별 출력할 상위 항목 수")
+    parser.add_argument("--tail-rate", type=float, default=0.0, help="꼬리 지연이 붙는 LLM 호출 비율")
+    parser.add_argument("--tail-latency", type=float, default=0.0, help="꼬리 지연 (초)")
+    parser.add_argument("--gateway", action="store_true", help="가짜 공급자들을 LLMGateway로 묶어 호출")
+    parser.add_argument("--providers", type=int, default=2, help="게이트웨이 모드의 가짜 공급자 수")
+    parser.add_argument("--hedge", action="store_true", help="게이트웨이 헤징 사용")
+    parser.add_argument("--llm-timeout", type=float, default=10.0, help="게이트웨이 / 동시 실행 제어 마감 시간 (초)")
+    parser.add_argument("--governor", action="store_true", help="LLMGovernor로 우선순위별 동시 실행 제어")
+    parser.add_argument("--quota-per-sec", type=float, default=50.0, help="동시 실행 제어 모드의 초당 LLM 호출 상한")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
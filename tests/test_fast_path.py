@@ -0,0 +1,102 @@
+"""
+그래프 실행 전 빠른 응답 규칙 테스트 (모킹 모드 Database)
+- 온보딩 완료 당일 / 평일 주간요약 요청 / 주간요약 완료 후 반복 접근 → 그래프와 같은 문구
+- 소감 저장 전, 날짜 변경 직후, 캐시에 데이터가 없을 때는 그래프로 넘김
+- ChatBotManager는 규칙이 응답하면 컨텍스트 로드/그래프 실행 없이 응답
+
+실행: python tests/test_fast_path.py (또는 pytest tests/test_fast_path.py)
+"""
+import asyncio
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.chatbot import ChatBotManager, fast_path
+from src.chatbot.fast_path import FastPathEngine
+from src.config import KST
+from src.database import Database
+from src.prompt.onboarding_questions import format_onboarding_day_block_message
+from src.service.weekly import format_weekday_only_message, format_weekly_completed_message
+
+WEDNESDAY = datetime(2026, 10, 14, 10, 0, tzinfo=KST)
+SATURDAY = datetime(2026, 10, 17, 20, 0, tzinfo=KST)
+
+
+def make_db(completed_at, temp_data=None, last_record_date=None):
+    db = Database()
+    db._mock_users["u1"] = {
+        "kakao_user_id": "u1",
+        "name": "테스터",
+        "onboarding_completed": True,
+        "onboarding_completed_at": completed_at.isoformat(),
+        "last_record_date": last_record_date,
+    }
+    if temp_data is not None:
+        db._mock_states["u1"] = {"kakao_user_id": "u1", "current_step": "weekly_completed", "temp_data": temp_data}
+    return db
+
+
+def evaluate_at(engine, now, message):
+    original = fast_path.get_kst_now
+    fast_path.get_kst_now = lambda: now
+    try:
+        return engine.evaluate("u1", message)
+    finally:
+        fast_path.get_kst_now = original
+
+
+def test_rules_answer_only_when_graph_reply_is_fixed():
+    yesterday = datetime.now() - timedelta(days=1)
+    week = WEDNESDAY.isocalendar()[1]
+
+    today_db = make_db(datetime.now())
+    assert evaluate_at(FastPathEngine(today_db), WEDNESDAY, "오늘 배포했어") == (
+        "onboarding_day_block", format_onboarding_day_block_message("테스터")
+    )
+
+    weekday_db = make_db(yesterday, temp_data={})
+    assert evaluate_at(FastPathEngine(weekday_db), WEDNESDAY, "주간요약 보여줘") == (
+        "weekly_weekday_only", format_weekday_only_message()
+    )
+    assert evaluate_at(FastPathEngine(weekday_db), SATURDAY, "주간요약 보여줘") is None
+    assert evaluate_at(FastPathEngine(weekday_db), WEDNESDAY, "오늘 배포했어") is None
+
+    # 날짜가 바뀐 첫 요청은 daily_agent의 카운트 리셋이 필요 → 그래프
+    stale_db = make_db(yesterday, temp_data={}, last_record_date="2020-01-01")
+    assert evaluate_at(FastPathEngine(stale_db), WEDNESDAY, "주간요약") is None
+
+    done = {"weekly_completed_week": week, "user_shared_weekly_thoughts": True}
+    assert evaluate_at(FastPathEngine(make_db(yesterday, temp_data=done)), WEDNESDAY, "고마워") == (
+        "weekly_completed_repeat", format_weekly_completed_message()
+    )
+    # 소감 저장 전 첫 응답은 그래프에서 is_review로 저장해야 함
+    first_reply = {"weekly_completed_week": week, "user_shared_weekly_thoughts": False}
+    assert evaluate_at(FastPathEngine(make_db(yesterday, temp_data=first_reply)), WEDNESDAY, "고마워") is None
+
+
+def test_uncached_data_falls_back_and_manager_skips_graph_on_hit():
+    # 실제 DB 모드인데 캐시가 비어 있음 → 규칙 평가 없이 그래프로
+    db = Database()
+    db.supabase = object()
+    engine = FastPathEngine(db)
+    assert engine.evaluate("u1", "주간요약") is None
+    assert engine.stats()["skipped_uncached"] == 1
+
+    manager = ChatBotManager(make_db(datetime.now()))
+
+    async def fail_graph(*args):
+        raise AssertionError("그래프가 실행되면 안 됨")
+
+    manager._invoke_graph = fail_graph
+    response = asyncio.run(manager.handle_conversation("u1", "안녕"))
+    assert response["template"]["outputs"][0]["simpleText"]["text"] == format_onboarding_day_block_message("테스터")
+    assert manager.fast_path.stats()["hits"]["onboarding_day_block"] == 1
+
+
+if __name__ == "__main__":
+    for name, fn in list(globals().items()):
+        if name.startswith("test_"):
+            fn()
+            print(f"✅ {name}")
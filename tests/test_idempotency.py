@@ -0,0 +1,58 @@
+"""
+웹훅 멱등성 테스트
+- 요청 ID 키: 진행 중 합류 + 완료 응답 캐시
+- 발화 키 (요청 ID 없음): 진행 중 합류만, 완료 후 같은 발화는 새로 처리
+- 퀵리플라이 의도가 다르면 다른 요청
+
+실행: python tests/test_idempotency.py (또는 pytest tests/test_idempotency.py)
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.chatbot.idempotency import IdempotencyGuard, make_idempotency_key
+
+
+def make_handler(calls):
+    async def handler():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"n": len(calls)}
+    return handler
+
+
+def test_request_id_is_cached_after_completion():
+    guard = IdempotencyGuard()
+    calls = []
+    key = make_idempotency_key("u1", "응", request_id="r1")
+
+    async def run():
+        first, retry = await asyncio.gather(guard.run(key, make_handler(calls)), guard.run(key, make_handler(calls)))
+        late_retry = await guard.run(key, make_handler(calls))
+        return first, retry, late_retry
+
+    first, retry, late_retry = asyncio.run(run())
+    assert len(calls) == 1 and first == retry == late_retry
+
+
+def test_utterance_key_only_joins_inflight():
+    guard = IdempotencyGuard()
+    calls = []
+    key = make_idempotency_key("u1", "응")
+
+    async def run():
+        await asyncio.gather(guard.run(key, make_handler(calls)), guard.run(key, make_handler(calls)))
+        # 새 봇 질문에 대한 두 번째 "응" → 다시 처리
+        return await guard.run(key, make_handler(calls))
+
+    assert asyncio.run(run()) == {"n": 2}
+    assert make_idempotency_key("u1", "정리해줘", quick_reply_intent="summary") != make_idempotency_key("u1", "정리해줘")
+
+
+if __name__ == "__main__":
+    for name, fn in list(globals().items()):
+        if name.startswith("test_"):
+            fn()
+            print(f"✅ {name}")
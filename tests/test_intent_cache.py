@@ -0,0 +1,56 @@
+"""
+의도 분류 캐시 테스트
+- 캐시 키는 (직전 봇 메시지 상태, 정규화된 사용자 메시지): 봇 문구가 달라도 같은 상태면 적중
+- 봇 상태가 다르면 ("응" + 요약 제안 vs 일반 질문) 따로 분류
+
+실행: python tests/test_intent_cache.py (또는 pytest tests/test_intent_cache.py)
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from langchain_core.messages import AIMessage
+
+from src.service.daily import intent_classifier
+from src.service.daily.intent_classifier import _classify_raw_intent, intent_cache_key
+
+
+class CountingLLM:
+    def __init__(self, label):
+        self.label = label
+        self.calls = 0
+
+    async def ainvoke(self, *args, **kwargs):
+        self.calls += 1
+        return AIMessage(content=self.label)
+
+
+def enhanced(bot, user):
+    return f"[Previous bot]: {bot}\n[User]: {user}"
+
+
+def test_cache_key_uses_bot_state_not_bot_text():
+    assert intent_cache_key(enhanced("민수님, 오늘 내용 정리해드릴까요?", "응!")) == ("ask", "응")
+    assert intent_cache_key(enhanced("지수님 고생 많으셨어요. 정리해 드릴까요?", "응")) == ("ask", "응")
+    assert intent_cache_key("요약해줘") == ("none", "요약해줘")
+
+    intent_classifier._intent_cache.clear()
+    llm = CountingLLM("summary")
+
+    async def run():
+        first = await _classify_raw_intent(enhanced("민수님, 오늘 내용 정리해드릴까요?", "응"), llm)
+        second = await _classify_raw_intent(enhanced("지수님, 여기까지 정리해드릴까요?", "응!"), llm)
+        other = await _classify_raw_intent(enhanced("어떤 작업이었나요?", "응"), llm)
+        return first, second, other
+
+    assert asyncio.run(run()) == ("summary", "summary", "summary")
+    assert llm.calls == 2  # 요약 제안 상태 1회 + 일반 질문 상태 1회
+
+
+if __name__ == "__main__":
+    for name, fn in list(globals().items()):
+        if name.startswith("test_"):
+            fn()
+            print(f"✅ {name}")
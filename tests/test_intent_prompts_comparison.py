@@ -17,205 +17,8 @@ if credentials_path.exists():
 else:
     print(f"⚠️ GCP 인증 파일을 찾을 수 없습니다: {credentials_path}")
 
-# 테스트 케이스
-TEST_CASES = [
-    # ========== 기본 케이스 ==========
-    ("수정 내용을 반영해서 다시 작성해", "요약을 보여드렸습니다", "edit_summary"),
-    ("일일기록 수정해줘", "요약 완료", "edit_summary"),
-    ("프롬프트 엔지니어링 안했어. 이건 빼줘", "요약 내용", "edit_summary"),
-    ("정리해줘", "", "summary"),
-    ("응", "지금까지 내용을 정리해드릴까요?", "summary"),
-    ("응", "오늘 하신 업무에 대해 이야기 나눠볼까요?", "continue"),
-    ("끝", "", "end_conversation"),
-    ("아니", "정리해드릴까요?", "rejection"),
-    ("안했어", "프롬프트 엔지니어링을 하셨나요?", "continue"),
-    ("안했어", "요약: 프롬프트 엔지니어링 완료", "edit_summary"),
-    ("처음부터 다시", "", "restart"),
-
-    # ========== 요약 요청 변형 ==========
-    ("요약해줘", "", "summary"),
-    ("오늘 한 거 정리해주면 안돼?", "", "summary"),
-    ("네", "내용을 정리해드릴까요?", "summary"),
-    ("좋아", "요약해드릴까요?", "summary"),
-    ("부탁해", "지금까지 내용을 정리해드릴까요?", "summary"),
-
-    # ========== 요약 수정 변형 ==========
-    ("라이브러리 버그 수정도 추가해줘", "요약 완료", "edit_summary"),
-    ("프롬프트 엔지니어링은 빠져있어", "요약 내용", "edit_summary"),
-    ("이거 틀렸어. 다시 작성해줘", "요약을 보여드렸습니다", "edit_summary"),
-    ("여기 누락된 부분 있어", "요약 완료", "edit_summary"),
-    ("수정하고 싶어", "요약 내용", "edit_summary"),
-    ("반영해줘", "요약 완료", "edit_summary"),
-
-    # ========== 짧은 응답 - 맥락별 ==========
-    ("네", "오늘 어떤 업무를 하셨나요?", "continue"),
-    ("응", "더 자세히 설명해주실 수 있나요?", "continue"),
-    ("좋아", "그 방법으로 진행하셨나요?", "continue"),
-    ("네", "수정하고 싶은 표현은 없나요?", "no_edit_needed"),
-    ("없어", "수정하고 싶은 부분 있나요?", "no_edit_needed"),
-    ("괜찮아", "디테일은 없나요?", "no_edit_needed"),
-
-    # ========== 거절 변형 ==========
-    ("싫어", "정리해드릴까요?", "rejection"),
-    ("나중에", "요약해드릴까요?", "rejection"),
-    ("안 할래", "내용을 정리해드릴까요?", "rejection"),
-
-    # ========== 대화 종료 변형 ==========
-    ("종료", "", "end_conversation"),
-    ("그만", "", "end_conversation"),
-    ("바이", "", "end_conversation"),
-    ("힘들어", "", "end_conversation"),
-    ("피곤해", "", "end_conversation"),
-    ("이제 그만", "", "end_conversation"),
-    ("마칠게", "", "end_conversation"),
-
-    # ========== 재시작 변형 ==========
-    ("새로 시작", "", "restart"),
-    ("리셋", "", "restart"),
-    ("다시 시작하자", "", "restart"),
-
-    # ========== 일반 대화 (continue) ==========
-    ("오늘 챗봇 개발했어", "", "continue"),
-    ("버그 수정하고 테스트 작성했어", "", "continue"),
-    ("없었어", "특별한 어려움은 없었나요?", "continue"),
-    ("딱히", "어떤 점이 어려웠나요?", "continue"),
-    ("그냥 평소처럼 했어", "", "continue"),
-    ("API 연동 작업 진행 중이야", "", "continue"),
-
-    # ========== 엣지 케이스 - "안했어" 맥락 구분 ==========
-    ("안했어", "테스트는 작성하셨나요?", "continue"),  # 대화 중
-    ("안했어", "📝 오늘의 커리어 메모\n\n테스트 작성 완료", "edit_summary"),  # 요약 후
-    ("안 했다니까", "리팩토링도 하셨나요?", "continue"),  # 대화 중
-    ("그거 안했어", "요약: 리팩토링 완료", "edit_summary"),  # 요약 후
-
-    # ========== 엣지 케이스 - 다시 작성 맥락 구분 ==========
-    ("다시 작성해", "요약 완료", "edit_summary"),  # 요약 수정
-    ("처음부터 다시 해볼게", "어떻게 진행하셨나요?", "continue"),  # 일반 대화
-
-    # ========== 엣지 케이스 - 애매한 짧은 응답 ==========
-    ("응", "", "continue"),  # 맥락 없으면 continue
-    ("네", "", "continue"),  # 맥락 없으면 continue
-    ("좋아", "", "continue"),  # 맥락 없으면 continue
-
-    # ========== 복합 의도 (우선순위 테스트) ==========
-    ("끝내고 싶어", "", "end_conversation"),  # end > continue
-    ("처음부터 다시 시작하고 싶어", "", "restart"),  # restart > continue
-    ("수정하고 끝낼게", "요약 완료", "edit_summary"),  # edit > end
-
-    # ========== 추가 요약 요청 패턴 ==========
-    ("정리 부탁해", "", "summary"),
-    ("요약 좀 해줘", "", "summary"),
-    ("지금까지 얘기한 거 정리해줄래?", "", "summary"),
-    ("오늘 한 일 정리해주세요", "", "summary"),
-    ("기록 정리해줘", "", "summary"),
-    ("오케이", "정리해드릴까요?", "summary"),
-    ("ㅇㅇ", "요약해드릴까요?", "summary"),
-    ("그래", "내용을 정리해드릴까요?", "summary"),
-    ("응응", "지금까지 내용을 정리해드릴까요?", "summary"),
-
-    # ========== 추가 요약 수정 패턴 ==========
-    ("이거 잘못됐어", "📝 오늘의 커리어 메모", "edit_summary"),
-    ("이 부분 수정", "요약 완료", "edit_summary"),
-    ("여기에 이것도 넣어줘", "요약:", "edit_summary"),
-    ("그 내용도 기록해줘", "📝 오늘의 커리어 메모", "edit_summary"),
-    ("회의 내용도 추가해줘", "요약 완료", "edit_summary"),
-    ("이 항목 빼줘", "📝 오늘의 커리어 메모", "edit_summary"),
-    ("문서 작성은 안 했어", "요약: 문서 작성 완료", "edit_summary"),
-    ("그건 하지 않았어", "📝 오늘의 커리어 메모\n\n코드 리뷰", "edit_summary"),
-    ("내용 좀 바꿔줘", "요약 완료", "edit_summary"),
-    ("표현 수정해줘", "📝 오늘의 커리어 메모", "edit_summary"),
-
-    # ========== 추가 대화 종료 패턴 ==========
-    ("그만할게", "", "end_conversation"),
-    ("종료할게", "", "end_conversation"),
-    ("오늘은 여기까지", "", "end_conversation"),
-    ("이만 끝낼게", "", "end_conversation"),
-    ("굿밤", "", "end_conversation"),
-    ("잘자", "", "end_conversation"),
-    ("너무 피곤하다", "", "end_conversation"),
-    ("지쳤어", "", "end_conversation"),
-    ("오늘은 힘들어서 그만할래", "", "end_conversation"),
-
-    # ========== 추가 거절 패턴 ==========
-    ("아니야", "정리해드릴까요?", "rejection"),
-    ("됐어", "요약해드릴까요?", "rejection"),
-    ("괜찮아", "내용을 정리해드릴까요?", "rejection"),  # 요약 제안에 대한 거절
-    ("안 해", "지금까지 내용을 정리해드릴까요?", "rejection"),
-    ("별로", "요약해드릴까요?", "rejection"),
-
-    # ========== 추가 일반 대화 패턴 ==========
-    ("오늘 회의 많았어", "", "continue"),
-    ("데이터베이스 설계했어", "", "continue"),
-    ("팀원들이랑 협업했어", "", "continue"),
-    ("문서 작성하고 리뷰 받았어", "", "continue"),
-    ("코드 리팩토링 진행 중", "", "continue"),
-    ("별일 없었어", "오늘은 어떤 일을 하셨나요?", "continue"),
-    ("평범했어", "특별한 일은 없었나요?", "continue"),
-    ("그냥 루틴대로", "", "continue"),
-    ("음...", "어떤 작업을 하셨나요?", "continue"),
-    ("글쎄", "어려운 점은 없었나요?", "continue"),
-
-    # ========== 추가 no_edit_needed 패턴 ==========
-    ("응 괜찮아", "수정하고 싶은 표현은 없나요?", "no_edit_needed"),
-    ("완벽해", "디테일은 없나요?", "no_edit_needed"),
-    ("잘 됐어", "수정하고 싶은 부분 있나요?", "no_edit_needed"),
-    ("이대로 좋아", "수정하고 싶은 표현은 없나요?", "no_edit_needed"),
-    ("수정할 거 없어", "디테일은 없나요?", "no_edit_needed"),
-
-    # ========== 추가 재시작 패턴 ==========
-    ("다시 시작할게", "", "restart"),
-    ("온보딩 다시", "", "restart"),
-    ("온보딩 초기화", "", "restart"),
-    ("온보딩 재시작", "", "restart"),
-    ("프로필 재설정", "", "restart"),
-
-    # ========== 복합 표현 - 맥락 중요 ==========
-    ("없어", "수정하고 싶은 표현은 없나요?", "no_edit_needed"),  # 수정 없음
-    ("없어", "오늘 어려움은 없었나요?", "continue"),  # 일반 대화
-    ("없어", "📝 오늘의 커리어 메모\n\n회의", "edit_summary"),  # 요약 수정
-    ("별로", "어떤 점이 어려웠나요?", "continue"),  # 일반 대화
-    ("별로", "정리해드릴까요?", "rejection"),  # 요약 거절
-    ("그냥", "어떻게 진행하셨나요?", "continue"),  # 일반 대화
-    ("좋아", "", "continue"),  # 맥락 없음
-    ("좋아", "오늘 업무에 대해 이야기 나눠볼까요?", "continue"),  # 대화 시작 동의
-    ("좋아", "수정하고 싶은 부분 있나요?", "no_edit_needed"),  # 수정 없음
-
-    # ========== 실제 사용자 시나리오 ==========
-    ("미팅도 추가해줘", "📝 오늘의 커리어 메모", "edit_summary"),
-    ("이건 오늘 안 했는데?", "요약: 테스트 작성", "edit_summary"),
-    ("버그 수정 내용이 빠졌어", "요약 완료", "edit_summary"),
-    ("프론트엔드 작업도 했어", "📝 오늘의 커리어 메모\n\n백엔드 개발", "edit_summary"),
-    ("이 표현 좀 이상한데", "요약 완료", "edit_summary"),
-    ("오늘은 그냥 회의만 했어", "", "continue"),
-    ("특별한 건 없었고 일상적인 업무만", "", "continue"),
-    ("진행 중인 프로젝트 계속 작업", "", "continue"),
-    ("아직 진행 중이야", "완료하셨나요?", "continue"),
-
-    # ========== 타이포/구어체 패턴 ==========
-    ("ㅇㅋ", "정리해드릴까요?", "summary"),
-    ("ㄱㄱ", "요약해드릴까요?", "summary"),
-    ("ㄴㄴ", "내용을 정리해드릴까요?", "rejection"),
-    ("ㅂㅂ", "", "end_conversation"),
-    ("ㅇㅇ 수정", "요약 완료", "edit_summary"),
-    ("정리ㄱㄱ", "", "summary"),
-
-    # ========== 긴 문장/자연스러운 표현 ==========
-    ("오늘 한 거 정리 좀 부탁드려도 될까요?", "", "summary"),
-    ("지금까지 이야기한 내용을 요약으로 만들어주면 좋겠어요", "", "summary"),
-    ("수정할 부분이 좀 있는데 다시 작성해줄 수 있어?", "요약 완료", "edit_summary"),
-    ("요약 내용 중에 틀린 부분이 있어서 수정이 필요해", "📝 오늘의 커리어 메모", "edit_summary"),
-    ("오늘은 정말 피곤해서 이제 그만하고 싶어", "", "end_conversation"),
-    ("처음부터 다시 시작하고 싶은데 가능해?", "", "restart"),
-
-    # ========== 애매한 표현 (기본값 테스트) ==========
-    ("음", "", "continue"),
-    ("아", "", "continue"),
-    ("흠", "", "continue"),
-    ("그렇구나", "", "continue"),
-    ("알겠어", "", "continue"),
-    ("okay", "", "continue"),
-    ("yes", "", "continue"),
-]
+# 테스트 케이스 (골든 데이터셋 - 로컬 분류기 학습 데이터와 공유)
+from src.service.daily.intent_golden_cases import INTENT_GOLDEN_CASES as TEST_CASES
 
 
 async def test_intent_classification(system_prompt: str, user_prompt_template: str, test_name: str):
@@ -0,0 +1,120 @@
+"""
+카카오 콜백(useCallback) 흐름 테스트
+- 빠른 처리: 동기 응답, 콜백 POST 없음
+- 느린 처리: useCallback 대기 응답 후 스텁 서버로 최종 응답 POST
+- 처리 오류 / 콜백 서버 5xx 재시도
+- 느린 작업이 많아도 뒤 요청이 대기하지 않음 (요청마다 태스크)
+
+실행: python tests/test_kakao_callback.py (또는 pytest tests/test_kakao_callback.py)
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.service.callback import KakaoCallbackDispatcher
+from src.utils.utils import simple_text_response
+from kakao_callback_stub import KakaoCallbackStub
+
+
+def _text(response: dict) -> str:
+    return response["template"]["outputs"][0]["simpleText"]["text"]
+
+
+async def _run(handler, stub_status_codes=None, sync_timeout=0.2):
+    with KakaoCallbackStub(status_codes=stub_status_codes) as stub:
+        dispatcher = KakaoCallbackDispatcher(sync_timeout=sync_timeout)
+        try:
+            response = await dispatcher.dispatch(handler, stub.url, label="test_user")
+        finally:
+            # 처리 중인 작업과 콜백 전송이 끝날 때까지 대기 후 종료
+            await dispatcher.stop()
+        return response, stub.received, dispatcher.stats
+
+
+def test_fast_handler_responds_synchronously():
+    async def handler():
+        return simple_text_response("빠른 응답")
+
+    response, received, stats = asyncio.run(_run(handler))
+
+    assert _text(response) == "빠른 응답"
+    assert received == []
+    assert stats["sync_responses"] == 1
+
+
+def test_slow_handler_switches_to_callback():
+    async def handler():
+        await asyncio.sleep(0.5)
+        return simple_text_response("느린 응답")
+
+    response, received, stats = asyncio.run(_run(handler))
+
+    assert response["useCallback"] is True
+    assert response["data"]["text"]
+    assert len(received) == 1
+    assert _text(received[0]["body"]) == "느린 응답"
+    assert stats["callback_responses"] == 1
+
+
+def test_handler_error_is_delivered_as_error_message():
+    async def handler():
+        await asyncio.sleep(0.5)
+        raise RuntimeError("LLM timeout")
+
+    response, received, stats = asyncio.run(_run(handler))
+
+    assert response["useCallback"] is True
+    assert len(received) == 1
+    assert "오류" in _text(received[0]["body"])
+
+
+def test_callback_retried_on_server_error():
+    async def handler():
+        await asyncio.sleep(0.5)
+        return simple_text_response("재시도 후 전달")
+
+    response, received, stats = asyncio.run(_run(handler, stub_status_codes=[503]))
+
+    assert len(received) == 1
+    assert _text(received[0]["body"]) == "재시도 후 전달"
+    assert stats["callback_failures"] == 0
+
+
+def test_slow_jobs_do_not_delay_later_requests():
+    async def slow():
+        await asyncio.sleep(0.5)
+        return simple_text_response("느린 응답")
+
+    async def fast():
+        return simple_text_response("빠른 응답")
+
+    async def scenario():
+        with KakaoCallbackStub() as stub:
+            dispatcher = KakaoCallbackDispatcher(sync_timeout=0.2)
+            try:
+                slow_responses = await asyncio.gather(*[
+                    dispatcher.dispatch(slow, stub.url, label=f"slow_{i}") for i in range(20)
+                ])
+                # 느린 작업 20건이 아직 실행 중이어도 새 요청은 바로 처리됨
+                fast_response = await dispatcher.dispatch(fast, stub.url, label="fast")
+            finally:
+                await dispatcher.stop()
+            return slow_responses, fast_response, stub.received, dispatcher.stats
+
+    slow_responses, fast_response, received, stats = asyncio.run(scenario())
+
+    assert all(r["useCallback"] is True for r in slow_responses)
+    assert _text(fast_response) == "빠른 응답"
+    assert stats["max_in_flight"] == 21
+    assert stats["in_flight"] == 0
+    assert len(received) == 20
+
+
+if __name__ == "__main__":
+    for name, fn in list(globals().items()):
+        if name.startswith("test_") and callable(fn):
+            fn()
+            print(f"✅ {name}")
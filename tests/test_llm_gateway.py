@@ -0,0 +1,103 @@
+"""
+LLM 게이트웨이 테스트 (FakeChatModel 공급자, 네트워크 없음)
+- 헤징: 첫 공급자가 p95보다 늦으면 두 번째 공급자 응답 채택 + 늦은 호출 취소
+- 장애 전환: 실패한 공급자 대신 다음 공급자, 오류율이 높으면 후순위
+- 마감 시간: 모든 공급자가 늦으면 LLMDeadlineExceeded
+- with_structured_output: 공급자별 래핑 + 통계 공유
+
+실행: python tests/test_llm_gateway.py (또는 pytest tests/test_llm_gateway.py)
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.chatbot.state import ExtractionResponse
+from src.utils import llm_gateway
+from src.utils.fake_llm import FakeChatModel
+from src.utils.llm_gateway import LLMDeadlineExceeded, LLMGateway
+
+
+def test_hedged_request_wins_over_tail_latency():
+    slow = FakeChatModel(latency=0.02, tail_rate=1.0, tail_latency=1.0)
+    fast = FakeChatModel(latency=0.02)
+    gateway = LLMGateway("chat", [("slow", slow), ("fast", fast)], timeout=5.0, hedge=True)
+    for _ in range(llm_gateway.LLM_HEDGE_MIN_SAMPLES):
+        gateway.stats["slow"].record_success(20.0)  # p95 20ms → 헤징 지연은 하한값
+
+    original = llm_gateway.LLM_HEDGE_MIN_DELAY
+    llm_gateway.LLM_HEDGE_MIN_DELAY = 0.05
+    try:
+        async def run():
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            reply = await gateway.ainvoke("오늘 배포했어")
+            return reply, loop.time() - start
+        reply, elapsed = asyncio.run(run())
+    finally:
+        llm_gateway.LLM_HEDGE_MIN_DELAY = original
+
+    stats = gateway.get_stats()
+    assert "fake:" in reply.content and elapsed < 0.5
+    assert stats["hedge_wins"] == 1
+    assert stats["providers"]["fast"]["hedged"] == 1 and stats["providers"]["fast"]["wins"] == 1
+    assert stats["providers"]["slow"]["ewma_ms"] > 20.0  # 취소된 호출도 지연 하한으로 반영
+
+
+def test_failover_and_cooldown_of_failing_provider():
+    broken = FakeChatModel(error_rate=1.0)
+    backup = FakeChatModel(latency=0.01)
+    gateway = LLMGateway("summary", [("broken", broken), ("backup", backup)], timeout=5.0, hedge=False)
+
+    async def run():
+        return [await gateway.ainvoke(f"요약 {i}") for i in range(6)]
+
+    replies = asyncio.run(run())
+    stats = gateway.get_stats()["providers"]
+
+    # 첫 호출만 실패 후 전환, 이후에는 측정된 backup이 먼저 선택됨
+    assert all(r.content for r in replies)
+    assert stats["broken"]["failures"] == 1 and stats["backup"]["wins"] == 6
+    assert [name for name, _ in gateway._ranked()] == ["backup", "broken"]
+
+    # 지연이 더 짧아도 오류율이 높으면 후순위
+    gateway.stats["broken"].record_success(1.0)
+    for _ in range(5):
+        gateway.stats["broken"].record_failure()
+    assert gateway.get_stats()["providers"]["broken"]["cooldown"] is True
+    assert [name for name, _ in gateway._ranked()] == ["backup", "broken"]
+
+
+def test_deadline_and_structured_output_share_stats():
+    gateway = LLMGateway(
+        "onboarding",
+        [("a", FakeChatModel(latency=1.0)), ("b", FakeChatModel(latency=1.0))],
+        timeout=0.1,
+        hedge=False
+    )
+    structured = gateway.with_structured_output(ExtractionResponse)
+
+    async def run():
+        try:
+            await structured.ainvoke("**사용자 메시지:** 테스터\n")
+        except LLMDeadlineExceeded:
+            return True
+        return False
+
+    assert asyncio.run(run()) is True
+    stats = gateway.get_stats()
+    assert stats["deadline_exceeded"] == 1 and stats["providers"]["a"]["timeouts"] == 1
+
+    gateway.timeout = structured.timeout = 5.0
+    gateway.providers = [("a", FakeChatModel()), ("b", FakeChatModel())]
+    extraction = asyncio.run(gateway.with_structured_output(ExtractionResponse).ainvoke("**사용자 메시지:** 테스터\n"))
+    assert extraction.extracted_value == "테스터"
+    assert gateway.get_stats()["providers"]["a"]["wins"] == 1
+
+
+if __name__ == "__main__":
+    for name, fn in list(globals().items()):
+        if name.startswith("test_"):
+            fn()
+            print(f"✅ {name}")
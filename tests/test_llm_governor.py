@@ -0,0 +1,110 @@
+"""
+LLM 동시 실행 제어 테스트 (FakeChatModel, 네트워크 없음)
+- llm_priority: 우선순위는 낮추기만 함 (배치에서 부른 요약 생성은 batch)
+- 우선순위별 동시 호출 상한 + 대기열 지표
+- 할당량 예약: summary / batch는 예약분을 남기고, interactive는 예약분까지 바로 사용
+- 마감 시간: 입장 대기 + 호출이 timeout을 넘으면 LLMDeadlineExceeded (할당량 미설정 시 동시 호출 수만 제한)
+
+실행: python tests/test_llm_governor.py (또는 pytest tests/test_llm_governor.py)
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.fake_llm import FakeChatModel
+from src.utils.llm_gateway import LLMDeadlineExceeded
+from src.utils.llm_governor import (
+    BATCH, INTERACTIVE, SUMMARY, GovernedLLM, LLMGovernor, get_llm_priority, llm_priority,
+)
+
+LIMITS = {INTERACTIVE: 4, SUMMARY: 2, BATCH: 1}
+
+
+def test_priority_only_lowers():
+    assert get_llm_priority() == INTERACTIVE
+    with llm_priority(BATCH):
+        with llm_priority(SUMMARY):
+            assert get_llm_priority() == BATCH
+    with llm_priority(SUMMARY):
+        assert get_llm_priority() == SUMMARY
+    assert get_llm_priority() == INTERACTIVE
+
+
+def test_batch_queues_while_interactive_proceeds():
+    governor = LLMGovernor(limits=LIMITS, rate=1000, burst=100, reserve=5)
+    llm = GovernedLLM(FakeChatModel(latency=0.05), governor)
+
+    async def batch_call(i):
+        with llm_priority(BATCH):
+            return await llm.ainvoke(f"주간요약 {i}")
+
+    async def run():
+        batch = asyncio.gather(*(batch_call(i) for i in range(3)))
+        await asyncio.sleep(0.01)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await asyncio.gather(*(llm.ainvoke(f"대화 {i}") for i in range(4)))
+        interactive_elapsed = loop.time() - start
+        await batch
+        return interactive_elapsed
+
+    interactive_elapsed = asyncio.run(run())
+    stats = governor.stats()["priorities"]
+
+    assert interactive_elapsed < 0.1  # 배치 3건(순차 0.15초)을 기다리지 않음
+    # 1건 실행 중 + 2건 대기
+    assert stats[BATCH]["max_queued"] == 2 and stats[BATCH]["admitted"] == 3
+    assert stats[BATCH]["wait_p95_ms"] >= 40.0
+    assert stats[INTERACTIVE]["admitted"] == 4 and stats[INTERACTIVE]["queued"] == 0
+
+
+def test_quota_reserve_kept_for_interactive():
+    governor = LLMGovernor(limits=LIMITS, rate=1, burst=6, reserve=5)
+
+    async def admit(priority):
+        async with governor.admit(priority):
+            pass
+
+    async def run():
+        await admit(SUMMARY)  # 6 → 5 (예약분만 남음)
+        try:
+            await asyncio.wait_for(admit(BATCH), timeout=0.05)
+            batch_blocked = False
+        except asyncio.TimeoutError:
+            batch_blocked = True
+        # 예약분은 대화 호출이 바로 사용
+        await asyncio.wait_for(asyncio.gather(*(admit(INTERACTIVE) for _ in range(5))), timeout=0.05)
+        return batch_blocked
+
+    assert asyncio.run(run()) is True
+    stats = governor.stats()["priorities"]
+    assert stats[BATCH]["queued"] == 0 and stats[BATCH]["admitted"] == 0  # 대기 중 취소 반영
+    assert stats[INTERACTIVE]["admitted"] == 5
+
+
+def test_admission_wait_is_bounded_by_deadline():
+    governor = LLMGovernor(limits={INTERACTIVE: 1, SUMMARY: 1, BATCH: 1})
+    assert governor.bucket is None
+    llm = GovernedLLM(FakeChatModel(latency=0.2), governor, timeout=0.1)
+
+    async def run():
+        results = await asyncio.gather(llm.ainvoke("대화 1"), llm.ainvoke("대화 2"), return_exceptions=True)
+        fast = GovernedLLM(FakeChatModel(latency=0.01), governor, timeout=0.1)
+        return results, await fast.ainvoke("대화 3")
+
+    results, reply = asyncio.run(run())
+    stats = governor.stats()["priorities"][INTERACTIVE]
+
+    # 첫 호출은 입장 후 응답이 늦어 초과, 두 번째는 입장 대기 중 초과 → 세마포어가 새지 않고 다음 호출 처리
+    assert all(isinstance(r, LLMDeadlineExceeded) for r in results)
+    assert stats["timed_out"] == 1 and stats["queued"] == 0 and stats["in_flight"] == 0
+    assert reply.content
+
+
+if __name__ == "__main__":
+    for name, fn in list(globals().items()):
+        if name.startswith("test_"):
+            fn()
+            print(f"✅ {name}")
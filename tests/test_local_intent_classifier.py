@@ -0,0 +1,44 @@
+"""
+로컬 의도 분류기 적용 범위 테스트
+- 봇 질문 없이 보낸 일반 업무 문장은 로컬에서 분류하지 않음 (LLM으로)
+- 요약 제안 / 요약 표시 직후의 짧은 답만 로컬 분류
+
+실행: python tests/test_local_intent_classifier.py (또는 pytest tests/test_local_intent_classifier.py)
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config.config import LOCAL_INTENT_CONFIDENCE_THRESHOLD
+from src.service.daily.local_intent_classifier import get_local_intent_classifier
+
+
+def enhanced(bot, user):
+    return f"[Previous bot]: {bot}\n[User]: {user}"
+
+
+def test_work_messages_fall_back_to_llm():
+    classifier = get_local_intent_classifier()
+    for message in [
+        "바이럴 마케팅 기획",
+        "종료 처리 로직 만들었어",
+        "프로젝트 끝났어",
+        "마감 끝",
+        "새로 시작한 프로젝트 얘기할게",
+        enhanced("어떤 작업이었나요?", "마감 끝"),
+        enhanced("오늘 내용 정리해드릴까요?", "종료 처리 로직 만들었어"),
+    ]:
+        assert classifier.classify(message, LOCAL_INTENT_CONFIDENCE_THRESHOLD) is None, message
+
+
+def test_short_answer_to_summary_offer_is_local():
+    classifier = get_local_intent_classifier()
+    assert classifier.classify(enhanced("오늘 내용 정리해드릴까요?", "응"), LOCAL_INTENT_CONFIDENCE_THRESHOLD) == "summary"
+
+
+if __name__ == "__main__":
+    for name, fn in list(globals().items()):
+        if name.startswith("test_"):
+            fn()
+            print(f"✅ {name}")
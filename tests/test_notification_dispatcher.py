@@ -0,0 +1,96 @@
+"""
+알림톡 발송 디스패처 테스트 (모킹 모드 Database + FakeTransport)
+- 토큰 버킷: 버스트 이후 초당 rate건으로 제한
+- 대량 예약: 중복 예약 제거, 배치 크기 단위 발송, 일시 오류 재시도 / 영구 오류 failed 기록
+- 주간요약 알림 예약은 같은 주에 1건만
+
+실행: python tests/test_notification_dispatcher.py (또는 pytest tests/test_notification_dispatcher.py)
+"""
+import asyncio
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.database import Database
+from src.service.notification import (
+    FakeTransport,
+    NotificationDispatcher,
+    schedule_weekly_summary_notification,
+)
+from src.utils.rate_limiter import TokenBucket
+
+
+def test_token_bucket_limits_rate_after_burst():
+    async def run():
+        bucket = TokenBucket(rate=200, capacity=10)
+        start = time.perf_counter()
+        for _ in range(5):
+            await bucket.acquire(10)
+        return time.perf_counter() - start
+
+    # 첫 10개는 즉시, 나머지 40개는 초당 200개 → 약 0.2초
+    elapsed = asyncio.run(run())
+    assert 0.18 <= elapsed < 0.5
+
+
+def test_bulk_dispatch_batches_retries_and_records_state():
+    async def run():
+        db = Database()
+        due = (datetime.now(timezone.utc) - timedelta(seconds=1)).isoformat()
+        rows = [
+            {
+                "kakao_user_id": f"user_{i:04d}",
+                "template_code": "WEEKLY_SUMMARY_READY",
+                "dedup_key": f"weekly_summary:user_{i:04d}",
+                "payload": {},
+                "send_at": due,
+            }
+            for i in range(250)
+        ]
+        inserted = await db.enqueue_notifications(rows + rows[:10])
+
+        transport = FakeTransport(
+            max_batch_size=40,
+            fail_user_ids={"user_0003"},
+            flaky_user_ids={"user_0007", "user_0100"},
+        )
+        dispatcher = NotificationDispatcher(
+            db, transport, num_workers=4, rate=10000, burst=100, retry_base_delay=0
+        )
+        claimed = await dispatcher.run_once()
+        return inserted, claimed, transport, dispatcher, await db.get_notification_delivery_counts(), db
+
+    inserted, claimed, transport, dispatcher, counts, db = asyncio.run(run())
+
+    assert inserted == 250
+    assert claimed == 252  # 일시 오류 2건은 재시도로 한 번 더 선점
+    assert max(transport.batch_sizes) == 40
+    assert counts == {"sent": 249, "failed": 1}
+    assert dispatcher.stats["retried"] == 2
+
+    failed = [row for row in db._mock_notifications.values() if row["status"] == "failed"]
+    assert failed[0]["kakao_user_id"] == "user_0003" and failed[0]["attempts"] == 1
+
+
+def test_weekly_summary_notification_is_scheduled_once_per_week():
+    async def run():
+        db = Database()
+        first = await schedule_weekly_summary_notification(db, "user_a", "2026-10-17T18:00:00+09:00")
+        second = await schedule_weekly_summary_notification(db, "user_a", "2026-10-17T18:00:00+09:00")
+        # 아직 발송 시각 전이면 선점되지 않음
+        claimed = await db.claim_notification_deliveries(limit=10, lease_seconds=60)
+        return first, second, claimed
+
+    first, second, claimed = asyncio.run(run())
+    assert first and not second
+    assert (claimed == []) == (datetime.now(timezone.utc) < datetime.fromisoformat("2026-10-17T18:00:00+09:00"))
+
+
+if __name__ == "__main__":
+    for name, fn in list(globals().items()):
+        if name.startswith("test_"):
+            fn()
+            print(f"✅ {name}")
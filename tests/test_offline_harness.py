@@ -0,0 +1,82 @@
+"""
+오프라인 부하 테스트 구성요소 테스트
+- 모킹 모드 Database: 대화 턴 저장/조회, 날짜별 데일리 요약, 요청 컨텍스트가 RPC와 같은 형태로 동작
+- FakeChatModel: 결정적 응답/지연, 의도 분류 라벨, structured output 파싱
+
+실행: python tests/test_offline_harness.py (또는 pytest tests/test_offline_harness.py)
+"""
+import asyncio
+import sys
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from src.chatbot.state import ExtractionResponse, OnboardingIntent
+from src.database import Database
+from src.prompt.intent_prompts import INTENT_CLASSIFICATION_SYSTEM_PROMPT, INTENT_CLASSIFICATION_USER_PROMPT
+from src.utils.fake_llm import FakeChatModel
+
+
+def test_in_memory_database_tracks_turns_and_daily_summaries():
+    async def run():
+        db = Database()
+        await db.create_or_update_user("u1", {"name": "테스터"})
+        await db.create_or_update_user("u1", {"job_title": "개발자"})
+
+        today = date.today().isoformat()
+        first = await db.save_conversation_turn("u1", "배포했어", "좋아요")
+        await db.save_conversation_turn("u1", "리뷰도 했어", "멋져요")
+        await db.save_conversation_turn("u1", "요약해줘", "요약 1", is_summary=True, summary_type="daily")
+        await db.save_conversation_turn("u1", "다시 요약", "요약 2", is_summary=True, summary_type="daily")
+
+        return db, today, first, (
+            await db.get_request_context("u1", today, turn_limit=3),
+            await db.get_shortterm_memory_v2("u1"),
+            await db.get_daily_summaries_v2("u1"),
+            await db.get_summary_dates_between("u1", today, today),
+        )
+
+    db, today, first, (context, shortterm, summaries, dates) = asyncio.run(run())
+
+    assert first["turn_index"] == 1 and first["session_date"] == today
+    assert context["user"]["name"] == "테스터" and context["user"]["attendance_count"] == 0
+    assert context["last_turn_date"] == today
+    assert [t["turn_index"] for t in context["today_turns"]] == [4, 3, 2]
+    assert shortterm[0] == {"user": "다시 요약", "ai": "요약 2"}
+    assert [s["summary_content"] for s in summaries] == ["요약 2"]
+    assert dates == [today]
+
+
+def test_fake_chat_model_is_deterministic_and_supports_structured_output():
+    llm = FakeChatModel(latency=0.01, jitter=0.01, seed=7)
+
+    async def run():
+        intent = await llm.ainvoke([
+            SystemMessage(content=INTENT_CLASSIFICATION_SYSTEM_PROMPT),
+            HumanMessage(content=INTENT_CLASSIFICATION_USER_PROMPT.format(
+                message="[Previous bot]: 어떤 일을 하셨나요?\n[User]: 오늘 내용 정리해줘"
+            ))
+        ])
+        replies = [await llm.ainvoke("오늘 배포했어") for _ in range(2)]
+        extraction = await llm.with_structured_output(ExtractionResponse).ainvoke([
+            HumanMessage(content="**목표 필드:** name\n**사용자 메시지:** 테스터\n")
+        ])
+        return intent, replies, extraction
+
+    intent, replies, extraction = asyncio.run(run())
+
+    assert intent.content == "summary"
+    assert replies[0].content == replies[1].content
+    assert replies[0].usage_metadata["output_tokens"] > 0
+    assert llm._delay("오늘 배포했어") == FakeChatModel(latency=0.01, jitter=0.01, seed=7)._delay("오늘 배포했어")
+    assert extraction.intent == OnboardingIntent.ANSWER and extraction.extracted_value == "테스터"
+
+
+if __name__ == "__main__":
+    for name, fn in list(globals().items()):
+        if name.startswith("test_"):
+            fn()
+            print(f"✅ {name}")
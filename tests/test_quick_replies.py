@@ -0,0 +1,151 @@
+"""
+퀵리플라이 버튼 테스트
+- 블록 버튼 extra(오픈빌더 블록 호출의 action.clientExtra)의 세부 의도 파싱 + 카카오 응답에 quickReplies 추가
+- 블록 ID가 없으면 message 버튼 → 직전 봇 메시지의 버튼 문구 일치로 의도 판별 (직접 입력 포함)
+- 버튼 의도는 의도 분류(LLM) 없이 daily_agent_node로 라우팅 (사용자 상태 보정은 동일하게 적용)
+- 요약 제안 / 수정 버튼 응답에 맞는 버튼과 처리
+
+실행: python tests/test_quick_replies.py (또는 pytest tests/test_quick_replies.py)
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.chatbot.state import UserContext, UserMetadata, OnboardingStage
+from src.config import SUMMARY_SUGGESTION_THRESHOLD
+from src.service.daily import build_quick_replies, parse_quick_reply_intent, process_daily_record
+from src.service.daily.quick_replies import SUMMARY_OFFER_BUTTONS, SUMMARY_RESULT_BUTTONS, match_quick_reply_label
+from src.service.router.service_intent_router import route_user_intent
+from src.utils.utils import simple_text_response
+
+
+class NoCallLLM:
+    """의도 분류가 생략되는지 확인용 (호출되면 실패)"""
+
+    async def ainvoke(self, *args, **kwargs):
+        raise AssertionError("LLM이 호출되면 안 됨")
+
+
+def make_context(**kwargs):
+    return UserContext(
+        user_id="u1",
+        onboarding_stage=OnboardingStage.COMPLETED,
+        metadata=UserMetadata(name="테스터"),
+        **kwargs
+    )
+
+
+def block_call_payload(utterance, button):
+    """오픈빌더가 블록 버튼 클릭 시 스킬로 보내는 요청 (extra → action.clientExtra)"""
+    return {
+        "intent": {"id": button["blockId"], "name": "퀵리플라이"},
+        "userRequest": {
+            "timezone": "Asia/Seoul",
+            "params": {"ignoreMe": "true"},
+            "block": {"id": button["blockId"], "name": "퀵리플라이"},
+            "utterance": utterance,
+            "lang": "ko",
+            "user": {"id": "u1", "type": "botUserKey", "properties": {"botUserKey": "u1"}},
+        },
+        "bot": {"id": "bot1", "name": "업무기록봇"},
+        "action": {
+            "name": "quick_reply",
+            "clientExtra": button.get("extra", {}),
+            "params": {},
+            "id": "action1",
+            "detailParams": {},
+        },
+    }
+
+
+def test_quick_reply_buttons_round_trip():
+    buttons = build_quick_replies(SUMMARY_OFFER_BUTTONS, block_id="blk_quick_reply")
+    response = simple_text_response("정리해드릴까요?", buttons)
+
+    assert [b["label"] for b in response["template"]["quickReplies"]] == ["정리해줘", "계속할래", "오늘은 끝"]
+    assert all(b["action"] == "block" and b["blockId"] == "blk_quick_reply" for b in buttons)
+
+    payload = block_call_payload("정리해줘", buttons[0])
+    assert parse_quick_reply_intent(payload["action"]) == "summary"
+    assert parse_quick_reply_intent({"name": "fallback", "clientExtra": {"quick_reply_intent": "restart"}}) is None
+    assert parse_quick_reply_intent({"name": "fallback"}) is None
+    assert "quickReplies" not in simple_text_response("안녕")["template"]
+
+
+def test_message_buttons_without_block_id_match_label():
+    buttons = build_quick_replies(SUMMARY_RESULT_BUTTONS, block_id="")
+
+    # message 버튼의 extra는 오픈빌더가 전달하지 않음 → 보내지 않음
+    assert all(b["action"] == "message" and "extra" not in b for b in buttons)
+
+    shown = "[Previous bot]: 📝 오늘의 업무 요약\n- 배포 완료\n[User]: "
+    offer = "[Previous bot]: 오늘 대화 정리해드릴까요?\n[User]: "
+    assert match_quick_reply_label(shown + "수정할게") == "edit_request"
+    assert match_quick_reply_label(shown + " 좋아요 ") == "no_edit_needed"
+    assert match_quick_reply_label(offer + "정리해줘") == "summary"
+    # 직전 메시지에 없는 버튼 / 버튼 문구가 아닌 메시지 / 직전 봇 메시지 없음 → 분류
+    assert match_quick_reply_label(offer + "수정할게") is None
+    assert match_quick_reply_label(shown + "수정할게 배포 일정도 넣어줘") is None
+    assert match_quick_reply_label("수정할게") is None
+
+
+def test_typed_button_label_skips_classification():
+    async def run():
+        summarized = make_context(daily_session_data={"last_summary_at": "2026-10-16T18:00:00"})
+        message = "[Previous bot]: 📝 오늘의 업무 요약\n- 배포 완료\n[User]: 수정할게"
+        return await route_user_intent(message, NoCallLLM(), summarized, None, {})
+
+    route = asyncio.run(run())
+
+    assert route[0] == "daily_agent_node" and route[2] == "edit_request"
+
+
+def test_button_intent_skips_classification():
+    async def run():
+        llm = NoCallLLM()
+        offered = make_context(daily_record_count=3, daily_session_data={"conversation_count": SUMMARY_SUGGESTION_THRESHOLD})
+        summary = await route_user_intent("정리해줘", llm, offered, None, {}, "summary")
+        cont = await route_user_intent("계속할래", llm, offered, None, {}, "continue")
+
+        no_record = make_context(daily_record_count=0)
+        no_record_summary = await route_user_intent("정리해줘", llm, no_record, None, None, "summary")
+        edit_before_summary = await route_user_intent("수정할게", llm, no_record, None, None, "edit_request")
+
+        # 주간 요약 제안 대기 중이면 버튼 의도 대신 기존 규칙 분류
+        weekly_state = {"current_step": "weekly_summary_pending", "temp_data": {}}
+        weekly = await route_user_intent("응", llm, no_record, None, weekly_state, "summary")
+        return summary, cont, offered, no_record_summary, edit_before_summary, weekly
+
+    summary, cont, offered, no_record_summary, edit_before_summary, weekly = asyncio.run(run())
+
+    assert summary == ("daily_agent_node", "daily_record", "summary")
+    assert cont == ("daily_agent_node", "daily_record", "continue")
+    assert offered.daily_session_data["conversation_count"] == 0  # 요약 제안 미룸
+    assert no_record_summary[2] == "no_record_today"
+    assert edit_before_summary[2] == "continue"
+    assert weekly[0] == "weekly_agent_node"
+
+
+def test_offer_and_edit_request_responses():
+    async def run():
+        llm = NoCallLLM()
+        offer_context = make_context(daily_session_data={"conversation_count": SUMMARY_SUGGESTION_THRESHOLD - 1})
+        offer = await process_daily_record(None, "u1", "배포했어", "continue", offer_context, [], llm)
+
+        summarized = make_context(daily_session_data={"last_summary_at": "2026-10-16T18:00:00"})
+        edit = await process_daily_record(None, "u1", "수정할게", "edit_request", summarized, [], llm)
+        return offer, edit
+
+    offer, edit = asyncio.run(run())
+
+    assert offer.summary_offered and [b["label"] for b in offer.quick_replies] == ["정리해줘", "계속할래", "오늘은 끝"]
+    assert edit.early_return and "요약에 반영" in edit.ai_response
+
+
+if __name__ == "__main__":
+    for name, fn in list(globals().items()):
+        if name.startswith("test_"):
+            fn()
+            print(f"✅ {name}")
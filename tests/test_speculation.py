@@ -0,0 +1,118 @@
+"""
+일반 대화 응답 추측 실행(speculation) 테스트
+- continue: 분류와 응답 생성이 겹쳐 LLM 왕복 ~1회 지연으로 응답
+- 다른 의도: 진행 중인 생성 취소 / 완료된 응답 폐기 → wasted 카운터 증가
+
+실행: python tests/test_speculation.py (또는 pytest tests/test_speculation.py)
+"""
+import asyncio
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.chatbot.state import UserContext, UserMetadata
+from src.service.daily import speculation
+from src.service.daily.record_handler import handle_general_conversation
+
+LLM_DELAY = 0.2
+
+
+class SlowLLM:
+    """고정 지연 후 응답하는 가짜 LLM (호출 횟수 기록)"""
+
+    def __init__(self, reply: str = "어떤 업무였나요?"):
+        self.reply = reply
+        self.calls = 0
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        await asyncio.sleep(LLM_DELAY)
+        return SimpleNamespace(content=self.reply)
+
+
+def _user_context() -> UserContext:
+    return UserContext(user_id="spec_user", metadata=UserMetadata(name="테스트"))
+
+
+@contextmanager
+def _speculation_enabled(enabled: bool = True):
+    """추측 실행 on + 로컬 분류기 off (테스트 후 원래 설정 복원)"""
+    saved = (speculation.SPECULATIVE_REPLY_ENABLED, speculation.LOCAL_INTENT_CLASSIFIER_ENABLED)
+    speculation.SPECULATIVE_REPLY_ENABLED = enabled
+    speculation.LOCAL_INTENT_CLASSIFIER_ENABLED = False
+    try:
+        yield
+    finally:
+        speculation.SPECULATIVE_REPLY_ENABLED, speculation.LOCAL_INTENT_CLASSIFIER_ENABLED = saved
+
+
+def _start(llm):
+    return speculation.start_speculative_reply(
+        "오늘 배포했어", "오늘 배포했어", _user_context(), [], llm
+    )
+
+
+def test_speculative_reply_overlaps_classification():
+    async def run():
+        llm = SlowLLM()
+        start = time.perf_counter()
+        spec = _start(llm)
+        await asyncio.sleep(LLM_DELAY)  # 의도 분류 LLM 호출
+        result = await handle_general_conversation(
+            "오늘 배포했어", _user_context(), UserMetadata(name="테스트"), [], llm, spec
+        )
+        return result, llm.calls, time.perf_counter() - start
+
+    used_before = speculation.get_speculation_stats()["used"]
+    with _speculation_enabled():
+        result, calls, elapsed = asyncio.run(run())
+
+    assert result.ai_response == "어떤 업무였나요?"
+    assert calls == 1
+    assert elapsed < LLM_DELAY * 1.8
+    assert speculation.get_speculation_stats()["used"] == used_before + 1
+
+
+def test_other_intent_cancels_or_discards():
+    async def run():
+        running = _start(SlowLLM())
+        await asyncio.sleep(0)
+        running.discard("intent=summary")
+
+        finished = _start(SlowLLM())
+        await asyncio.sleep(LLM_DELAY * 1.5)
+        finished.discard("intent=summary")
+        finished.discard("again")  # 중복 폐기는 무시
+        return await finished.take()
+
+    before = speculation.get_speculation_stats()
+    with _speculation_enabled():
+        assert asyncio.run(run()) is None
+    after = speculation.get_speculation_stats()
+
+    assert after["cancelled"] == before["cancelled"] + 1
+    assert after["discarded"] == before["discarded"] + 1
+    assert after["wasted"] == before["wasted"] + 2
+
+
+def test_disabled_or_summary_turn_does_not_speculate():
+    with _speculation_enabled(False):
+        assert not speculation.should_speculate("오늘 배포했어", _user_context())
+
+    with _speculation_enabled():
+        assert speculation.should_speculate("오늘 배포했어", _user_context())
+
+        context = _user_context()
+        context.daily_session_data["conversation_count"] = speculation.SUMMARY_SUGGESTION_THRESHOLD - 1
+        assert not speculation.should_speculate("오늘 배포했어", context)
+
+
+if __name__ == "__main__":
+    for name, fn in list(globals().items()):
+        if name.startswith("test_"):
+            fn()
+            print(f"✅ {name}")
@@ -0,0 +1,110 @@
+"""
+일일 요약 미리 생성(summary prefetch) 테스트
+- 요약 제안 후 "응": 미리 생성된 요약을 LLM 재호출 없이 사용
+- 제안 후 새 턴 저장 / turn_index 불일치: 폐기 후 새로 생성
+- SUMMARY_PREFETCH_TTL이 지난 요약은 사용하지 않음 (TTLCache.pop 만료 처리)
+
+실행: python tests/test_summary_prefetch.py (또는 pytest tests/test_summary_prefetch.py)
+"""
+import asyncio
+import sys
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.service.daily import record_handler, summary_prefetch
+from src.utils.cache import TTLCache
+
+USER_ID = "prefetch_user"
+
+
+def _patch_generator(last_turn_index: int):
+    """generate_today_summary를 호출 횟수를 세는 가짜 함수로 교체 (원래 함수 반환)"""
+    calls = []
+
+    async def fake_generate_today_summary(db, user_id, today, user_data, llm):
+        calls.append(user_id)
+        await asyncio.sleep(0.05)
+        turns = [{"turn_index": last_turn_index}]
+        return turns, SimpleNamespace(attendance_count=1), SimpleNamespace(summary_text=f"요약 #{len(calls)}")
+
+    original = record_handler.generate_today_summary
+    record_handler.generate_today_summary = fake_generate_today_summary
+    return original, calls
+
+
+def _today() -> str:
+    return datetime.now().date().isoformat()
+
+
+def test_prefetched_summary_is_served_once():
+    async def run():
+        assert summary_prefetch.start_summary_prefetch(None, USER_ID, {}, llm=None)
+        # 생성 중에 요청이 와도 진행 중인 작업을 기다려 사용
+        first = await summary_prefetch.take_prefetched_summary(USER_ID, _today(), 5)
+        second = await summary_prefetch.take_prefetched_summary(USER_ID, _today(), 5)
+        return first, second
+
+    original, calls = _patch_generator(last_turn_index=5)
+    try:
+        first, second = asyncio.run(run())
+    finally:
+        record_handler.generate_today_summary = original
+
+    assert first[1].summary_text == "요약 #1"
+    assert second is None
+    assert len(calls) == 1
+
+
+def test_new_turn_or_turn_mismatch_invalidates():
+    async def run():
+        summary_prefetch.start_summary_prefetch(None, USER_ID, {}, llm=None)
+        summary_prefetch.invalidate_summary_prefetch(USER_ID, "new_turn")
+        after_new_turn = await summary_prefetch.take_prefetched_summary(USER_ID, _today(), 5)
+
+        summary_prefetch.start_summary_prefetch(None, USER_ID, {}, llm=None)
+        after_mismatch = await summary_prefetch.take_prefetched_summary(USER_ID, _today(), 6)
+        return after_new_turn, after_mismatch
+
+    before = summary_prefetch.get_summary_prefetch_stats()
+    original, _ = _patch_generator(last_turn_index=5)
+    try:
+        after_new_turn, after_mismatch = asyncio.run(run())
+    finally:
+        record_handler.generate_today_summary = original
+    after = summary_prefetch.get_summary_prefetch_stats()
+
+    assert after_new_turn is None
+    assert after_mismatch is None
+    assert after["invalidated"] == before["invalidated"] + 1
+    assert after["stale"] == before["stale"] + 1
+
+
+def test_expired_prefetch_is_not_served():
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("old", 1, ttl=-1)
+    cache.set("fresh", 2)
+    assert "old" not in cache._data  # 새 항목 저장 시 만료 항목 정리
+    cache._data["old"] = (0.0, 1)
+    assert cache.pop("old") is None and cache.pop("fresh") == 2
+
+    async def run():
+        summary_prefetch.start_summary_prefetch(None, USER_ID, {}, llm=None)
+        expires_at, entry = summary_prefetch._prefetched._data[USER_ID]
+        summary_prefetch._prefetched._data[USER_ID] = (0.0, entry)  # TTL 경과
+        return await summary_prefetch.take_prefetched_summary(USER_ID, _today(), 5)
+
+    original, _ = _patch_generator(last_turn_index=5)
+    try:
+        assert asyncio.run(run()) is None
+    finally:
+        record_handler.generate_today_summary = original
+
+
+if __name__ == "__main__":
+    for name, fn in list(globals().items()):
+        if name.startswith("test_"):
+            fn()
+            print(f"✅ {name}")
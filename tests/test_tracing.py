@@ -0,0 +1,97 @@
+"""
+요청 트레이싱 테스트
+- 요청 트레이스: 노드 → DB 왕복 스팬 중첩, 요청 ID ContextVar, 의도별/노드별/DB 메서드별 히스토그램
+- DB 스팬은 실제 왕복(execute)만 기록 (사용자 캐시 적중은 제외)
+- LLM 콜백: ainvoke 스팬 + 토큰 사용량 집계
+
+실행: python tests/test_tracing.py (또는 pytest tests/test_tracing.py)
+"""
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+
+from src.database import Database
+from src.utils import tracing
+
+
+class FakeQuery:
+    """Supabase 쿼리 빌더 체인 (table().select().eq().single().execute())"""
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self
+
+    def execute(self):
+        return SimpleNamespace(data={"kakao_user_id": "trace_user", "name": "테스터"})
+
+
+def test_request_trace_collects_node_and_db_spans():
+    db = Database()
+    db.supabase = FakeQuery()
+    seen_request_ids = []
+
+    async def fake_node(state):
+        seen_request_ids.append(tracing.get_request_id())
+        await db.get_user(state["user_id"])
+        await db.get_user(state["user_id"])  # 캐시 적중 → 왕복 없음
+        await asyncio.sleep(0.01)
+        return {}
+
+    node = tracing.trace_node("router_node", fake_node)
+
+    async def run():
+        with tracing.start_trace("req-1", user_id="trace_user") as trace:
+            await node({"user_id": "trace_user"})
+            tracing.set_trace_attribute("intent", "daily_record:continue")
+        return trace
+
+    tracing.reset_metrics()
+    trace = asyncio.run(run()).to_dict()
+    metrics = tracing.get_metrics()
+
+    assert seen_request_ids == ["req-1"]
+    assert tracing.get_request_id() is None
+    assert [(s["name"], s["kind"], s["parent"]) for s in trace["spans"]] == [
+        ("router_node", "node", None),
+        ("get_user", "db", "router_node"),
+    ]
+    assert metrics["node"]["router_node"]["count"] == 1
+    assert metrics["node"]["router_node"]["p99_ms"] >= 10
+    assert metrics["db"]["get_user"]["count"] == 1
+    assert metrics["intent"]["daily_record:continue"]["count"] == 1
+    assert tracing.get_recent_traces(limit=1)[0]["request_id"] == "req-1"
+
+
+def test_llm_callback_records_latency_and_tokens():
+    llm = GenericFakeChatModel(
+        messages=iter([AIMessage(content="좋아요", usage_metadata={"input_tokens": 12, "output_tokens": 3, "total_tokens": 15})]),
+        callbacks=[tracing.get_llm_tracing_callback()]
+    )
+
+    async def run():
+        with tracing.start_trace() as trace:
+            with tracing.trace_span("daily_agent_node", "node"):
+                await llm.ainvoke("오늘 배포했어")
+        return trace
+
+    tracing.reset_metrics()
+    trace = asyncio.run(run()).to_dict()
+    metrics = tracing.get_metrics()
+
+    llm_span = trace["spans"][1]
+    assert llm_span["kind"] == "llm" and llm_span["parent"] == "daily_agent_node"
+    assert llm_span["attrs"]["input_tokens"] == 12
+    assert metrics["llm"]["GenericFakeChatModel"]["count"] == 1
+    assert metrics["llm_tokens"]["GenericFakeChatModel"] == {"calls": 1, "input_tokens": 12, "output_tokens": 3}
+
+
+if __name__ == "__main__":
+    for name, fn in list(globals().items()):
+        if name.startswith("test_"):
+            fn()
+            print(f"✅ {name}")
@@ -0,0 +1,133 @@
+"""
+Database 사용자 row 캐시 테스트 (쿼리 수를 세는 가짜 Supabase 클라이언트)
+- 동시 미스는 조회 1회로 합쳐지고 이후 조회는 메모리 hit
+- create_or_update_user / increment_daily_counts / load_request_context는 캐시를 즉시 갱신
+- 조회 도중 쓰기가 끼어들면 그 조회 결과는 캐시하지 않음
+
+실행: python tests/test_user_cache.py (또는 pytest tests/test_user_cache.py)
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.database import Database
+
+
+class FakeSupabase:
+    """users 테이블 + 카운트/컨텍스트 RPC만 흉내 내는 클라이언트 (execute는 스레드 풀에서 실행됨)"""
+
+    def __init__(self, users, latency=0.0):
+        self.users = users
+        self.latency = latency
+        self.calls = []
+
+    def table(self, name):
+        return FakeQuery(self, name)
+
+    def rpc(self, name, params):
+        query = FakeQuery(self, name)
+        query.op, query.payload = "rpc", params
+        return query
+
+
+class FakeQuery:
+    def __init__(self, client, name):
+        self.client, self.name = client, name
+        self.op, self.payload, self.filters = "select", None, {}
+
+    def select(self, *_):
+        return self
+
+    def single(self):
+        return self
+
+    def eq(self, key, value):
+        self.filters[key] = value
+        return self
+
+    def update(self, data):
+        self.op, self.payload = "update", data
+        return self
+
+    def execute(self):
+        time.sleep(self.client.latency)
+        self.client.calls.append((self.op, self.name))
+        if self.op == "select":
+            return SimpleNamespace(data=dict(self.client.users[self.filters["kakao_user_id"]]))
+        if self.op == "update":
+            row = self.client.users[self.filters["kakao_user_id"]]
+            row.update(self.payload)
+            return SimpleNamespace(data=[dict(row)])
+        row = self.client.users[self.payload["p_kakao_user_id"]]
+        if self.name == "increment_daily_counts":
+            row["daily_record_count"] += 1
+            return SimpleNamespace(data=[{
+                "daily_record_count": row["daily_record_count"],
+                "attendance_count": row["attendance_count"],
+                "attendance_incremented": False,
+            }])
+        # load_request_context
+        return SimpleNamespace(data={"user": dict(row), "conv_state": None, "last_turn_date": None, "today_turns": []})
+
+
+def make_db(latency=0.0):
+    db = Database()
+    db.supabase = FakeSupabase(
+        {"u1": {"kakao_user_id": "u1", "name": "테스터", "daily_record_count": 0, "attendance_count": 0}},
+        latency=latency
+    )
+    return db
+
+
+def test_concurrent_misses_are_coalesced_and_then_served_from_memory():
+    async def run():
+        db = make_db(latency=0.05)
+        users = await asyncio.gather(*(db.get_user("u1") for _ in range(10)))
+        users[0]["name"] = "변경"  # 반환값은 사본 → 캐시에 영향 없음
+        again = await db.get_user("u1")
+        return db, again
+
+    db, again = asyncio.run(run())
+    assert db.supabase.calls == [("select", "users")]
+    assert again["name"] == "테스터"
+    stats = db.get_user_cache_stats()
+    assert stats["coalesced"] == 9 and stats["hits"] == 1
+
+
+def test_writes_update_cache_and_racing_fetch_is_not_cached():
+    async def run():
+        db = make_db()
+        await db.get_request_context("u1", "2026-10-16")  # 요청 시작 시 캐시 채움
+        await db.create_or_update_user("u1", {"job_title": "개발자"})
+        await db.increment_daily_counts("u1")
+        after_writes = await db.get_user("u1")
+        queries_after_writes = list(db.supabase.calls)
+
+        # 캐시 비운 뒤 느린 조회 도중 카운트 증가 → 조회 결과는 캐시하지 않음
+        db._user_cache.clear()
+        db.supabase.latency = 0.05
+        fetch = asyncio.create_task(db.get_user("u1"))
+        await asyncio.sleep(0.01)
+        db.supabase.latency = 0.0
+        await db.increment_daily_counts("u1")
+        await fetch
+        refetched = await db.get_user("u1")
+        return after_writes, queries_after_writes, refetched, db
+
+    after_writes, queries_after_writes, refetched, db = asyncio.run(run())
+    assert after_writes["job_title"] == "개발자" and after_writes["daily_record_count"] == 1
+    # 쓰기 전 존재 확인과 쓰기 후 조회 모두 캐시 hit → users select 없음
+    assert ("select", "users") not in queries_after_writes
+    assert refetched["daily_record_count"] == 2
+    assert db.supabase.calls.count(("select", "users")) == 2
+
+
+if __name__ == "__main__":
+    for name, fn in list(globals().items()):
+        if name.startswith("test_"):
+            fn()
+            print(f"✅ {name}")
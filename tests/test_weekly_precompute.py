@@ -0,0 +1,185 @@
+"""
+주간요약 v1.0 주말 배치 미리 생성 테스트
+- 배치: 동시 생성 수 제한 + 저장 → 요청 시 LLM 호출 없이 사용
+- 중단 후 재실행: 체크포인트 커서부터 이어서 진행 / dry-run은 LLM 호출·저장 없음
+- 생성 이후 입력이 바뀌면 사용하지 않고 새로 생성
+- 실패한 사용자는 한 번 더 생성, 그래도 실패하면 완료로 기록하지 않고 재실행 시 다시 생성
+
+실행: python tests/test_weekly_precompute.py (또는 pytest tests/test_weekly_precompute.py)
+"""
+import asyncio
+import sys
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.chatbot.state import UserMetadata
+from src.service.weekly import precompute
+from src.service.weekly.feedback_processor import handle_weekly_v1_request
+
+USER_IDS = [f"weekly_user_{i:02d}" for i in range(7)]
+
+
+class FakeLLM:
+    """고정 지연 후 응답하는 가짜 LLM (동시 호출 수 기록)"""
+
+    def __init__(self):
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _call(self, result):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return result
+
+    async def ainvoke(self, messages):
+        return await self._call(SimpleNamespace(content="이번 주 요약"))
+
+    def with_structured_output(self, schema):
+        llm = self
+
+        class Structured:
+            async def ainvoke(self, messages):
+                return await llm._call(schema(questions=["Q1", "Q2", "Q3"]))
+
+        return Structured()
+
+
+class FakeDB:
+    """배치/요청 경로에 필요한 메서드만 가진 인메모리 DB"""
+
+    def __init__(self):
+        self.precomputed = {}
+        self.summaries = {user_id: [{"session_date": "2026-10-12", "summary_content": "배포"}] for user_id in USER_IDS}
+        self.failures = {}  # user_id → 남은 실패 횟수
+
+    async def get_weekly_precompute_candidates(self, week_start, week_end, min_days, after_user=None, limit=200):
+        rows = [
+            {"kakao_user_id": user_id, "weekday_count": 3}
+            for user_id in sorted(USER_IDS)
+            if (after_user is None or user_id > after_user) and (user_id, week_start) not in self.precomputed
+        ]
+        return rows[:limit]
+
+    async def get_user(self, user_id):
+        if self.failures.get(user_id, 0) > 0:
+            self.failures[user_id] -= 1
+            raise RuntimeError("일시적 오류")
+        return {"kakao_user_id": user_id, "name": "테스트"}
+
+    async def get_daily_summaries_v2(self, user_id, limit=7):
+        return self.summaries[user_id]
+
+    async def save_weekly_v1_precomputed(self, user_id, week_start, input_fingerprint, v1_summary, follow_up_questions):
+        self.precomputed[(user_id, week_start)] = {
+            "input_fingerprint": input_fingerprint,
+            "v1_summary": v1_summary,
+            "follow_up_questions": follow_up_questions,
+        }
+        return True
+
+    async def get_weekly_v1_precomputed(self, user_id, week_start):
+        return self.precomputed.get((user_id, week_start))
+
+    async def delete_weekly_v1_precomputed_before(self, week_start):
+        pass
+
+    async def get_conversation_state(self, user_id):
+        return None
+
+    async def upsert_conversation_state(self, user_id, current_step, temp_data):
+        return None
+
+
+def _checkpoint_path() -> str:
+    return str(Path(tempfile.mkdtemp()) / "checkpoint.json")
+
+
+def test_batch_precomputes_and_request_reads_cache():
+    async def run():
+        db, llm = FakeDB(), FakeLLM()
+        report = await precompute.run_weekly_precompute(
+            db, llm, concurrency=2, batch_size=3, checkpoint_path=_checkpoint_path()
+        )
+
+        request_llm = FakeLLM()
+        result = await handle_weekly_v1_request(db, USER_IDS[0], UserMetadata(name="테스트"), request_llm)
+        return report, llm, request_llm, result
+
+    report, llm, request_llm, result = asyncio.run(run())
+
+    assert report.completed and report.generated == len(USER_IDS)
+    assert llm.calls == len(USER_IDS) * 2
+    assert llm.max_in_flight <= 2
+    assert request_llm.calls == 0
+    assert "이번 주 요약" in result.ai_response and "1. Q1" in result.ai_response
+
+
+def test_resume_from_checkpoint_and_dry_run():
+    async def run():
+        db, path = FakeDB(), _checkpoint_path()
+
+        dry = await precompute.run_weekly_precompute(db, dry_run=True, checkpoint_path=path)
+
+        # limit으로 중간에 멈춘 뒤 같은 체크포인트로 재실행
+        first = await precompute.run_weekly_precompute(db, FakeLLM(), batch_size=2, limit=3, checkpoint_path=path)
+        db.precomputed.clear()  # 커서만으로 이어서 진행하는지 확인
+        second = await precompute.run_weekly_precompute(db, FakeLLM(), batch_size=2, checkpoint_path=path)
+        again = await precompute.run_weekly_precompute(db, FakeLLM(), checkpoint_path=path)
+        return dry, first, second, again, db
+
+    dry, first, second, again, db = asyncio.run(run())
+
+    assert dry.candidates == len(USER_IDS) and dry.generated == 0
+    assert first.generated == 3 and not first.completed
+    assert second.resumed_from == USER_IDS[2]
+    assert sorted(user_id for user_id, _ in db.precomputed) == USER_IDS[3:]
+    assert again.completed and again.candidates == 0
+
+
+def test_changed_input_falls_back_to_live_generation():
+    async def run():
+        db = FakeDB()
+        await precompute.run_weekly_precompute(db, FakeLLM(), checkpoint_path=None)
+        db.summaries[USER_IDS[0]].append({"session_date": "2026-10-16", "summary_content": "회고"})
+
+        request_llm = FakeLLM()
+        await handle_weekly_v1_request(db, USER_IDS[0], UserMetadata(name="테스트"), request_llm)
+        return request_llm
+
+    before = precompute.get_weekly_precompute_stats()
+    request_llm = asyncio.run(run())
+    after = precompute.get_weekly_precompute_stats()
+
+    assert request_llm.calls == 2
+    assert after["stale"] == before["stale"] + 1
+
+
+def test_failed_users_are_retried_and_block_completion():
+    async def run():
+        db, path = FakeDB(), _checkpoint_path()
+        db.failures = {USER_IDS[1]: 1, USER_IDS[4]: 2}
+        first = await precompute.run_weekly_precompute(db, FakeLLM(), batch_size=3, checkpoint_path=path)
+        checkpoint = precompute._load_checkpoint(path, first.week_start)
+        second = await precompute.run_weekly_precompute(db, FakeLLM(), batch_size=3, checkpoint_path=path)
+        return first, checkpoint, second, db
+
+    first, checkpoint, second, db = asyncio.run(run())
+
+    assert first.retried == 2 and first.failed == 1 and not first.completed
+    assert checkpoint == {**checkpoint, "completed": False, "cursor": None}
+    assert second.candidates == 1 and second.generated == 1 and second.completed
+    assert len(db.precomputed) == len(USER_IDS)
+
+
+if __name__ == "__main__":
+    for name, fn in list(globals().items()):
+        if name.startswith("test_"):
+            fn()
+            print(f"✅ {name}")